@@ -5,6 +5,9 @@ from autogen_agentchat.agents import AssistantAgent
 from autogen_core.models import ChatCompletionClient
 from typing import Dict, Any
 from ..tools.search import web_search
+from ..core.log import get_logger
+
+logger = get_logger(__name__)
 
 # 함수 인자를 llm_config 대신 model_client 객체로 변경
 def create_critic_agent(model_client: ChatCompletionClient) -> AssistantAgent:
@@ -19,7 +22,7 @@ def create_critic_agent(model_client: ChatCompletionClient) -> AssistantAgent:
         AssistantAgent: 설정된 Critic 에이전트 인스턴스.
     """
     # 로깅 개선: 사용하는 모델 정보는 model_client 객체에서 가져오기 어려울 수 있음 (필요시 다른 방법 강구)
-    print(f"Critic 에이전트 생성 중 (도구: web_search)...")
+    logger.debug("Critic 에이전트 생성 중 (도구: web_search)...")
 
     critic_system_message = """당신은 AI 비판가(Critic)입니다. 사용자의 주장을 깊이 분석하여 약점과 불완전성을 찾아내되, 단순한 반대가 아니라 ‘건설적 비판’을 목표로 삼습니다.
 
@@ -82,5 +85,5 @@ def create_critic_agent(model_client: ChatCompletionClient) -> AssistantAgent:
         tools=[web_search],
         # code_execution_config=False, # 이 인자도 유효하지 않을 가능성 높음 (이전 오류 참고)
     )
-    print("Critic 에이전트 생성 완료 (웹 검색 도구 포함).")
+    logger.debug("Critic 에이전트 생성 완료 (웹 검색 도구 포함).")
     return critic_agent
\ No newline at end of file
@@ -1,17 +1,29 @@
 # backend/app/api/v1/endpoints/chat.py
 
-from fastapi import APIRouter, HTTPException, status, Path, Depends
+import time
+
+from fastapi import APIRouter, HTTPException, status, Path, Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-from ....core.orchestration import run_conversation_turn_langgraph
+# 오케스트레이션(langgraph/LLM 클라이언트)은 임포트가 무거우므로 핸들러 안에서 임포트 (앱 시작 시간 단축)
+from ....core.streaming import prime_stream, sse_response
+from ....core.turn_lock import TurnInProgressError
+from ....core.graph_registry import GraphRegistry, get_graph_registry
+from ....core.metrics import TURN_LATENCY, timed_stream
+from ....core.tracing import TRACE_HEADER, trace_format, trace_payload, trace_turn
 from ....models.chat import SendMessageRequest, MessageResponse
 from ....db.session import get_db_session
+from ....core.log import get_logger
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 
 @router.post(
     "/sessions/{session_id}/message",
     response_model=MessageResponse,
+    response_model_exclude_none=True,  # trace 는 디버그 요청에서만 포함
     summary="세션에 메시지 전송 및 Critic 응답 받기",
     tags=["Chat"]
 )
@@ -19,35 +31,65 @@ async def send_message(
     request: SendMessageRequest,
     session_id: str = Path(..., title="Session ID", description="메시지를 보낼 세션의 ID"),
     db: AsyncSession = Depends(get_db_session),  # ✅ 비동기 세션 주입
+    registry: GraphRegistry = Depends(get_graph_registry),  # 프로세스 공유 그래프/체크포인터
+    debug_trace: Optional[str] = Header(None, alias=TRACE_HEADER),
 ):
     """
     세션에 메시지를 전송하고 Critic의 응답을 받아 반환합니다.
+    X-Debug-Trace 헤더(또는 DEBUG_TRACE)가 있으면 응답의 trace 에 구간별 지연 분해를 담습니다.
     """
-    print(f"API: 세션 {session_id}에 메시지 수신: '{request.content}'")
+    logger.info("API: 세션 %s에 메시지 수신: '%s'", session_id, request.content)
+    from ....core.orchestration import run_conversation_turn_langgraph
 
     try:
-        critic_response = await run_conversation_turn_langgraph(
-            session_id,
-            request.content
-        )
+        with trace_turn("/message", trace_format(debug_trace)) as trace, TURN_LATENCY.time(endpoint="/message"):
+            critic_response = await run_conversation_turn_langgraph(
+                session_id,
+                request.content,
+                registry=registry,
+            )
 
         if critic_response is None or critic_response.startswith("오류:") or critic_response.startswith("Error:"):
-            print(f"API: 세션 {session_id} 오케스트레이션 오류: {critic_response}")
+            logger.error("API: 세션 %s 오케스트레이션 오류: %s", session_id, critic_response)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=critic_response or "오케스트레이션 처리 중 응답을 받지 못했습니다."
             )
 
-        print(f"API: 세션 {session_id}에 대한 Critic 응답 전송")
-        return MessageResponse(content=critic_response)
+        logger.info("API: 세션 %s에 대한 Critic 응답 전송", session_id)
+        return MessageResponse(content=critic_response, trace=trace_payload(trace))
 
     except HTTPException:
         raise
+    except TurnInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
-        print(f"API 오류: 세션 {session_id} 메시지 처리 실패 - {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("API 오류: 세션 %s 메시지 처리 실패 - %s", session_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"메시지 처리에 실패했습니다: {e}"
         )
+
+
+@router.post(
+    "/sessions/{session_id}/message/stream",
+    summary="세션에 메시지 전송 및 응답 스트리밍 (SSE)",
+    tags=["Chat"]
+)
+async def stream_message(
+    request: SendMessageRequest,
+    session_id: str = Path(..., title="Session ID", description="메시지를 보낼 세션의 ID"),
+    registry: GraphRegistry = Depends(get_graph_registry),
+):
+    """
+    /message 와 같은 턴을 실행하되, text/event-stream 으로 노드 전환(node)과
+    토큰 델타(token)를 도착하는 즉시 보내고 마지막에 final 이벤트로 전체 응답을 보냅니다.
+    """
+    logger.info("API: 세션 %s에 스트리밍 메시지 수신: '%s'", session_id, request.content)
+    from ....core.orchestration import stream_conversation_turn_langgraph
+    started = time.perf_counter()
+    try:
+        events = await prime_stream(stream_conversation_turn_langgraph(session_id, request.content, registry=registry))
+    except TurnInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return sse_response(timed_stream(events, TURN_LATENCY, started, endpoint="/message/stream"))
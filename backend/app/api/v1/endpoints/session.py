@@ -1,28 +1,29 @@
 # backend/app/api/v1/endpoints/session.py
 
-from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi import Body
-from sqlalchemy.ext.asyncio import AsyncSession
+import time
+
+from fastapi import APIRouter, HTTPException, status, Query, Response
+from fastapi import Body, Header
 from typing import List, Optional, Union # Union 추가
 
 # --- 상대 경로 임포트 수정 ---
 # 가정: 현재 파일 위치는 backend/app/api/v1/endpoints/session.py
 # core, models, db 등은 app 폴더 하위에 있다고 가정
-from ....core import state_manager # state_manager.py 구현 필요
 from ....models.session import SessionCreateRequest, SessionCreateResponse
 from ....models.chat import Message, MessageResponse # 사용자 정의 모델
-from ....db.session import get_db_session, async_session_factory
-from ....core.redis_checkpointer import RedisCheckpointer
-from ....core.sql_checkpointer import SQLCheckpointer
-from ....core.checkpointers import CombinedCheckpointer
-from ....core.why_orchestration import run_why_exploration_turn
-from ....core.recovery_manager import restore_session_to_redis # recovery_manager.py 구현 필요
+from ....db.session import get_db_session
+from ....core.streaming import prime_stream, sse_response
+from ....core.metrics import TURN_LATENCY, timed_stream
+from ....core.tracing import TRACE_HEADER, trace_format, trace_payload, trace_turn
+from ....core.turn_lock import TurnInProgressError
 from ....core.config import get_settings
 # --- Langchain/Langgraph 관련 임포트 ---
-from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
-from langgraph.errors import GraphInterrupt
+# state_manager, recovery_manager, why_orchestration, langgraph, 메시지 로그(redis) 는 임포트가 무거우므로 핸들러 안에서 임포트 (앱 시작 시간 단축)
 # --- Pydantic ---
 from pydantic import BaseModel
+from ....core.log import get_logger
+
+logger = get_logger(__name__)
 
 settings = get_settings()
 
@@ -37,108 +38,85 @@ router = APIRouter()
 )
 async def create_session(request: SessionCreateRequest):
     """ 새로운 토론 세션 생성 """
+    from ....core import state_manager
     try:
         # state_manager.create_new_session이 초기 상태를 Redis/SQL에 저장한다고 가정
         # 이 초기 상태는 CombinedCheckpointer가 읽을 수 있는 형식이어야 함
         # (예: messages 키를 포함한 빈 리스트)
-        print(f"[API /sessions] 요청 수신: Topic='{request.topic}', Agent='{request.initial_agent_type}'")
+        logger.info("[API /sessions] 요청 수신: Topic='%s', Agent='%s'", request.topic, request.initial_agent_type)
         session_id = await state_manager.create_new_session(
             topic=request.topic,
             initial_agent_type=request.initial_agent_type
         )
-        print(f"[API /sessions] 세션 생성됨: ID={session_id}, 초기 에이전트={request.initial_agent_type}")
+        logger.info("[API /sessions] 세션 생성됨: ID=%s, 초기 에이전트=%s", session_id, request.initial_agent_type)
         return SessionCreateResponse(session_id=session_id)
     except Exception as e:
-        print(f"[API /sessions] 세션 생성 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[API /sessions] 세션 생성 오류: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"세션 생성 중 예기치 않은 오류 발생: {e}"
         )
 
 @router.get("/sessions/{session_id}/messages", response_model=List[Message], tags=["Session Management"])
-async def get_session_messages(session_id: str, db: AsyncSession = Depends(get_db_session)):
-    """ 특정 세션의 메시지 기록 조회 """
-    print(f"[API /messages] 세션 {session_id} 메시지 기록 요청")
-
-    # 체크포인터 초기화
-    try:
-        redis_cp = RedisCheckpointer(settings.REDIS_URL, ttl=settings.SESSION_TTL_SECONDS)
-        sql_cp = SQLCheckpointer(async_session_factory)
-        checkpointer = CombinedCheckpointer(redis_cp, sql_cp)
-    except Exception as e_cp_init:
-         print(f"[API /messages] 체크포인터 초기화 오류: {e_cp_init}")
-         raise HTTPException(status_code=500, detail="서버 설정 오류")
-
-
-    config = {"configurable": {"thread_id": session_id}}
+async def get_session_messages(
+    session_id: str,
+    response: Response,
+    limit: int = Query(settings.MESSAGES_PAGE_DEFAULT_LIMIT, ge=1, le=settings.MESSAGES_PAGE_MAX_LIMIT, description="가져올 최대 메시지 수 (최근 것부터)"),
+    before: Optional[int] = Query(None, ge=0, description="이 id 보다 앞선 메시지만 (이전 페이지 커서)"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    특정 세션의 메시지 기록 조회: id 가 before 보다 작은 메시지 중 최근 limit 개를 오래된 순으로 반환합니다.
+    그래프 체크포인트가 아니라 메시지 로그(Redis 리스트 + messages 테이블, app/core/message_log.py)에서 읽습니다.
+    - 더 이전 메시지가 있을 수 있으면 X-Next-Before 헤더에 다음 페이지의 before 값을 담습니다.
+    - 목록이 바뀌지 않았으면 If-None-Match(ETag) 에 304 로 응답합니다 (HWM 조회 한 번).
+    """
+    logger.info("[API /messages] 세션 %s 메시지 기록 요청 (limit=%s, before=%s)", session_id, limit, before)
+    from ....core.flush_manager import get_flushed_count
+    from ....core.message_log import read_page
 
     try:
-        # aget_user_visible_messages는 이제 항상 리스트를 반환 (비어 있을 수 있음)
-        messages_raw: List[Union[BaseMessage, dict]] = await checkpointer.aget_user_visible_messages(config)
-
-        # 메시지 객체를 API 응답 모델로 변환
-        processed_messages = []
-        for msg_data in messages_raw: # messages_raw는 이제 항상 리스트
-            role = "assistant" # 기본값
-            content = ""
-            try:
-                if isinstance(msg_data, HumanMessage):
-                    role = "user"
-                    content = msg_data.content
-                elif isinstance(msg_data, AIMessage):
-                    role = "assistant"
-                    content = msg_data.content
-                elif isinstance(msg_data, dict): # 직렬화된 dict 형태 처리
-                    role = msg_data.get("type", "assistant") # 'type'을 role로 사용
-                    if role == "ai": role = "assistant" # 'ai'를 'assistant'로 통일
-                    content = msg_data.get("content", "")
-                else:
-                    print(f"  [API /messages] ⚠️ 알 수 없는 메시지 타입 건너뜀: {type(msg_data)}")
-                    continue # 다음 메시지로 넘어감
-
-                # content가 비어있지 않은 경우에만 추가 (선택 사항)
-                if content:
-                    processed_messages.append(Message(role=role, content=content))
-                else:
-                    print(f"  [API /messages] ⚠️ 내용이 없는 메시지 건너뜀: role={role}")
-
-
-            except Exception as e_msg_proc:
-                # 개별 메시지 처리 오류는 로깅하고 계속 진행
-                print(f"  [API /messages] ⚠️ 메시지 처리 중 오류: {e_msg_proc}, 메시지 데이터: {msg_data}")
-
-        print(f"[API /messages] 세션 {session_id}에 대해 {len(processed_messages)}개의 메시지 반환.")
-        return processed_messages
-
-    except HTTPException: # 이미 HTTPException인 경우 그대로 전달
-        raise
+        # get_db_session 은 asynccontextmanager 라 Depends 로 주입하면 세션이 아닌 컨텍스트매니저가 들어오므로 직접 엶
+        # (Redis 로 끝나는 요청은 쿼리가 없어 DB 연결을 잡지 않음)
+        async with get_db_session() as db:
+            # flush 된 메시지 수가 곧 메시지 로그의 버전 (flush 마다 로그와 같은 Redis 트랜잭션에서 갱신)
+            version = await get_flushed_count(db, session_id)
+            etag = f'W/"{version}-{limit}-{"" if before is None else before}"'
+            if if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(",")):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+            page = await read_page(db, session_id, limit, before)
     except Exception as e:
-        print(f"[API /messages] 세션 메시지 조회 중 예기치 않은 오류: {e}")
-        import traceback; traceback.print_exc()
+        logger.exception("[API /messages] 세션 메시지 조회 중 예기치 않은 오류: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"메시지 기록 조회 중 예기치 않은 오류 발생: {e}"
         )
 
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"  # 캐시하되 매번 ETag 로 재검증
+    if len(page) == limit and page[0]["id"] > 0:
+        response.headers["X-Next-Before"] = str(page[0]["id"])
+    logger.info("[API /messages] 세션 %s에 대해 %s개의 메시지 반환.", session_id, len(page))
+    return [Message(**entry) for entry in page]
+
 
 @router.post("/sessions/{session_id}/restore", tags=["Session Management"])
 async def restore_session_api(session_id: str): # 함수 이름 충돌 방지
     """ SQL 등 영구 저장소에서 Redis로 세션 상태 복원 시도 """
-    print(f"[API /restore] 세션 {session_id} 복구 요청")
+    logger.info("[API /restore] 세션 %s 복구 요청", session_id)
+    from ....core.recovery_manager import restore_session_to_redis
     try:
         success = await restore_session_to_redis(session_id)
         if success:
-            print(f"[API /restore] 세션 {session_id} 복구 성공")
+            logger.info("[API /restore] 세션 %s 복구 성공", session_id)
             return {"success": True, "message": "세션 복구 성공"}
         else:
-            print(f"[API /restore] 세션 {session_id} 복구 실패 (restore_session_to_redis가 False 반환)")
+            logger.error("[API /restore] 세션 %s 복구 실패 (restore_session_to_redis가 False 반환)", session_id)
             # 실패 시 404 또는 다른 적절한 상태 코드 반환 고려
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없거나 복구에 실패했습니다.")
     except Exception as e:
-        print(f"[API /restore] 세션 복구 중 오류 발생: {e}")
-        import traceback; traceback.print_exc()
+        logger.exception("[API /restore] 세션 복구 중 오류 발생: %s", e)
         raise HTTPException(status_code=500, detail=f"세션 복구 중 오류 발생: {e}")
 
 
@@ -147,10 +125,13 @@ async def restore_session_api(session_id: str): # 함수 이름 충돌 방지
 class WhyTurnRequest(BaseModel):
     input: str # 사용자 입력은 필수로 변경
 
-@router.post("/sessions/{session_id}/why", response_model=MessageResponse, tags=["Why Agent"])
-async def run_why_turn_endpoint(session_id: str, req: WhyTurnRequest = Body(...)): # 함수 이름 충돌 방지
-    """ Why agent를 통한 탐색 턴 실행 """
-    print(f"[API /why] 세션 {session_id} Why 턴 실행 요청: input='{req.input[:50]}...'")
+@router.post("/sessions/{session_id}/why", response_model=MessageResponse, response_model_exclude_none=True, tags=["Why Agent"])
+async def run_why_turn_endpoint(session_id: str, req: WhyTurnRequest = Body(...),
+                                debug_trace: Optional[str] = Header(None, alias=TRACE_HEADER)): # 함수 이름 충돌 방지
+    """ Why agent를 통한 탐색 턴 실행 (X-Debug-Trace 헤더가 있으면 응답 trace 에 지연 분해 포함) """
+    logger.info("[API /why] 세션 %s Why 턴 실행 요청: input='%s...'", session_id, req.input[:50])
+    from langgraph.errors import GraphInterrupt
+    from ....core.why_orchestration import run_why_exploration_turn
 
     # 입력 값 검증 (Pydantic에서 이미 처리하지만 명시적으로도 가능)
     # if not req.input:
@@ -159,38 +140,55 @@ async def run_why_turn_endpoint(session_id: str, req: WhyTurnRequest = Body(...)
     try:
         # run_why_exploration_turn 호출
         # initial_topic은 run_why_exploration_turn 내부에서 새 세션 여부 판단 후 사용됨
-        response_content = await run_why_exploration_turn(
-            session_id=session_id,
-            user_input=req.input,
-            initial_topic=req.input # 새 세션의 첫 턴일 경우 raw_topic 설정에 사용됨
-        )
+        with trace_turn("/why", trace_format(debug_trace)) as trace, TURN_LATENCY.time(endpoint="/why"):
+            response_content = await run_why_exploration_turn(
+                session_id=session_id,
+                user_input=req.input,
+                initial_topic=req.input # 새 세션의 첫 턴일 경우 raw_topic 설정에 사용됨
+            )
 
         # 오케스트레이터가 None을 반환하는 경우 처리
         if response_content is None:
-            print(f"[API /why][WARN] run_why_exploration_turn이 None을 반환 (session: {session_id}).")
+            logger.warning("[API /why] run_why_exploration_turn이 None을 반환 (session: %s).", session_id)
             # 사용자에게 전달할 적절한 메시지 설정
             response_content = "대화 흐름을 완료했거나 처리 중 문제가 발생했습니다. 다음 질문을 입력해주세요."
             # 또는 상태에 따라 다른 메시지 가능 (예: 최종 요약이 있다면 그것을 반환)
 
-        print(f"[API /why] 세션 {session_id} 응답 반환: '{response_content[:50]}...'")
-        return MessageResponse(content=response_content)
+        logger.info("[API /why] 세션 %s 응답 반환: '%s...'", session_id, response_content[:50])
+        return MessageResponse(content=response_content, trace=trace_payload(trace))
 
     except GraphInterrupt as gi:
         # LangGraph 노드가 사용자 입력을 기다리기 위해 interrupt 발생시킨 경우
         interrupt_message = str(gi.value) if gi.value else "다음 입력을 기다리고 있습니다."
-        print(f"[API /why][INFO] GraphInterrupt 발생 (session: {session_id}): '{interrupt_message[:50]}...'")
+        logger.info("[API /why] GraphInterrupt 발생 (session: %s): '%s...'", session_id, interrupt_message[:50])
         # GraphInterrupt의 value는 노드가 사용자에게 전달하려는 메시지/질문
-        return MessageResponse(content=interrupt_message)
+        return MessageResponse(content=interrupt_message, trace=trace_payload(trace))
 
     except HTTPException: # 이미 HTTPException인 경우 그대로 전달
         raise
+    except TurnInProgressError as e: # 같은 세션의 이전 턴이 실행 중 (reject 모드 또는 대기 시간 초과)
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         # 예상치 못한 오류 발생 시
-        print(f"[API /why][ERROR] Why 흐름 처리 중 예외 발생 (session: {session_id}): {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[API /why] Why 흐름 처리 중 예외 발생 (session: %s): %s", session_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Why 흐름 처리 중 예기치 않은 오류 발생: {e}"
         )
 
+
+@router.post("/sessions/{session_id}/why/stream", tags=["Why Agent"])
+async def stream_why_turn_endpoint(session_id: str, req: WhyTurnRequest = Body(...)):
+    """ /why 와 같은 턴을 text/event-stream 으로 실행 (노드 전환/토큰 이벤트 후 final 이벤트) """
+    logger.info("[API /why/stream] 세션 %s Why 턴 스트리밍 요청: input='%s...'", session_id, req.input[:50])
+    from ....core.why_orchestration import stream_why_exploration_turn
+    started = time.perf_counter()
+    try:
+        events = await prime_stream(stream_why_exploration_turn(
+            session_id=session_id,
+            user_input=req.input,
+            initial_topic=req.input # 새 세션의 첫 턴일 경우 raw_topic 설정에 사용됨
+        ))
+    except TurnInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return sse_response(timed_stream(events, TURN_LATENCY, started, endpoint="/why/stream"))
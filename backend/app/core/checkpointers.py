@@ -10,6 +10,14 @@ from langchain_core.runnables import RunnableConfig
 # Assuming SQLCheckpointer and RedisCheckpointer are correctly defined elsewhere
 from .sql_checkpointer import SQLCheckpointer
 from .redis_checkpointer import RedisCheckpointer
+from .write_behind import SQLWriteBehindQueue
+from .log import get_logger
+from langgraph.constants import ERROR, INTERRUPT, RESUME, SCHEDULED
+
+logger = get_logger(__name__)
+
+# 저장하지 않는 LangGraph 내부 write 채널 (aput_writes 참고)
+_UNREPLAYED_CHANNELS = frozenset({ERROR, INTERRUPT, RESUME, SCHEDULED})
 
 # ===== LangGraph Checkpoint TypedDict Structure (Assumption) =====
 # Verify against your installed LangGraph version's source code!
@@ -41,9 +49,12 @@ class CombinedCheckpointer:
     Attempts to implement the LangGraph CheckpointSaver interface.
     NOTE: Conformance to the exact interface of your LangGraph version is crucial.
     """
-    def __init__(self, redis_cp: RedisCheckpointer, sql_cp: SQLCheckpointer):
+    def __init__(self, redis_cp: RedisCheckpointer, sql_cp: SQLCheckpointer,
+                 write_behind: Optional[SQLWriteBehindQueue] = None):
         self.redis_cp = redis_cp
         self.sql_cp = sql_cp
+        # 설정 시 SQL 저장은 write-behind 큐로 위임 (aput 지연은 Redis에만 의존)
+        self.write_behind = write_behind
         # Indicate that this checkpointer supports saving/loading metadata
         self.is_persistent = True
 
@@ -52,17 +63,35 @@ class CombinedCheckpointer:
            containing keys expected by LangGraph (channel_values, metadata, etc.)."""
         runnable_config: RunnableConfig = config
         thread_id = config.get("configurable", {}).get("thread_id")
-        print(f"[CHECKPOINTER][aget] Attempting to load state for thread_id: {thread_id}")
+        logger.debug("[CHECKPOINTER][aget] Attempting to load state for thread_id: %s", thread_id)
 
         wrapper = await self.redis_cp.aget(config) # Pass the full config
-        print(f"[CHECKPOINTER][aget] Redis lookup result for {thread_id}: {'Found' if wrapper else 'None'}")
+        logger.debug("[CHECKPOINTER][aget] Redis lookup result for %s: %s", thread_id, 'Found' if wrapper else 'None')
+        if wrapper is not None:
+            # pending writes는 별도 레코드로 쌓여 있으므로 읽을 때 기준 상태에 접어 넣음
+            checkpoint_id = self._wrapper_checkpoint_id(wrapper)
+            self._fold_writes(wrapper, await self.redis_cp.aget_writes(config, checkpoint_id))
+        if wrapper is None and self.write_behind is not None:
+            # 아직 SQL에 flush되지 않은 최신 상태가 있으면 그것을 우선 사용
+            wrapper = self.write_behind.get_pending(thread_id)
+            if wrapper:
+                 logger.debug("[CHECKPOINTER][aget] Using pending write-behind state for %s", thread_id)
+                 checkpoint_id = self._wrapper_checkpoint_id(wrapper)
+                 wrapper = self._fold_writes(dict(wrapper, channel_values=dict(wrapper.get("channel_values") or {})),
+                                             self.write_behind.get_pending_writes(thread_id, checkpoint_id))
+                 await self.redis_cp.aset(config, wrapper)
         if wrapper is None:
             wrapper = await self.sql_cp.aget(config) # Pass the full config
-            print(f"[CHECKPOINTER][aget] SQL lookup result for {thread_id}: {'Found' if wrapper else 'None'}")
+            logger.debug("[CHECKPOINTER][aget] SQL lookup result for %s: %s", thread_id, 'Found' if wrapper else 'None')
             if wrapper:
+                 checkpoint_id = self._wrapper_checkpoint_id(wrapper)
+                 writes = await self.sql_cp.aget_writes(config, checkpoint_id)
+                 if self.write_behind is not None:
+                     writes += self.write_behind.get_pending_writes(thread_id, checkpoint_id)
+                 self._fold_writes(wrapper, writes)
                  # If loaded from SQL, potentially cache it back to Redis
                  # Consider adding TTL logic here if caching back
-                 print(f"[CHECKPOINTER][aget] Caching state from SQL to Redis for {thread_id}")
+                 logger.debug("[CHECKPOINTER][aget] Caching state from SQL to Redis for %s", thread_id)
                  await self.redis_cp.aset(config, wrapper)
 
 
@@ -75,7 +104,7 @@ class CombinedCheckpointer:
                 "versions_seen": {},
                 "channel_versions": {},
             }
-            print(f"[CHECKPOINTER][aget] No state found for {thread_id}, returning default wrapper.")
+            logger.debug("[CHECKPOINTER][aget] No state found for %s, returning default wrapper.", thread_id)
         else:
             # Ensure essential keys and structure in the loaded wrapper
             cv = wrapper.get("channel_values")
@@ -105,26 +134,51 @@ class CombinedCheckpointer:
             if not isinstance(md, dict): md = {}
             md.setdefault("step", 0) # Default step to 0 if loaded state has no step
             wrapper["metadata"] = md
-            print(f"[CHECKPOINTER][aget] Loaded state for {thread_id}, processed wrapper.")
+            logger.debug("[CHECKPOINTER][aget] Loaded state for %s, processed wrapper.", thread_id)
 
         return wrapper
 
+    @staticmethod
+    def _latest_config(config: Dict[str, Any]) -> Dict[str, Any]:
+        configurable = {k: v for k, v in config.get("configurable", {}).items() if k != "checkpoint_id"}
+        return {**config, "configurable": configurable}
+
+    @staticmethod
+    def _wrapper_checkpoint_id(wrapper: dict) -> Optional[str]:
+        metadata = wrapper.get("metadata")
+        return metadata.get("checkpoint_id") if isinstance(metadata, dict) else None
+
+    @staticmethod
+    def _fold_writes(wrapper: dict, writes: List[Tuple[str, str, Any]]) -> dict:
+        """(task_id, channel, value) 레코드를 순서대로 덮어써서 기준 상태에 적용"""
+        if not writes:
+            return wrapper
+        channel_values = wrapper.get("channel_values")
+        if not isinstance(channel_values, dict):
+            channel_values = {}
+            wrapper["channel_values"] = channel_values
+        for _task_id, channel, value in writes:
+            channel_values[channel] = value
+            if channel == "messages" and isinstance(value, list):
+                wrapper["messages"] = value
+        return wrapper
+
 
     async def aget_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
         """Loads state using aget and converts it into the CheckpointTuple format expected by LangGraph."""
         runnable_config: RunnableConfig = config
         thread_id = config.get("configurable", {}).get("thread_id")
-        print(f"[CHECKPOINTER][aget_tuple] Loading state for thread_id: {thread_id}")
+        logger.debug("[CHECKPOINTER][aget_tuple] Loading state for thread_id: %s", thread_id)
         wrapper = await self.aget(config) # aget now returns the full wrapper
 
         # aget should always return a dict now
         if wrapper is None:
-             print(f"[CHECKPOINTER][aget_tuple][ERROR] aget returned None unexpectedly for {thread_id}.")
+             logger.error("[CHECKPOINTER][aget_tuple] aget returned None unexpectedly for %s.", thread_id)
              return None
 
-        print(f"  [CHECKPOINTER][aget_tuple] Loaded wrapper keys: {list(wrapper.keys())}")
-        print(f"  [CHECKPOINTER][aget_tuple] Config received: {runnable_config}")
-        print(f"  [CHECKPOINTER][aget_tuple] Metadata from wrapper: {wrapper.get('metadata')}")
+        logger.debug("[CHECKPOINTER][aget_tuple] Loaded wrapper keys: %s", list(wrapper.keys()))
+        logger.debug("[CHECKPOINTER][aget_tuple] Config received: %s", runnable_config)
+        logger.debug("[CHECKPOINTER][aget_tuple] Metadata from wrapper: %s", wrapper.get('metadata'))
 
         try:
             # Determine checkpoint ID
@@ -135,11 +189,11 @@ class CombinedCheckpointer:
 
             # --- FIX: Ensure final_checkpoint_id is always a string ---
             if final_checkpoint_id is None:
-                 print(f"  [CHECKPOINTER][aget_tuple] No checkpoint ID found for new thread {thread_id}. Generating new UUID.")
+                 logger.debug("[CHECKPOINTER][aget_tuple] No checkpoint ID found for new thread %s. Generating new UUID.", thread_id)
                  final_checkpoint_id = str(uuid.uuid4()) # Generate a new UUID for the initial checkpoint
             # --- END FIX ---
 
-            print(f"  [CHECKPOINTER][aget_tuple] Using Checkpoint ID: {final_checkpoint_id}")
+            logger.debug("[CHECKPOINTER][aget_tuple] Using Checkpoint ID: %s", final_checkpoint_id)
 
             # Ensure channel_values is a dict
             channel_values_for_checkpoint = wrapper.get("channel_values", {})
@@ -161,7 +215,7 @@ class CombinedCheckpointer:
             metadata_content = wrapper.get("metadata", {})
             # Use step -1 for brand new threads as loaded by aget's default
             metadata_content.setdefault("step", -1 if wrapper.get("metadata", {}).get("step") == -1 else 0)
-            print(f"  [CHECKPOINTER][aget_tuple] Metadata object for tuple: {metadata_content}")
+            logger.debug("[CHECKPOINTER][aget_tuple] Metadata object for tuple: %s", metadata_content)
 
             tuple_to_return = CheckpointTuple(
                 config=runnable_config,
@@ -172,12 +226,10 @@ class CombinedCheckpointer:
                 pending_sends=None, # Usually None when loading directly
             )
 
-            print(f"  [CHECKPOINTER][aget_tuple] Returning CheckpointTuple for {thread_id}.")
+            logger.debug("[CHECKPOINTER][aget_tuple] Returning CheckpointTuple for %s.", thread_id)
 
         except Exception as e:
-            print(f"[CHECKPOINTER][aget_tuple][ERROR] Failed to create CheckpointTuple for {thread_id}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[CHECKPOINTER][aget_tuple] Failed to create CheckpointTuple for %s: %s", thread_id, e)
             tuple_to_return = None
 
         return tuple_to_return
@@ -194,14 +246,12 @@ class CombinedCheckpointer:
         thread_id = config.get("configurable", {}).get("thread_id")
         checkpoint_id = checkpoint.get("id") # ID should be present now
         if not checkpoint_id:
-             print(f"[CHECKPOINTER][aput][ERROR] Checkpoint ID is missing in checkpoint object for thread {thread_id}!")
+             logger.error("[CHECKPOINTER][aput] Checkpoint ID is missing in checkpoint object for thread %s!", thread_id)
              checkpoint_id = str(uuid.uuid4()) # Assign new ID as fallback
              checkpoint["id"] = checkpoint_id
 
-        print(f"[CHECKPOINTER][aput] Saving checkpoint for thread_id: {thread_id}, checkpoint_id: {checkpoint_id}")
-        print(f"  - Config: {runnable_config}")
-        # Log new_versions if needed
-        print(f"  - New versions received by aput: {new_versions}") # Log the received versions
+        logger.debug("[CHECKPOINTER][aput] Saving checkpoint for thread_id: %s, checkpoint_id: %s, config: %s, new_versions: %s",
+                     thread_id, checkpoint_id, runnable_config, new_versions)
 
         # Metadata to save alongside the state
         if not isinstance(metadata, dict):
@@ -212,7 +262,7 @@ class CombinedCheckpointer:
              metadata_to_save["checkpoint_id"] = checkpoint_id
              metadata_to_save["ts"] = checkpoint.get("ts")
 
-        print(f"  - Metadata being saved: {metadata_to_save}")
+        logger.debug("[CHECKPOINTER][aput] Metadata being saved: %s", metadata_to_save)
 
         # Structure to save (wrapper format for aget)
         app_state_from_checkpoint = checkpoint.get("channel_values", {})
@@ -239,11 +289,19 @@ class CombinedCheckpointer:
             "versions_seen": checkpoint.get("versions_seen", {}),
         }
 
-        # Save to Redis and SQL
-        await self.redis_cp.aset(runnable_config, state_to_store)
-        await self.sql_cp.aset(runnable_config, state_to_store)
+        # Save to Redis and SQL (write-behind 모드에서는 SQL 저장을 큐에 맡김)
+        # 이전 체크포인트(config의 checkpoint_id)에 쌓인 pending writes는 새 기준 상태에 이미 반영됨
+        parent_checkpoint_id = runnable_config.get("configurable", {}).get("checkpoint_id")
+        # 이 체크포인터는 스레드별 최신 상태만 보관하므로 Redis도 aget이 읽는 'latest' 키에 저장
+        # (config의 checkpoint_id는 부모 체크포인트라 그 키에 저장하면 다음 aget이 못 찾거나 오래된 상태를 읽음)
+        await self.redis_cp.aset(self._latest_config(runnable_config), state_to_store,
+                                 stale_writes_checkpoint_id=parent_checkpoint_id)
+        if self.write_behind is not None:
+            await self.write_behind.enqueue(runnable_config, state_to_store)
+        else:
+            await self.sql_cp.aset(runnable_config, state_to_store)
 
-        print(f"[CHECKPOINTER][aput] Saved checkpoint {checkpoint_id} for thread {thread_id}.")
+        logger.debug("[CHECKPOINTER][aput] Saved checkpoint %s for thread %s.", checkpoint_id, thread_id)
         # Return the config, ensuring it includes the checkpoint_id used for saving
         saved_config = runnable_config.copy()
         if "configurable" not in saved_config: saved_config["configurable"] = {}
@@ -252,68 +310,63 @@ class CombinedCheckpointer:
 
 
     async def aput_writes(self, config: Dict[str, Any], writes: List[Tuple[str, Any]], task_id: str) -> RunnableConfig:
-        """Applies partial writes to the current state and saves."""
+        """Appends partial writes as small per-checkpoint records (folded into the state lazily on read)."""
         thread_id = config.get("configurable", {}).get("thread_id")
-        print(f"[CHECKPOINTER][aput_writes] Applying writes for thread {thread_id}, task {task_id}")
-        print(f"  - Writes: {writes}")
-
-        current_tuple = await self.aget_tuple(config)
-        if not current_tuple:
-            print(f"[CHECKPOINTER][aput_writes][ERROR] Cannot apply writes, failed to load current state for {thread_id}")
+        checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
+        logger.debug("[CHECKPOINTER][aput_writes] Appending %s writes for thread %s, checkpoint %s, task %s", len(writes), thread_id, checkpoint_id or 'latest', task_id)
+        # interrupt/error 등 LangGraph 내부 채널은 재개(resume)용인데, 이 체크포인터는 pending_writes를
+        # 돌려주지 않으므로 저장하지 않음 (상태에 접혀 들어가거나 직렬화되지 않는 값이 SQL에 남는 것 방지)
+        writes = [(channel, value) for channel, value in writes if channel not in _UNREPLAYED_CHANNELS]
+        if not writes:
             return config
 
-        updated_checkpoint = current_tuple.checkpoint.copy()
-        if "channel_values" not in updated_checkpoint: updated_checkpoint["channel_values"] = {}
-
-        # --- Simplified write application (overwrite) ---
-        for channel, value in writes:
-            updated_checkpoint["channel_values"][channel] = value
-        # --- End Simplified write application ---
-
-        updated_checkpoint["ts"] = datetime.now(timezone.utc).isoformat()
-
-        print(f"  - State after applying writes (before save): {updated_checkpoint['channel_values']}")
-
-        # Save the updated state using aput
-        # We need to pass the expected number of arguments to aput now
-        # The 'new_versions' for aput_writes might need calculation based on 'writes'
-        # For simplicity, passing None, assuming aput primarily uses checkpoint object's versions
-        saved_config = await self.aput(config, updated_checkpoint, current_tuple.metadata, new_versions=None)
-        print(f"[CHECKPOINTER][aput_writes] Finished applying writes for thread {thread_id}, task {task_id}")
-        return saved_config
+        # 전체 상태를 다시 읽고 쓰지 않고 변경분(delta)만 추가 → 대화 길이와 무관한 비용
+        await self.redis_cp.aappend_writes(config, checkpoint_id, task_id, writes)
+        if self.write_behind is not None:
+            await self.write_behind.enqueue_writes([
+                (thread_id, checkpoint_id or "latest", task_id, idx, channel, value)
+                for idx, (channel, value) in enumerate(writes)
+            ])
+        else:
+            await self.sql_cp.aput_writes(config, checkpoint_id, task_id, writes)
+        return config
 
     async def adelete(self, config: Dict[str, Any]) -> None:
         """Deletes a specific checkpoint or potentially the latest one."""
         runnable_config: RunnableConfig = config
         thread_id = config.get("configurable", {}).get("thread_id")
         checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
-        print(f"[CHECKPOINTER][adelete] Deleting checkpoint for thread_id: {thread_id}, checkpoint_id: {checkpoint_id or 'latest'}")
+        logger.debug("[CHECKPOINTER][adelete] Deleting checkpoint for thread_id: %s, checkpoint_id: %s", thread_id, checkpoint_id or 'latest')
+        if self.write_behind is not None:
+            self.write_behind.discard(thread_id)
         await self.redis_cp.adelete(config)
         await self.sql_cp.adelete(config)
-        print(f"[CHECKPOINTER][adelete] Deletion complete for {thread_id}, {checkpoint_id or 'latest'}")
+        logger.debug("[CHECKPOINTER][adelete] Deletion complete for %s, %s", thread_id, checkpoint_id or 'latest')
 
 
     async def adelete_thread(self, config: Dict[str, Any]) -> None:
         """Deletes all checkpoints associated with a thread."""
         thread_id = config.get("configurable", {}).get("thread_id")
-        print(f"[CHECKPOINTER][adelete_thread] Deleting ALL checkpoints for thread_id: {thread_id}")
+        logger.debug("[CHECKPOINTER][adelete_thread] Deleting ALL checkpoints for thread_id: %s", thread_id)
+        if self.write_behind is not None:
+            self.write_behind.discard(thread_id)
         # Assuming Redis/SQL checkpointers have methods to delete by thread_id prefix/query
         await self.redis_cp.adelete_thread(config)
         await self.sql_cp.adelete_thread(config)
-        print(f"[CHECKPOINTER][adelete_thread] Deletion complete for thread {thread_id}.")
+        logger.debug("[CHECKPOINTER][adelete_thread] Deletion complete for thread %s.", thread_id)
 
 
     async def alist(self, config: Dict[str, Any], *, filter: Optional[Dict[str, Any]] = None, before: Optional[RunnableConfig] = None, limit: Optional[int] = None) -> AsyncIterator[CheckpointTuple]:
         """ Lists checkpoints for a thread, potentially filtered. """
         thread_id = config.get("configurable", {}).get("thread_id")
-        print(f"[CHECKPOINTER][alist] Listing checkpoints for thread_id: {thread_id}, filter: {filter}, before: {before}, limit: {limit}")
+        logger.debug("[CHECKPOINTER][alist] Listing checkpoints for thread_id: %s, filter: %s, before: %s, limit: %s", thread_id, filter, before, limit)
 
         # Delegate to SQL checkpointer assuming it handles listing and filtering
         if hasattr(self.sql_cp, 'alist') and asyncio.iscoroutinefunction(self.sql_cp.alist):
             async for tup in self.sql_cp.alist(config, filter=filter, before=before, limit=limit):
                 yield tup
         else:
-            print("[CHECKPOINTER][alist][WARN] SQL checkpointer does not have an async 'alist' method. Cannot list history.")
+            logger.warning("[CHECKPOINTER][alist] SQL checkpointer does not have an async 'alist' method. Cannot list history.")
             # If listing isn't supported or nothing found, the loop will finish,
             # and an empty async iterator will be returned implicitly.
 
@@ -322,14 +375,14 @@ class CombinedCheckpointer:
 
     def get(self, config: Dict[str, Any]) -> Optional[dict]:
         """Synchronous version of aget."""
-        print(f"[CHECKPOINTER][SYNC] get 호출됨 for config: {config}")
+        logger.debug("[CHECKPOINTER][SYNC] get 호출됨 for config: %s", config)
         try: loop = asyncio.get_running_loop()
         except RuntimeError: loop = asyncio.new_event_loop(); asyncio.set_event_loop(loop)
         return loop.run_until_complete(self.aget(config))
 
     def get_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
         """Synchronous version of aget_tuple."""
-        print(f"[CHECKPOINTER][SYNC] get_tuple 호출됨 for config: {config}")
+        logger.debug("[CHECKPOINTER][SYNC] get_tuple 호출됨 for config: %s", config)
         try: loop = asyncio.get_running_loop()
         except RuntimeError: loop = asyncio.new_event_loop(); asyncio.set_event_loop(loop)
         return loop.run_until_complete(self.aget_tuple(config))
@@ -343,7 +396,7 @@ class CombinedCheckpointer:
            ) -> RunnableConfig:
     # --- END FIX ---
         """Synchronous version of aput."""
-        print(f"[CHECKPOINTER][SYNC] put 호출됨 for config: {config}")
+        logger.debug("[CHECKPOINTER][SYNC] put 호출됨 for config: %s", config)
         try: loop = asyncio.get_running_loop()
         except RuntimeError: loop = asyncio.new_event_loop(); asyncio.set_event_loop(loop)
         # Pass the new_versions argument to the async version
@@ -351,21 +404,21 @@ class CombinedCheckpointer:
 
     def put_writes(self, config: Dict[str, Any], writes: List[Tuple[str, Any]], task_id: str) -> RunnableConfig:
         """Synchronous version of aput_writes."""
-        print(f"[CHECKPOINTER][SYNC] put_writes 호출됨 for config: {config}")
+        logger.debug("[CHECKPOINTER][SYNC] put_writes 호출됨 for config: %s", config)
         try: loop = asyncio.get_running_loop()
         except RuntimeError: loop = asyncio.new_event_loop(); asyncio.set_event_loop(loop)
         return loop.run_until_complete(self.aput_writes(config, writes, task_id))
 
     def delete_thread(self, config: Dict[str, Any]) -> None:
         """Synchronous version of adelete_thread."""
-        print(f"[CHECKPOINTER][SYNC] delete_thread 호출됨 for config: {config}")
+        logger.debug("[CHECKPOINTER][SYNC] delete_thread 호출됨 for config: %s", config)
         try: loop = asyncio.get_running_loop()
         except RuntimeError: loop = asyncio.new_event_loop(); asyncio.set_event_loop(loop)
         loop.run_until_complete(self.adelete_thread(config))
 
     def list(self, config: Dict[str, Any], *, filter: Optional[Dict[str, Any]] = None, before: Optional[RunnableConfig] = None, limit: Optional[int] = None) -> List[CheckpointTuple]:
         """Synchronous version of alist."""
-        print(f"[CHECKPOINTER][SYNC] list 호출됨 for config: {config}")
+        logger.debug("[CHECKPOINTER][SYNC] list 호출됨 for config: %s", config)
         try: loop = asyncio.get_running_loop()
         except RuntimeError: loop = asyncio.new_event_loop(); asyncio.set_event_loop(loop)
 
@@ -382,7 +435,7 @@ class CombinedCheckpointer:
         Calculates the next version for a channel based on the current version.
         LangGraph uses this for managing channel updates. A simple increment is common.
         """
-        print(f"[CHECKPOINTER] get_next_version called. current_version={current_version}, type={type(current_version)}")
+        logger.debug("[CHECKPOINTER] get_next_version called. current_version=%s, type=%s", current_version, type(current_version))
         if isinstance(current_version, int):
             return current_version + 1
         elif current_version is None:
@@ -392,7 +445,7 @@ class CombinedCheckpointer:
             try:
                 return int(current_version) + 1
             except (ValueError, TypeError):
-                print(f"[CHECKPOINTER][WARN] get_next_version received non-integer/None version: {current_version}. Returning 1.")
+                logger.warning("[CHECKPOINTER] get_next_version received non-integer/None version: %s. Returning 1.", current_version)
                 return 1
 
 
@@ -404,49 +457,49 @@ class CombinedCheckpointer:
         """
         runnable_config: RunnableConfig = config
         thread_id = config.get("configurable", {}).get("thread_id")
-        print(f"[CHECKPOINTER][aget_user_visible_messages] Getting messages for thread_id: {thread_id}")
+        logger.debug("[CHECKPOINTER][aget_user_visible_messages] Getting messages for thread_id: %s", thread_id)
         wrapper = await self.aget(config) # aget ensures a default structure
 
         if not wrapper:
-            print(f"  [CHECKPOINTER][aget_user_visible_messages][WARN] Wrapper is None for {thread_id}, returning empty list.")
+            logger.warning("[CHECKPOINTER][aget_user_visible_messages] Wrapper is None for %s, returning empty list.", thread_id)
             return []
 
         # Prioritize the top-level 'messages' key populated by aget/aput
         messages_data = wrapper.get("messages", [])
-        print(f"  [CHECKPOINTER][aget_user_visible_messages] Found {len(messages_data)} messages in top-level 'messages' key.")
+        logger.debug("[CHECKPOINTER][aget_user_visible_messages] Found %s messages in top-level 'messages' key.", len(messages_data))
 
         if not messages_data:
             # Fallback to checking channel_values if top-level is empty
-            print(f"  [CHECKPOINTER][aget_user_visible_messages] Top-level 'messages' empty, checking channel_values for {thread_id}...")
+            logger.debug("[CHECKPOINTER][aget_user_visible_messages] Top-level 'messages' empty, checking channel_values for %s...", thread_id)
             channel_values = wrapper.get("channel_values", {})
             if isinstance(channel_values, dict):
                 # Check within __default__ channel
                 default_channel_state = channel_values.get("__default__", {})
                 if isinstance(default_channel_state, dict):
                     messages_data = default_channel_state.get("messages", [])
-                    print(f"    Found {len(messages_data)} messages in channel_values.__default__.messages.")
+                    logger.debug("Found %s messages in channel_values.__default__.messages.", len(messages_data))
                 elif isinstance(default_channel_state, list):
                     messages_data = default_channel_state
-                    print(f"    Found {len(messages_data)} messages directly in channel_values.__default__ (list).")
+                    logger.debug("Found %s messages directly in channel_values.__default__ (list).", len(messages_data))
 
                 # Check 'messages' as a separate channel if still not found
                 if not messages_data and "messages" in channel_values:
                      candidate = channel_values.get("messages")
                      if isinstance(candidate, list):
                          messages_data = candidate
-                         print(f"    Found {len(messages_data)} messages in channel_values.messages.")
+                         logger.debug("Found %s messages in channel_values.messages.", len(messages_data))
 
         if not isinstance(messages_data, list):
-            print(f"  [CHECKPOINTER][aget_user_visible_messages][WARN] Final messages_data is not a list (type: {type(messages_data)}), returning empty list for {thread_id}.")
+            logger.warning("[CHECKPOINTER][aget_user_visible_messages] Final messages_data is not a list (type: %s), returning empty list for %s.", type(messages_data), thread_id)
             return []
 
         if not messages_data:
-            print(f"  [CHECKPOINTER][aget_user_visible_messages][INFO] No messages found in state after checking all locations for {thread_id}, returning empty list.")
+            logger.debug("[CHECKPOINTER][aget_user_visible_messages] No messages found in state after checking all locations for %s, returning empty list.", thread_id)
             return []
 
         # Deserialize message data
         deserialized_messages = []
-        print(f"  [CHECKPOINTER][aget_user_visible_messages] Deserializing {len(messages_data)} message items for {thread_id}...")
+        logger.debug("[CHECKPOINTER][aget_user_visible_messages] Deserializing %s message items for %s...", len(messages_data), thread_id)
         for i, msg_data in enumerate(messages_data):
             try:
                 if isinstance(msg_data, dict) and "type" in msg_data and "content" in msg_data:
@@ -458,15 +511,15 @@ class CombinedCheckpointer:
                     elif msg_type == "ai" or msg_type == "assistant":
                         deserialized_messages.append(AIMessage(content=content, additional_kwargs=additional_kwargs))
                     else:
-                        print(f"    [WARN] Keeping unknown message type as dict: {msg_type}")
+                        logger.warning("Keeping unknown message type as dict: %s", msg_type)
                         deserialized_messages.append(msg_data)
                 elif isinstance(msg_data, BaseMessage):
                     deserialized_messages.append(msg_data)
                 else:
-                    print(f"    [WARN] Skipping unknown message data format at index {i}: {type(msg_data)}")
+                    logger.warning("Skipping unknown message data format at index %s: %s", i, type(msg_data))
             except Exception as e_deserialize:
-                 print(f"    [ERROR] Error deserializing message at index {i}: {e_deserialize}, data: {msg_data}")
+                 logger.error("Error deserializing message at index %s: %s, data: %s", i, e_deserialize, msg_data)
 
-        print(f"[CHECKPOINTER][aget_user_visible_messages] Returning {len(deserialized_messages)} deserialized messages for {thread_id}.")
+        logger.debug("[CHECKPOINTER][aget_user_visible_messages] Returning %s deserialized messages for %s.", len(deserialized_messages), thread_id)
         return deserialized_messages
 
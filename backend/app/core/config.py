@@ -1,6 +1,10 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, Optional
+
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
 
 class Settings(BaseSettings):
     OPENAI_API_KEY: Optional[str] = None
@@ -12,6 +16,104 @@ class Settings(BaseSettings):
     REDIS_URL: str     # 필수
     SESSION_TTL_SECONDS: int = 3600
 
+    # 프로세스당 하나의 Redis 연결 풀 (app/core/redis_pool.py)
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: float = 5.0          # 풀이 가득 찼을 때 연결을 기다리는 최대 시간
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = 30    # 이 시간 이상 쉰 연결은 사용 전 PING 으로 확인
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 5.0
+
+    # 메시지 기록 조회 (GET /sessions/{id}/messages, app/core/message_log.py)
+    MESSAGE_LOG_REDIS_MAXLEN: int = 200       # 세션별 Redis 메시지 로그에 남기는 최근 메시지 수
+    MESSAGES_PAGE_DEFAULT_LIMIT: int = 100
+    MESSAGES_PAGE_MAX_LIMIT: int = 500
+
+    # 체크포인트 write-behind: Redis는 동기 저장, SQL은 백그라운드 배치 저장
+    CHECKPOINT_WRITE_BEHIND: bool = False
+    CHECKPOINT_FLUSH_INTERVAL_MS: int = 200   # flusher 깨어나는 주기
+    CHECKPOINT_MAX_LAG_MS: int = 1000         # SQL 반영 최대 지연
+    CHECKPOINT_QUEUE_MAXSIZE: int = 1000      # 대기 가능한 thread 수 (초과 시 backpressure)
+    CHECKPOINT_FLUSH_BATCH_SIZE: int = 100
+
+    # transcript(대화 로그) 배치 저장 (app/core/transcript_appender.py)
+    TRANSCRIPT_FLUSH_INTERVAL_MS: int = 200
+    TRANSCRIPT_FLUSH_BATCH_SIZE: int = 500
+    TRANSCRIPT_QUEUE_MAXSIZE: int = 5000      # 버퍼 최대 행 수 (초과 시 backpressure)
+
+    # Why 세션 상태 hydration 캐시 (app/core/state_cache.py)
+    SESSION_STATE_CACHE_ENABLED: bool = True
+    SESSION_STATE_CACHE_MAXSIZE: int = 1024    # 프로세스당 캐시할 세션 수 (LRU)
+    # False 면 hit 마다 updated_at 만 조회해 버전 확인, True 면 Redis pub/sub 무효화로 대신함 (확인 쿼리 생략)
+    SESSION_STATE_CACHE_PUBSUB: bool = False
+    SESSION_STATE_CACHE_CHANNEL: str = "session_state_invalidate"
+
+    # Why 노드 대화 이력 윈도잉 (app/core/context_window.py)
+    CONTEXT_SUMMARY_ENABLED: bool = True       # False 면 예산 밖 메시지는 요약 없이 생략 표시만
+    CONTEXT_SUMMARY_CHUNK_MESSAGES: int = 8    # 롤링 요약에 한 번에 접어 넣는 메시지 수
+    CONTEXT_SUMMARY_CACHE_MAXSIZE: int = 1024  # 롤링 요약 LRU 캐시 항목 수
+    FREE_CONVERSATION_SUMMARY_IN_BACKGROUND: bool = True  # 자유 대화의 과거 요약을 응답 경로 밖에서 생성
+
+    # Redis 체크포인트 직렬화: "msgpack"(버전 헤더 + 선택 압축) 또는 "pickle"(기존 방식)
+    CHECKPOINT_SERIALIZER: str = "msgpack"
+    CHECKPOINT_COMPRESSION: Optional[str] = "zstd"  # "zstd" | "zlib" | "none"
+    CHECKPOINT_COMPRESS_MIN_BYTES: int = 1024       # 이 크기 이상일 때만 압축
+    # 기존 pickle 값 읽기 허용. pickle 은 임의 코드를 실행할 수 있으므로 기본은 거부하고,
+    # 배포 전환기에만 켰다가 기존 키가 SESSION_TTL_SECONDS 로 모두 만료되면 끌 것
+    CHECKPOINT_ACCEPT_LEGACY_PICKLE: bool = False
+
+    # 로깅 (app/core/log.py)
+    LOG_LEVEL: str = "INFO"                     # DEBUG 면 체크포인터/노드 프롬프트 등 상세 로그까지 출력
+    LOG_LEVELS: Dict[str, str] = {}             # 모듈별 레벨, 예: {"app.core.checkpointers": "DEBUG"}
+    LOG_FORMAT: str = "text"                    # "text" | "json"
+    LOG_SAMPLE_RATES: Dict[str, float] = {}     # 로거별 INFO 이하 샘플링 비율, 예: {"app.core.streaming": 0.01}
+
+    # 시작 워밍업 (app/core/warmup.py): "blocking" | "background" | "off"
+    STARTUP_WARMUP: str = "background"
+
+    # 디버그: 이벤트 루프를 임계값 이상 막는 콜백을 스택과 함께 출력 (app/core/loop_monitor.py)
+    DEBUG_LOOP_MONITOR: bool = False
+    LOOP_BLOCK_THRESHOLD_MS: int = 100
+
+    # 디버그: 턴 지연 분해(trace)를 MessageResponse.trace 로 반환 (app/core/tracing.py)
+    DEBUG_TRACE: bool = False                   # 모든 응답에 trace 포함
+    # 요청 헤더 X-Debug-Trace: 1 | chrome 로 요청별 활성화 허용. 내부 지연/스팬 속성/검색어가 노출되므로
+    # 기본은 끄고 개발·스테이징 등 환경 변수로 켠 환경에서만 사용
+    DEBUG_TRACE_HEADER_ENABLED: bool = False
+
+    # 웹 검색 (app/services/search_service.py)
+    SEARCH_API_BASE_URL: str = "https://api.tavily.com"
+    SEARCH_TIMEOUT_SECONDS: float = 10.0
+    SEARCH_MAX_CONNECTIONS: int = 20
+    SEARCH_CACHE_TTL_SECONDS: int = 3600
+    SEARCH_CACHE_MAXSIZE: int = 512
+    SEARCH_CACHE_REDIS: bool = False  # True 면 Redis 캐시 계층을 워커 간에 공유
+
+    # LLM 응답 캐시 (app/core/llm_cache.py): 결정적/저온도 호출 위치만 opt-in
+    LLM_CACHE_ENABLED: bool = False
+    LLM_CACHE_SITES: str = "focus,identify_assumptions,summarize_idea_motivation,moderator_summary"  # 쉼표 구분
+    LLM_CACHE_TTL_SECONDS: int = 86400
+    LLM_CACHE_MAXSIZE: int = 1024
+    LLM_CACHE_REDIS: bool = False  # True 면 Redis 캐시 계층을 워커 간에 공유
+
+    # LLM 호출 승인 계층 (app/core/llm_admission.py): 모델별 한도, 0 이하면 해당 요율 제한 없음
+    LLM_ADMISSION_ENABLED: bool = True
+    LLM_MAX_CONCURRENCY: int = 16
+    LLM_REQUESTS_PER_MINUTE: int = 500
+    LLM_TOKENS_PER_MINUTE: int = 200000
+    LLM_ESTIMATED_OUTPUT_TOKENS: int = 512  # 호출 전 토큰 차감 시 가정하는 응답 길이
+    # 모델별 덮어쓰기 (JSON), 예: {"gpt-4o-mini": {"concurrency": 32, "requests_per_minute": 1000, "tokens_per_minute": 400000}}
+    LLM_MODEL_LIMITS: Dict[str, Dict[str, int]] = {}
+
+    # 세션별 턴 직렬화 (app/core/turn_lock.py): 실행 중인 턴이 있을 때 "reject" | "queue" | "coalesce"
+    TURN_LOCK_MODE: str = "coalesce"
+    TURN_LOCK_REDIS: bool = False           # True 면 Redis lease 로 워커 간에도 직렬화
+    TURN_LOCK_LEASE_MS: int = 30000         # 실행 중에는 lease_ms/3 마다 연장
+    TURN_LOCK_WAIT_SECONDS: float = 120.0   # queue/coalesce 대기 한도 (초과 시 409)
+    TURN_LOCK_POLL_MS: int = 100            # 다른 워커의 lease 해제를 확인하는 주기
+    TURN_RESULT_TTL_SECONDS: int = 30       # coalesce 용으로 Redis 에 남기는 응답 보관 시간
+
+    # True 면 코디네이터의 포커스 결정 LLM 호출을 에이전트 노드와 병렬로 실행 (결과는 다음 턴에 사용)
+    COORDINATOR_SPECULATIVE_FOCUS: bool = False
+
     model_config = SettingsConfigDict(
         env_file='.env',
         env_file_encoding='utf-8',
@@ -20,7 +122,7 @@ class Settings(BaseSettings):
 
 @lru_cache()
 def get_settings() -> Settings:
-    print("애플리케이션 설정 로딩...")
+    logger.debug("애플리케이션 설정 로딩...")
     return Settings()
 
 # ✅ 요거 추가
@@ -0,0 +1,345 @@
+# backend/app/core/context_window.py
+"""
+Why 노드 공용 대화 이력 컨텍스트 빌더 (토큰 예산 기반 윈도잉).
+
+- 토큰 수는 로컬 토크나이저(tiktoken, cl100k_base)로 셉니다. 인코딩 파일을 불러올 수 없는 환경
+  (오프라인 등)에서는 문자 수 기반 근사치를 사용합니다.
+- 최신 메시지부터 노드별 예산(NODE_TOKEN_BUDGETS) 안에 들어가는 만큼 원문 그대로 두고,
+  그보다 오래된 메시지는 롤링 요약 한 단락으로 대체합니다.
+- 롤링 요약은 요약 대상 메시지 구간(prefix)의 해시를 키로 프로세스 내 LRU 캐시에 보관합니다.
+  구간은 CONTEXT_SUMMARY_CHUNK_MESSAGES 단위로만 늘어나므로 요약 LLM 호출은 몇 턴에 한 번, 작은 청크만 접어 넣습니다.
+  캐시에 이어 갈 요약이 없으면(새 워커, 재시작 등) 구간 전체를 한 번의 호출로 요약합니다.
+- 요약과 그 구간 길이는 상태의 older_history_summary / older_history_summary_upto 로 저장되고(HistoryContext.state_updates),
+  다음 턴에 build_node_history(state=...) 가 캐시에 다시 등록하므로 워커가 바뀌어도 요약을 처음부터 만들지 않습니다.
+- build_history_context() 는 프롬프트용 텍스트와 토큰 계정(HistoryContext)을 함께 반환합니다.
+- 백그라운드 요약(schedule_rolling_summary)의 결과는 응답에 실리지 않으므로 Redis 에도 저장해 두고
+  (SESSION_TTL_SECONDS), 다음 턴이 어느 워커에서 실행되든 load_shared_summary() 로 가져와 상태에 저장합니다.
+"""
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from cachetools import LRUCache
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from app.core.config import settings
+from app.core.log import get_logger, lazy
+from app.core.redis_pool import get_redis
+
+logger = get_logger(__name__)
+
+# 노드별 대화 이력 토큰 예산 (요약 포함). 목록에 없는 노드는 DEFAULT_TOKEN_BUDGET
+NODE_TOKEN_BUDGETS = {
+    "motivation_elicitation": 1500,
+    "identify_assumptions": 2000,
+    "probe_assumption": 1500,
+    "findings_summarization": 3000,
+}
+DEFAULT_TOKEN_BUDGET = 2000
+
+SUMMARY_BUDGET_SHARE = 0.25  # 오래된 메시지가 있을 때 요약 몫으로 떼어 두는 예산 비율
+
+_summary_cache: LRUCache = LRUCache(maxsize=settings.CONTEXT_SUMMARY_CACHE_MAXSIZE)
+SHARED_SUMMARY_PREFIX = "rolling_summary:"  # + prefix 해시 (백그라운드 요약 결과)
+
+
+# --- 토큰 계산 ---
+@lru_cache(maxsize=1)
+def _encoding():
+    """tiktoken 인코딩 (실패 시 None 을 캐시해 다시 시도하지 않음)"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("[ContextWindow] tiktoken 인코딩을 불러오지 못해 근사 토큰 수를 사용합니다: %s", e)
+        return None
+
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # 근사: ASCII 는 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 약 1토큰 (cl100k 기준 보수적 추정)
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+# --- 메시지 → 프롬프트 라인 ---
+def message_line(msg: Any) -> Optional[str]:
+    """메시지(BaseMessage 또는 직렬화된 dict)를 '- User: ...' 형식 한 줄로. 대상이 아니면 None"""
+    if isinstance(msg, HumanMessage):
+        role, content = "User", msg.content
+    elif isinstance(msg, AIMessage):
+        role, content = "Assistant", msg.content
+    elif isinstance(msg, dict):
+        msg_type = msg.get("type")
+        content = msg.get("content")
+        if msg_type == "human":
+            role = "User"
+        elif msg_type in ("ai", "assistant"):
+            role = "Assistant"
+        else:
+            return None
+    else:
+        return None
+    if content is None:
+        return None
+    return f"- {role}: {content}"
+
+
+def history_lines(messages: Sequence[Any]) -> List[str]:
+    return [line for line in (message_line(m) for m in messages or []) if line is not None]
+
+
+# --- 결과 ---
+@dataclass
+class HistoryContext:
+    text: str                  # 프롬프트에 넣을 대화 이력 (요약 + 최근 원문)
+    budget_tokens: int
+    total_tokens: int          # text 전체 토큰 수
+    verbatim_tokens: int       # 최근 원문 부분 토큰 수
+    summary_tokens: int        # 롤링 요약 부분 토큰 수
+    verbatim_messages: int
+    summarized_messages: int
+    full_history_tokens: int   # 윈도잉 없이 전체 이력을 넣었을 때의 토큰 수 (비교용)
+    summary: str = ""          # 롤링 요약 본문 (없으면 "")
+    summary_upto: int = 0      # summary 가 요약한 앞쪽 메시지 라인 수 (history_lines(messages)[:summary_upto])
+
+    def describe(self) -> str:
+        return (f"{self.total_tokens}/{self.budget_tokens} tokens "
+                f"(원문 {self.verbatim_messages}개 {self.verbatim_tokens}, "
+                f"요약 {self.summarized_messages}개 {self.summary_tokens}, 전체 이력이었다면 {self.full_history_tokens})")
+
+    def state_updates(self) -> Dict[str, Any]:
+        """다음 턴/다른 워커가 요약을 재사용하도록 상태에 저장할 값. 요약이 없으면 {}"""
+        if not self.summary:
+            return {}
+        return {'older_history_summary': self.summary, 'older_history_summary_upto': self.summary_upto}
+
+
+# --- 롤링 요약 ---
+def _prefix_key(lines: Sequence[str]) -> str:
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+async def _fold_into_summary(previous_summary: str, new_lines: Sequence[str]) -> str:
+    """이전 요약에 새로 밀려난 대화 몇 줄을 접어 넣은 요약 한 단락"""
+    # llm_provider 를 모듈 속성으로 조회 (테스트/부하 테스트에서 교체 가능)
+    from app.core import llm_provider
+
+    llm = llm_provider.get_fast_llm()
+    prompt = (
+        f"이전 요약:\n{previous_summary or '(없음)'}\n\n"
+        "이어진 대화:\n" + "\n".join(new_lines) + "\n\n"
+        "이전 요약과 이어진 대화를 합쳐 사용자의 아이디어, 동기, 주요 답변과 가정이 드러나도록 "
+        "한 단락(300자 이내)으로 다시 요약하세요."
+    )
+    response = await llm.ainvoke([
+        SystemMessage(content="당신은 대화 기록을 간결하게 요약하는 도우미입니다."),
+        HumanMessage(content=prompt),
+    ])
+    return str(getattr(response, "content", response)).strip()
+
+
+async def rolling_summary(lines: Sequence[str], chunk_size: int) -> str:
+    """
+    lines 전체를 요약. 캐시에 있는 가장 긴 청크 경계 prefix 요약에서 출발해
+    나머지를 chunk_size 줄씩 접어 넣고, 각 단계 결과를 캐시에 남깁니다.
+    이어 갈 prefix 요약이 없으면 청크로 나누지 않고 lines 전체를 한 번에 요약합니다.
+    """
+    if not lines:
+        return ""
+    cached = _summary_cache.get(_prefix_key(lines))
+    if cached is not None:
+        return cached
+
+    start, summary = 0, ""
+    boundary = ((len(lines) - 1) // chunk_size) * chunk_size
+    while boundary > 0:
+        hit = _summary_cache.get(_prefix_key(lines[:boundary]))
+        if hit is not None:
+            start, summary = boundary, hit
+            break
+        boundary -= chunk_size
+
+    if start == 0:
+        # 콜드 미스: 청크마다 순차 호출하지 않고 한 번에 요약 (이후 턴은 이 결과에서 청크 단위로 이어 감)
+        summary = await _fold_into_summary("", lines)
+        _summary_cache[_prefix_key(lines)] = summary
+        return summary
+
+    while start < len(lines):
+        end = min(start + chunk_size, len(lines))
+        summary = await _fold_into_summary(summary, lines[start:end])
+        _summary_cache[_prefix_key(lines[:end])] = summary
+        start = end
+    return summary
+
+
+def remember_summary(lines: Sequence[str], summary: str) -> None:
+    """다른 곳(예: 저장된 상태)에서 얻은 lines 구간 요약을 캐시에 등록"""
+    if lines and summary:
+        _summary_cache[_prefix_key(lines)] = summary
+
+
+def cached_summary_prefix(lines: Sequence[str], max_upto: int, chunk_size: int) -> Tuple[int, str]:
+    """max_upto 이하 청크 경계 중 캐시에 요약이 있는 가장 긴 구간 (upto, summary). 없으면 (0, "")"""
+    boundary = (min(max_upto, len(lines)) // chunk_size) * chunk_size
+    while boundary > 0:
+        hit = _summary_cache.get(_prefix_key(lines[:boundary]))
+        if hit is not None:
+            return boundary, hit
+        boundary -= chunk_size
+    return 0, ""
+
+
+_background_summaries: Dict[str, asyncio.Task] = {}
+
+
+def schedule_rolling_summary(lines: Sequence[str], chunk_size: int) -> None:
+    """rolling_summary 를 백그라운드 태스크로 실행 (같은 구간이 이미 진행 중이면 무시). 결과는 캐시로 전달"""
+    key = _prefix_key(lines)
+    if key in _summary_cache or key in _background_summaries:
+        return
+    lines = list(lines)
+
+    async def _run():
+        try:
+            summary = await rolling_summary(lines, chunk_size)
+        except Exception as e:
+            logger.error("[ContextWindow] 백그라운드 롤링 요약 실패: %s", e)
+            _background_summaries.pop(key, None)
+            return
+        try:
+            await get_redis().set(SHARED_SUMMARY_PREFIX + key, summary, ex=settings.SESSION_TTL_SECONDS)
+        except Exception as e:  # 이 워커의 캐시에는 남아 있으므로 같은 워커의 다음 턴은 사용 가능
+            logger.warning("[ContextWindow] 백그라운드 요약 공유 저장 실패: %s", e)
+        finally:
+            _background_summaries.pop(key, None)
+
+    _background_summaries[key] = asyncio.create_task(_run(), name="rolling-summary")
+
+
+async def load_shared_summary(lines: Sequence[str]) -> Optional[str]:
+    """lines 구간의 요약을 프로세스 캐시, 없으면 Redis(다른 워커의 백그라운드 요약 결과)에서 찾음. 없으면 None"""
+    key = _prefix_key(lines)
+    cached = _summary_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        raw = await get_redis().get(SHARED_SUMMARY_PREFIX + key)
+    except Exception as e:  # Redis 장애는 미스로 취급 (요약은 다시 예약됨)
+        logger.warning("[ContextWindow] 공유 요약 조회 실패: %s", e)
+        return None
+    if raw is None:
+        return None
+    summary = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+    _summary_cache[key] = summary
+    return summary
+
+
+async def wait_for_background_summaries() -> None:
+    """진행 중인 백그라운드 요약이 끝날 때까지 대기 (테스트/종료 훅)"""
+    while _background_summaries:
+        await asyncio.gather(*list(_background_summaries.values()), return_exceptions=True)
+
+
+# --- 컨텍스트 빌더 ---
+def node_budget(node_name: str) -> int:
+    return NODE_TOKEN_BUDGETS.get(node_name, DEFAULT_TOKEN_BUDGET)
+
+
+async def build_history_context(
+    messages: Sequence[Any],
+    budget_tokens: int,
+    empty_text: str = "",
+    summarize: Optional[bool] = None,
+    stored_summary: Optional[Tuple[int, str]] = None,
+) -> HistoryContext:
+    """
+    messages 를 budget_tokens 안에 맞춘 대화 이력 텍스트로 만듭니다.
+    최신 메시지는 원문 그대로(최소 1개), 예산을 넘는 오래된 메시지는 롤링 요약으로 대체합니다.
+    summarize=False(또는 CONTEXT_SUMMARY_ENABLED=False)면 요약 대신 생략 개수만 표시합니다.
+    stored_summary=(upto, summary) 는 상태에 저장돼 있던 history_lines(messages)[:upto] 의 요약으로, 캐시에 먼저 등록합니다.
+    """
+    summarize = settings.CONTEXT_SUMMARY_ENABLED if summarize is None else summarize
+    chunk_size = max(settings.CONTEXT_SUMMARY_CHUNK_MESSAGES, 1)
+    lines = history_lines(messages)
+    line_tokens = [count_tokens(line) + 1 for line in lines]  # +1: 줄바꿈
+    full_tokens = sum(line_tokens)
+    if stored_summary is not None:
+        stored_upto, stored_text = stored_summary
+        if stored_text and 0 < stored_upto <= len(lines):
+            remember_summary(lines[:stored_upto], stored_text)
+
+    if not lines:
+        return HistoryContext(empty_text, budget_tokens, count_tokens(empty_text), 0, 0, 0, 0, 0)
+    if full_tokens <= budget_tokens:
+        text = "\n".join(lines)
+        return HistoryContext(text, budget_tokens, full_tokens, full_tokens, 0, len(lines), 0, full_tokens)
+
+    # 요약 몫을 떼어 두고, 최신 메시지부터 남은 예산만큼 원문 유지
+    verbatim_budget = budget_tokens - int(budget_tokens * SUMMARY_BUDGET_SHARE)
+    cut, used = len(lines) - 1, line_tokens[-1]
+    while cut > 0 and used + line_tokens[cut - 1] <= verbatim_budget:
+        cut -= 1
+        used += line_tokens[cut]
+    # 요약 구간은 청크 경계로만 늘려 매 턴 요약 호출이 생기지 않게 함 (최신 메시지 하나는 항상 원문)
+    cut = min(-(-cut // chunk_size) * chunk_size, len(lines) - 1)
+
+    older, recent = lines[:cut], lines[cut:]
+    if summarize:
+        try:
+            summary_text = await rolling_summary(older, chunk_size)
+        except Exception as e:
+            logger.error("[ContextWindow] 롤링 요약 실패, 생략 표시로 대체: %s", e)
+            summary_text = ""
+    else:
+        summary_text = ""
+    header = (f"[이전 대화 요약 ({len(older)}개 메시지)]\n{summary_text}" if summary_text
+              else f"[이전 대화 {len(older)}개 메시지 생략]")
+    recent_text = "\n".join(recent)
+    text = f"{header}\n\n[최근 대화]\n{recent_text}"
+
+    summary_tokens = count_tokens(header)
+    verbatim_tokens = count_tokens(recent_text)
+    return HistoryContext(
+        text=text,
+        budget_tokens=budget_tokens,
+        total_tokens=count_tokens(text),
+        verbatim_tokens=verbatim_tokens,
+        summary_tokens=summary_tokens,
+        verbatim_messages=len(recent),
+        summarized_messages=len(older),
+        full_history_tokens=full_tokens,
+        summary=summary_text,
+        summary_upto=len(older) if summary_text else 0,
+    )
+
+
+async def build_node_history(
+    node_name: str,
+    messages: Sequence[Any],
+    empty_text: str = "",
+    state: Optional[Dict[str, Any]] = None,
+) -> HistoryContext:
+    """
+    노드 이름의 예산으로 build_history_context 를 호출하고 토큰 계정을 로그로 남김.
+    state 를 넘기면 저장된 older_history_summary 를 재사용합니다 (messages 가 state['messages'] 와 같은 이력일 때만).
+    """
+    stored_summary = None
+    if state is not None:
+        stored_summary = (state.get('older_history_summary_upto') or 0, state.get('older_history_summary') or "")
+    context = await build_history_context(
+        messages, node_budget(node_name), empty_text=empty_text, stored_summary=stored_summary,
+    )
+    logger.debug("[ContextWindow] %s: %s", node_name, lazy(context.describe))
+    return context
@@ -1,54 +1,132 @@
 # backend/app/core/flush_manager.py (새 파일 만들자)
 
+from typing import Dict, List, Tuple
+
 from app.db.models import GraphStateRecord, MessageRecord
 from app.db.session import get_db_session_async
-from app.core.session_store import r  # redis.from_url(...)
-from sqlalchemy import select
+from app.db.dialect import insert_ignore_conflicts, upsert_rows
+from app.core.message_log import push_messages
+from app.core.redis_pool import get_redis, transaction
+from app.core.session_store import refresh_session_ttl
+from langchain_core.messages import AIMessage, HumanMessage
+from sqlalchemy import func, select
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+# 이미 PostgreSQL에 저장된 메시지 수 (high-water mark). 다음 flush는 이 위치부터 저장
+FLUSH_HWM_KEY_PREFIX = "flush_hwm:"
+
+
+def _to_sender_content(msg):
+    """메시지(dict 또는 메시지 객체)를 (sender, content)로. 저장 대상이 아니면 None"""
+    if isinstance(msg, dict):
+        return msg.get("sender", "bot"), msg.get("content", "")  # 'user' or 'bot'
+    if isinstance(msg, HumanMessage):
+        return "user", msg.content
+    if isinstance(msg, AIMessage):
+        return "bot", msg.content
+    return None
+
+
+async def _get_flushed_counts(db, session_ids: List[str]) -> Dict[str, int]:
+    """세션별 high-water mark 를 MGET 한 번으로 읽음"""
+    raws = await get_redis().mget([FLUSH_HWM_KEY_PREFIX + session_id for session_id in session_ids])
+    return {
+        session_id: int(raw) if raw is not None else await _recover_flushed_count(db, session_id)
+        for session_id, raw in zip(session_ids, raws)
+    }
+
+
+async def _recover_flushed_count(db, session_id: str) -> int:
+    # Redis에 기록이 없으면(만료/재시작) DB의 마지막 seq 기준으로 복구
+    result = await db.execute(
+        select(func.max(MessageRecord.seq)).where(MessageRecord.thread_id == session_id)
+    )
+    max_seq = result.scalar()
+    return 0 if max_seq is None else max_seq + 1
+
+
+async def get_flushed_count(db, session_id: str) -> int:
+    """저장된 메시지 수 (high-water mark). 새 메시지가 flush 될 때마다 바뀌므로 메시지 목록의 버전으로 사용"""
+    return (await _get_flushed_counts(db, [session_id]))[session_id]
+
 
 async def flush_session_to_postgres(session_id: str, memory_state: dict, messages: list):
-    """Redis MemorySaver 데이터를 PostgreSQL에 저장"""
+    """Redis MemorySaver 데이터를 PostgreSQL에 저장 (메시지는 지난 flush 이후 추가분만)"""
+    await flush_sessions_to_postgres({session_id: (memory_state, messages)})
+
+
+async def flush_sessions_to_postgres(sessions: Dict[str, Tuple[dict, list]]):
+    """
+    여러 세션을 한 트랜잭션으로 저장: GraphState 는 upsert 한 문장, 새 메시지는 INSERT 한 문장.
+    성공하면 각 세션의 flush 실패 표시도 함께 지웁니다 (clear_flush_failed 를 따로 부를 필요 없음).
+    """
+    if not sessions:
+        return
     async with get_db_session_async() as db:
-        # GraphState 저장
-        result = await db.execute(
-            select(GraphStateRecord).where(GraphStateRecord.thread_id == session_id)
+        # GraphState 저장 (ON CONFLICT DO UPDATE)
+        await upsert_rows(
+            db,
+            GraphStateRecord.__table__,
+            [{"thread_id": session_id, "state_json": memory_state} for session_id, (memory_state, _) in sessions.items()],
+            index_elements=["thread_id"],
+            update_columns=["state_json"],
         )
-        record = result.scalar_one_or_none()
-
-        if record:
-            record.state_json = memory_state
-        else:
-            record = GraphStateRecord(thread_id=session_id, state_json=memory_state)
-            db.add(record)
-
-        # Messages 저장
-        for msg in messages:
-            if isinstance(msg, dict):
-                sender = msg.get("sender", "bot")  # 'user' or 'bot'
-                content = msg.get("content", "")
-            else:
-                # 메시지 객체가 아니라 dict라면 패스하거나 raise
-                continue
-
-            message_record = MessageRecord(
-                thread_id=session_id,
-                sender=sender,
-                content=content
-            )
-            db.add(message_record)
+
+        # Messages 저장: 새 메시지만 한 번의 INSERT ... VALUES 로.
+        # seq 는 대화 내 위치이므로 재시도(retry_failed_flush)로 같은 메시지가 다시 와도 충돌 → 무시됨
+        rows = []
+        new_counts = {}
+        new_rows: Dict[str, List[dict]] = {}
+        flushed_counts = await _get_flushed_counts(db, list(sessions))
+        for session_id, (_, messages) in sessions.items():
+            flushed = flushed_counts[session_id]
+            session_rows = new_rows.setdefault(session_id, [])
+            for seq in range(flushed, len(messages)):
+                sender_content = _to_sender_content(messages[seq])
+                if sender_content is None:
+                    continue
+                sender, content = sender_content
+                session_rows.append({"thread_id": session_id, "seq": seq, "sender": sender, "content": content})
+            rows += session_rows
+            if len(messages) > flushed:
+                new_counts[session_id] = len(messages)
+        await insert_ignore_conflicts(db, MessageRecord.__table__, rows, index_elements=["thread_id", "seq"])
 
         await db.commit()
-        print(f"[flush 성공] session_id={session_id}")  # ✅ 커밋 후 위치가 맞음
+        # 턴 마무리 Redis 작업 (HWM 갱신, 메시지 로그 추가, flush 실패 표시 해제, 세션 TTL 연장) 을 한 번의 왕복으로
+        # HWM 과 메시지 로그가 같은 MULTI/EXEC 안에서 바뀌므로 HWM 을 메시지 목록의 버전(ETag)으로 쓸 수 있음
+        async with transaction(get_redis()) as pipe:
+            for session_id in sessions:
+                if session_id in new_counts:
+                    pipe.set(FLUSH_HWM_KEY_PREFIX + session_id, new_counts[session_id], ex=86400)
+                    push_messages(pipe, session_id, new_rows[session_id], from_start=flushed_counts[session_id] == 0)
+                pipe.delete(FAILED_FLUSH_KEY_PREFIX + session_id)
+                refresh_session_ttl(pipe, session_id)
+        logger.info("[flush 성공] 세션 %s개, 새 메시지 %s건", len(sessions), len(rows))  # ✅ 커밋 후 위치가 맞음
 
 FAILED_FLUSH_KEY_PREFIX = "flush_failed:"
 
 async def mark_flush_failed(session_id: str):
     key = FAILED_FLUSH_KEY_PREFIX + session_id
-    await r.set(key, "1", ex=86400)  # 1일 보존
+    await get_redis().set(key, "1", ex=86400)  # 1일 보존
 
 async def clear_flush_failed(session_id: str):
     key = FAILED_FLUSH_KEY_PREFIX + session_id
-    await r.delete(key)
+    await get_redis().delete(key)
 
 async def has_flush_failed(session_id: str) -> bool:
     key = FAILED_FLUSH_KEY_PREFIX + session_id
-    return await r.exists(key) > 0
\ No newline at end of file
+    return await get_redis().exists(key) > 0
+
+
+async def filter_flush_failed(session_ids: List[str]) -> List[str]:
+    """session_ids 중 flush 실패 표시가 있는 세션만 (EXISTS 를 파이프라인 한 번으로)"""
+    if not session_ids:
+        return []
+    async with get_redis().pipeline(transaction=False) as pipe:
+        for session_id in session_ids:
+            pipe.exists(FAILED_FLUSH_KEY_PREFIX + session_id)
+        flags = await pipe.execute()
+    return [session_id for session_id, flag in zip(session_ids, flags) if flag]
\ No newline at end of file
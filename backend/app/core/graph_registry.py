@@ -0,0 +1,106 @@
+# backend/app/core/graph_registry.py
+"""
+GraphRegistry: 토론 그래프(app_graph), Why 그래프(why_graph)와 체크포인터를 프로세스당 한 번만 만들어 재사용합니다.
+
+두 그래프 모두 Redis(핫, TTL) + SQL(콜드) CombinedCheckpointer를 공유하므로 워커 프로세스에
+세션 상태가 쌓이지 않고, 어느 워커가 다음 요청을 받아도 같은 상태를 이어서 사용합니다.
+
+FastAPI lifespan 훅에서 init_graph_registry()로 생성하고 종료 시 close_graph_registry()로 정리합니다.
+lifespan 없이 실행되는 경우(스크립트, TestClient 등)에는 첫 호출 시 지연 생성됩니다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from app.core.config import settings
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+if TYPE_CHECKING:  # 체크포인터/langgraph 모듈은 그래프를 만들 때 임포트 (app 임포트 시간 단축)
+    from app.core.checkpointers import CombinedCheckpointer
+    from app.core.redis_checkpointer import RedisCheckpointer
+    from app.core.sql_checkpointer import SQLCheckpointer
+    from app.core.write_behind import SQLWriteBehindQueue
+
+
+@dataclass
+class GraphRegistry:
+    """프로세스 전역에서 공유되는 그래프/체크포인터 묶음"""
+    redis_cp: RedisCheckpointer
+    sql_cp: SQLCheckpointer
+    checkpointer: CombinedCheckpointer
+    app_graph: Any
+    write_behind: Optional[SQLWriteBehindQueue] = None
+    why_graph: Any = None
+
+    async def aclose(self) -> None:
+        if self.write_behind is not None:
+            # 종료 전에 대기 중인 SQL 저장을 모두 반영
+            await self.write_behind.drain()
+        await self.redis_cp.aclose()
+
+
+_registry: Optional[GraphRegistry] = None
+
+
+def build_graph_registry() -> GraphRegistry:
+    """체크포인터를 만들고 토론/Why 그래프를 컴파일합니다. (요청마다 호출하지 말 것)"""
+    # orchestration이 이 모듈을 임포트하므로 순환 임포트를 피하기 위해 지연 임포트
+    from app.core.orchestration import workflow
+    from app.core.why_orchestration import why_workflow
+    from app.core.checkpointers import CombinedCheckpointer
+    from app.core.redis_checkpointer import RedisCheckpointer
+    from app.core.sql_checkpointer import SQLCheckpointer
+    from app.core.write_behind import SQLWriteBehindQueue
+    from app.core.redis_pool import get_redis
+    from app.db.session import async_session_factory
+
+    redis_cp = RedisCheckpointer(client=get_redis(), ttl=settings.SESSION_TTL_SECONDS)
+    sql_cp = SQLCheckpointer(async_session_factory)
+    write_behind = None
+    if settings.CHECKPOINT_WRITE_BEHIND:
+        write_behind = SQLWriteBehindQueue(
+            sql_cp,
+            flush_interval_ms=settings.CHECKPOINT_FLUSH_INTERVAL_MS,
+            max_lag_ms=settings.CHECKPOINT_MAX_LAG_MS,
+            max_pending=settings.CHECKPOINT_QUEUE_MAXSIZE,
+            batch_size=settings.CHECKPOINT_FLUSH_BATCH_SIZE,
+        )
+    cp = CombinedCheckpointer(redis_cp, sql_cp, write_behind=write_behind)
+    return GraphRegistry(
+        redis_cp=redis_cp,
+        sql_cp=sql_cp,
+        checkpointer=cp,
+        app_graph=workflow.compile(checkpointer=cp),
+        write_behind=write_behind,
+        why_graph=why_workflow.compile(checkpointer=cp),
+    )
+
+
+async def init_graph_registry() -> GraphRegistry:
+    """lifespan 시작 시 호출. 이미 생성되어 있으면 그대로 반환합니다."""
+    global _registry
+    if _registry is None:
+        _registry = build_graph_registry()
+        if _registry.write_behind is not None:
+            _registry.write_behind.start()
+        logger.info("[GraphRegistry] 토론/Why 그래프 컴파일 및 체크포인터 생성 완료")
+    return _registry
+
+
+async def get_graph_registry() -> GraphRegistry:
+    """공유 레지스트리 반환 (FastAPI Depends로도 사용 가능)"""
+    if _registry is None:
+        return await init_graph_registry()
+    return _registry
+
+
+async def close_graph_registry() -> None:
+    """lifespan 종료 시 호출. write-behind 큐를 비웁니다. (공유 Redis 연결 풀은 close_redis_pool() 이 닫음)"""
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+        _registry = None
+        logger.info("[GraphRegistry] 리소스 정리 완료")
@@ -0,0 +1,244 @@
+# backend/app/core/llm_admission.py
+"""
+LLM 호출 승인(admission) 계층: 모든 세션이 보내는 LLM 요청을 모델별로 제한하고 공정하게 순서를 정합니다.
+
+- 모델별 동시 요청 수(semaphore 역할)와 분당 요청 수/분당 토큰 수(token bucket)를 제한합니다.
+  한도는 LLM_MAX_CONCURRENCY / LLM_REQUESTS_PER_MINUTE / LLM_TOKENS_PER_MINUTE, 모델별 덮어쓰기는 LLM_MODEL_LIMITS.
+- 대기 중인 호출은 세션(LangGraph thread_id)별 큐에 들어가고, 세션 사이를 라운드 로빈으로 돌며
+  승인하므로 요청을 많이 보내는 세션 하나가 다른 세션을 굶기지 않습니다.
+- 토큰 수는 호출 전에 프롬프트 토큰 + LLM_ESTIMATED_OUTPUT_TOKENS 로 추정해 차감하고,
+  응답에 usage_metadata 가 있으면 실제 사용량으로 정산합니다.
+- 모델별 대기 시간(queue wait)은 /metrics 의 LLM_QUEUE_WAIT 히스토그램과 ModelLimiter.stats 의 합계/최대로 쌓입니다.
+- llm_provider 의 get_*_llm() 이 AdmittedChatModel 로 감싸 돌려줍니다 (ainvoke 와 with_structured_output 경로).
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from langchain_core.messages import convert_to_messages
+from langchain_core.runnables.config import ensure_config
+
+from app.core.config import settings
+from app.core.metrics import LLM_QUEUE_WAIT
+from app.core.tracing import span
+
+DEFAULT_SESSION = "_default"
+
+
+class TokenBucket:
+    """분당 한도(per_minute)만큼 차 있다가 초당 per_minute/60 씩 다시 차는 버킷. per_minute<=0 이면 무제한"""
+
+    def __init__(self, per_minute: int, clock=time.monotonic):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.clock = clock
+        self.level = self.capacity
+        self.updated = clock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """amount 를 차감할 수 있을 때까지 남은 초 (한 번에 capacity 보다 큰 요청은 가득 찼을 때 허용)"""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        needed = min(amount, self.capacity)
+        return 0.0 if self.level >= needed else (needed - self.level) / self.rate
+
+    def consume(self, amount: float) -> None:
+        if not self.unlimited:
+            self._refill()
+            self.level -= amount  # 정산으로 음수가 될 수 있음 (그만큼 다음 승인이 늦어짐)
+
+
+class _Waiter:
+    __slots__ = ("session", "tokens", "future", "enqueued")
+
+    def __init__(self, session: str, tokens: int, future: asyncio.Future):
+        self.session = session
+        self.tokens = tokens
+        self.future = future
+        self.enqueued = time.monotonic()
+
+
+class ModelLimiter:
+    """모델 하나의 동시성/요청률/토큰률 제한과 세션 간 라운드 로빈 대기열"""
+
+    def __init__(self, model: str, max_concurrency: int, requests_per_minute: int, tokens_per_minute: int):
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.in_flight = 0
+        self._queues: Dict[str, Deque[_Waiter]] = {}
+        self._ready: Deque[str] = deque()  # 대기 중인 요청이 있는 세션들 (라운드 로빈 순서)
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.stats: Dict[str, Any] = {
+            "admitted": 0,
+            "waiting": 0,
+            "queue_wait_ms_sum": 0.0,
+            "queue_wait_ms_max": 0.0,
+        }
+
+    async def acquire(self, session: str, tokens: int) -> None:
+        waiter = _Waiter(session, tokens, asyncio.get_running_loop().create_future())
+        if session not in self._queues:
+            self._queues[session] = deque()
+            self._ready.append(session)
+        self._queues[session].append(waiter)
+        self.stats["waiting"] += 1
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release()  # 승인 직후 취소된 경우 슬롯 반환
+            else:
+                self._remove(waiter)
+            raise
+
+    def release(self, estimated_tokens: int = 0, actual_tokens: Optional[int] = None) -> None:
+        self.in_flight -= 1
+        if actual_tokens is not None:
+            self.tokens.consume(actual_tokens - estimated_tokens)
+        self._dispatch()
+
+    def _remove(self, waiter: _Waiter) -> None:
+        queue = self._queues.get(waiter.session)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            self.stats["waiting"] -= 1
+            if not queue:
+                del self._queues[waiter.session]
+                self._ready.remove(waiter.session)
+
+    def _dispatch(self) -> None:
+        while self.in_flight < self.max_concurrency and self._ready:
+            session = self._ready[0]
+            waiter = self._queues[session][0]
+            wait = max(self.requests.delay(1), self.tokens.delay(waiter.tokens))
+            if wait > 0:
+                self._schedule(wait)
+                return
+            # 이 세션의 요청 하나를 꺼내고 세션을 라운드 로빈 순서의 맨 뒤로
+            self._queues[session].popleft()
+            self._ready.popleft()
+            if self._queues[session]:
+                self._ready.append(session)
+            else:
+                del self._queues[session]
+            if waiter.future.done():  # 대기 중 취소됨
+                self.stats["waiting"] -= 1
+                continue
+            self.requests.consume(1)
+            self.tokens.consume(waiter.tokens)
+            self.in_flight += 1
+            self._record_wait(waiter)
+            waiter.future.set_result(None)
+
+    def _schedule(self, delay: float) -> None:
+        if self._timer is not None:
+            return
+        loop = asyncio.get_running_loop()
+
+        def _wake():
+            self._timer = None
+            self._dispatch()
+
+        self._timer = loop.call_later(delay, _wake)
+
+    def _record_wait(self, waiter: _Waiter) -> None:
+        waited_ms = (time.monotonic() - waiter.enqueued) * 1000
+        stats = self.stats
+        stats["admitted"] += 1
+        stats["waiting"] -= 1
+        stats["queue_wait_ms_sum"] += waited_ms
+        stats["queue_wait_ms_max"] = max(stats["queue_wait_ms_max"], waited_ms)
+        LLM_QUEUE_WAIT.observe(waited_ms / 1000, model=self.model)
+
+
+def current_session() -> str:
+    """실행 중인 LangGraph 호출의 thread_id (노드 안에서의 LLM 호출은 config 를 contextvar 로 물려받음)"""
+    configurable = ensure_config().get("configurable") or {}
+    return str(configurable.get("thread_id") or DEFAULT_SESSION)
+
+
+def estimate_tokens(messages: Any) -> int:
+    from app.core.context_window import count_tokens
+
+    try:
+        prompt = sum(count_tokens(str(m.content)) for m in convert_to_messages(messages))
+    except Exception:
+        prompt = count_tokens(str(messages))
+    return prompt + settings.LLM_ESTIMATED_OUTPUT_TOKENS
+
+
+def _actual_tokens(output: Any) -> Optional[int]:
+    usage = getattr(output, "usage_metadata", None)
+    if isinstance(usage, dict) and usage.get("total_tokens"):
+        return int(usage["total_tokens"])
+    return None
+
+
+class AdmittedChatModel:
+    """채팅 모델 래퍼: ainvoke 를 모델별 ModelLimiter 의 승인을 받은 뒤 실행하고 그 밖의 속성은 원래 모델에 위임"""
+
+    def __init__(self, llm: Any, limiter: ModelLimiter, structured: Any = None):
+        self._llm = llm
+        self._runnable = structured or llm
+        self.limiter = limiter
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> "AdmittedChatModel":
+        return AdmittedChatModel(self._llm, self.limiter, structured=self._llm.with_structured_output(schema, **kwargs))
+
+    async def ainvoke(self, messages: Any, config: Any = None, **kwargs: Any) -> Any:
+        estimated = estimate_tokens(messages)
+        with span(self.limiter.model, "llm_queue"):
+            await self.limiter.acquire(current_session(), estimated)
+        actual = None
+        try:
+            output = await self._runnable.ainvoke(messages, config, **kwargs)
+            actual = _actual_tokens(output)
+            return output
+        finally:
+            self.limiter.release(estimated, actual)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._runnable, name)
+
+
+_limiters: Dict[str, ModelLimiter] = {}
+
+
+def get_limiter(model: str) -> ModelLimiter:
+    limiter = _limiters.get(model)
+    if limiter is None:
+        overrides = settings.LLM_MODEL_LIMITS.get(model, {})
+        limiter = ModelLimiter(
+            model,
+            max_concurrency=overrides.get("concurrency", settings.LLM_MAX_CONCURRENCY),
+            requests_per_minute=overrides.get("requests_per_minute", settings.LLM_REQUESTS_PER_MINUTE),
+            tokens_per_minute=overrides.get("tokens_per_minute", settings.LLM_TOKENS_PER_MINUTE),
+        )
+        _limiters[model] = limiter
+    return limiter
+
+
+def admission_stats() -> Dict[str, Dict[str, Any]]:
+    """모델별 승인/대기 통계"""
+    return {model: {**limiter.stats, "in_flight": limiter.in_flight} for model, limiter in _limiters.items()}
+
+
+def admitted(llm: Any, model: str) -> Any:
+    """LLM_ADMISSION_ENABLED 면 모델 이름별 ModelLimiter 를 거치는 래퍼로 감싸서 반환"""
+    if not settings.LLM_ADMISSION_ENABLED:
+        return llm
+    return AdmittedChatModel(llm, get_limiter(model))
@@ -0,0 +1,176 @@
+# backend/app/core/llm_cache.py
+"""
+LLM 응답 캐시: 입력이 같으면 결과도 사실상 같은(저온도/결정적) 호출의 응답을 재사용합니다.
+
+- 키: 모델, temperature, 메시지(type/content), 구조화 출력 스키마의 SHA-256 해시.
+- 계층: 프로세스 메모리 TTL + LRU → 선택적으로 Redis (워커 간 공유, TTL).
+- 호출 위치(call site)별로 켜고 끕니다 (settings.LLM_CACHE_ENABLED + LLM_CACHE_SITES).
+  llm_provider 의 get_*_llm(cache_site=...) 가 켜진 위치에만 CachedChatModel 을 돌려줍니다.
+- 위치별 hit/miss 통계는 LLMResponseCache.stats 에 쌓이고 /metrics 의 llm_cache_lookups_total 로 노출됩니다.
+- 캐시된 것은 ainvoke/invoke 결과뿐이며 스트리밍(astream 등)은 그대로 원래 모델로 전달됩니다.
+"""
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+from langchain_core.messages import AIMessage, convert_to_messages
+
+from app.core.config import settings
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+LLM_CACHE_PREFIX = "llm_cache:"
+
+
+def _model_identity(llm: Any) -> Dict[str, Any]:
+    return {
+        "model": getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__,
+        "temperature": getattr(llm, "temperature", None),
+    }
+
+
+def _schema_identity(schema: Any) -> Optional[Dict[str, Any]]:
+    if schema is None:
+        return None
+    if hasattr(schema, "model_json_schema"):
+        return {"name": schema.__name__, "schema": schema.model_json_schema()}
+    return {"name": getattr(schema, "__name__", None), "schema": schema if isinstance(schema, dict) else repr(schema)}
+
+
+def cache_key(llm: Any, messages: Any, schema: Any = None) -> str:
+    """모델/temperature/메시지/스키마로 만든 캐시 키"""
+    payload = {
+        **_model_identity(llm),
+        "messages": [{"type": m.type, "content": m.content} for m in convert_to_messages(messages)],
+        "schema": _schema_identity(schema),
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    def __init__(self, maxsize: int = 1024, ttl_seconds: int = 86400, redis_client=None):
+        self.ttl_seconds = ttl_seconds
+        self.redis = redis_client  # None 이면 프로세스 메모리 캐시만 사용
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _site_stats(self, site: str) -> Dict[str, int]:
+        return self.stats.setdefault(site, {"memory_hits": 0, "redis_hits": 0, "misses": 0, "errors": 0})
+
+    async def get(self, site: str, key: str) -> Optional[Any]:
+        stats = self._site_stats(site)
+        value = self._cache.get(key)
+        if value is not None:
+            stats["memory_hits"] += 1
+            return value
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(LLM_CACHE_PREFIX + key)
+                if raw is not None:
+                    value = json.loads(raw)
+                    self._cache[key] = value
+                    stats["redis_hits"] += 1
+                    return value
+            except Exception as e:  # Redis 장애는 캐시 미스로 취급
+                stats["errors"] += 1
+                logger.warning("[LLMCache] Redis 캐시 조회 실패 (%s): %s", site, e)
+        stats["misses"] += 1
+        return None
+
+    async def set(self, site: str, key: str, value: Any) -> None:
+        self._cache[key] = value
+        if self.redis is not None:
+            try:
+                await self.redis.set(LLM_CACHE_PREFIX + key, json.dumps(value, ensure_ascii=False), ex=self.ttl_seconds)
+            except Exception as e:
+                self._site_stats(site)["errors"] += 1
+                logger.warning("[LLMCache] Redis 캐시 저장 실패 (%s): %s", site, e)
+
+
+class CachedChatModel:
+    """채팅 모델 래퍼: ainvoke/invoke 결과를 캐시하고 그 밖의 속성은 원래 모델에 위임"""
+
+    def __init__(self, llm: Any, site: str, cache: LLMResponseCache, schema: Any = None, structured: Any = None):
+        self._llm = llm                # 키 계산용 원래 모델 (model_name/temperature)
+        self._runnable = structured or llm
+        self._schema = schema
+        self.site = site
+        self.cache = cache
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> "CachedChatModel":
+        return CachedChatModel(self._llm, self.site, self.cache, schema=schema,
+                               structured=self._llm.with_structured_output(schema, **kwargs))
+
+    def _encode(self, output: Any) -> Any:
+        if self._schema is None:
+            return {"content": output.content}
+        if hasattr(output, "model_dump"):
+            return output.model_dump(mode="json")
+        return output
+
+    def _decode(self, value: Any) -> Any:
+        if self._schema is None:
+            return AIMessage(content=value["content"])
+        if hasattr(self._schema, "model_validate"):
+            return self._schema.model_validate(value)
+        return value
+
+    async def ainvoke(self, messages: Any, config: Any = None, **kwargs: Any) -> Any:
+        key = cache_key(self._llm, messages, self._schema)
+        cached = await self.cache.get(self.site, key)
+        if cached is not None:
+            return self._decode(cached)
+        output = await self._runnable.ainvoke(messages, config, **kwargs)
+        await self.cache.set(self.site, key, self._encode(output))
+        return output
+
+    def invoke(self, messages: Any, config: Any = None, **kwargs: Any) -> Any:
+        # 동기 경로는 메모리 계층만 사용
+        key = cache_key(self._llm, messages, self._schema)
+        stats = self.cache._site_stats(self.site)
+        cached = self.cache._cache.get(key)
+        if cached is not None:
+            stats["memory_hits"] += 1
+            return self._decode(cached)
+        stats["misses"] += 1
+        output = self._runnable.invoke(messages, config, **kwargs)
+        self.cache._cache[key] = self._encode(output)
+        return output
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._runnable, name)
+
+
+def enabled_sites() -> frozenset:
+    if not settings.LLM_CACHE_ENABLED:
+        return frozenset()
+    return frozenset(site.strip() for site in settings.LLM_CACHE_SITES.split(",") if site.strip())
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """공유 LLMResponseCache (LLM_CACHE_REDIS 면 Redis 계층 포함)"""
+    global _llm_cache
+    if _llm_cache is None:
+        redis_client = None
+        if settings.LLM_CACHE_REDIS:
+            from app.core.redis_pool import get_redis
+            redis_client = get_redis()
+        _llm_cache = LLMResponseCache(
+            maxsize=settings.LLM_CACHE_MAXSIZE,
+            ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+            redis_client=redis_client,
+        )
+    return _llm_cache
+
+
+def maybe_cached(llm: Any, site: Optional[str]) -> Any:
+    """site 가 캐시 대상이면 CachedChatModel 로 감싸고, 아니면 그대로 반환"""
+    if site is None or site not in enabled_sites():
+        return llm
+    return CachedChatModel(llm, site, get_llm_cache())
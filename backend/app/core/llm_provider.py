@@ -1,10 +1,16 @@
 # backend/app/core/llm_provider.py
-# from langchain_google_genai import ChatGoogleGenerativeAI # 필요시 유지
-from langchain_openai import ChatOpenAI # OpenAI 클라이언트 임포트
-# from langchain_anthropic import ChatAnthropic
+# 제공자 SDK(langchain_openai 등)는 임포트가 무거우므로 클라이언트를 처음 만들 때 임포트 (앱 시작 시간 단축)
+import time
 from functools import lru_cache
 from .config import get_settings
+from .llm_admission import admitted
+from .llm_cache import maybe_cached
+from .metrics import LLM_ERRORS, LLM_LATENCY, LLM_TOKENS
+from .tracing import span
 from typing import TypedDict, Dict, Any, Optional
+from .log import get_logger
+
+logger = get_logger(__name__)
 
 settings = get_settings()
 
@@ -16,7 +22,7 @@ class WhyGraphState(TypedDict, total=False):
 @lru_cache()
 def get_llm_client(provider: str = "openai", model_name: str = "gpt-4o", temperature: float = 0.7): # 기본 provider/model 변경
     """지정된 제공자와 모델명으로 LLM 클라이언트를 생성하여 반환"""
-    print(f"LLM 클라이언트 요청: Provider={provider}, Model={model_name}, Temp={temperature}")
+    logger.debug("LLM 클라이언트 요청: Provider=%s, Model=%s, Temp=%s", provider, model_name, temperature)
 
     if provider == "google":
         if not settings.GEMINI_API_KEY:
@@ -30,18 +36,19 @@ def get_llm_client(provider: str = "openai", model_name: str = "gpt-4o", tempera
                 temperature=temperature,
             )
         except Exception as e:
-            print(f"Gemini 클라이언트 ({model_name}) 생성 실패: {e}")
+            logger.error("Gemini 클라이언트 (%s) 생성 실패: %s", model_name, e)
             raise
 
     elif provider == "openai":
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
         try:
+            from langchain_openai import ChatOpenAI # 함수 내에서 임포트
             # 사용자가 제공한 OpenAI 모델명 사용 가능
             # 예: "gpt-4o", "gpt-4o-mini", "gpt-4-turbo" 등
             return ChatOpenAI(model=model_name, api_key=settings.OPENAI_API_KEY, temperature=temperature, streaming=True)
         except Exception as e:
-            print(f"OpenAI 클라이언트 ({model_name}) 생성 실패: {e}")
+            logger.error("OpenAI 클라이언트 (%s) 생성 실패: %s", model_name, e)
             raise
 
     # elif provider == "anthropic":
@@ -50,18 +57,58 @@ def get_llm_client(provider: str = "openai", model_name: str = "gpt-4o", tempera
     else:
         raise ValueError(f"지원하지 않는 LLM 제공자입니다: {provider}")
 
+class InstrumentedChatModel:
+    """ ainvoke 시간/토큰/오류를 모델별 메트릭(app.core.metrics)과 디버그 trace 로 기록하고 그 밖의 속성은 원래 모델에 위임 """
+
+    def __init__(self, llm: Any, model: str, structured: Any = None):
+        self._llm = llm
+        self._runnable = structured or llm
+        self.model = model
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> "InstrumentedChatModel":
+        return InstrumentedChatModel(self._llm, self.model, structured=self._llm.with_structured_output(schema, **kwargs))
+
+    async def ainvoke(self, messages: Any, config: Any = None, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            with span(self.model, "llm"):
+                output = await self._runnable.ainvoke(messages, config, **kwargs)
+        except Exception as e:
+            LLM_ERRORS.inc(model=self.model, error=type(e).__name__)
+            raise
+        finally:
+            LLM_LATENCY.observe(time.perf_counter() - start, model=self.model)
+        # 구조화 출력(pydantic 객체)에는 usage_metadata 가 없어 토큰이 집계되지 않음
+        usage = getattr(output, "usage_metadata", None)
+        if isinstance(usage, dict):
+            LLM_TOKENS.inc(usage.get("input_tokens") or 0, model=self.model, kind="input")
+            LLM_TOKENS.inc(usage.get("output_tokens") or 0, model=self.model, kind="output")
+        return output
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._runnable, name)
+
+
 # --- 기본 제공 함수 수정 (OpenAI 모델 사용) ---
-def get_high_performance_llm():
+def _client(model_name: str, temperature: float, cache_site: Optional[str]):
+    """ 모델별 승인 계층(llm_admission)을 거치고, 캐시 대상 위치면 그 앞에 응답 캐시를 둔 클라이언트 (캐시 적중은 대기열을 거치지 않음)
+        호출 메트릭은 승인 안쪽에서 기록하므로 대기 시간은 포함하지 않음 """
+    llm = InstrumentedChatModel(get_llm_client(provider="openai", model_name=model_name, temperature=temperature), model_name)
+    llm = admitted(llm, model_name)
+    return maybe_cached(llm, cache_site)
+
+# cache_site: 응답 캐시 대상 호출 위치 이름 (settings.LLM_CACHE_SITES 에 있고 LLM_CACHE_ENABLED 일 때만 캐시 적용)
+def get_high_performance_llm(cache_site: Optional[str] = None):
     """ 기본 고성능 LLM 반환 (예: GPT-4o) """
     # 원하는 OpenAI 모델명으로 변경 (예: "gpt-4o", "gpt-4-turbo")
-    return get_llm_client(provider="openai", model_name="gpt-4o-2024-08-06", temperature=0.7)
+    return _client("gpt-4o-2024-08-06", 0.7, cache_site)
 
-def get_fast_llm():
+def get_fast_llm(cache_site: Optional[str] = None):
     """ 기본 빠른 LLM 반환 (예: GPT-4o Mini) """
     # 원하는 OpenAI 모델명으로 변경 (예: "gpt-4o-mini")
-    return get_llm_client(provider="openai", model_name="gpt-4.1-mini-2025-04-14", temperature=0.7)
+    return _client("gpt-4.1-mini-2025-04-14", 0.7, cache_site)
 
-def get_focus_llm():
+def get_focus_llm(cache_site: Optional[str] = None):
      """ 포커스 결정 등 간단한 작업용 LLM (가장 빠르고 저렴한 모델 권장) """
      # 예: GPT-4o Mini 재사용 또는 더 경량 모델 (예: "gpt-3.5-turbo" 등)
-     return get_llm_client(provider="openai", model_name="gpt-4o-mini", temperature=0.2)
\ No newline at end of file
+     return _client("gpt-4o-mini", 0.2, cache_site)
\ No newline at end of file
@@ -0,0 +1,132 @@
+# backend/app/core/log.py
+"""
+레벨/구조화 로깅 (표준 logging 위의 얇은 설정 계층).
+
+- 모듈마다 logger = get_logger(__name__) 를 두고 메시지는 %-포맷 인자로 넘깁니다.
+  레벨이 꺼져 있으면 문자열을 만들지 않으므로, 상태 dict 같은 큰 값도 인자로만 넘기면 비용이 거의 없습니다.
+  인자 자체를 만드는 데 비용이 들면 lazy(lambda: ...) 로 감싸 출력될 때만 계산합니다.
+- settings.LOG_LEVEL     : 기본 레벨 (app.* 로거 전체)
+  settings.LOG_LEVELS    : 모듈별 레벨, 예: {"app.core.checkpointers": "DEBUG", "app.graph_nodes.why": "DEBUG"}
+  settings.LOG_FORMAT    : "text" | "json" (한 줄에 JSON 객체 하나, extra= 로 넘긴 필드 포함)
+  settings.LOG_SAMPLE_RATES : 로거별 INFO 이하 기록 샘플링 비율, 예: {"app.core.streaming": 0.01}
+                              (WARNING 이상은 항상 남김, 접두사가 가장 긴 항목 적용)
+configure_logging() 은 app.main 에서 한 번 호출합니다. uvicorn 등 다른 라이브러리 로거는 건드리지 않습니다.
+"""
+import json
+import logging
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import IO, Callable, Dict, Mapping, Optional
+
+APP_LOGGER = "app"
+LOG_FORMATS = ("text", "json")
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# LogRecord 기본 속성 (JSON 출력에서 extra 필드와 구분)
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(name)
+
+
+class lazy:
+    """str() 될 때(=실제로 출력될 때)만 fn() 을 호출하는 로그 인자"""
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[[], object]):
+        self.fn = fn
+
+    def __str__(self) -> str:
+        return str(self.fn())
+
+    __repr__ = __str__
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """로거 이름 접두사별로 INFO 이하 기록을 N 개 중 1 개만 통과 (결정적: 카운터 기반)"""
+
+    def __init__(self, rates: Mapping[str, float]):
+        super().__init__()
+        # 접두사가 긴 것부터 검사
+        self.rates = sorted(rates.items(), key=lambda item: -len(item[0]))
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        for prefix, rate in self.rates:
+            if record.name == prefix or record.name.startswith(prefix + "."):
+                if rate <= 0:
+                    return False
+                every = max(int(round(1 / rate)), 1)
+                with self._lock:
+                    count = self._counts.get(prefix, 0)
+                    self._counts[prefix] = count + 1
+                return count % every == 0
+        return True
+
+
+_handler: Optional[logging.Handler] = None
+_configured_modules: list = []
+
+
+def configure_logging(
+    level: str = "INFO",
+    module_levels: Optional[Mapping[str, str]] = None,
+    fmt: str = "text",
+    sample_rates: Optional[Mapping[str, float]] = None,
+    stream: Optional[IO[str]] = None,
+) -> logging.Handler:
+    """app.* 로거에 핸들러/레벨/샘플링을 설정. 다시 호출하면 이전 설정을 교체합니다."""
+    global _handler, _configured_modules
+    if fmt not in LOG_FORMATS:
+        raise ValueError(f"지원하지 않는 LOG_FORMAT 입니다: {fmt}")
+
+    root = logging.getLogger(APP_LOGGER)
+    if _handler is not None:
+        root.removeHandler(_handler)
+    handler = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    handler.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+    if sample_rates:
+        handler.addFilter(SamplingFilter(sample_rates))
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+    root.propagate = False
+    for name in _configured_modules:
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    for name, module_level in (module_levels or {}).items():
+        logging.getLogger(name).setLevel(module_level.upper())
+    _configured_modules = list(module_levels or {})
+    _handler = handler
+    return handler
+
+
+def configure_from_settings(stream: Optional[IO[str]] = None) -> logging.Handler:
+    from app.core.config import settings
+
+    return configure_logging(
+        level=settings.LOG_LEVEL,
+        module_levels=settings.LOG_LEVELS,
+        fmt=settings.LOG_FORMAT,
+        sample_rates=settings.LOG_SAMPLE_RATES,
+        stream=stream,
+    )
@@ -0,0 +1,116 @@
+# backend/app/core/loop_monitor.py
+"""
+LoopBlockMonitor: 이벤트 루프를 막는 콜백(동기 LLM 호출, time.sleep 등)을 잡아내는 디버그용 감시기.
+
+- 루프 안의 하트비트 태스크가 interval 마다 시각을 기록합니다.
+- 별도 watchdog 스레드가 하트비트가 threshold_ms 이상 갱신되지 않으면
+  그 순간 루프 스레드의 스택(sys._current_frames)을 떠서 기록/출력합니다.
+- 하나의 블로킹 구간은 한 번만 보고하고, 풀린 뒤 실제 지속 시간을 채워 넣습니다.
+
+사용: settings.DEBUG_LOOP_MONITOR=True 이면 main.py lifespan 에서 자동으로 켜집니다.
+테스트에서는 `async with LoopBlockMonitor(threshold_ms=50) as monitor:` 로 감싼 뒤
+monitor.blocks 를 확인합니다.
+"""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class LoopBlock:
+    started_at: float          # 마지막 하트비트 시각 (time.monotonic)
+    duration_ms: float         # 감지 시점의 지연, 블로킹이 끝나면 실제 지속 시간으로 갱신
+    stack: str                 # 감지 시점의 루프 스레드 스택
+
+
+class LoopBlockMonitor:
+    def __init__(
+        self,
+        threshold_ms: int = 100,
+        interval_ms: Optional[int] = None,
+        on_block: Optional[Callable[[LoopBlock], None]] = None,
+    ):
+        self.threshold = threshold_ms / 1000
+        self.interval = (interval_ms if interval_ms is not None else max(threshold_ms // 4, 5)) / 1000
+        self.on_block = on_block or self._print_block
+        self.blocks: List[LoopBlock] = []
+
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._current: Optional[LoopBlock] = None
+
+    # --- 생명주기 ---
+    def start(self) -> None:
+        """실행 중인 이벤트 루프 안에서 호출"""
+        if self._heartbeat_task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat(), name="loop-block-heartbeat")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-block-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info("[LoopMonitor] 이벤트 루프 블로킹 감시 시작 (임계값 %.0fms)", self.threshold * 1000)
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join, 1.0)
+            self._watchdog = None
+
+    async def __aenter__(self) -> "LoopBlockMonitor":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        # 마지막 블로킹 구간의 지속 시간이 기록되도록 하트비트 한 번 더 양보
+        await asyncio.sleep(self.interval)
+        await self.stop()
+
+    # --- 내부 ---
+    async def _heartbeat(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._last_beat = now  # _current 보다 먼저 갱신해야 watchdog 이 같은 구간을 중복 보고하지 않음
+            current = self._current
+            if current is not None:
+                # 블로킹이 풀림 → 실제 지속 시간 기록
+                current.duration_ms = (now - current.started_at) * 1000
+                self._current = None
+            await asyncio.sleep(self.interval)
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            lag = time.monotonic() - self._last_beat
+            if lag < self.threshold or self._current is not None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "(스택 없음)"
+            block = LoopBlock(started_at=self._last_beat, duration_ms=lag * 1000, stack=stack)
+            self._current = block
+            self.blocks.append(block)
+            try:
+                self.on_block(block)
+            except Exception as e:
+                logger.error("[LoopMonitor] on_block 콜백 실패: %s", e)
+
+    @staticmethod
+    def _print_block(block: LoopBlock) -> None:
+        logger.warning("[LoopMonitor] 이벤트 루프가 %.0fms 이상 블로킹됨. 루프 스레드 스택:\n%s", block.duration_ms, block.stack)
@@ -0,0 +1,77 @@
+# backend/app/core/message_log.py
+"""
+세션별 메시지 로그: GET /sessions/{id}/messages 의 읽기 경로 (그래프 체크포인트를 읽지 않음).
+
+- 원본은 messages 테이블 (thread_id, seq). seq 는 대화 내 메시지 순번이고 API 의 메시지 id/커서로 씁니다.
+  (thread_id, seq) 유니크 키가 곧 페이지 조회용 인덱스입니다.
+- Redis 리스트 message_log:{session_id} 는 최근 메시지의 읽기 캐시입니다.
+  flush_manager 가 DB 커밋 뒤 같은 Redis 트랜잭션(HWM 갱신과 함께)으로 새 메시지를 RPUSH 하고
+  settings.MESSAGE_LOG_REDIS_MAXLEN 개만 남깁니다. 대화 첫 메시지부터 쌓인 리스트는 맨 앞에
+  시작 표식(START_MARKER)이 있어, 리스트만으로 이전 메시지가 더 없다는 것을 알 수 있습니다.
+- read_page() 는 리스트로 요청 페이지를 채울 수 있으면 Redis 만, 아니면 DB 를 seq 역순 LIMIT 으로 조회합니다.
+"""
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.redis_pool import get_redis
+from app.db.models import MessageRecord
+
+MESSAGE_LOG_KEY_PREFIX = "message_log:"
+START_MARKER = json.dumps({"start": True})
+_ROLES = {"user": "user", "bot": "assistant"}
+
+LogEntry = Dict[str, Any]  # {"id": seq, "role": "user" | "assistant", "content": str}
+
+
+def _entry(seq: int, sender: str, content: str) -> LogEntry:
+    return {"id": seq, "role": _ROLES.get(sender, "assistant"), "content": content}
+
+
+def push_messages(pipe, session_id: str, rows: List[Dict[str, Any]], from_start: bool) -> None:
+    """flush 된 messages 행(seq 순)을 로그 리스트에 추가 (호출자의 트랜잭션 파이프라인에 명령만 쌓음)"""
+    key = MESSAGE_LOG_KEY_PREFIX + session_id
+    if from_start:
+        # 대화 첫 flush: 이전 리스트가 남아 있어도 새로 시작
+        pipe.delete(key)
+        pipe.rpush(key, START_MARKER)
+    entries = [json.dumps(_entry(row["seq"], row["sender"], row["content"]), ensure_ascii=False) for row in rows if row["content"]]
+    if entries:
+        pipe.rpush(key, *entries)
+    if from_start or entries:
+        pipe.ltrim(key, -settings.MESSAGE_LOG_REDIS_MAXLEN, -1)
+        pipe.expire(key, settings.SESSION_TTL_SECONDS)
+
+
+async def _read_cached(session_id: str) -> Tuple[List[LogEntry], bool]:
+    """(seq 순 항목 목록, 대화 첫 메시지부터 포함하는지)"""
+    raws = await get_redis().lrange(MESSAGE_LOG_KEY_PREFIX + session_id, 0, -1)
+    complete = bool(raws) and raws[0] in (START_MARKER, START_MARKER.encode())
+    by_id: Dict[int, LogEntry] = {}
+    for raw in raws[1:] if complete else raws:
+        entry = json.loads(raw)
+        by_id[entry["id"]] = entry  # 재시도 flush 로 중복 push 된 항목은 하나로
+    return [by_id[seq] for seq in sorted(by_id)], complete
+
+
+async def _read_db(db, session_id: str, limit: int, before: Optional[int]) -> List[LogEntry]:
+    stmt = (
+        select(MessageRecord.seq, MessageRecord.sender, MessageRecord.content)
+        .where(MessageRecord.thread_id == session_id, MessageRecord.seq.isnot(None), MessageRecord.content != "")
+    )
+    if before is not None:
+        stmt = stmt.where(MessageRecord.seq < before)
+    result = await db.execute(stmt.order_by(MessageRecord.seq.desc()).limit(limit))
+    return [_entry(seq, sender, content) for seq, sender, content in reversed(result.all())]
+
+
+async def read_page(db, session_id: str, limit: int, before: Optional[int] = None) -> List[LogEntry]:
+    """id 가 before 보다 작은 메시지 중 최근 limit 개 (오래된 것부터)"""
+    cached, complete = await _read_cached(session_id)
+    if before is not None:
+        cached = [entry for entry in cached if entry["id"] < before]
+    if len(cached) >= limit or complete:
+        return cached[-limit:]
+    return await _read_db(db, session_id, limit, before)
@@ -0,0 +1,343 @@
+# backend/app/core/metrics.py
+"""
+프로세스 내 메트릭 레지스트리와 Prometheus 텍스트 노출 형식 (prometheus_client 없이 표준 라이브러리만 사용).
+
+- Counter / Gauge / Histogram 을 모듈 수준에서 한 번 만들고 라벨을 키워드 인자로 넘겨 기록합니다.
+  예: LLM_LATENCY.observe(0.8, model="gpt-4o"), with TURN_LATENCY.time(endpoint="/why"): ...
+- Gauge/Counter 에 collect= 를 주면 값을 저장하지 않고 노출(render) 시점에 읽어 옵니다.
+  큐 깊이처럼 다른 객체가 이미 들고 있는 값은 이렇게 노출합니다.
+- /metrics (app.main) 가 REGISTRY.render() 를 text/plain; version=0.0.4 로 돌려줍니다.
+
+이 모듈은 앱 시작 시 임포트되므로 무거운 모듈(redis, langgraph 등)을 임포트하지 않습니다.
+런타임 게이지는 sys.modules 에 이미 올라온 모듈만 읽습니다.
+"""
+import functools
+import math
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from app.core.tracing import span
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+NAMESPACE = "thinkdeeper"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+# collect 콜백 반환값: 라벨 없는 메트릭은 숫자, 라벨이 있으면 {라벨값 튜플: 값}
+Collected = Any
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, "_Metric"] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: "_Metric") -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 메트릭 이름입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> Optional["_Metric"]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for suffix, names, values, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_format_labels(names, values)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: Optional[MetricsRegistry] = None, collect: Optional[Callable[[], Collected]] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+        self._values: Dict[LabelValues, Any] = {}
+        self._lock = threading.Lock()
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if len(labels) != len(self.labelnames) or any(name not in labels for name in self.labelnames):
+            raise ValueError(f"{self.name} 라벨이 맞지 않습니다: {sorted(labels)} (필요: {list(self.labelnames)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _collected(self) -> Iterable[Tuple[LabelValues, float]]:
+        result = self.collect()
+        if not self.labelnames:
+            return [((), result)] if result is not None else []
+        return sorted(result.items())
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], LabelValues, float]]:
+        items = self._collected() if self.collect is not None else sorted(self._values.items())
+        for key, value in items:
+            yield "", self.labelnames, key, value
+
+    def value(self, **labels: Any) -> float:
+        if self.collect is not None:
+            return dict(self._collected()).get(self._key(labels), 0.0)
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counter 는 감소할 수 없습니다.")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self, n_buckets: int):
+        self.buckets = [0] * n_buckets  # 구간별 개수 (노출 시 누적)
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: Optional[MetricsRegistry] = None, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(float(b) for b in buckets if b != math.inf)) + (math.inf,)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = next(i for i, le in enumerate(self.buckets) if value <= le)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = _HistogramValue(len(self.buckets))
+            entry.buckets[index] += 1
+            entry.sum += value
+            entry.count += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """블록 실행 시간(초)을 기록. 예외로 빠져나와도 기록합니다."""
+        self._key(labels)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: Any) -> int:
+        entry = self._values.get(self._key(labels))
+        return entry.count if entry else 0
+
+    def sum(self, **labels: Any) -> float:
+        entry = self._values.get(self._key(labels))
+        return entry.sum if entry else 0.0
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], LabelValues, float]]:
+        bucket_names = self.labelnames + ("le",)
+        with self._lock:
+            snapshot = [(key, list(v.buckets), v.sum, v.count) for key, v in sorted(self._values.items())]
+        for key, buckets, total, count in snapshot:
+            cumulative = 0
+            for le, n in zip(self.buckets, buckets):
+                cumulative += n
+                yield "_bucket", bucket_names, key + (_format_value(le),), cumulative
+            yield "_sum", self.labelnames, key, total
+            yield "_count", self.labelnames, key, count
+
+
+def timed(histogram: Histogram, category: Optional[str] = None, **labels: Any) -> Callable:
+    """코루틴 함수 실행 시간을 histogram 에 기록하는 데코레이터.
+    category 를 주면 디버그 trace(app.core.tracing) 에도 라벨 값을 이은 이름(예: "redis.aget")의 구간으로 남깁니다."""
+    name = ".".join(str(value) for value in labels.values())
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if category is None:
+                with histogram.time(**labels):
+                    return await fn(*args, **kwargs)
+            with histogram.time(**labels), span(name, category):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+async def timed_stream(events: AsyncIterator[Any], histogram: Histogram, started: float, **labels: Any) -> AsyncIterator[Any]:
+    """스트림이 끝나거나 닫힐 때까지의 시간(started 기준)을 기록하며 이벤트를 그대로 전달"""
+    try:
+        async for event in events:
+            yield event
+    finally:
+        histogram.observe(time.perf_counter() - started, **labels)
+        aclose = getattr(events, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+# --- 앱 메트릭 ---
+
+TURN_LATENCY = Histogram(
+    f"{NAMESPACE}_turn_latency_seconds",
+    "엔드포인트별 한 턴의 처리 시간 (스트리밍은 마지막 이벤트까지)",
+    ["endpoint"],
+)
+NODE_LATENCY = Histogram(
+    f"{NAMESPACE}_graph_node_latency_seconds",
+    "그래프 노드 한 번 실행 시간 (interrupt 로 끝난 실행 포함)",
+    ["graph", "node"],
+)
+LLM_LATENCY = Histogram(
+    f"{NAMESPACE}_llm_call_latency_seconds",
+    "모델별 LLM 호출 시간 (승인 대기 제외)",
+    ["model"],
+)
+LLM_QUEUE_WAIT = Histogram(
+    f"{NAMESPACE}_llm_admission_queue_wait_seconds",
+    "모델별 LLM 호출의 승인 대기 시간 (llm_admission 대기열)",
+    ["model"],
+)
+LLM_TOKENS = Counter(
+    f"{NAMESPACE}_llm_tokens_total",
+    "모델이 보고한 사용 토큰 수 (usage_metadata 가 있는 응답만)",
+    ["model", "kind"],
+)
+LLM_ERRORS = Counter(
+    f"{NAMESPACE}_llm_errors_total",
+    "모델별 LLM 호출 오류 수",
+    ["model", "error"],
+)
+STORAGE_LATENCY = Histogram(
+    f"{NAMESPACE}_checkpoint_storage_latency_seconds",
+    "체크포인터 저장소(redis/sql) 메서드별 호출 시간",
+    ["backend", "method"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+
+def instrument_node(graph: str, node: str, fn: Callable) -> Callable:
+    """그래프에 등록하는 노드 함수를 NODE_LATENCY(및 trace 구간) 기록 래퍼로 감쌈 (시그니처는 functools.wraps 로 유지)"""
+    return timed(NODE_LATENCY, "node", graph=graph, node=node)(fn)
+
+
+# --- 런타임 게이지 (노출 시점에 읽음) ---
+
+def _loaded(name: str) -> Any:
+    return sys.modules.get(name)
+
+
+def _write_behind_depth() -> Optional[float]:
+    graph_registry = _loaded("app.core.graph_registry")
+    registry = getattr(graph_registry, "_registry", None)
+    if registry is None or registry.write_behind is None:
+        return None
+    return registry.write_behind.depth()
+
+
+def _transcript_depth() -> Optional[float]:
+    why_orchestration = _loaded("app.core.why_orchestration")
+    return why_orchestration.transcript_appender.depth() if why_orchestration is not None else None
+
+
+def _state_cache_entries() -> Optional[float]:
+    why_orchestration = _loaded("app.core.why_orchestration")
+    return len(why_orchestration.state_cache) if why_orchestration is not None else None
+
+
+def _state_cache_lookups() -> Dict[LabelValues, float]:
+    why_orchestration = _loaded("app.core.why_orchestration")
+    if why_orchestration is None:
+        return {}
+    stats = why_orchestration.state_cache.stats
+    return {("hit",): stats["hits"], ("miss",): stats["misses"]}
+
+
+def _llm_cache_lookups() -> Dict[LabelValues, float]:
+    llm_cache = _loaded("app.core.llm_cache")
+    cache = getattr(llm_cache, "_llm_cache", None)
+    if cache is None:
+        return {}
+    results = {"memory_hits": "memory_hit", "redis_hits": "redis_hit", "misses": "miss", "errors": "error"}
+    return {
+        (site, result): stats[field]
+        for site, stats in list(cache.stats.items())
+        for field, result in results.items()
+    }
+
+
+def _admission(field: str) -> Dict[LabelValues, float]:
+    llm_admission = _loaded("app.core.llm_admission")
+    if llm_admission is None:
+        return {}
+    return {(model,): stats[field] for model, stats in llm_admission.admission_stats().items()}
+
+
+def _redis_pool_connections() -> Dict[LabelValues, float]:
+    redis_pool = _loaded("app.core.redis_pool")
+    if redis_pool is None:
+        return {}
+    stats = redis_pool.pool_stats()
+    return {("in_use",): stats["in_use"], ("idle",): stats["idle"]}
+
+
+Gauge(f"{NAMESPACE}_write_behind_queue_depth", "SQL write-behind 큐에 남은 체크포인트 수", collect=_write_behind_depth)
+Gauge(f"{NAMESPACE}_transcript_queue_depth", "저장 대기 중인 Why transcript 행 수", collect=_transcript_depth)
+Gauge(f"{NAMESPACE}_session_state_cache_entries", "hydrated Why 세션 상태 캐시 항목 수", collect=_state_cache_entries)
+Counter(f"{NAMESPACE}_session_state_cache_lookups_total", "Why 세션 상태 캐시 조회 수", ["result"], collect=_state_cache_lookups)
+Counter(f"{NAMESPACE}_llm_cache_lookups_total", "호출 위치별 LLM 응답 캐시 조회 수", ["site", "result"], collect=_llm_cache_lookups)
+Gauge(f"{NAMESPACE}_llm_admission_waiting", "모델별 승인 대기 중인 LLM 호출 수", ["model"], collect=lambda: _admission("waiting"))
+Gauge(f"{NAMESPACE}_llm_in_flight", "모델별 실행 중인 LLM 호출 수", ["model"], collect=lambda: _admission("in_flight"))
+Gauge(f"{NAMESPACE}_redis_pool_connections", "공유 Redis 연결 풀의 연결 수", ["state"], collect=_redis_pool_connections)
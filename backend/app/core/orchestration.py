@@ -1,44 +1,53 @@
 # backend/app/core/orchestration.py
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 from langchain_core.messages import HumanMessage, AIMessage
 from langgraph.graph import StateGraph, END
 
-from app.core.config import settings
-from app.db.session import async_session_factory
-from app.core.redis_checkpointer import RedisCheckpointer
-from app.core.sql_checkpointer import SQLCheckpointer
-from app.core.checkpointers import CombinedCheckpointer
+from app.core.graph_registry import GraphRegistry, get_graph_registry
 from app.models.graph_state import GraphState
 from app.core import state_manager
-from app.core.flush_manager import flush_session_to_postgres, mark_flush_failed, clear_flush_failed
+from app.core.flush_manager import flush_session_to_postgres, mark_flush_failed
+from app.core.streaming import GraphRunResult, StreamEvent, graph_node_names, translate_graph_event
+from app.core.metrics import instrument_node
+from app.core.tracing import span
+from app.core.turn_lock import serialized_stream
 
 # --- 노드 임포트 ---
-from app.graph_nodes.coordinator import coordinator_node
+from app.graph_nodes.coordinator import coordinator_node, focus_node
 from app.graph_nodes.critic import critic_node
 from app.graph_nodes.moderator import moderator_node
 from app.graph_nodes.search import search_node
 from app.graph_nodes.advocate import advocate_node
 from app.graph_nodes.socratic import socratic_node
+from app.core.log import get_logger
 
-# --- 그래프 정의 ---
+logger = get_logger(__name__)
+
+# --- 그래프 정의 --- (노드 실행 시간은 instrument_node 가 /metrics 의 NODE_LATENCY 로 기록)
 workflow = StateGraph(GraphState)
-workflow.add_node("coordinator", coordinator_node)
-workflow.add_node("critic", critic_node)
-workflow.add_node("search", search_node)
-workflow.add_node("moderator", moderator_node)
-workflow.add_node("advocate", advocate_node)
-workflow.add_node("socratic", socratic_node)
+workflow.add_node("coordinator", instrument_node("debate", "coordinator", coordinator_node))
+workflow.add_node("critic", instrument_node("debate", "critic", critic_node))
+workflow.add_node("search", instrument_node("debate", "search", search_node))
+workflow.add_node("moderator", instrument_node("debate", "moderator", moderator_node))
+workflow.add_node("advocate", instrument_node("debate", "advocate", advocate_node))
+workflow.add_node("socratic", instrument_node("debate", "socratic", socratic_node))
+workflow.add_node("focus", instrument_node("debate", "focus", focus_node))
 workflow.set_entry_point("coordinator")
 
+def route_after_coordinator(s: GraphState):
+    if s.get("moderator_flags"):
+        return "moderator"
+    agent = s.get("target_agent", "critic")
+    if agent not in ["critic", "advocate", "socratic"]:
+        agent = "critic"
+    # 투기적 포커스 모드: focus 노드를 에이전트와 같은 단계에서 병렬 실행
+    return [agent, "focus"] if s.get("focus_requested") else agent
+
 workflow.add_conditional_edges(
     "coordinator",
-    lambda s: "moderator" if s.get("moderator_flags") else (
-        s.get("target_agent", "critic")
-        if s.get("target_agent", "critic") in ["critic", "advocate", "socratic"]
-        else "critic"
-    ),
-    {"critic": "critic", "moderator": "moderator", "advocate": "advocate", "socratic": "socratic"},
+    route_after_coordinator,
+    {"critic": "critic", "moderator": "moderator", "advocate": "advocate", "socratic": "socratic", "focus": "focus"},
 )
 workflow.add_conditional_edges(
     "critic",
@@ -49,28 +58,56 @@ workflow.add_edge("search", "critic")
 workflow.add_conditional_edges("advocate", lambda _: "moderator", {"moderator": "moderator"})
 workflow.add_conditional_edges("socratic", lambda _: "moderator", {"moderator": "moderator"})
 workflow.add_conditional_edges("moderator", lambda _: END, {END: END})
+workflow.add_edge("focus", END)
 
 # --- 그래프 컴파일 함수 ---
 async def compile_graph() -> StateGraph:
-    redis_cp = RedisCheckpointer(settings.REDIS_URL, ttl=settings.SESSION_TTL_SECONDS)
-    sql_cp = SQLCheckpointer(async_session_factory)
-    cp = CombinedCheckpointer(redis_cp, sql_cp)
-    return workflow.compile(checkpointer=cp)
+    # 컴파일은 프로세스당 한 번만 수행 (graph_registry 참고)
+    return (await get_graph_registry()).app_graph
 
 # --- FastAPI 연동 함수 ---
-async def run_conversation_turn_langgraph(
+# 토큰을 클라이언트로 스트리밍하지 않는 내부 노드 (라우팅/포커스 결정용 LLM 호출)
+_SILENT_NODES = frozenset({"coordinator", "focus"})
+
+
+def _final_response(final_state: Optional[Dict[str, Any]]) -> str:
+    if final_state is None:
+        return "(시스템 오류: 그래프 최종 상태를 가져올 수 없습니다.)"
+    if final_state.get("final_response"):
+        return final_state["final_response"]
+    msgs = final_state.get("messages", [])
+    if msgs and isinstance(msgs[-1], AIMessage):
+        return msgs[-1].content
+    return "(응답 없음)"
+
+
+def stream_conversation_turn_langgraph(
     session_id: str,
-    user_input: str
-) -> Optional[str]:
+    user_input: str,
+    registry: Optional[GraphRegistry] = None,
+) -> AsyncIterator[StreamEvent]:
+    """
+    한 턴을 실행하면서 노드 전환/토큰 델타 이벤트를 내보내고,
+    마지막에 PostgreSQL flush 후 final(또는 error) 이벤트를 내보냅니다. (app.core.streaming 참고)
+    같은 세션의 턴은 한 번에 하나만 실행됩니다 (app.core.turn_lock, 실행 중이면 TurnInProgressError).
+    """
+    return serialized_stream(session_id, user_input, lambda: _stream_conversation_turn(session_id, user_input, registry))
+
+
+async def _stream_conversation_turn(
+    session_id: str,
+    user_input: str,
+    registry: Optional[GraphRegistry],
+) -> AsyncIterator[StreamEvent]:
     config = {"configurable": {"thread_id": session_id}}
     graph_input = {"messages": [HumanMessage(content=user_input)]}
 
-    redis_cp = RedisCheckpointer(settings.REDIS_URL, ttl=settings.SESSION_TTL_SECONDS)
-    async with async_session_factory() as db_session:
-        sql_cp = SQLCheckpointer(async_session_factory)
-        cp = CombinedCheckpointer(redis_cp, sql_cp)
-        app_graph = workflow.compile(checkpointer=cp)
+    if registry is None:
+        registry = await get_graph_registry()
+    cp = registry.checkpointer
+    app_graph = registry.app_graph
 
+    with span("load_state", "state_load"):
         state = await cp.aget(config)
         if state is None:
             info = await state_manager.get_session_initial_info(session_id)
@@ -79,57 +116,47 @@ async def run_conversation_turn_langgraph(
                 graph_input["initial_topic"] = info.get("topic", "")
                 graph_input["target_agent"] = info.get("agent_type", "critic")
 
+    node_names = graph_node_names(app_graph)
+    run = GraphRunResult()
+    try:
+        with span("astream_events", "graph"):
+            async for ev in app_graph.astream_events(graph_input, config=config, version="v2"):
+                if run.observe(ev):
+                    continue
+                out = translate_graph_event(ev, node_names, silent_nodes=_SILENT_NODES)
+                if out is not None:
+                    yield out
+    except Exception as e:
+        logger.exception("[Orchestration] session_id=%s 그래프 실행 오류: %s", session_id, e)
+        yield {"event": "error", "data": {"content": f"(시스템 오류: {e})"}}
+        return
+
+    # 루트 런의 on_chain_end 출력 = 이번 턴이 끝난 뒤의 전체 상태
+    final_state = run.output
+    if final_state is not None:
+        memory_state = final_state.get("memory", {})
+        messages = final_state.get("messages", [])
         try:
-            final_state = None
-            async for ev in app_graph.astream_events(graph_input, config=config, version="v1"):
-                print(f"[그래프 이벤트] {ev}")
-                if ev.get("event") == "on_chain_end" and ev.get("name") == "LangGraph":
-                    output_dict = ev["data"]["output"]
-
-                    # ✅ dict인 값 중 가장 먼저 나오는 실제 상태(dict)를 final_state로 설정
-                    if isinstance(output_dict, dict):
-                        final_state = next(
-                            (v for v in output_dict.values() if isinstance(v, dict)),
-                            None
-                        )
-                    else:
-                        final_state = output_dict  # fallback (예외적 상황)
-
-                    print(f"[그래프 상태] final_state: {final_state}")
-
-                    if final_state and isinstance(final_state, dict):
-                        memory_state = final_state.get("memory", {})
-                        messages = final_state.get("messages", [])
-                        try:
-                            await flush_session_to_postgres(session_id, memory_state, messages)
-                            await clear_flush_failed(session_id)
-                            print(f"[flush 성공] session_id={session_id}")
-                        except Exception as flush_error:
-                            print(f"[flush 실패] session_id={session_id}: {flush_error}")
-                            await mark_flush_failed(session_id)
-                    else:
-                        print("[오류] final_state가 None이거나 dict가 아님")
-
-                    break
-
-            if final_state is None:
-                return "(시스템 오류: 그래프 최종 상태를 가져올 수 없습니다.)"
-
-            if not isinstance(final_state, dict):
-                print("[오류] 최종 상태 포맷이 dict 아님")
-                return "(시스템 오류: 그래프 최종 상태 형식이 올바르지 않습니다.)"
-
-            vals = final_state
-            if vals.get("final_response"):
-                return vals["final_response"]
-
-            msgs = vals.get("messages", [])
-            if msgs and isinstance(msgs[-1], AIMessage):
-                return msgs[-1].content
-
-            return "(응답 없음)"
-
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            return f"(시스템 오류: {e})"
+            # 성공 시 flush 실패 표시 해제와 세션 TTL 연장까지 한 번의 Redis 왕복으로 처리됨
+            with span("flush_session_to_postgres", "flush"):
+                await flush_session_to_postgres(session_id, memory_state, messages)
+        except Exception as flush_error:
+            logger.error("[flush 실패] session_id=%s: %s", session_id, flush_error)
+            await mark_flush_failed(session_id)
+    else:
+        logger.error("[오류] session_id=%s: 그래프 최종 상태를 받지 못함", session_id)
+
+    yield {"event": "final", "data": {"content": _final_response(final_state)}}
+
+
+async def run_conversation_turn_langgraph(
+    session_id: str,
+    user_input: str,
+    registry: Optional[GraphRegistry] = None,
+) -> Optional[str]:
+    """스트림을 끝까지 소비하고 최종 응답 문자열만 반환 (비스트리밍 엔드포인트용)"""
+    response = None
+    async for ev in stream_conversation_turn_langgraph(session_id, user_input, registry=registry):
+        if ev["event"] in ("final", "error"):
+            response = ev["data"]["content"]
+    return response
@@ -2,13 +2,13 @@
 
 from app.db.session import get_db_session_async
 from app.db.models import GraphStateRecord, MessageRecord
-from app.core.redis_checkpointer import RedisCheckpointer
-from app.core.config import settings
+from app.core.graph_registry import get_graph_registry
 from sqlalchemy.future import select
 
 import pickle
+from app.core.log import get_logger
 
-redis_cp = RedisCheckpointer(settings.REDIS_URL, ttl=settings.SESSION_TTL_SECONDS)
+logger = get_logger(__name__)
 
 async def restore_session_to_redis(session_id: str) -> bool:
     """PostgreSQL에 저장된 세션 memory + messages를 Redis에 복구"""
@@ -19,14 +19,15 @@ async def restore_session_to_redis(session_id: str) -> bool:
         )
         record = result.scalar_one_or_none()
         if not record:
-            print(f"[복구 실패] session_id={session_id} 에 대한 메모리 상태 없음.")
+            logger.error("[복구 실패] session_id=%s 에 대한 메모리 상태 없음.", session_id)
             return False
 
         memory_state = record.state_json
 
-        # 2. messages 복구
+        # 2. messages 복구 (seq 가 대화 내 위치. seq 가 없는 기존 행은 그보다 앞이므로 먼저, 삽입 순서대로)
         result = await db.execute(
-            select(MessageRecord).where(MessageRecord.thread_id == session_id).order_by(MessageRecord.timestamp)
+            select(MessageRecord).where(MessageRecord.thread_id == session_id)
+            .order_by(MessageRecord.seq.asc().nulls_first(), MessageRecord.id)
         )
         message_records = result.scalars().all()
         messages = []
@@ -42,7 +43,8 @@ async def restore_session_to_redis(session_id: str) -> bool:
             "messages": messages,
         }
         config = {"configurable": {"thread_id": session_id}}
-        redis_cp.set(config, redis_state)
-        print(f"[복구 성공] session_id={session_id} Redis에 복원 완료.")
+        redis_cp = (await get_graph_registry()).redis_cp  # 프로세스 공유 RedisCheckpointer
+        await redis_cp.aset(config, redis_state)
+        logger.info("[복구 성공] session_id=%s Redis에 복원 완료.", session_id)
 
         return True
@@ -2,12 +2,19 @@
 
 from redis.asyncio import Redis
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
 from langchain_core.load import dumps
-import pickle
+from app.core.serializers import Serializer, get_checkpoint_serializer
+from app.core.log import get_logger, lazy
+from app.core.metrics import STORAGE_LATENCY, timed
+
+logger = get_logger(__name__)
 
 SESSION_PREFIX = "session:"
+WRITES_KEY_PREFIX = "checkpointer_writes:"
+# wrapper["messages"]가 channel_values["messages"]와 같은 리스트일 때 한 번만 저장하기 위한 표식
+MESSAGES_FROM_CHANNEL = "__messages_from_channel__"
 
 def deserialize_messages(messages: List[Dict[str, Any]]) -> List[BaseMessage]:
     """dict를 다시 메시지 객체로 복원."""
@@ -25,9 +32,13 @@ def deserialize_messages(messages: List[Dict[str, Any]]) -> List[BaseMessage]:
     return deserialized
 
 class RedisCheckpointer:
-    def __init__(self, redis_url: str, ttl: int = 3600):
-        self.client = Redis.from_url(redis_url, decode_responses=False)
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 3600, serializer: Optional[Serializer] = None,
+                 client: Optional[Redis] = None):
+        # client 를 받으면 공유 연결 풀(app.core.redis_pool)을 사용하고, 풀은 소유자가 닫음
+        self._owns_client = client is None
+        self.client = client if client is not None else Redis.from_url(redis_url, decode_responses=False)
         self.ttl = ttl
+        self.serializer = serializer or get_checkpoint_serializer()
 
     def _key(self, config: Dict[str, Any]) -> str:
         ns = config.get("configurable", {}).get("checkpoint_ns", "") or "default"
@@ -35,11 +46,19 @@ class RedisCheckpointer:
         checkpoint_id = config.get("configurable", {}).get("checkpoint_id", "") or "latest"
         return f"checkpointer:{ns}:{thread_id}:{checkpoint_id}"
 
+    def _writes_key(self, config: Dict[str, Any], checkpoint_id: Optional[str]) -> str:
+        ns = config.get("configurable", {}).get("checkpoint_ns", "") or "default"
+        thread_id = config.get("configurable", {}).get("thread_id", "")
+        return f"{WRITES_KEY_PREFIX}{ns}:{thread_id}:{checkpoint_id or 'latest'}"
+
+    @timed(STORAGE_LATENCY, "checkpoint", backend="redis", method="aget")
     async def aget(self, config: Dict[str, Any]) -> Optional[dict]:
         raw = await self.client.get(self._key(config))
         if raw is None:
             return None
-        state = pickle.loads(raw)
+        state = self.serializer.loads(raw)
+        if state.pop(MESSAGES_FROM_CHANNEL, False):
+            state["messages"] = state["channel_values"]["messages"]
 
         # ❗ 메시지 복원 처리
         if "messages" in state and isinstance(state["messages"], list):
@@ -47,19 +66,65 @@ class RedisCheckpointer:
 
         return state
 
-    async def aset(self, config: Dict[str, Any], checkpoint: dict):
+    @timed(STORAGE_LATENCY, "checkpoint", backend="redis", method="aset")
+    async def aset(self, config: Dict[str, Any], checkpoint: dict, stale_writes_checkpoint_id: Optional[str] = None):
         key = self._key(config)
-        print(f"[RedisCheckpointer] aset 호출됨")
-        print(f"  - thread_id: {config['configurable']['thread_id']}")
-        print(f"  - keys: {list(checkpoint.keys())}")  # <-- 여기가 에러났던 부분
+        logger.debug("[RedisCheckpointer] aset 호출됨 thread_id=%s keys=%s",
+                     config['configurable']['thread_id'], lazy(lambda: list(checkpoint.keys())))
 
         # 실제 저장
-        data = pickle.dumps(checkpoint)
-        await self.client.set(key, data, ex=self.ttl)
-
-
+        data = self.serializer.dumps(self._dedupe_messages(checkpoint))
+        if stale_writes_checkpoint_id is None:
+            await self.client.set(key, data, ex=self.ttl)
+            return
+        # 새 체크포인트가 저장되면 이전 체크포인트의 pending writes는 더 이상 필요 없음 (한 번의 왕복)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(key, data, ex=self.ttl)
+            pipe.delete(self._writes_key(config, stale_writes_checkpoint_id))
+            await pipe.execute()
+
+    @staticmethod
+    def _dedupe_messages(checkpoint: dict) -> dict:
+        channel_values = checkpoint.get("channel_values")
+        if isinstance(channel_values, dict) and checkpoint.get("messages") is channel_values.get("messages") is not None:
+            slim = {k: v for k, v in checkpoint.items() if k != "messages"}
+            slim[MESSAGES_FROM_CHANNEL] = True
+            return slim
+        return checkpoint
+
+    # --- pending writes (append-only, 체크포인트별) ---
+    @timed(STORAGE_LATENCY, "checkpoint", backend="redis", method="aappend_writes")
+    async def aappend_writes(self, config: Dict[str, Any], checkpoint_id: Optional[str],
+                             task_id: str, writes: List[Tuple[str, Any]]) -> None:
+        """(task_id, idx, channel, value) 레코드를 체크포인트별 리스트 끝에 추가"""
+        if not writes:
+            return
+        key = self._writes_key(config, checkpoint_id)
+        records = [self.serializer.dumps((task_id, idx, channel, value)) for idx, (channel, value) in enumerate(writes)]
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, *records)
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    @timed(STORAGE_LATENCY, "checkpoint", backend="redis", method="aget_writes")
+    async def aget_writes(self, config: Dict[str, Any], checkpoint_id: Optional[str]) -> List[Tuple[str, str, Any]]:
+        """추가된 순서대로 (task_id, channel, value) 목록 반환"""
+        raw_records = await self.client.lrange(self._writes_key(config, checkpoint_id), 0, -1)
+        writes = []
+        for raw in raw_records:
+            task_id, _idx, channel, value = self.serializer.loads(raw)
+            writes.append((task_id, channel, value))
+        return writes
+
+
+    @timed(STORAGE_LATENCY, "checkpoint", backend="redis", method="adelete")
     async def adelete(self, config: Dict[str, Any]) -> None:
-        await self._redis.delete(self._key(config))
+        await self.client.delete(self._key(config))
+
+    async def aclose(self) -> None:
+        """직접 만든 연결 풀 정리 (lifespan 종료 시 호출). 공유 풀은 close_redis_pool() 이 닫음"""
+        if self._owns_client:
+            await self.client.aclose()
 
     def get(self, config: Dict[str, Any]) -> Optional[dict]:
         raise NotImplementedError("동기 get은 테스트 용도로만 구현 필요")
@@ -0,0 +1,76 @@
+# backend/app/core/redis_pool.py
+"""
+프로세스당 하나의 Redis 연결 풀.
+
+session_store, flush_manager, RedisCheckpointer, 검색/LLM 캐시, 턴 잠금이 모두 get_redis() 의
+클라이언트를 공유하므로 워커 프로세스의 Redis 연결 수는 REDIS_MAX_CONNECTIONS 를 넘지 않습니다.
+- BlockingConnectionPool: 풀이 가득 차면 REDIS_POOL_TIMEOUT_SECONDS 까지 빈 연결을 기다림 (즉시 실패하지 않음)
+- health_check_interval: 오래 쉰 연결은 사용 전에 PING 으로 확인해 끊긴 연결을 재연결
+- 응답은 bytes (decode_responses=False). 문자열이 필요한 곳에서 직접 decode
+
+여러 키를 건드리는 작업은 transaction() 으로 묶어 한 번의 왕복(MULTI/EXEC)으로 보냅니다.
+redis 패키지는 첫 get_redis() 호출 시 임포트합니다 (app 임포트 시간 단축).
+"""
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.core.config import settings
+
+_client: Optional[Any] = None
+
+
+def get_redis() -> Any:
+    """공유 풀에 묶인 redis.asyncio.Redis 클라이언트. 첫 호출 시 풀을 만듭니다."""
+    global _client
+    if _client is None:
+        import redis.asyncio as redis
+
+        pool = redis.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_keepalive=True,
+        )
+        _client = redis.Redis(connection_pool=pool)
+    return _client
+
+
+@asynccontextmanager
+async def transaction(client: Optional[Any] = None) -> AsyncIterator[Any]:
+    """
+    블록 안에서 파이프라인에 쌓은 명령을 블록을 나갈 때 MULTI/EXEC 한 번의 왕복으로 실행합니다.
+    블록에서 예외가 나면 아무 명령도 보내지 않습니다.
+
+        async with transaction() as pipe:
+            pipe.set(key, value, ex=ttl)
+            pipe.delete(marker_key)
+    """
+    client = client if client is not None else get_redis()
+    async with client.pipeline(transaction=True) as pipe:
+        yield pipe
+        if len(pipe):
+            await pipe.execute()
+
+
+def pool_stats() -> Dict[str, int]:
+    """풀 사용 현황 (아직 풀이 없으면 0)"""
+    if _client is None:
+        return {"max_connections": settings.REDIS_MAX_CONNECTIONS, "in_use": 0, "idle": 0}
+    pool = _client.connection_pool
+    return {
+        "max_connections": pool.max_connections,
+        "in_use": len(getattr(pool, "_in_use_connections", ())),
+        "idle": len(getattr(pool, "_available_connections", ())),
+    }
+
+
+async def close_redis_pool() -> None:
+    """lifespan 종료 시 호출. 풀의 모든 연결을 닫습니다."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        await _client.connection_pool.disconnect()
+        _client = None
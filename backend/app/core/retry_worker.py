@@ -1,26 +1,55 @@
 # backend/app/core/retry_worker.py
 
-from app.core.flush_manager import has_flush_failed, flush_session_to_postgres, clear_flush_failed
-from app.core.redis_checkpointer import RedisCheckpointer
-from app.core.config import settings
+from typing import Dict, List, Tuple
+
+from app.core.flush_manager import has_flush_failed, filter_flush_failed, flush_session_to_postgres, flush_sessions_to_postgres
+from app.core.graph_registry import get_graph_registry
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+
+async def _redis_cp():
+    """프로세스 공유 RedisCheckpointer (모듈마다 연결 풀을 따로 만들지 않음)"""
+    return (await get_graph_registry()).redis_cp
 
-redis_cp = RedisCheckpointer(settings.REDIS_URL, ttl=settings.SESSION_TTL_SECONDS)
 
 async def retry_failed_flush(session_id: str):
     if not await has_flush_failed(session_id):
         return False
 
     config = {"configurable": {"thread_id": session_id}}
-    state = await redis_cp.aget(config)
+    state = await (await _redis_cp()).aget(config)
     if not state:
-        print(f"[retry flush] session_id={session_id} - Redis 상태 없음")
+        logger.info("[retry flush] session_id=%s - Redis 상태 없음", session_id)
         return False
 
     try:
-        await flush_session_to_postgres(session_id, state.get("memory", {}), state.get("messages", []))
-        await clear_flush_failed(session_id)
-        print(f"[retry flush 성공] session_id={session_id}")
+        await flush_session_to_postgres(session_id, state.get("memory", {}), state.get("messages", []))  # 실패 표시도 해제
+        logger.info("[retry flush 성공] session_id=%s", session_id)
         return True
     except Exception as e:
-        print(f"[retry flush 실패] session_id={session_id}: {e}")
+        logger.error("[retry flush 실패] session_id=%s: %s", session_id, e)
         return False
+
+
+async def retry_failed_flushes(session_ids: List[str]) -> List[str]:
+    """flush 실패 표시된 세션들을 한 번의 배치 flush 로 재시도하고, 성공한 세션 id 목록을 반환"""
+    sessions: Dict[str, Tuple[dict, list]] = {}
+    redis_cp = await _redis_cp()
+    for session_id in await filter_flush_failed(session_ids):
+        state = await redis_cp.aget({"configurable": {"thread_id": session_id}})
+        if not state:
+            logger.info("[retry flush] session_id=%s - Redis 상태 없음", session_id)
+            continue
+        sessions[session_id] = (state.get("memory", {}), state.get("messages", []))
+    if not sessions:
+        return []
+
+    try:
+        await flush_sessions_to_postgres(sessions)
+    except Exception as e:
+        logger.error("[retry flush 실패] 세션 %s개: %s", len(sessions), e)
+        return []
+    logger.info("[retry flush 성공] 세션 %s개", len(sessions))
+    return list(sessions)
@@ -0,0 +1,277 @@
+# backend/app/core/serializers.py
+"""
+체크포인트 직렬화 계층 (Redis 저장용).
+
+바이트 구성: [버전 1바이트][압축 1바이트][본문]
+- 버전   : 포맷이 바뀌면 증가시키고, 이전 버전 디코더를 남겨 배포 간 호환을 유지합니다.
+- 압축   : b"n"(없음) / b"z"(zstd) / b"l"(zlib). 본문이 임계값 이상일 때만 압축합니다.
+- 본문   : msgpack. HumanMessage/AIMessage 등은 Ext 타입의 짧은 위치 기반 레코드로 저장하고,
+           읽을 때는 pydantic 검증 없이 객체를 복원합니다 (저장 시 이미 검증된 값).
+- pydantic 모델은 register_model() 로 등록한 것만, 모듈 경로가 아닌 고정 태그로 저장합니다.
+  등록되지 않은 태그는 SerializationError 이므로 저장된 바이트가 임의 모듈을 import 하게 할 수 없습니다.
+
+pickle 프로토콜 2 이상의 데이터는 항상 0x80 으로 시작하므로, 기존에 pickle로 저장된
+값은 첫 바이트로 구분해 읽을 수 있습니다(legacy 읽기 전용). 기본값은 거부이며,
+배포 전환기에만 CHECKPOINT_ACCEPT_LEGACY_PICKLE=True 로 켜 두었다가 기존 키가 TTL 로
+모두 만료되면(SESSION_TTL_SECONDS) 다시 끕니다.
+"""
+import datetime
+import pickle
+import uuid
+import zlib
+from typing import Any, Dict, Optional, Type
+
+import ormsgpack
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 환경에서는 zlib 사용
+    zstandard = None
+
+FORMAT_VERSION = 1
+_PICKLE_MAGIC = 0x80
+
+_COMPRESSION_NONE = b"n"
+_COMPRESSION_ZSTD = b"z"
+_COMPRESSION_ZLIB = b"l"
+
+# --- Ext 타입 코드 (한 번 정하면 바꾸지 말 것) ---
+_EXT_HUMAN = 1
+_EXT_AI = 2
+_EXT_SYSTEM = 3
+_EXT_TOOL = 4
+_EXT_LC_MESSAGE = 5   # 그 외 BaseMessage (langchain dumpd)
+_EXT_TUPLE = 6
+_EXT_SET = 7
+_EXT_DATETIME = 8
+_EXT_UUID = 9
+_EXT_PYDANTIC_BY_PATH = 10  # 사용 중지: 모듈 경로로 클래스를 찾던 형식 (읽지 않음)
+_EXT_MODEL = 11             # [태그, 필드] (register_model 로 등록된 모델만)
+
+_PACK_OPTIONS = (
+    ormsgpack.OPT_NON_STR_KEYS
+    | ormsgpack.OPT_PASSTHROUGH_TUPLE
+    | ormsgpack.OPT_PASSTHROUGH_DATETIME
+    | ormsgpack.OPT_PASSTHROUGH_UUID
+)
+
+
+class SerializationError(ValueError):
+    pass
+
+
+class Serializer:
+    """dumps/loads 인터페이스 (RedisCheckpointer 가 사용)"""
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class PickleSerializer(Serializer):
+    """기존 동작 (비교/롤백용)"""
+
+    def dumps(self, obj: Any) -> bytes:
+        return pickle.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+# --- 저장 가능한 pydantic 모델 ---
+_MODELS_BY_TAG: Dict[str, Type[BaseModel]] = {}
+_TAGS_BY_MODEL: Dict[Type[BaseModel], str] = {}
+
+
+def register_model(tag: str, cls: Type[BaseModel]) -> Type[BaseModel]:
+    """cls 를 체크포인트에 저장할 수 있게 등록. tag 는 저장 데이터에 남으므로 클래스 이름/위치가 바뀌어도 유지할 것"""
+    existing = _MODELS_BY_TAG.get(tag)
+    if existing is not None and existing is not cls:
+        raise ValueError(f"이미 다른 모델에 쓰인 태그: {tag} ({existing.__qualname__})")
+    _MODELS_BY_TAG[tag] = cls
+    _TAGS_BY_MODEL[cls] = tag
+    return cls
+
+
+# --- 메시지 <-> 압축 레코드 ---
+def _message_record(msg: BaseMessage) -> list:
+    # 자주 비어 있는 필드는 None 으로 두어 크기를 줄임
+    return [msg.content, msg.additional_kwargs or None, msg.id, msg.name]
+
+
+# 필드 기본값 (가변 기본값인 additional_kwargs/response_metadata/invalid_tool_calls 는 복원 때마다 새로 만듦)
+_MESSAGE_DEFAULTS = {
+    cls: dict(cls(content="", **extra).__dict__)
+    for cls, extra in (
+        (HumanMessage, {}), (AIMessage, {}), (SystemMessage, {}), (ToolMessage, {"tool_call_id": ""}),
+    )
+}
+
+
+def _restore_message(cls: Type[BaseMessage], fields: Dict[str, Any]) -> BaseMessage:
+    """pydantic 검증 없이 메시지 복원 (pickle 의 __setstate__ 와 같은 방식, model_construct 보다 빠름)"""
+    msg = cls.__new__(cls)
+    values = dict(_MESSAGE_DEFAULTS[cls])
+    values.update(fields)
+    object.__setattr__(msg, "__dict__", values)
+    object.__setattr__(msg, "__pydantic_fields_set__", set(fields))
+    object.__setattr__(msg, "__pydantic_extra__", {})
+    object.__setattr__(msg, "__pydantic_private__", None)
+    return msg
+
+
+def _default(obj: Any) -> ormsgpack.Ext:
+    if isinstance(obj, HumanMessage):
+        return ormsgpack.Ext(_EXT_HUMAN, _packb(_message_record(obj)))
+    if isinstance(obj, AIMessage):
+        record = _message_record(obj) + [obj.tool_calls or None, obj.response_metadata or None]
+        return ormsgpack.Ext(_EXT_AI, _packb(record))
+    if isinstance(obj, SystemMessage):
+        return ormsgpack.Ext(_EXT_SYSTEM, _packb(_message_record(obj)))
+    if isinstance(obj, ToolMessage):
+        return ormsgpack.Ext(_EXT_TOOL, _packb(_message_record(obj) + [obj.tool_call_id]))
+    if isinstance(obj, BaseMessage):
+        from langchain_core.load import dumpd
+        return ormsgpack.Ext(_EXT_LC_MESSAGE, _packb(dumpd(obj)))
+    if isinstance(obj, tuple):
+        return ormsgpack.Ext(_EXT_TUPLE, _packb(list(obj)))
+    if isinstance(obj, (set, frozenset)):
+        return ormsgpack.Ext(_EXT_SET, _packb(list(obj)))
+    if isinstance(obj, datetime.datetime):
+        return ormsgpack.Ext(_EXT_DATETIME, obj.isoformat().encode())
+    if isinstance(obj, uuid.UUID):
+        return ormsgpack.Ext(_EXT_UUID, obj.bytes)
+    if isinstance(obj, BaseModel):
+        tag = _TAGS_BY_MODEL.get(type(obj))
+        if tag is None:
+            raise TypeError(f"register_model 로 등록되지 않은 모델: {type(obj)!r}")
+        return ormsgpack.Ext(_EXT_MODEL, _packb([tag, obj.model_dump()]))
+    raise TypeError(f"직렬화할 수 없는 타입: {type(obj)!r}")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code in (_EXT_HUMAN, _EXT_SYSTEM):
+        content, additional_kwargs, msg_id, name = _unpackb(data)
+        return _restore_message(HumanMessage if code == _EXT_HUMAN else SystemMessage, {
+            "content": content, "additional_kwargs": additional_kwargs or {}, "response_metadata": {},
+            "id": msg_id, "name": name,
+        })
+    if code == _EXT_AI:
+        content, additional_kwargs, msg_id, name, tool_calls, response_metadata = _unpackb(data)
+        return _restore_message(AIMessage, {
+            "content": content, "additional_kwargs": additional_kwargs or {},
+            "response_metadata": response_metadata or {}, "id": msg_id, "name": name,
+            "tool_calls": tool_calls or [], "invalid_tool_calls": [],
+        })
+    if code == _EXT_TOOL:
+        content, additional_kwargs, msg_id, name, tool_call_id = _unpackb(data)
+        return _restore_message(ToolMessage, {
+            "content": content, "additional_kwargs": additional_kwargs or {}, "response_metadata": {},
+            "id": msg_id, "name": name, "tool_call_id": tool_call_id,
+        })
+    if code == _EXT_LC_MESSAGE:
+        from langchain_core.load import load
+        return load(_unpackb(data))
+    if code == _EXT_TUPLE:
+        return tuple(_unpackb(data))
+    if code == _EXT_SET:
+        return set(_unpackb(data))
+    if code == _EXT_DATETIME:
+        return datetime.datetime.fromisoformat(data.decode())
+    if code == _EXT_UUID:
+        return uuid.UUID(bytes=data)
+    if code == _EXT_MODEL:
+        tag, fields = _unpackb(data)
+        cls = _MODELS_BY_TAG.get(tag)
+        if cls is None:
+            raise SerializationError(f"등록되지 않은 모델 태그: {tag!r}")
+        return cls.model_validate(fields)
+    if code == _EXT_PYDANTIC_BY_PATH:
+        raise SerializationError("모듈 경로 기반 모델 데이터는 지원하지 않습니다.")
+    return ormsgpack.Ext(code, data)
+
+
+def _packb(obj: Any) -> bytes:
+    return ormsgpack.packb(obj, default=_default, option=_PACK_OPTIONS)
+
+
+def _unpackb(data: bytes) -> Any:
+    return ormsgpack.unpackb(data, ext_hook=_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+class MsgpackSerializer(Serializer):
+    """버전 헤더 + (선택) 압축 + msgpack 본문"""
+
+    def __init__(self, compression: Optional[str] = "zstd", compress_min_bytes: int = 1024,
+                 level: int = 3, allow_legacy_pickle: bool = False):
+        if compression == "zstd" and zstandard is None:
+            compression = "zlib"
+        if compression not in (None, "none", "zstd", "zlib"):
+            raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+        self.compression = None if compression == "none" else compression
+        self.compress_min_bytes = compress_min_bytes
+        self.level = level
+        self.allow_legacy_pickle = allow_legacy_pickle
+        if self.compression == "zstd":
+            self._zstd_c = zstandard.ZstdCompressor(level=level)
+            self._zstd_d = zstandard.ZstdDecompressor()
+
+    def dumps(self, obj: Any) -> bytes:
+        body = _packb(obj)
+        flag = _COMPRESSION_NONE
+        if self.compression and len(body) >= self.compress_min_bytes:
+            if self.compression == "zstd":
+                body, flag = self._zstd_c.compress(body), _COMPRESSION_ZSTD
+            else:
+                body, flag = zlib.compress(body, self.level), _COMPRESSION_ZLIB
+        return bytes((FORMAT_VERSION,)) + flag + body
+
+    def loads(self, data: bytes) -> Any:
+        if not data:
+            raise SerializationError("빈 데이터")
+        version = data[0]
+        if version == _PICKLE_MAGIC:
+            if not self.allow_legacy_pickle:
+                raise SerializationError("legacy pickle 데이터 읽기가 비활성화되어 있습니다.")
+            return pickle.loads(data)
+        if version != FORMAT_VERSION:
+            raise SerializationError(f"알 수 없는 포맷 버전: {version}")
+
+        flag, body = data[1:2], data[2:]
+        if flag == _COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise SerializationError("zstd로 압축된 데이터지만 zstandard가 설치되어 있지 않습니다.")
+            decompressor = self._zstd_d if self.compression == "zstd" else zstandard.ZstdDecompressor()
+            body = decompressor.decompress(body)
+        elif flag == _COMPRESSION_ZLIB:
+            body = zlib.decompress(body)
+        elif flag != _COMPRESSION_NONE:
+            raise SerializationError(f"알 수 없는 압축 플래그: {flag!r}")
+        try:
+            return _unpackb(body)
+        except ValueError as e:
+            # ormsgpack 은 ext_hook 의 예외(등록되지 않은 모델 태그 등)를 ValueError 로 감싸 원인을 잃음
+            raise SerializationError(f"본문 디코딩 실패: {e}") from e
+
+
+def get_checkpoint_serializer() -> Serializer:
+    """설정(CHECKPOINT_SERIALIZER 등)에 맞는 직렬화기 생성"""
+    if settings.CHECKPOINT_SERIALIZER == "pickle":
+        return PickleSerializer()
+    return MsgpackSerializer(
+        compression=settings.CHECKPOINT_COMPRESSION,
+        compress_min_bytes=settings.CHECKPOINT_COMPRESS_MIN_BYTES,
+        allow_legacy_pickle=settings.CHECKPOINT_ACCEPT_LEGACY_PICKLE,
+    )
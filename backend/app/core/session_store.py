@@ -1,21 +1,23 @@
 # backend/app/core/session_store.py
 
 import json
-import redis.asyncio as redis
 from app.core.config import settings
-
-r = redis.from_url(settings.REDIS_URL)
+from app.core.redis_pool import get_redis
 
 SESSION_PREFIX = "session_info:"
 
 async def save_session_initial_info(session_id: str, topic: str, agent_type: str):
     key = SESSION_PREFIX + session_id
     value = json.dumps({"topic": topic, "agent_type": agent_type})
-    await r.set(key, value, ex=settings.SESSION_TTL_SECONDS)
+    await get_redis().set(key, value, ex=settings.SESSION_TTL_SECONDS)
 
 async def get_session_initial_info(session_id: str) -> dict:
     key = SESSION_PREFIX + session_id
-    raw = await r.get(key)
+    raw = await get_redis().get(key)
     if raw is None:
         return {}
     return json.loads(raw)
+
+def refresh_session_ttl(pipe, session_id: str) -> None:
+    """활동 중인 세션의 초기 정보 만료 시간을 연장 (호출자의 파이프라인에 추가만 함)"""
+    pipe.expire(SESSION_PREFIX + session_id, settings.SESSION_TTL_SECONDS)
@@ -1,16 +1,32 @@
 # backend/app/core/sql_checkpointer.py
 
 import json
+from typing import Any, List, Optional, Tuple
+from sqlalchemy import delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from app.db.models import GraphStateRecord
-from langchain_core.load import dumps  # 상단 import
+from app.db.dialect import upsert_rows
+from app.db.models import GraphStateRecord, CheckpointWriteRecord
+from langchain_core.load import dumps, load  # 상단 import
+from app.core.log import get_logger
+from app.core.metrics import STORAGE_LATENCY, timed
+
+logger = get_logger(__name__)
+
+# (thread_id, checkpoint_id, task_id, idx, channel, value)
+WriteRecord = Tuple[str, str, str, int, str, Any]
+
+
+def _stored_checkpoint_id(state: dict) -> Optional[str]:
+    metadata = state.get("metadata") if isinstance(state, dict) else None
+    return metadata.get("checkpoint_id") if isinstance(metadata, dict) else None
 
 class SQLCheckpointer:
     def __init__(self, db_session_factory):
         # db_session_factory는 async_sessionmaker 또는 asynccontextmanager
         self.db_session_factory = db_session_factory
 
+    @timed(STORAGE_LATENCY, "checkpoint", backend="sql", method="aget")
     async def aget(self, config: dict):
         session_id = config["configurable"]["thread_id"]
         async with self.db_session_factory() as session:  # AsyncSession 팩토리 호출
@@ -21,24 +37,86 @@ class SQLCheckpointer:
             return record.state_json if record else None
 
     async def aset(self, config: dict, state: dict) -> None:
-        print("[SQLCheckpointer] aset 호출됨")
-        print("  - thread_id:", config.get("configurable", {}).get("thread_id"))
-        session_id = config["configurable"]["thread_id"]
+        logger.debug("[SQLCheckpointer] aset 호출됨 thread_id=%s", config.get("configurable", {}).get("thread_id"))
+        await self.aset_many([(config, state)])
 
+    @timed(STORAGE_LATENCY, "checkpoint", backend="sql", method="aset_many")
+    async def aset_many(self, items: List[Tuple[dict, dict]]) -> None:
+        """여러 thread의 상태를 INSERT ... ON CONFLICT DO UPDATE 한 문장/한 커밋으로 저장 (write-behind 배치 flush용)"""
+        if not items:
+            return
         # 💡 LangChain 메시지 객체 등 JSON 직렬화가 안되는 항목을 문자열로 변환
-        json_serialized_state = json.loads(dumps(state))
+        # 같은 thread가 여러 번 오면 마지막 상태만 (한 문장 안에서 같은 행을 두 번 갱신할 수 없음)
+        states = {
+            config["configurable"]["thread_id"]: json.loads(dumps(state))
+            for config, state in items
+        }
+        checkpoint_ids = {
+            config["configurable"]["thread_id"]: _stored_checkpoint_id(state)
+            for config, state in items
+        }
+        async with self.db_session_factory() as session:
+            await upsert_rows(
+                session,
+                GraphStateRecord.__table__,
+                [{"thread_id": thread_id, "state_json": state_json} for thread_id, state_json in states.items()],
+                index_elements=["thread_id"],
+                update_columns=["state_json"],
+            )
+            for thread_id, checkpoint_id in checkpoint_ids.items():
+                await self._prune_stale_writes(session, thread_id, checkpoint_id)
+            await session.commit()
+
+    async def _prune_stale_writes(self, session: AsyncSession, thread_id: str, checkpoint_id: Optional[str]) -> None:
+        """새 기준 상태가 저장되면 다른 체크포인트에 대한 pending writes는 정리"""
+        if checkpoint_id is None:
+            return
+        await session.execute(
+            delete(CheckpointWriteRecord).where(
+                CheckpointWriteRecord.thread_id == thread_id,
+                CheckpointWriteRecord.checkpoint_id != checkpoint_id,
+            )
+        )
 
+    # --- pending writes (append-only) ---
+    async def aput_writes(self, config: dict, checkpoint_id: Optional[str], task_id: str, writes: List[Tuple[str, Any]]) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        await self.aput_writes_many([
+            (thread_id, checkpoint_id or "latest", task_id, idx, channel, value)
+            for idx, (channel, value) in enumerate(writes)
+        ])
+
+    @timed(STORAGE_LATENCY, "checkpoint", backend="sql", method="aput_writes_many")
+    async def aput_writes_many(self, records: List[WriteRecord]) -> None:
+        """write 레코드들을 executemany 한 번으로 추가"""
+        if not records:
+            return
+        rows = [
+            {
+                "thread_id": thread_id, "checkpoint_id": checkpoint_id, "task_id": task_id,
+                "idx": idx, "channel": channel, "value_json": json.loads(dumps(value)),
+            }
+            for thread_id, checkpoint_id, task_id, idx, channel, value in records
+        ]
+        async with self.db_session_factory() as session:
+            await session.execute(insert(CheckpointWriteRecord), rows)
+            await session.commit()
+
+    @timed(STORAGE_LATENCY, "checkpoint", backend="sql", method="aget_writes")
+    async def aget_writes(self, config: dict, checkpoint_id: Optional[str]) -> List[Tuple[str, str, Any]]:
+        thread_id = config["configurable"]["thread_id"]
         async with self.db_session_factory() as session:
             result = await session.execute(
-                select(GraphStateRecord).where(GraphStateRecord.thread_id == session_id)
+                select(CheckpointWriteRecord.task_id, CheckpointWriteRecord.channel, CheckpointWriteRecord.value_json)
+                .where(
+                    CheckpointWriteRecord.thread_id == thread_id,
+                    CheckpointWriteRecord.checkpoint_id == (checkpoint_id or "latest"),
+                )
+                .order_by(CheckpointWriteRecord.id)
             )
-            record = result.scalar_one_or_none()
-            if record:
-                record.state_json = json_serialized_state
-            else:
-                session.add(GraphStateRecord(thread_id=session_id, state_json=json_serialized_state))
-            await session.commit()
+            return [(task_id, channel, load(value)) for task_id, channel, value in result.all()]
 
+    @timed(STORAGE_LATENCY, "checkpoint", backend="sql", method="adelete")
     async def adelete(self, config: dict) -> None:
         session_id = config["configurable"]["thread_id"]
         async with self.db_session_factory() as session:
@@ -48,4 +126,5 @@ class SQLCheckpointer:
             record = result.scalar_one_or_none()
             if record:
                 await session.delete(record)
-                await session.commit()
+            await session.execute(delete(CheckpointWriteRecord).where(CheckpointWriteRecord.thread_id == session_id))
+            await session.commit()
@@ -0,0 +1,214 @@
+# backend/app/core/state_cache.py
+"""
+SessionStateCache: Why 세션 상태를 역직렬화된(hydrated) 형태로 프로세스 메모리에 두는 LRU 캐시입니다.
+
+- 자주 쓰이는 세션은 턴마다 UserStateStore.load(DB) 와 메시지 객체 복원을 건너뜁니다.
+- 항목마다 버전(session_state.updated_at 의 마이크로초)을 함께 저장합니다.
+- 쓰기는 write-through: 호출자가 DB 에 저장한 뒤 commit() 으로 캐시를 갱신하고 다른 워커에 무효화를 알립니다.
+- pubsub=False (기본) 이면 다른 워커의 저장을 알 수 없으므로, 호출자는 hit 마다 DB 의 버전(updated_at 만 조회)과
+  항목의 버전을 비교해야 합니다 (why_orchestration._load_why_state). 상태 본문 전송과 역직렬화만 생략됩니다.
+- 여러 워커로 배포할 때 pubsub=True (settings.SESSION_STATE_CACHE_PUBSUB) 로 켜면 버전 확인 쿼리도 생략합니다.
+  commit() 은 Redis 채널에 {"session_id", "version", "origin"} 을 PUBLISH 하고, 각 워커의 리스너는
+  다른 워커가 보낸 메시지의 버전과 자기 항목의 버전이 다르면 항목을 버립니다.
+  리스너가 구독 중이 아닐 때(시작 전/연결 끊김)는 무효화를 놓칠 수 있으므로 캐시를 쓰지 않고,
+  끊기면 전체를 비운 뒤 다시 구독합니다. 구독은 공유 풀의 연결 하나를 계속 점유합니다.
+- DB 읽기 도중 무효화된 세션의 결과는 캐시에 넣지 않습니다 (load_token/put 의 token 비교).
+- 캐시는 상태 객체를 복사하지 않습니다. get() 결과를 수정하지 말고 필요하면 복사해서 쓰세요.
+"""
+import asyncio
+import json
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.log import get_logger
+from app.core.redis_pool import get_redis
+
+logger = get_logger(__name__)
+
+DEFAULT_CHANNEL = "session_state_invalidate"
+_RESUBSCRIBE_DELAY_SECONDS = 1.0
+_EPOCH = datetime(1970, 1, 1)
+
+
+def state_version(updated_at: datetime) -> int:
+    """session_state.updated_at(UTC) 을 캐시 버전(에포크 이후 마이크로초)으로 변환"""
+    if updated_at.tzinfo is not None:
+        updated_at = updated_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return (updated_at - _EPOCH) // timedelta(microseconds=1)
+
+
+class _CachedState:
+    __slots__ = ("state", "version")
+
+    def __init__(self, state: Dict[str, Any], version: int):
+        self.state = state
+        self.version = version
+
+
+class SessionStateCache:
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        enabled: bool = True,
+        pubsub: bool = False,
+        channel: str = DEFAULT_CHANNEL,
+        redis_client=None,
+    ):
+        self.maxsize = maxsize
+        self.enabled = enabled and maxsize > 0
+        self.pubsub = pubsub
+        self.channel = channel
+        self._redis = redis_client  # None 이면 공유 풀의 클라이언트 (get_redis)
+        self.worker_id = uuid.uuid4().hex  # 자기가 보낸 무효화는 무시
+
+        self._entries: "OrderedDict[str, _CachedState]" = OrderedDict()
+        # 무효화 기록: 세션별 마지막 무효화 시점(epoch). 크기를 제한하고, 밀려난 기록은 _floor 로 보수적으로 처리
+        self._epoch = 0
+        self._invalidated_at: "OrderedDict[str, int]" = OrderedDict()
+        self._floor = 0
+        self._subscribed = False
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0, "invalidations": 0}
+
+    # --- 생명주기 ---
+    def start(self) -> None:
+        if self.enabled and self.pubsub and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._listen(), name="session-state-invalidation")
+
+    async def stop(self) -> None:
+        """리스너를 멈추고 캐시를 비웁니다 (lifespan 종료 훅)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._subscribed = False
+        self._entries.clear()
+
+    def _usable(self) -> bool:
+        if not self.enabled:
+            return False
+        if self.pubsub:
+            self.start()  # lifespan 없이 쓰이는 경우를 위해 첫 사용 시 시작 (구독 전까지는 캐시를 쓰지 않음)
+            return self._subscribed
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # --- 읽기 ---
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        cached = self.get_versioned(session_id)
+        return cached[0] if cached is not None else None
+
+    def get_versioned(self, session_id: str) -> Optional[Tuple[Dict[str, Any], int]]:
+        """(상태, 버전). pubsub 이 아니면 호출자가 버전을 DB 와 비교해야 함 (틀리면 discard)"""
+        entry = self._entries.get(session_id) if self._usable() else None
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(session_id)
+        self.stats["hits"] += 1
+        return entry.state, entry.version
+
+    def load_token(self) -> int:
+        """DB 읽기 전에 받아 두었다가 put(token=...) 에 넘김"""
+        return self._epoch
+
+    def put(self, session_id: str, state: Dict[str, Any], version: int, token: Optional[int] = None) -> None:
+        """DB 에서 읽은 상태를 캐시에 넣음. token 이후 이 세션이 무효화됐으면 넣지 않음"""
+        if not self._usable():
+            return
+        if token is not None and (self._invalidated_at.get(session_id, 0) > token or self._floor > token):
+            return
+        existing = self._entries.get(session_id)
+        if existing is not None and existing.version > version:
+            return
+        self._store(session_id, state, version)
+
+    # --- 쓰기 ---
+    async def commit(self, session_id: str, state: Dict[str, Any], version: int) -> None:
+        """DB 에 저장한 상태로 캐시를 갱신하고(write-through), pubsub 이면 다른 워커에 무효화를 알림"""
+        if not self.enabled:
+            return
+        self._record_invalidation(session_id)  # 이 쓰기 이전에 시작된 DB 읽기 결과가 덮어쓰지 않도록
+        if self._usable():
+            self._store(session_id, state, version)
+        if self.pubsub:
+            message = json.dumps({"session_id": session_id, "version": version, "origin": self.worker_id})
+            try:
+                await (self._redis or get_redis()).publish(self.channel, message)
+            except Exception as e:
+                # 다른 워커가 오래된 상태를 쓸 수 있음: 로그만 남기고 턴은 계속 (DB 저장은 이미 끝남)
+                logger.error("[StateCache] session_id=%s 무효화 알림 실패: %s", session_id, e)
+
+    def discard(self, session_id: str, stale: bool = False) -> None:
+        """이 워커의 항목만 버림 (저장 실패, 버전 불일치 등으로 캐시 내용을 믿을 수 없을 때)"""
+        self._record_invalidation(session_id)
+        if self._entries.pop(session_id, None) is not None and stale:
+            self.stats["stale"] += 1
+
+    def invalidate(self, session_id: str, version: Optional[int] = None) -> None:
+        """다른 워커가 version 으로 저장한 세션의 항목을 버림 (같은 버전이면 이미 최신이므로 유지)"""
+        self._record_invalidation(session_id)
+        entry = self._entries.get(session_id)
+        if entry is not None and (version is None or entry.version != version):
+            del self._entries[session_id]
+            self.stats["invalidations"] += 1
+
+    def _store(self, session_id: str, state: Dict[str, Any], version: int) -> None:
+        self._entries[session_id] = _CachedState(state, version)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _record_invalidation(self, session_id: str) -> None:
+        self._epoch += 1
+        self._invalidated_at[session_id] = self._epoch
+        self._invalidated_at.move_to_end(session_id)
+        while len(self._invalidated_at) > self.maxsize:
+            _, epoch = self._invalidated_at.popitem(last=False)
+            self._floor = max(self._floor, epoch)
+
+    # --- 무효화 리스너 ---
+    def _handle_message(self, data: Any) -> None:
+        try:
+            message = json.loads(data)
+            if message.get("origin") == self.worker_id:
+                return
+            self.invalidate(message["session_id"], message.get("version"))
+        except Exception as e:
+            logger.warning("[StateCache] 알 수 없는 무효화 메시지 무시: %r (%s)", data, e)
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = (self._redis or get_redis()).pubsub()
+                await pubsub.subscribe(self.channel)
+                self._subscribed = True
+                logger.info("[StateCache] 무효화 채널 구독: %s", self.channel)
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None and message.get("type") == "message":
+                        self._handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("[StateCache] 무효화 구독 끊김, 캐시를 비우고 다시 구독합니다: %s", e)
+            finally:
+                # 구독하지 않는 동안의 무효화는 받을 수 없으므로 가진 항목을 모두 버림
+                self._subscribed = False
+                self._entries.clear()
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+            await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
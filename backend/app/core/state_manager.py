@@ -6,6 +6,9 @@ from app.core.session_store import save_session_initial_info
 from app.core.session_store import get_session_initial_info as get_session_info_from_redis
 import asyncio
 import os  # ✅ 추가됨
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
 
 async def create_new_session(topic: str, initial_agent_type: Optional[str] = None) -> str:
     """ 새로운 세션 ID 생성 + Redis에 초기 정보 저장 """
@@ -19,16 +22,17 @@ async def create_new_session(topic: str, initial_agent_type: Optional[str] = Non
             save_session_initial_info(new_session_id, topic, agent_type)
         )
 
-    print(f"세션 초기 정보 저장됨 (Redis): ID={new_session_id}, 주제='{topic}', 초기 에이전트='{agent_type}'")
+    logger.info("세션 초기 정보 저장됨 (Redis): ID=%s, 주제='%s', 초기 에이전트='%s'", new_session_id, topic, agent_type)
     return new_session_id
 
 async def get_session_initial_info(session_id: str):
     return await get_session_info_from_redis(session_id)
 
 async def delete_session_initial_info(session_id: str) -> bool:
-    from app.core.session_store import r, SESSION_PREFIX
-    result = await r.delete(SESSION_PREFIX + session_id)
+    from app.core.redis_pool import get_redis
+    from app.core.session_store import SESSION_PREFIX
+    result = await get_redis().delete(SESSION_PREFIX + session_id)
     if result:
-        print(f"세션 초기 정보 삭제됨 (Redis): ID={session_id}")
+        logger.info("세션 초기 정보 삭제됨 (Redis): ID=%s", session_id)
         return True
     return False
@@ -0,0 +1,129 @@
+# backend/app/core/streaming.py
+"""
+LangGraph astream_events(version="v2") → 클라이언트 스트림 이벤트 변환 및 SSE 포맷팅.
+
+클라이언트로 보내는 이벤트 (dict: {"event": ..., "data": {...}}):
+- node  : {"node": 노드 이름, "status": "start" | "end"}   노드 전환
+- token : {"node": 노드 이름, "delta": 텍스트 조각}         LLM 토큰 델타
+- final : {"content": 최종 응답}                            턴 종료 (체크포인트/flush 완료 후)
+- error : {"content": 오류 메시지}                          턴 실패
+"""
+import json
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from fastapi.responses import StreamingResponse
+
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+StreamEvent = Dict[str, Any]
+
+
+def graph_node_names(app_graph) -> frozenset:
+    """컴파일된 그래프의 사용자 정의 노드 이름 (__start__ 등 내부 노드 제외)"""
+    return frozenset(name for name in app_graph.nodes if not name.startswith("__"))
+
+
+def is_root_event(ev: Dict[str, Any]) -> bool:
+    """그래프 실행 자체(LangGraph 루트 런)의 이벤트인지 여부"""
+    return not ev.get("parent_ids")
+
+
+def translate_graph_event(
+    ev: Dict[str, Any],
+    node_names: Iterable[str],
+    silent_nodes: Iterable[str] = (),
+) -> Optional[StreamEvent]:
+    """
+    astream_events v2 이벤트 하나를 클라이언트 이벤트로 변환합니다. 전달할 필요가 없으면 None.
+    silent_nodes 에서 나온 토큰(포커스 결정 등 내부용 LLM 호출)은 보내지 않습니다.
+    """
+    kind = ev.get("event")
+    node = ev.get("metadata", {}).get("langgraph_node")
+
+    if kind in ("on_chain_start", "on_chain_end") and ev.get("name") == node and node in node_names:
+        return {"event": "node", "data": {"node": node, "status": "start" if kind == "on_chain_start" else "end"}}
+
+    if kind == "on_chat_model_stream" and node not in silent_nodes:
+        content = getattr(ev.get("data", {}).get("chunk"), "content", None)
+        # 구조화 출력(tool call) 청크는 content 가 비어 있으므로 자연스럽게 걸러짐
+        if isinstance(content, str) and content:
+            return {"event": "token", "data": {"node": node, "delta": content}}
+
+    return None
+
+
+class GraphRunResult:
+    """루트 런 이벤트에서 최종 상태와 interrupt 를 모아 ainvoke 와 같은 형태의 결과를 만듭니다."""
+
+    def __init__(self):
+        self.output: Optional[Dict[str, Any]] = None
+        self.interrupts: List[Any] = []
+
+    def observe(self, ev: Dict[str, Any]) -> bool:
+        """루트 런 이벤트면 기록하고 True 반환 (클라이언트로 보낼 필요 없음)"""
+        if not is_root_event(ev):
+            return False
+        kind = ev.get("event")
+        data = ev.get("data", {})
+        if kind == "on_chain_stream":
+            chunk = data.get("chunk")
+            if isinstance(chunk, dict) and "__interrupt__" in chunk:
+                self.interrupts.extend(chunk["__interrupt__"])
+        elif kind == "on_chain_end":
+            output = data.get("output")
+            self.output = output if isinstance(output, dict) else None
+        return True
+
+    def as_invoke_output(self) -> Optional[Dict[str, Any]]:
+        """ainvoke 반환값과 동일하게 interrupt 가 있으면 "__interrupt__" 키를 붙여 반환"""
+        if self.output is None:
+            return None
+        if self.interrupts:
+            return {**self.output, "__interrupt__": list(self.interrupts)}
+        return self.output
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _sse_body(events: AsyncIterator[StreamEvent]) -> AsyncIterator[str]:
+    try:
+        async for ev in events:
+            yield format_sse(ev["event"], ev["data"])
+    except Exception as e:
+        # 응답 헤더가 이미 나간 뒤라 HTTP 상태 코드로는 알릴 수 없으므로 error 이벤트로 전달
+        logger.exception("[SSE] 스트림 도중 오류: %s", e)
+        yield format_sse("error", {"content": f"(시스템 오류: {e})"})
+
+
+async def prime_stream(events: AsyncIterator[StreamEvent]) -> AsyncIterator[StreamEvent]:
+    """
+    첫 이벤트까지 미리 실행한 스트림을 반환합니다. 턴 시작 전에 나는 오류(예: TurnInProgressError)를
+    응답 헤더를 보내기 전에 받아 HTTP 상태 코드로 돌려줄 수 있습니다.
+    """
+    try:
+        first = await events.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def _chained() -> AsyncIterator[StreamEvent]:
+        try:
+            if first is not None:
+                yield first
+                async for ev in events:
+                    yield ev
+        finally:
+            await events.aclose()
+
+    return _chained()
+
+
+def sse_response(events: AsyncIterator[StreamEvent]) -> StreamingResponse:
+    return StreamingResponse(
+        _sse_body(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},  # 프록시 버퍼링 방지
+    )
@@ -0,0 +1,162 @@
+# backend/app/core/tracing.py
+"""
+턴 단위 지연 분해(trace): 한 요청이 어디서 시간을 썼는지 구간별로 기록하는 디버그 기능.
+
+- 엔드포인트가 trace_turn() 으로 TurnTrace 를 contextvar 에 올리면, 그 안에서 span(name, category) 으로
+  감싼 구간이 모두 같은 TurnTrace 에 쌓입니다. LangGraph 노드/LLM 호출은 별도 태스크에서 실행되지만
+  태스크는 생성 시점의 contextvar 를 복사하므로 같은 TurnTrace 를 봅니다.
+- trace 가 없으면 span() 은 contextvar 조회 한 번으로 끝나므로 평소 요청에는 비용이 거의 없습니다.
+- 구간 분류(category):
+    state_load  체크포인트/세션 상태 읽기        graph   그래프 실행 전체 (astream_events / ainvoke)
+    node        그래프 노드 실행                  llm_queue  LLM 승인 대기 (llm_admission)
+    llm         LLM 호출 (승인 이후, 네트워크)    search  웹 검색
+    checkpoint  Redis/SQL 체크포인터 메서드       flush   턴 종료 후 PostgreSQL 저장
+- 활성화: settings.DEBUG_TRACE (모든 응답) 또는 요청 헤더 X-Debug-Trace (settings.DEBUG_TRACE_HEADER_ENABLED 일 때, 기본 꺼짐).
+  헤더 값이 "chrome" 이면 Chrome trace-event JSON 으로 돌려주므로 그대로 파일에 저장해
+  chrome://tracing 이나 Perfetto 에서 플레임그래프처럼 볼 수 있습니다.
+"""
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+TRACE_HEADER = "X-Debug-Trace"
+TRACE_FORMATS = ("summary", "chrome")
+_DISABLED_VALUES = frozenset({"", "0", "false", "off", "no"})
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start: float               # time.perf_counter
+    end: float
+    task: int                  # 같은 trace 안에서 태스크별 번호 (Chrome trace 의 tid)
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.start) * 1000
+
+
+class TurnTrace:
+    def __init__(self, name: str, fmt: str = "summary"):
+        if fmt not in TRACE_FORMATS:
+            raise ValueError(f"지원하지 않는 trace 형식입니다: {fmt}")
+        self.name = name
+        self.fmt = fmt
+        self.started = time.perf_counter()
+        self.ended: Optional[float] = None
+        self.spans: List[Span] = []
+        self._tasks: Dict[int, int] = {}
+
+    def _task_number(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        return self._tasks.setdefault(id(task), len(self._tasks))
+
+    def add(self, name: str, category: str, start: float, end: float, attrs: Dict[str, Any]) -> None:
+        self.spans.append(Span(name, category, start, end, self._task_number(), attrs))
+
+    def finish(self) -> None:
+        self.ended = time.perf_counter()
+
+    @property
+    def total_ms(self) -> float:
+        return ((self.ended or time.perf_counter()) - self.started) * 1000
+
+    def summary(self) -> Dict[str, Any]:
+        """분류별 합계와 시작 시각 순 구간 목록 (중첩 구간은 각 분류에 따로 합산됨)"""
+        by_category: Dict[str, float] = {}
+        for span in self.spans:
+            by_category[span.category] = by_category.get(span.category, 0.0) + span.duration_ms
+        return {
+            "name": self.name,
+            "total_ms": round(self.total_ms, 3),
+            "by_category_ms": {category: round(ms, 3) for category, ms in by_category.items()},
+            "spans": [
+                {
+                    "name": span.name,
+                    "category": span.category,
+                    "start_ms": round((span.start - self.started) * 1000, 3),
+                    "duration_ms": round(span.duration_ms, 3),
+                    **span.attrs,
+                }
+                for span in sorted(self.spans, key=lambda s: s.start)
+            ],
+        }
+
+    def to_chrome(self) -> Dict[str, Any]:
+        """Chrome trace-event 형식 (완료 이벤트 "X", 마이크로초 단위)"""
+        events = [{
+            "name": self.name, "cat": "turn", "ph": "X", "pid": 1, "tid": 0,
+            "ts": 0.0, "dur": round(self.total_ms * 1000, 1),
+        }]
+        for span in self.spans:
+            events.append({
+                "name": span.name, "cat": span.category, "ph": "X", "pid": 1, "tid": span.task,
+                "ts": round((span.start - self.started) * 1_000_000, 1),
+                "dur": round((span.end - span.start) * 1_000_000, 1),
+                "args": span.attrs,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self) -> Dict[str, Any]:
+        return self.to_chrome() if self.fmt == "chrome" else self.summary()
+
+
+_current: ContextVar[Optional[TurnTrace]] = ContextVar("turn_trace", default=None)
+
+
+def current_trace() -> Optional[TurnTrace]:
+    return _current.get()
+
+
+@contextmanager
+def span(name: str, category: str, **attrs: Any) -> Iterator[None]:
+    """실행 중인 trace 가 있으면 블록 구간을 기록 (없으면 아무것도 하지 않음)"""
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, category, start, time.perf_counter(), attrs)
+
+
+def trace_format(header_value: Optional[str]) -> Optional[str]:
+    """설정과 X-Debug-Trace 헤더로 이번 요청의 trace 형식을 결정 (None 이면 수집하지 않음)"""
+    if header_value is not None and settings.DEBUG_TRACE_HEADER_ENABLED:
+        value = header_value.strip().lower()
+        if value not in _DISABLED_VALUES:
+            return "chrome" if value == "chrome" else "summary"
+    return "summary" if settings.DEBUG_TRACE else None
+
+
+@contextmanager
+def trace_turn(name: str, fmt: Optional[str]) -> Iterator[Optional[TurnTrace]]:
+    """fmt 가 있으면 이번 요청의 TurnTrace 를 만들어 블록 동안 현재 trace 로 설정"""
+    if fmt is None:
+        yield None
+        return
+    trace = TurnTrace(name, fmt)
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        trace.finish()
+        _current.reset(token)
+
+
+def trace_payload(trace: Optional[TurnTrace]) -> Optional[Dict[str, Any]]:
+    return trace.export() if trace is not None else None
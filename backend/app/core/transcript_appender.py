@@ -0,0 +1,112 @@
+# backend/app/core/transcript_appender.py
+"""
+TranscriptAppender: 대화 로그(transcript) 행을 모아 배치로 저장하는 백그라운드 appender 입니다.
+
+- 모든 세션의 행을 하나의 버퍼에 모으고, flush_interval 마다 또는 batch_size 행이 쌓이면
+  한 트랜잭션의 executemany 로 저장합니다 (메시지마다 트랜잭션을 열지 않음).
+- 버퍼가 max_pending 에 도달하면 append 가 대기합니다 (backpressure).
+- 배치 저장이 실패하면 세션별로 나눠 다시 시도해, 문제 있는 세션의 행만 버립니다.
+- flush() 는 즉시 저장(테스트용), drain() 은 종료 시 남은 행을 모두 저장합니다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+TranscriptRow = Dict[str, Any]  # {"session_id", "role", "content", "occurred_at"}
+
+
+class TranscriptAppender:
+    def __init__(
+        self,
+        write_rows: Callable[[List[TranscriptRow]], Awaitable[None]],
+        flush_interval_ms: int = 200,
+        batch_size: int = 500,
+        max_pending: int = 5000,
+    ):
+        self.write_rows = write_rows  # 행 목록을 한 트랜잭션으로 저장하는 함수 (UserStateStore.insert_transcript_rows)
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+
+        self._pending: List[TranscriptRow] = []
+        self._cond = asyncio.Condition()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()  # 백그라운드 flush 와 flush() 호출이 겹쳐 순서가 섞이지 않도록
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.stats = {"appended": 0, "flushed": 0, "batches": 0, "dropped": 0}
+
+    # --- 생명주기 ---
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._closed = False
+            self._task = asyncio.create_task(self._run(), name="transcript-appender")
+
+    async def drain(self) -> None:
+        """새 행 수집을 멈추고 남은 행을 모두 저장합니다 (lifespan 종료 훅)."""
+        self._closed = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+
+    # --- 생산자 측 ---
+    async def append(self, rows: List[TranscriptRow]) -> None:
+        if not rows:
+            return
+        self.start()  # lifespan 없이 쓰이는 경우(스크립트 등)를 위해 첫 사용 시 시작
+        async with self._cond:
+            while len(self._pending) >= self.max_pending and not self._closed:
+                self._wakeup.set()
+                await self._cond.wait()
+            self._pending.extend(rows)
+            self.stats["appended"] += len(rows)
+            if len(self._pending) >= self.batch_size:
+                self._wakeup.set()
+
+    def depth(self) -> int:
+        return len(self._pending)
+
+    # --- 소비자 측 ---
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """버퍼에 있는 행을 batch_size 단위로 모두 저장합니다."""
+        async with self._flush_lock:
+            while self._pending:
+                async with self._cond:
+                    batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+                    self._cond.notify_all()
+                await self._write_batch(batch)
+
+    async def _write_batch(self, batch: List[TranscriptRow]) -> None:
+        try:
+            await self.write_rows(batch)
+            self.stats["flushed"] += len(batch)
+            self.stats["batches"] += 1
+            return
+        except Exception as e:
+            logger.error("[TranscriptAppender] 배치 저장 실패 (%s행), 세션별로 재시도: %s", len(batch), e)
+
+        by_session: Dict[str, List[TranscriptRow]] = {}
+        for row in batch:
+            by_session.setdefault(row["session_id"], []).append(row)
+        for session_id, rows in by_session.items():
+            try:
+                await self.write_rows(rows)
+                self.stats["flushed"] += len(rows)
+                self.stats["batches"] += 1
+            except Exception as e:
+                self.stats["dropped"] += len(rows)
+                logger.error("[TranscriptAppender] session_id=%s 행 %s개 저장 실패, 버림: %s", session_id, len(rows), e)
@@ -0,0 +1,279 @@
+# backend/app/core/turn_lock.py
+"""
+세션(thread)별 턴 직렬화: 같은 세션의 그래프 실행이 동시에 두 번 돌지 않도록 합니다.
+
+- 프로세스 안에서는 세션별 asyncio.Lock, 워커가 여러 개면 Redis lease(SET NX PX + 실행 중 갱신)를 함께 잡습니다.
+- 이미 실행 중인 턴이 있을 때의 동작 (settings.TURN_LOCK_MODE):
+    reject   : 즉시 TurnInProgressError (엔드포인트에서 409)
+    queue    : 앞선 턴이 끝날 때까지 기다렸다가 실행 (TURN_LOCK_WAIT_SECONDS 초과 시 TurnInProgressError)
+    coalesce : 같은 입력이면 앞선 턴의 응답을 그대로 공유하고, 다른 입력이면 queue 와 같이 대기
+  다른 워커에서 실행된 턴의 응답은 Redis 에 TURN_RESULT_TTL_SECONDS 동안 남겨 coalesce 에 사용합니다.
+- Redis 오류가 나면 경고만 남기고 프로세스 내 잠금만으로 진행합니다.
+
+사용:
+    async with get_turn_lock().turn(thread_id, user_input) as turn:
+        if turn.shared_result is not None:
+            return turn.shared_result        # 중복 제출: 먼저 실행된 턴의 응답
+        ...                                  # 그래프 실행
+        turn.set_result(response)
+"""
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from contextlib import aclosing, asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+TURN_LOCK_MODES = ("reject", "queue", "coalesce")
+LOCK_PREFIX = "turn_lock:"
+RESULT_PREFIX = "turn_result:"
+
+# 값(token)이 일치할 때만 만료 연장/삭제 (다른 워커가 새로 잡은 lease 를 건드리지 않도록)
+_RENEW_SCRIPT = """
+local value = redis.call('get', KEYS[1])
+if value and cjson.decode(value)['token'] == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2]) end
+return 0
+"""
+_RELEASE_SCRIPT = """
+local value = redis.call('get', KEYS[1])
+if value and cjson.decode(value)['token'] == ARGV[1] then return redis.call('del', KEYS[1]) end
+return 0
+"""
+
+
+class TurnInProgressError(Exception):
+    """같은 세션의 턴이 이미 실행 중 (reject 모드이거나 대기 시간 초과)"""
+
+
+def input_hash(user_input: Optional[str]) -> str:
+    return hashlib.sha256((user_input or "").strip().encode("utf-8")).hexdigest()
+
+
+class TurnHandle:
+    def __init__(self, shared_result: Optional[str] = None):
+        self.shared_result = shared_result  # coalesce 된 경우 먼저 실행된 턴의 응답
+        self.result: Optional[str] = None
+
+    def set_result(self, result: Optional[str]) -> None:
+        """이번 턴의 응답 (같은 입력으로 기다리는 중복 제출에 공유됨)"""
+        self.result = result
+
+
+class SessionTurnLock:
+    def __init__(
+        self,
+        mode: str = "coalesce",
+        redis_client=None,
+        lease_ms: int = 30000,
+        wait_seconds: float = 120.0,
+        poll_ms: int = 100,
+        result_ttl_seconds: int = 30,
+    ):
+        if mode not in TURN_LOCK_MODES:
+            raise ValueError(f"지원하지 않는 TURN_LOCK_MODE 입니다: {mode}")
+        self.mode = mode
+        self.redis = redis_client  # None 이면 프로세스 내 잠금만 사용
+        self.lease_ms = lease_ms
+        self.wait_seconds = wait_seconds
+        self.poll_interval = poll_ms / 1000
+        self.result_ttl_seconds = result_ttl_seconds
+
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._users: Dict[str, int] = {}  # 세션별 잠금 사용자 수 (0 이 되면 잠금 객체 제거)
+        self._inflight: Dict[str, Tuple[str, asyncio.Future]] = {}  # 세션 → (입력 해시, 응답 future)
+        self.stats = {"acquired": 0, "rejected": 0, "queued": 0, "coalesced": 0, "timeouts": 0, "redis_errors": 0}
+
+    @asynccontextmanager
+    async def turn(self, key: str, user_input: Optional[str]) -> AsyncIterator[TurnHandle]:
+        digest = input_hash(user_input)
+        deadline = time.monotonic() + self.wait_seconds
+
+        shared = await self._join_inflight(key, digest)
+        if shared is not None:
+            yield TurnHandle(shared_result=shared)
+            return
+
+        self._users[key] = self._users.get(key, 0) + 1
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            if not lock.locked():
+                await lock.acquire()  # 경합이 없으면 양보 없이 바로 획득
+            elif self.mode == "reject":
+                self.stats["rejected"] += 1
+                raise TurnInProgressError(f"세션 {key} 의 이전 요청을 처리 중입니다.")
+            else:
+                self.stats["queued"] += 1
+                try:
+                    await asyncio.wait_for(lock.acquire(), timeout=max(deadline - time.monotonic(), 0))
+                except asyncio.TimeoutError:
+                    self.stats["timeouts"] += 1
+                    raise TurnInProgressError(f"세션 {key} 의 이전 요청이 끝나지 않았습니다.")
+            try:
+                async with self._lease(key, digest, deadline) as (shared, lease_token):
+                    if shared is not None:
+                        yield TurnHandle(shared_result=shared)
+                        return
+                    future = asyncio.get_running_loop().create_future()
+                    self._inflight[key] = (digest, future)
+                    handle = TurnHandle()
+                    self.stats["acquired"] += 1
+                    try:
+                        yield handle
+                    finally:
+                        self._inflight.pop(key, None)
+                        future.set_result(handle.result)  # None 이면 기다리던 중복 제출이 직접 실행
+                        if handle.result is not None and lease_token is not None and self.mode == "coalesce":
+                            await self._store_result(key, lease_token, handle.result)
+            finally:
+                lock.release()
+        finally:
+            self._users[key] -= 1
+            if not self._users[key]:
+                del self._users[key]
+                self._locks.pop(key, None)
+
+    async def _join_inflight(self, key: str, digest: str) -> Optional[str]:
+        """coalesce 모드에서 같은 입력의 턴이 이 프로세스에서 실행 중이면 그 응답을 기다려 반환"""
+        inflight = self._inflight.get(key)
+        if self.mode != "coalesce" or inflight is None or inflight[0] != digest:
+            return None
+        try:
+            result = await asyncio.wait_for(asyncio.shield(inflight[1]), timeout=self.wait_seconds)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            raise TurnInProgressError(f"세션 {key} 의 이전 요청이 끝나지 않았습니다.")
+        if result is not None:
+            self.stats["coalesced"] += 1
+        return result
+
+    # --- Redis lease (워커 간) ---
+    @asynccontextmanager
+    async def _lease(self, key: str, digest: str, deadline: float) -> AsyncIterator[Tuple[Optional[str], Optional[str]]]:
+        """
+        lease 를 잡고 (None, lease token) 을 내주거나,
+        같은 입력으로 먼저 lease 를 잡고 있던 다른 워커의 응답이 남아 있으면 (그 응답, None) 을 내줍니다.
+        """
+        if self.redis is None:
+            yield None, None
+            return
+        token = uuid.uuid4().hex
+        value = json.dumps({"token": token, "input": digest})
+        held, shared = False, None
+        duplicate_of: Optional[str] = None  # 같은 입력으로 lease 를 잡고 있던 턴의 token
+        try:
+            while True:
+                if await self.redis.set(LOCK_PREFIX + key, value, nx=True, px=self.lease_ms):
+                    held = True
+                    break
+                if self.mode == "reject":
+                    self.stats["rejected"] += 1
+                    raise TurnInProgressError(f"세션 {key} 의 이전 요청을 다른 워커에서 처리 중입니다.")
+                if time.monotonic() >= deadline:
+                    self.stats["timeouts"] += 1
+                    raise TurnInProgressError(f"세션 {key} 의 이전 요청이 끝나지 않았습니다.")
+                if self.mode == "coalesce":
+                    raw = await self.redis.get(LOCK_PREFIX + key)
+                    holder = json.loads(raw) if raw is not None else None
+                    if holder and holder.get("input") == digest:
+                        duplicate_of = holder.get("token")
+                await asyncio.sleep(self.poll_interval)
+            # 실제로 기다린 중복 제출일 때만 응답을 공유 (끝난 턴과 같은 입력을 새로 보낸 경우는 다시 실행)
+            if duplicate_of is not None:
+                raw = await self.redis.get(RESULT_PREFIX + key)
+                stored = json.loads(raw) if raw is not None else None
+                if stored and stored.get("token") == duplicate_of:
+                    shared = stored["result"]
+        except TurnInProgressError:
+            raise
+        except Exception as e:  # Redis 장애: 프로세스 내 잠금만으로 진행
+            self.stats["redis_errors"] += 1
+            logger.warning("[TurnLock] Redis lease 획득 실패, 프로세스 내 잠금만 사용 (%s): %s", key, e)
+
+        if shared is not None:
+            self.stats["coalesced"] += 1
+            await self._release(key, token)
+            yield shared, None
+            return
+
+        renewer = asyncio.create_task(self._renew(key, token), name="turn-lease-renew") if held else None
+        try:
+            yield None, token if held else None
+        finally:
+            if renewer is not None:
+                renewer.cancel()
+            if held:
+                await self._release(key, token)
+
+    async def _release(self, key: str, token: str) -> None:
+        try:
+            await self.redis.eval(_RELEASE_SCRIPT, 1, LOCK_PREFIX + key, token)
+        except Exception as e:
+            self.stats["redis_errors"] += 1
+            logger.warning("[TurnLock] Redis lease 해제 실패 (%s): %s", key, e)
+
+    async def _renew(self, key: str, token: str) -> None:
+        """실행이 lease 보다 길어져도 잠금이 풀리지 않도록 lease_ms/3 마다 연장"""
+        while True:
+            await asyncio.sleep(self.lease_ms / 3000)
+            try:
+                await self.redis.eval(_RENEW_SCRIPT, 1, LOCK_PREFIX + key, token, self.lease_ms)
+            except Exception as e:
+                self.stats["redis_errors"] += 1
+                logger.warning("[TurnLock] Redis lease 연장 실패 (%s): %s", key, e)
+
+    async def _store_result(self, key: str, token: str, result: str) -> None:
+        """lease 를 기다리던 다른 워커의 중복 제출이 읽어 갈 응답 (lease token 으로 구분)"""
+        try:
+            payload = json.dumps({"token": token, "result": result}, ensure_ascii=False)
+            await self.redis.set(RESULT_PREFIX + key, payload, ex=self.result_ttl_seconds)
+        except Exception as e:
+            self.stats["redis_errors"] += 1
+            logger.warning("[TurnLock] 응답 공유 저장 실패 (%s): %s", key, e)
+
+
+_turn_lock: Optional[SessionTurnLock] = None
+
+
+def get_turn_lock() -> SessionTurnLock:
+    """설정으로 만든 공유 SessionTurnLock (TURN_LOCK_REDIS 면 Redis lease 포함)"""
+    global _turn_lock
+    if _turn_lock is None:
+        redis_client = None
+        if settings.TURN_LOCK_REDIS:
+            from app.core.redis_pool import get_redis
+            redis_client = get_redis()
+        _turn_lock = SessionTurnLock(
+            mode=settings.TURN_LOCK_MODE,
+            redis_client=redis_client,
+            lease_ms=settings.TURN_LOCK_LEASE_MS,
+            wait_seconds=settings.TURN_LOCK_WAIT_SECONDS,
+            poll_ms=settings.TURN_LOCK_POLL_MS,
+            result_ttl_seconds=settings.TURN_RESULT_TTL_SECONDS,
+        )
+    return _turn_lock
+
+
+async def serialized_stream(
+    key: str,
+    user_input: Optional[str],
+    start_stream: Callable[[], AsyncIterator[Dict[str, Any]]],
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    start_stream() 의 이벤트 스트림(app.core.streaming 형식)을 세션 턴 잠금 안에서 실행합니다.
+    final 이벤트의 응답은 같은 입력의 중복 제출과 공유되고, 중복 제출은 final 이벤트 하나만 받습니다.
+    """
+    async with get_turn_lock().turn(key, user_input) as turn:
+        if turn.shared_result is not None:
+            yield {"event": "final", "data": {"content": turn.shared_result}}
+            return
+        async with aclosing(start_stream()) as events:
+            async for ev in events:
+                if ev["event"] == "final":
+                    turn.set_result(ev["data"]["content"])
+                yield ev
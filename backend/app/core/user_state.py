@@ -3,11 +3,15 @@
 UserStateStore: 사용자 대화 상태 및 전체 대화 로그(transcript)를 SQL DB에 저장/로드합니다.
 """
 from datetime import datetime
-from sqlalchemy import select
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.dialect import upsert_rows
 from app.db.session import get_db_session_async
 from app.db.models import SessionStateRecord, SessionTranscriptRecord
+from app.core.state_cache import state_version
+from app.core.transcript_appender import TranscriptAppender
 
 
 class UserStateStore:
@@ -15,38 +19,79 @@ class UserStateStore:
     사용자 상태(state)와 대화 로그(transcript)를 관리하는 저장소입니다.
     """
 
-    def __init__(self, session_factory):
+    def __init__(self, session_factory, transcript_appender: Optional[TranscriptAppender] = None):
         self._session_factory = session_factory  # 외부에서 주입
+        # 설정 시 transcript 행은 백그라운드 appender 가 모아서 배치로 저장
+        self.transcript_appender = transcript_appender
 
     async def load(self, session_id: str) -> dict:
+        return (await self.load_versioned(session_id))[0]
+
+    async def load_versioned(self, session_id: str) -> Tuple[dict, Optional[int]]:
+        """(상태, 버전). 버전은 updated_at 기반 (app.core.state_cache.state_version), 행이 없으면 ({}, None)"""
         async with self._session_factory() as session:  # type: AsyncSession
             result = await session.execute(
-                select(SessionStateRecord).where(SessionStateRecord.session_id == session_id)
+                select(SessionStateRecord.state, SessionStateRecord.updated_at)
+                .where(SessionStateRecord.session_id == session_id)
             )
-            record = result.scalar_one_or_none()
-            return record.state if record else {}
+            row = result.one_or_none()
+            return (row.state, state_version(row.updated_at)) if row else ({}, None)
 
-    async def upsert(self, session_id: str, state: dict) -> None:
+    async def load_version(self, session_id: str) -> Optional[int]:
+        """상태 본문 없이 버전만 조회 (캐시된 상태가 최신인지 확인용, 행이 없으면 None)"""
         async with self._session_factory() as session:  # type: AsyncSession
             result = await session.execute(
-                select(SessionStateRecord).where(SessionStateRecord.session_id == session_id)
+                select(SessionStateRecord.updated_at).where(SessionStateRecord.session_id == session_id)
+            )
+            updated_at = result.scalar_one_or_none()
+            return state_version(updated_at) if updated_at is not None else None
+
+    async def upsert(self, session_id: str, state: dict) -> int:
+        return await self.upsert_many({session_id: state})
+
+    async def upsert_many(self, states: Dict[str, dict]) -> Optional[int]:
+        """
+        여러 세션 상태를 INSERT ... ON CONFLICT DO UPDATE 한 문장으로 저장 (SELECT/ORM 로드 없음).
+        저장된 행들의 버전(같은 updated_at)을 반환합니다.
+        """
+        if not states:
+            return None
+        now = datetime.utcnow()
+        rows = [
+            {"session_id": session_id, "state": state, "updated_at": now}
+            for session_id, state in states.items()
+        ]
+        async with self._session_factory() as session:  # type: AsyncSession
+            await upsert_rows(
+                session,
+                SessionStateRecord.__table__,
+                rows,
+                index_elements=["session_id"],
+                update_columns=["state", "updated_at"],
             )
-            record = result.scalar_one_or_none()
-            if record:
-                record.state = state
-                record.updated_at = datetime.utcnow()
-            else:
-                session.add(SessionStateRecord(
-                    session_id=session_id,
-                    state=state,
-                ))
             await session.commit()
+        return state_version(now)
 
     async def append_transcript(self, session_id: str, role: str, content: str) -> None:
+        await self.append_transcript_many(session_id, [(role, content)])
+
+    async def append_transcript_many(self, session_id: str, rows: Sequence[Tuple[str, str]]) -> None:
+        """(role, content) 행들을 추가. appender 가 있으면 버퍼에 넣고, 없으면 executemany 한 번으로 저장"""
+        now = datetime.utcnow()
+        records = [
+            {"session_id": session_id, "role": role, "content": content, "occurred_at": now}
+            for role, content in rows
+        ]
+        if self.transcript_appender is not None:
+            await self.transcript_appender.append(records)
+        else:
+            await self.insert_transcript_rows(records)
+
+    async def insert_transcript_rows(self, records: List[Dict[str, Any]]) -> None:
+        """여러 세션의 transcript 행을 한 트랜잭션의 executemany 로 저장 (TranscriptAppender 의 writer)"""
+        if not records:
+            return
         async with self._session_factory() as session:  # type: AsyncSession
-            session.add(SessionTranscriptRecord(
-                session_id=session_id,
-                role=role,
-                content=content,
-            ))
+            # id 는 컬럼 기본값(_new_uuid)으로 채워짐
+            await session.execute(insert(SessionTranscriptRecord.__table__), records)
             await session.commit()
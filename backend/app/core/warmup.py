@@ -0,0 +1,118 @@
+# backend/app/core/warmup.py
+"""
+시작 워밍업: app 임포트는 가볍게 두고, 무거운 객체는 lifespan 의 워밍업 단계에서 미리 만듭니다.
+
+단계 (default_steps):
+- imports        : 오케스트레이션 모듈 임포트 (langgraph, 그래프 노드, LLM SDK). 이벤트 루프를 막지 않도록 스레드에서
+- graph_registry : 체크포인터 생성과 토론/Why 그래프 컴파일
+- tokenizer      : context_window 의 tiktoken 인코딩 로드 (스레드에서)
+- llm_clients    : 기본 LLM 클라이언트 생성 (OPENAI_API_KEY 가 있을 때만)
+
+settings.STARTUP_WARMUP:
+- "blocking"   : lifespan 시작 시 끝까지 수행 (워밍업이 끝나야 요청을 받음)
+- "background" : 요청을 받으면서 백그라운드로 수행. /readyz 가 완료 전에는 503 (기본)
+- "off"        : 수행하지 않음. 각 객체는 첫 사용 시 지연 생성
+단계가 실패해도 나머지 단계는 계속하며, 실패한 객체는 첫 사용 시 다시 만들어집니다.
+"""
+import asyncio
+import importlib
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+WARMUP_MODES = ("blocking", "background", "off")
+HEAVY_MODULES = ("app.core.orchestration", "app.core.why_orchestration")
+
+WarmupStep = Callable[[], Awaitable[None]]
+
+
+async def _import_modules() -> None:
+    def _import_all():
+        for name in HEAVY_MODULES:
+            importlib.import_module(name)
+
+    await asyncio.to_thread(_import_all)
+
+
+async def _init_graph_registry() -> None:
+    from app.core.graph_registry import init_graph_registry
+
+    await init_graph_registry()
+
+
+async def _load_tokenizer() -> None:
+    from app.core.context_window import _encoding
+
+    await asyncio.to_thread(_encoding)
+
+
+async def _build_llm_clients() -> None:
+    if not settings.OPENAI_API_KEY:
+        return
+    from app.core import llm_provider
+
+    llm_provider.get_high_performance_llm()
+    llm_provider.get_fast_llm()
+    llm_provider.get_focus_llm()
+
+
+def default_steps() -> Dict[str, WarmupStep]:
+    return {
+        "imports": _import_modules,
+        "graph_registry": _init_graph_registry,
+        "tokenizer": _load_tokenizer,
+        "llm_clients": _build_llm_clients,
+    }
+
+
+class Warmup:
+    def __init__(self, steps: Optional[Dict[str, WarmupStep]] = None):
+        self.steps = default_steps() if steps is None else steps
+        self.ready = asyncio.Event()
+        self.timings_ms: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(self) -> None:
+        t_start = time.perf_counter()
+        for name, step in self.steps.items():
+            t0 = time.perf_counter()
+            try:
+                await step()
+            except Exception as e:
+                self.errors[name] = str(e)
+                logger.error("[Warmup] %s 단계 실패 (첫 사용 시 다시 시도): %s", name, e)
+            self.timings_ms[name] = round((time.perf_counter() - t0) * 1000, 1)
+        self.timings_ms["total"] = round((time.perf_counter() - t_start) * 1000, 1)
+        logger.info("[Warmup] 완료: %s", self.timings_ms)
+        self.ready.set()
+
+    async def start(self, mode: str) -> None:
+        """lifespan 시작 훅. mode 는 settings.STARTUP_WARMUP"""
+        if mode not in WARMUP_MODES:
+            raise ValueError(f"지원하지 않는 STARTUP_WARMUP 입니다: {mode}")
+        if mode == "blocking":
+            await self.run()
+        elif mode == "background":
+            self._task = asyncio.create_task(self.run(), name="startup-warmup")
+        else:
+            self.ready.set()
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def status(self) -> dict:
+        return {
+            "ready": self.ready.is_set(),
+            "timings_ms": self.timings_ms,
+            "errors": self.errors,
+        }
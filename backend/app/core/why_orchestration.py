@@ -1,21 +1,27 @@
 # backend/app/core/why_orchestration.py
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Tuple, AsyncIterator
 from fastapi import HTTPException
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
 from langchain_core.runnables import RunnableConfig
 from langgraph.errors import GraphInterrupt
 from langgraph.types import Interrupt as TypesInterrupt # 명시적으로 langgraph.types.Interrupt 사용
-from langgraph.checkpoint.memory import MemorySaver
 import copy
 import asyncio
-import traceback
 
 from app.core.llm_provider import get_high_performance_llm
 from app.core.user_state import UserStateStore
+from app.core.state_cache import SessionStateCache
+from app.core.transcript_appender import TranscriptAppender
 from app.db.session import async_session_factory
 from app.core.config import get_settings
+from app.core.graph_registry import get_graph_registry
+from app.core.streaming import GraphRunResult, StreamEvent, graph_node_names, translate_graph_event
+from app.core.metrics import instrument_node
+from app.core.tracing import span
+from app.core.turn_lock import get_turn_lock, serialized_stream
+from app.core.log import get_logger
 from app.models.why_graph_state import WhyGraphState
 from app.graph_nodes.why.motivation_elicitation_node import motivation_elicitation_node
 # 다른 노드들도 interrupt 시 value에 상태 dict를 전달하도록 수정 필요할 수 있음
@@ -25,102 +31,117 @@ from app.graph_nodes.why.probe_assumption_node import probe_assumption_node
 from app.graph_nodes.why.findings_summarization_node import findings_summarization_node
 from app.graph_nodes.why.free_conversation_node import free_conversation_node
 
+logger = get_logger(__name__)
 settings = get_settings()
-checkpointer = MemorySaver()
-# print("[Orchestrator Setup] Using MemorySaver for LangGraph's internal checkpointing.")
 user_store = UserStateStore(async_session_factory)
-
-app_why_graph = None
-# (Graph Definition and Compilation - 이전과 동일하게 유지)
-if checkpointer is not None:
-    try:
-        workflow = StateGraph(WhyGraphState)
-        workflow.add_node("motivation_elicitation", motivation_elicitation_node)
-        workflow.add_node("summarize_idea_motivation", summarize_idea_motivation_node)
-        workflow.add_node("identify_assumptions", identify_assumptions_node)
-        workflow.add_node("probe_assumption", probe_assumption_node)
-        workflow.add_node("findings_summarization", findings_summarization_node)
-        workflow.add_node("free_conversation", free_conversation_node)
-        workflow.set_entry_point("motivation_elicitation")
-
-        def decide_after_motivation(state: WhyGraphState) -> str:
-            motivation_cleared = state.get("motivation_cleared", False)
-            # motivation_elicitation_node가 interrupt 대신 상태를 반환하는 경우,
-            # 이 엣지는 해당 상태를 기반으로 다음 노드를 결정합니다.
-            # 만약 interrupt가 발생했다면, ainvoke는 중단된 상태를 반환하고 이 엣지는 실행되지 않습니다.
-            # 오케스트레이터가 interrupt를 처리하고 사용자에게 응답을 전달합니다.
-            # print(f"  [COND_EDGE] decide_after_motivation: motivation_cleared={motivation_cleared}")
-            if motivation_cleared: # 노드가 명확하다고 판단하여 상태를 반환한 경우
-                return "summarize_idea_motivation"
-            # 노드가 interrupt를 발생시켰거나, 명확하지 않다고 판단하여 특정 키 없이 상태를 반환한 경우
-            # (현재 motivation_elicitation_node는 명확하지 않으면 항상 interrupt 발생)
-            # print(f"  [COND_EDGE][WARN] decide_after_motivation: motivation not cleared or node interrupted, ending graph run for this turn.")
-            return END # 현재 턴 종료, 오케스트레이터가 interrupt 처리
-
-        def decide_after_summary(state: WhyGraphState) -> str:
-            idea_summary_exists = bool(state.get("idea_summary", "").strip())
-            motivation_summary_exists = bool(state.get("motivation_summary", "").strip()) or bool(state.get("final_motivation_summary", "").strip())
-            # print(f"  [COND_EDGE] decide_after_summary: idea_summary_exists={idea_summary_exists}, motivation_summary_exists={motivation_summary_exists}")
-            if idea_summary_exists and motivation_summary_exists:
-                 return "identify_assumptions"
-            # print(f"  [COND_EDGE][WARN] decide_after_summary: Missing summary, ending.")
-            return END
-
-        def decide_after_identification(state: WhyGraphState) -> str:
-            assumptions_identified = bool(state.get("identified_assumptions"))
-            # print(f"  [COND_EDGE] decide_after_identification: assumptions_identified={assumptions_identified}")
-            if assumptions_identified:
-                return "probe_assumption"
-            return "findings_summarization"
-
-        def decide_after_probing(state: WhyGraphState) -> str:
-            assumptions_fully_probed = state.get("assumptions_fully_probed", False)
-            current_assumption = state.get("assumption_being_probed_now")
-            probed_assumptions = state.get("probed_assumptions", [])
-            identified_assumptions = state.get("identified_assumptions", [])
-            
-            # 현재 가정이 있고, 아직 완전히 탐구되지 않았다면 계속 탐구
-            if current_assumption and current_assumption not in probed_assumptions:
-                return "probe_assumption"
-            
-            # 모든 가정이 탐구되었다면 findings_summarization으로 이동
-            if assumptions_fully_probed or len(probed_assumptions) >= len(identified_assumptions):
-                return "findings_summarization"
-            
-            # 다음 가정으로 이동
-            return "probe_assumption"
-
-        def decide_after_findings(state: WhyGraphState) -> str:
-            findings_summary_exists = bool(state.get("findings_summary", "").strip())
-            # print(f"  [COND_EDGE] decide_after_findings: findings_summary_exists={findings_summary_exists}")
-            return "free_conversation" if findings_summary_exists else END
-
-        workflow.add_conditional_edges("motivation_elicitation", decide_after_motivation, {
-            "summarize_idea_motivation": "summarize_idea_motivation", END: END
-        })
-        workflow.add_conditional_edges("summarize_idea_motivation", decide_after_summary, {
-            "identify_assumptions": "identify_assumptions", END: END
-        })
-        workflow.add_conditional_edges("identify_assumptions", decide_after_identification, {
-            "probe_assumption": "probe_assumption", "findings_summarization": "findings_summarization"
-        })
-        workflow.add_conditional_edges("probe_assumption", decide_after_probing, {
-            "findings_summarization": "findings_summarization", END: END
-        })
-        workflow.add_conditional_edges("findings_summarization", decide_after_findings, {
-            "free_conversation": "free_conversation", END: END
-        })
-        workflow.add_edge("free_conversation", END)
-
-        app_why_graph = workflow.compile(checkpointer=checkpointer)
-        # print("[Orchestrator Setup] Graph compiled successfully.")
-    except Exception as e_compile:
-        # print(f"[Orchestrator Setup][ERROR] Failed to compile graph: {e_compile}")
-        traceback.print_exc()
-        app_why_graph = None
-else:
-    # print("[Orchestrator Setup][ERROR] Cannot compile graph: Checkpointer is None.")
-    pass
+# Why 턴의 사용자 입력/응답 로그는 턴마다 트랜잭션을 열지 않고 백그라운드에서 모아 저장
+transcript_appender = TranscriptAppender(
+    user_store.insert_transcript_rows,
+    flush_interval_ms=settings.TRANSCRIPT_FLUSH_INTERVAL_MS,
+    batch_size=settings.TRANSCRIPT_FLUSH_BATCH_SIZE,
+    max_pending=settings.TRANSCRIPT_QUEUE_MAXSIZE,
+)
+user_store.transcript_appender = transcript_appender
+# 자주 쓰이는 세션은 턴마다 DB 에서 상태를 읽고 메시지 객체를 복원하지 않도록 hydrated 상태를 캐시 (write-through)
+state_cache = SessionStateCache(
+    maxsize=settings.SESSION_STATE_CACHE_MAXSIZE,
+    enabled=settings.SESSION_STATE_CACHE_ENABLED,
+    pubsub=settings.SESSION_STATE_CACHE_PUBSUB,
+    channel=settings.SESSION_STATE_CACHE_CHANNEL,
+)
+
+# 체크포인터는 토론 그래프와 같은 Redis(핫) + SQL(콜드) CombinedCheckpointer를 사용합니다.
+# 컴파일은 graph_registry.build_graph_registry()에서 프로세스당 한 번 수행 (get_why_graph 참고)
+# 토론 그래프와 thread_id 가 겹치지 않도록 Why 흐름의 체크포인트는 이 접두사를 붙여 저장
+WHY_THREAD_PREFIX = "why:"
+
+# 노드 실행 시간은 instrument_node 가 /metrics 의 NODE_LATENCY 로 기록
+why_workflow = StateGraph(WhyGraphState)
+why_workflow.add_node("motivation_elicitation", instrument_node("why", "motivation_elicitation", motivation_elicitation_node))
+why_workflow.add_node("summarize_idea_motivation", instrument_node("why", "summarize_idea_motivation", summarize_idea_motivation_node))
+why_workflow.add_node("identify_assumptions", instrument_node("why", "identify_assumptions", identify_assumptions_node))
+why_workflow.add_node("probe_assumption", instrument_node("why", "probe_assumption", probe_assumption_node))
+why_workflow.add_node("findings_summarization", instrument_node("why", "findings_summarization", findings_summarization_node))
+why_workflow.add_node("free_conversation", instrument_node("why", "free_conversation", free_conversation_node))
+why_workflow.set_entry_point("motivation_elicitation")
+
+def decide_after_motivation(state: WhyGraphState) -> str:
+    motivation_cleared = state.get("motivation_cleared", False)
+    # motivation_elicitation_node가 interrupt 대신 상태를 반환하는 경우,
+    # 이 엣지는 해당 상태를 기반으로 다음 노드를 결정합니다.
+    # 만약 interrupt가 발생했다면, ainvoke는 중단된 상태를 반환하고 이 엣지는 실행되지 않습니다.
+    # 오케스트레이터가 interrupt를 처리하고 사용자에게 응답을 전달합니다.
+    # print(f"  [COND_EDGE] decide_after_motivation: motivation_cleared={motivation_cleared}")
+    if motivation_cleared: # 노드가 명확하다고 판단하여 상태를 반환한 경우
+        return "summarize_idea_motivation"
+    # 노드가 interrupt를 발생시켰거나, 명확하지 않다고 판단하여 특정 키 없이 상태를 반환한 경우
+    # (현재 motivation_elicitation_node는 명확하지 않으면 항상 interrupt 발생)
+    # print(f"  [COND_EDGE][WARN] decide_after_motivation: motivation not cleared or node interrupted, ending graph run for this turn.")
+    return END # 현재 턴 종료, 오케스트레이터가 interrupt 처리
+
+def decide_after_summary(state: WhyGraphState) -> str:
+    idea_summary_exists = bool(state.get("idea_summary", "").strip())
+    motivation_summary_exists = bool(state.get("motivation_summary", "").strip()) or bool(state.get("final_motivation_summary", "").strip())
+    # print(f"  [COND_EDGE] decide_after_summary: idea_summary_exists={idea_summary_exists}, motivation_summary_exists={motivation_summary_exists}")
+    if idea_summary_exists and motivation_summary_exists:
+         return "identify_assumptions"
+    # print(f"  [COND_EDGE][WARN] decide_after_summary: Missing summary, ending.")
+    return END
+
+def decide_after_identification(state: WhyGraphState) -> str:
+    assumptions_identified = bool(state.get("identified_assumptions"))
+    # print(f"  [COND_EDGE] decide_after_identification: assumptions_identified={assumptions_identified}")
+    if assumptions_identified:
+        return "probe_assumption"
+    return "findings_summarization"
+
+def decide_after_probing(state: WhyGraphState) -> str:
+    assumptions_fully_probed = state.get("assumptions_fully_probed", False)
+    current_assumption = state.get("assumption_being_probed_now")
+    probed_assumptions = state.get("probed_assumptions", [])
+    identified_assumptions = state.get("identified_assumptions", [])
+    
+    # 현재 가정이 있고, 아직 완전히 탐구되지 않았다면 계속 탐구
+    if current_assumption and current_assumption not in probed_assumptions:
+        return "probe_assumption"
+    
+    # 모든 가정이 탐구되었다면 findings_summarization으로 이동
+    if assumptions_fully_probed or len(probed_assumptions) >= len(identified_assumptions):
+        return "findings_summarization"
+    
+    # 다음 가정으로 이동
+    return "probe_assumption"
+
+def decide_after_findings(state: WhyGraphState) -> str:
+    findings_summary_exists = bool(state.get("findings_summary", "").strip())
+    # print(f"  [COND_EDGE] decide_after_findings: findings_summary_exists={findings_summary_exists}")
+    return "free_conversation" if findings_summary_exists else END
+
+why_workflow.add_conditional_edges("motivation_elicitation", decide_after_motivation, {
+    "summarize_idea_motivation": "summarize_idea_motivation", END: END
+})
+why_workflow.add_conditional_edges("summarize_idea_motivation", decide_after_summary, {
+    "identify_assumptions": "identify_assumptions", END: END
+})
+why_workflow.add_conditional_edges("identify_assumptions", decide_after_identification, {
+    "probe_assumption": "probe_assumption", "findings_summarization": "findings_summarization"
+})
+why_workflow.add_conditional_edges("probe_assumption", decide_after_probing, {
+    "probe_assumption": "probe_assumption", "findings_summarization": "findings_summarization", END: END
+})
+why_workflow.add_conditional_edges("findings_summarization", decide_after_findings, {
+    "free_conversation": "free_conversation", END: END
+})
+why_workflow.add_edge("free_conversation", END)
+
+
+async def get_why_graph():
+    """공유 레지스트리에서 컴파일된 Why 그래프 반환"""
+    return (await get_graph_registry()).why_graph
+
+
+def why_thread_config(session_id: str) -> RunnableConfig:
+    return {"configurable": {"thread_id": f"{WHY_THREAD_PREFIX}{session_id}"}}
 
 
 def _serialize_state_for_db(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -147,41 +168,72 @@ def _serialize_state_for_db(state: Dict[str, Any]) -> Dict[str, Any]:
              serializable_state[key] = value
     return serializable_state
 
-async def run_why_exploration_turn(
+def _hydrate_state(stored: Dict[str, Any]) -> Dict[str, Any]:
+    """DB 에 저장된 상태(dict)의 messages 를 메시지 객체로 복원한 새 dict"""
+    state = dict(stored)
+    loaded_messages_serial = stored.get("messages", [])
+    messages_list_obj = []
+    if isinstance(loaded_messages_serial, list):
+        for msg_data in loaded_messages_serial:
+            try:
+                if isinstance(msg_data, dict) and "type" in msg_data and "content" in msg_data:
+                    msg_type, content, add_kwargs = msg_data.get("type"), msg_data.get("content"), msg_data.get("additional_kwargs", {})
+                    if content is not None:
+                        if msg_type == "human": messages_list_obj.append(HumanMessage(content=content, additional_kwargs=add_kwargs))
+                        elif msg_type == "ai" or msg_type == "assistant": messages_list_obj.append(AIMessage(content=content, additional_kwargs=add_kwargs))
+                        else: messages_list_obj.append(BaseMessage(type=msg_type, content=content, additional_kwargs=add_kwargs))
+                elif isinstance(msg_data, BaseMessage): messages_list_obj.append(msg_data)
+            except Exception as e_des: pass
+    state["messages"] = messages_list_obj
+    return state
+
+
+async def _load_why_state(session_id: str) -> Dict[str, Any]:
+    """
+    세션의 hydrated 상태 (없으면 {}). state_cache 에 최신 버전이 있으면 상태 본문 조회/역직렬화 없이 반환합니다.
+    반환값은 캐시와 공유되므로 수정하지 말고 _graph_input_from() 으로 복사해서 쓰세요.
+    """
+    cached = state_cache.get_versioned(session_id)
+    if cached is not None:
+        state, version = cached
+        # pub/sub 무효화가 없으면 다른 워커가 더 새 상태를 저장했을 수 있으므로 updated_at 만 읽어 확인
+        # (오래된 상태로 턴을 실행하면 저장 시 그 턴이 더 새 상태를 덮어씀)
+        if state_cache.pubsub or await user_store.load_version(session_id) == version:
+            return state
+        state_cache.discard(session_id, stale=True)
+    token = state_cache.load_token()
+    stored, version = await user_store.load_versioned(session_id)
+    if not stored:
+        return {}
+    state = _hydrate_state(stored)
+    state_cache.put(session_id, state, version, token=token)
+    return state
+
+
+def _graph_input_from(state: Dict[str, Any]) -> Dict[str, Any]:
+    """캐시된 상태를 이번 턴 입력으로: 최상위 list/dict 만 복사 (메시지 객체는 공유, deepcopy 없음)"""
+    return {key: copy.copy(value) if isinstance(value, (list, dict)) else value for key, value in state.items()}
+
+
+async def _prepare_why_turn(
     session_id: str,
-    user_input: Optional[str] = None,
-    initial_topic: Optional[str] = None
-) -> Optional[str]:
-    if not app_why_graph:
-         raise HTTPException(status_code=500, detail="Graph is not compiled or unavailable.")
-
-    config: RunnableConfig = {"configurable": {"thread_id": session_id}}
+    user_input: Optional[str],
+    initial_topic: Optional[str],
+) -> Tuple[Dict[str, Any], RunnableConfig]:
+    """UserStateStore(또는 state_cache)의 상태와 사용자 입력으로 이번 턴의 그래프 입력을 만듭니다."""
+    config = why_thread_config(session_id)
     graph_input: Dict[str, Any] = {}
 
     is_first_turn_of_session = False
-    current_state_from_store = await user_store.load(session_id) or {}
+    current_state_from_store = await _load_why_state(session_id)
 
     if user_input is not None:
         if not current_state_from_store:
             if not initial_topic: initial_topic = user_input
             is_first_turn_of_session = True
         else:
-            graph_input = copy.deepcopy(current_state_from_store)
-            loaded_messages_serial = graph_input.get("messages", [])
-            messages_list_obj = []
-            if isinstance(loaded_messages_serial, list):
-                for msg_data in loaded_messages_serial:
-                    try:
-                        if isinstance(msg_data, dict) and "type" in msg_data and "content" in msg_data:
-                            msg_type, content, add_kwargs = msg_data.get("type"), msg_data.get("content"), msg_data.get("additional_kwargs", {})
-                            if content is not None:
-                                if msg_type == "human": messages_list_obj.append(HumanMessage(content=content, additional_kwargs=add_kwargs))
-                                elif msg_type == "ai" or msg_type == "assistant": messages_list_obj.append(AIMessage(content=content, additional_kwargs=add_kwargs))
-                                else: messages_list_obj.append(BaseMessage(type=msg_type, content=content, additional_kwargs=add_kwargs))
-                        elif isinstance(msg_data, BaseMessage): messages_list_obj.append(msg_data)
-                    except Exception as e_des: pass
-            graph_input["messages"] = messages_list_obj
-            
+            graph_input = _graph_input_from(current_state_from_store)
+
             # 사용자 입력이 마지막 메시지와 동일하면 추가하지 않음
             if graph_input.get("messages") and isinstance(graph_input["messages"][-1], HumanMessage):
                 if graph_input["messages"][-1].content == user_input:
@@ -192,7 +244,7 @@ async def run_why_exploration_turn(
                 graph_input.setdefault("messages", []).append(HumanMessage(content=user_input))
     else:
         if not current_state_from_store : is_first_turn_of_session = True
-        else: graph_input = current_state_from_store
+        else: graph_input = _graph_input_from(current_state_from_store)
 
     if is_first_turn_of_session:
         if not initial_topic:
@@ -202,79 +254,98 @@ async def run_why_exploration_turn(
             "initial_topic": initial_topic, "has_asked_initial": False, "motivation_cleared": False,
             "final_motivation_summary": None, "idea_summary": None, "motivation_summary": None,
             "identified_assumptions": [], "probed_assumptions": [], "assumption_being_probed_now": None,
-            "assumptions_fully_probed": False, "findings_summary": None, "older_history_summary": None, "error_message": None,
+            "assumptions_fully_probed": False, "findings_summary": None, "older_history_summary": None, "older_history_summary_upto": 0, "error_message": None,
             "probe_messages": [], "current_node": "motivation_elicitation"
         }
 
+    return graph_input, config
+
+
+def _response_from_run_output(
+    final_run_output: Any,
+    graph_input: Dict[str, Any],
+) -> Tuple[str, Dict[str, Any]]:
+    """그래프 실행 결과(ainvoke 반환값 형태)에서 사용자에게 보낼 응답과 저장할 상태를 고릅니다."""
     assistant_response_to_user = None
     final_state_to_save = graph_input
 
-    try:
-        final_run_output = await app_why_graph.ainvoke(graph_input, config)
-
-        if not isinstance(final_run_output, dict):
-            assistant_response_to_user = "(오류: 그래프 응답 형식 문제)"
-        else:
-            final_state_to_save = final_run_output.copy()
-            interrupted_by_node_with_message = False
-            
-            interrupt_payload_list = final_state_to_save.get("__interrupt__")
-            actual_interrupt_object = None
+    if not isinstance(final_run_output, dict):
+        assistant_response_to_user = "(오류: 그래프 응답 형식 문제)"
+    else:
+        final_state_to_save = final_run_output.copy()
+        interrupted_by_node_with_message = False
+        
+        interrupt_payload_list = final_state_to_save.get("__interrupt__")
+        actual_interrupt_object = None
+        
+        if isinstance(interrupt_payload_list, list) and interrupt_payload_list:
+            actual_interrupt_object = interrupt_payload_list[0]
+        elif isinstance(interrupt_payload_list, (GraphInterrupt, TypesInterrupt)):
+            actual_interrupt_object = interrupt_payload_list
+
+        if actual_interrupt_object:
+            interrupt_value = getattr(actual_interrupt_object, 'value', None)
             
-            if isinstance(interrupt_payload_list, list) and interrupt_payload_list:
-                actual_interrupt_object = interrupt_payload_list[0]
-            elif isinstance(interrupt_payload_list, (GraphInterrupt, TypesInterrupt)):
-                actual_interrupt_object = interrupt_payload_list
-
-            if actual_interrupt_object:
-                interrupt_value = getattr(actual_interrupt_object, 'value', None)
-                
-                if isinstance(interrupt_value, dict):
-                    final_state_to_save.update(interrupt_value)
-                    if "user_facing_message" in interrupt_value and interrupt_value["user_facing_message"]:
-                        assistant_response_to_user = str(interrupt_value["user_facing_message"])
-                        interrupted_by_node_with_message = True
-                    elif "clarification_question" in interrupt_value and interrupt_value["clarification_question"]:
-                        assistant_response_to_user = str(interrupt_value["clarification_question"])
-                        interrupted_by_node_with_message = True
-                elif interrupt_value is not None:
-                    value_str = str(interrupt_value)
-                    if value_str.strip():
-                        assistant_response_to_user = value_str
-                        interrupted_by_node_with_message = True
-
-            if not interrupted_by_node_with_message:
-                clarification_q = final_state_to_save.get("clarification_question")
-                assumption_q = final_state_to_save.get("assumption_question")
-                assistant_msg_from_state = final_state_to_save.get("assistant_message")
-
-                if clarification_q and str(clarification_q).strip():
-                    assistant_response_to_user = str(clarification_q)
+            if isinstance(interrupt_value, dict):
+                final_state_to_save.update(interrupt_value)
+                if "user_facing_message" in interrupt_value and interrupt_value["user_facing_message"]:
+                    assistant_response_to_user = str(interrupt_value["user_facing_message"])
                     interrupted_by_node_with_message = True
-                elif assumption_q and str(assumption_q).strip():
-                    assistant_response_to_user = str(assumption_q)
+                elif "clarification_question" in interrupt_value and interrupt_value["clarification_question"]:
+                    assistant_response_to_user = str(interrupt_value["clarification_question"])
                     interrupted_by_node_with_message = True
-                elif assistant_msg_from_state and str(assistant_msg_from_state).strip():
-                    assistant_response_to_user = str(assistant_msg_from_state)
+            elif interrupt_value is not None:
+                value_str = str(interrupt_value)
+                if value_str.strip():
+                    assistant_response_to_user = value_str
                     interrupted_by_node_with_message = True
 
-            if not interrupted_by_node_with_message:
-                current_findings = final_state_to_save.get('findings_summary')
-                if current_findings and str(current_findings).strip():
-                    assistant_response_to_user = str(current_findings)
+        if not interrupted_by_node_with_message:
+            clarification_q = final_state_to_save.get("clarification_question")
+            assumption_q = final_state_to_save.get("assumption_question")
+            assistant_msg_from_state = final_state_to_save.get("assistant_message")
+
+            if clarification_q and str(clarification_q).strip():
+                assistant_response_to_user = str(clarification_q)
+                interrupted_by_node_with_message = True
+            elif assumption_q and str(assumption_q).strip():
+                assistant_response_to_user = str(assumption_q)
+                interrupted_by_node_with_message = True
+            elif assistant_msg_from_state and str(assistant_msg_from_state).strip():
+                assistant_response_to_user = str(assistant_msg_from_state)
+                interrupted_by_node_with_message = True
+
+        if not interrupted_by_node_with_message:
+            current_findings = final_state_to_save.get('findings_summary')
+            if current_findings and str(current_findings).strip():
+                assistant_response_to_user = str(current_findings)
+            else:
+                messages_in_state = final_state_to_save.get('messages', [])
+                if messages_in_state and isinstance(messages_in_state[-1], AIMessage) and messages_in_state[-1].content.strip():
+                    assistant_response_to_user = messages_in_state[-1].content
                 else:
-                    messages_in_state = final_state_to_save.get('messages', [])
-                    if messages_in_state and isinstance(messages_in_state[-1], AIMessage) and messages_in_state[-1].content.strip():
-                        assistant_response_to_user = messages_in_state[-1].content
-                    else:
-                        assistant_response_to_user = "다음 탐색이 완료되었거나, 추가 진행을 위한 정보가 필요합니다."
+                    assistant_response_to_user = "다음 탐색이 완료되었거나, 추가 진행을 위한 정보가 필요합니다."
+
+    return assistant_response_to_user, final_state_to_save
 
-    except HTTPException:
-        raise
-    except Exception as e_invoke:
-        traceback.print_exc()
-        assistant_response_to_user = f"(오류: 그래프 실행 중 문제 발생 - {e_invoke})"
 
+def _transcript_rows(graph_input: Dict[str, Any], assistant_response_to_user: Optional[str]) -> List[Tuple[str, str]]:
+    """이번 턴의 (role, content) 로그 행: 그래프에 넣은 마지막 사용자 메시지와 사용자에게 보낸 응답"""
+    rows: List[Tuple[str, str]] = []
+    messages = graph_input.get("messages") if isinstance(graph_input, dict) else None
+    if messages and isinstance(messages[-1], HumanMessage):
+        rows.append(("user", str(messages[-1].content)))
+    if assistant_response_to_user:
+        rows.append(("assistant", str(assistant_response_to_user)))
+    return rows
+
+
+async def _save_why_turn(
+    session_id: str,
+    graph_input: Dict[str, Any],
+    final_state_to_save: Dict[str, Any],
+    assistant_response_to_user: Optional[str],
+) -> str:
     if not (final_state_to_save and isinstance(final_state_to_save, dict)):
         final_state_to_save = graph_input if isinstance(graph_input, dict) else {}
             
@@ -300,9 +371,17 @@ async def run_why_exploration_turn(
     try:
         serializable_state_for_db = _serialize_state_for_db(final_state_to_save)
         if serializable_state_for_db:
-            await user_store.upsert(session_id, serializable_state_for_db)
+            try:
+                version = await user_store.upsert(session_id, serializable_state_for_db)
+            except Exception:
+                state_cache.discard(session_id)  # 저장 여부를 알 수 없으므로 다음 턴은 DB 에서 읽음
+                raise
+            # write-through: 다시 읽어 복원한 것과 같은 상태 (직렬화 대상 키 + 이미 만든 메시지 객체)
+            await state_cache.commit(session_id, {**serializable_state_for_db, "messages": processed_messages_for_state}, version)
+            # transcript 는 session_state 행을 참조하므로 상태 저장이 성공한 뒤에만 기록
+            await user_store.append_transcript_many(session_id, _transcript_rows(graph_input, assistant_response_to_user))
     except Exception as e_upsert:
-        traceback.print_exc()
+        logger.exception("[WhyOrchestration] session_id=%s 상태 저장 실패: %s", session_id, e_upsert)
         if not assistant_response_to_user or assistant_response_to_user.startswith("다음 탐색이 완료되었거나"):
              assistant_response_to_user = "(오류: 대화 상태 저장에 실패했습니다. 다음 대화에 영향이 있을 수 있습니다.)"
 
@@ -311,3 +390,89 @@ async def run_why_exploration_turn(
 
     return str(assistant_response_to_user)
 
+
+async def run_why_exploration_turn(
+    session_id: str,
+    user_input: Optional[str] = None,
+    initial_topic: Optional[str] = None
+) -> Optional[str]:
+    """같은 세션의 턴은 한 번에 하나만 실행 (app.core.turn_lock, 실행 중이면 TurnInProgressError)"""
+    async with get_turn_lock().turn(WHY_THREAD_PREFIX + session_id, user_input) as turn:
+        if turn.shared_result is not None:
+            return turn.shared_result
+        response = await _run_why_exploration_turn(session_id, user_input, initial_topic)
+        turn.set_result(response)
+        return response
+
+
+async def _run_why_exploration_turn(
+    session_id: str,
+    user_input: Optional[str],
+    initial_topic: Optional[str],
+) -> str:
+    app_why_graph = await get_why_graph()
+    with span("load_state", "state_load"):
+        graph_input, config = await _prepare_why_turn(session_id, user_input, initial_topic)
+
+    assistant_response_to_user = None
+    final_state_to_save = graph_input
+
+    try:
+        with span("ainvoke", "graph"):
+            final_run_output = await app_why_graph.ainvoke(graph_input, config)
+        assistant_response_to_user, final_state_to_save = _response_from_run_output(final_run_output, graph_input)
+    except HTTPException:
+        raise
+    except Exception as e_invoke:
+        logger.exception("[WhyOrchestration] session_id=%s 그래프 실행 오류: %s", session_id, e_invoke)
+        assistant_response_to_user = f"(오류: 그래프 실행 중 문제 발생 - {e_invoke})"
+
+    with span("save_why_turn", "flush"):
+        return await _save_why_turn(session_id, graph_input, final_state_to_save, assistant_response_to_user)
+
+
+def stream_why_exploration_turn(
+    session_id: str,
+    user_input: Optional[str] = None,
+    initial_topic: Optional[str] = None
+) -> AsyncIterator[StreamEvent]:
+    """run_why_exploration_turn 의 스트리밍 버전: 노드 전환/토큰 이벤트 후 상태 저장을 마치고 final 이벤트"""
+    return serialized_stream(
+        WHY_THREAD_PREFIX + session_id,
+        user_input,
+        lambda: _stream_why_exploration_turn(session_id, user_input, initial_topic),
+    )
+
+
+async def _stream_why_exploration_turn(
+    session_id: str,
+    user_input: Optional[str],
+    initial_topic: Optional[str],
+) -> AsyncIterator[StreamEvent]:
+    app_why_graph = await get_why_graph()
+    with span("load_state", "state_load"):
+        graph_input, config = await _prepare_why_turn(session_id, user_input, initial_topic)
+
+    assistant_response_to_user = None
+    final_state_to_save = graph_input
+
+    node_names = graph_node_names(app_why_graph)
+    run = GraphRunResult()
+    try:
+        with span("astream_events", "graph"):
+            async for ev in app_why_graph.astream_events(graph_input, config, version="v2"):
+                if run.observe(ev):
+                    continue
+                out = translate_graph_event(ev, node_names)
+                if out is not None:
+                    yield out
+        assistant_response_to_user, final_state_to_save = _response_from_run_output(run.as_invoke_output(), graph_input)
+    except HTTPException:
+        raise
+    except Exception as e_invoke:
+        logger.exception("[WhyOrchestration] session_id=%s 그래프 실행 오류: %s", session_id, e_invoke)
+        assistant_response_to_user = f"(오류: 그래프 실행 중 문제 발생 - {e_invoke})"
+
+    with span("save_why_turn", "flush"):
+        content = await _save_why_turn(session_id, graph_input, final_state_to_save, assistant_response_to_user)
+    yield {"event": "final", "data": {"content": content}}
@@ -0,0 +1,201 @@
+# backend/app/core/write_behind.py
+"""
+SQLWriteBehindQueue: 체크포인트의 SQL 저장을 요청 경로에서 분리하는 write-behind 큐입니다.
+
+- 같은 thread_id에 대한 반복 저장은 마지막 상태 하나로 합쳐집니다(coalescing).
+- pending write 레코드(aput_writes)는 합치지 않고 순서대로 모아 함께 저장합니다.
+- 백그라운드 태스크가 flush_interval 마다 깨어나, max_lag 를 넘긴 항목이 있거나
+  batch_size 만큼 쌓였으면 오래된 순서로 한 번에 저장합니다.
+- 대기 중인 thread 수가 max_pending 에 도달하면 enqueue 가 대기합니다(backpressure).
+- 종료 시 drain() 으로 남은 항목을 모두 저장합니다.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class _PendingSave:
+    __slots__ = ("config", "state", "first_enqueued_at")
+
+    def __init__(self, config: Dict[str, Any], state: dict, first_enqueued_at: float):
+        self.config = config
+        self.state = state
+        self.first_enqueued_at = first_enqueued_at
+
+
+class SQLWriteBehindQueue:
+    def __init__(
+        self,
+        sql_cp,
+        flush_interval_ms: int = 200,
+        max_lag_ms: int = 1000,
+        max_pending: int = 1000,
+        batch_size: int = 100,
+    ):
+        self.sql_cp = sql_cp  # aset_many(items), aput_writes_many(records) 를 지원해야 함
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_lag = max_lag_ms / 1000
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+
+        self._pending: "OrderedDict[str, _PendingSave]" = OrderedDict()
+        self._inflight: Dict[str, dict] = {}  # 저장 중인 상태 (읽기 일관성용)
+        self._pending_writes: List[tuple] = []  # (thread_id, checkpoint_id, task_id, idx, channel, value)
+        self._inflight_writes: List[tuple] = []
+        self._writes_first_enqueued_at: Optional[float] = None
+        self._cond = asyncio.Condition()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # 간단한 통계 (모니터링/테스트용)
+        self.stats = {"enqueued": 0, "coalesced": 0, "flushed": 0, "batches": 0, "failed": 0}
+
+    # --- 생명주기 ---
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._closed = False
+            self._task = asyncio.create_task(self._run(), name="sql-write-behind")
+
+    async def drain(self) -> None:
+        """새 저장을 멈추고 남은 항목을 모두 SQL에 기록합니다 (lifespan 종료 훅)."""
+        self._closed = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+
+    # --- 생산자 측 ---
+    async def enqueue(self, config: Dict[str, Any], state: dict) -> None:
+        thread_id = config.get("configurable", {}).get("thread_id")
+        async with self._cond:
+            self.stats["enqueued"] += 1
+            existing = self._pending.get(thread_id)
+            if existing is not None:
+                # 최신 상태로 교체하되 최초 적재 시각은 유지 → 최대 지연(max_lag) 보장
+                existing.config = config
+                existing.state = state
+                self.stats["coalesced"] += 1
+                return
+
+            await self._wait_for_capacity()
+            self._pending[thread_id] = _PendingSave(config, state, time.monotonic())
+            if len(self._pending) >= self.batch_size:
+                self._wakeup.set()
+
+    async def enqueue_writes(self, records: List[tuple]) -> None:
+        """aput_writes 레코드를 추가 (합치지 않음)"""
+        if not records:
+            return
+        async with self._cond:
+            await self._wait_for_capacity()
+            if not self._pending_writes:
+                self._writes_first_enqueued_at = time.monotonic()
+            self._pending_writes.extend(records)
+            if len(self._pending_writes) >= self.batch_size:
+                self._wakeup.set()
+
+    async def _wait_for_capacity(self) -> None:
+        # self._cond 를 잡은 상태에서 호출
+        while self.depth() >= self.max_pending and not self._closed:
+            self._wakeup.set()  # 큐가 가득 차면 즉시 flush 유도
+            await self._cond.wait()
+
+    def get_pending(self, thread_id: str) -> Optional[dict]:
+        """아직 SQL에 반영되지 않은 최신 상태 (Redis 미스 시 SQL보다 먼저 확인)"""
+        item = self._pending.get(thread_id)
+        if item is not None:
+            return item.state
+        return self._inflight.get(thread_id)
+
+    def get_pending_writes(self, thread_id: str, checkpoint_id: Optional[str]) -> List[Tuple[str, str, Any]]:
+        """아직 SQL에 반영되지 않은 (task_id, channel, value) 목록"""
+        checkpoint_id = checkpoint_id or "latest"
+        return [
+            (task_id, channel, value)
+            for t_id, c_id, task_id, _idx, channel, value in self._inflight_writes + self._pending_writes
+            if t_id == thread_id and c_id == checkpoint_id
+        ]
+
+    def discard(self, thread_id: str) -> None:
+        self._pending.pop(thread_id, None)
+        self._pending_writes = [r for r in self._pending_writes if r[0] != thread_id]
+
+    def depth(self) -> int:
+        return len(self._pending) + len(self._pending_writes)
+
+    # --- 소비자 측 ---
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._due():
+                await self._flush_batch()
+
+    def _due(self) -> bool:
+        if not self._pending and not self._pending_writes:
+            return False
+        if self.depth() >= self.batch_size or self.depth() >= self.max_pending:
+            return True
+        now = time.monotonic()
+        if self._pending:
+            oldest = next(iter(self._pending.values()))
+            if now - oldest.first_enqueued_at >= self.max_lag:
+                return True
+        return bool(self._pending_writes) and now - self._writes_first_enqueued_at >= self.max_lag
+
+    async def flush(self) -> None:
+        """대기 중인 항목을 지연 조건과 무관하게 모두 저장합니다."""
+        while self._pending or self._pending_writes:
+            if not await self._flush_batch():
+                break
+
+    async def _flush_batch(self) -> bool:
+        async with self._cond:
+            batch: List[Tuple[str, _PendingSave]] = []
+            while self._pending and len(batch) < self.batch_size:
+                batch.append(self._pending.popitem(last=False))
+            for thread_id, item in batch:
+                self._inflight[thread_id] = item.state
+            # write 레코드는 작으므로 한 번에 모두 가져감
+            writes, self._pending_writes = self._pending_writes, []
+            self._inflight_writes = writes
+            self._cond.notify_all()
+        if not batch and not writes:
+            return True
+
+        ok = True
+        try:
+            # write 먼저: 뒤이은 상태 저장이 다른 체크포인트의 오래된 write를 정리함
+            if writes:
+                await self.sql_cp.aput_writes_many(writes)
+            if batch:
+                await self.sql_cp.aset_many([(item.config, item.state) for _, item in batch])
+            self.stats["flushed"] += len(batch) + len(writes)
+            self.stats["batches"] += 1
+        except Exception as e:
+            ok = False
+            self.stats["failed"] += len(batch) + len(writes)
+            logger.error("[WriteBehind] SQL 배치 저장 실패 (상태 %s건, write %s건): %s", len(batch), len(writes), e)
+            async with self._cond:
+                # 그 사이 더 최신 상태가 들어온 thread는 재시도하지 않음
+                for thread_id, item in reversed(batch):
+                    if thread_id not in self._pending:
+                        self._pending[thread_id] = item
+                        self._pending.move_to_end(thread_id, last=False)
+                if writes:
+                    self._pending_writes = writes + self._pending_writes
+                    self._writes_first_enqueued_at = time.monotonic() - self.max_lag
+        finally:
+            for thread_id, _ in batch:
+                self._inflight.pop(thread_id, None)
+            self._inflight_writes = []
+        return ok
@@ -0,0 +1,39 @@
+"""add checkpoint_writes table
+
+Revision ID: 5c1e7a9b2f40
+Revises: abcdef123456
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a9b2f40'
+down_revision: Union[str, None] = 'abcdef123456'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('checkpoint_writes',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('thread_id', sa.String(), nullable=False),
+    sa.Column('checkpoint_id', sa.String(), nullable=False),
+    sa.Column('task_id', sa.String(), nullable=False),
+    sa.Column('idx', sa.Integer(), nullable=False),
+    sa.Column('channel', sa.String(), nullable=False),
+    sa.Column('value_json', sa.JSON(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_checkpoint_writes_thread_checkpoint', 'checkpoint_writes', ['thread_id', 'checkpoint_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_checkpoint_writes_thread_checkpoint', table_name='checkpoint_writes')
+    op.drop_table('checkpoint_writes')
@@ -0,0 +1,31 @@
+"""add seq column and (thread_id, seq) unique key to messages
+
+Revision ID: 8d2f4b6a1c93
+Revises: 5c1e7a9b2f40
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f4b6a1c93'
+down_revision: Union[str, None] = '5c1e7a9b2f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 행은 seq NULL 로 남음 (UNIQUE 제약은 NULL 끼리 충돌하지 않음)
+    op.add_column('messages', sa.Column('seq', sa.Integer(), nullable=True))
+    op.create_unique_constraint('uq_messages_thread_seq', 'messages', ['thread_id', 'seq'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_messages_thread_seq', 'messages', type_='unique')
+    op.drop_column('messages', 'seq')
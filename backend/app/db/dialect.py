@@ -0,0 +1,49 @@
+# backend/app/db/dialect.py
+"""
+DB 방언별 INSERT ... ON CONFLICT 헬퍼 (DO NOTHING / DO UPDATE).
+
+운영은 PostgreSQL, 로컬/테스트는 SQLite(aiosqlite)를 쓰므로 두 방언의 insert()를
+세션에 바인딩된 엔진 기준으로 골라 줍니다.
+"""
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_insert(session: AsyncSession, table):
+    """세션의 방언에 맞는 insert() (on_conflict_* 지원)"""
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(table)
+    return postgresql.insert(table)
+
+
+async def insert_ignore_conflicts(
+    session: AsyncSession,
+    table,
+    rows: List[Dict[str, Any]],
+    index_elements: Sequence[str],
+) -> None:
+    """rows를 한 번의 INSERT ... VALUES 로 넣고, 고유키 충돌 행은 무시합니다 (재시도 멱등성)."""
+    if not rows:
+        return
+    stmt = dialect_insert(session, table).values(rows).on_conflict_do_nothing(index_elements=list(index_elements))
+    await session.execute(stmt)
+
+
+async def upsert_rows(
+    session: AsyncSession,
+    table,
+    rows: List[Dict[str, Any]],
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+) -> None:
+    """rows를 한 번의 INSERT ... ON CONFLICT DO UPDATE 로 저장합니다 (SELECT/ORM 객체 없이 1회 왕복)."""
+    if not rows:
+        return
+    stmt = dialect_insert(session, table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_={column: stmt.excluded[column] for column in update_columns},
+    )
+    await session.execute(stmt)
@@ -1,8 +1,8 @@
 # backend/app/db/models.py (기존 파일에 추가)
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, TIMESTAMP, func
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, TIMESTAMP, func, Index, UniqueConstraint, Uuid
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.dialects.postgresql import JSON, UUID, JSONB
+from sqlalchemy.dialects.postgresql import JSON, JSONB
 from datetime import datetime
 import uuid
 
@@ -12,9 +12,14 @@ Base = declarative_base()
 
 class MessageRecord(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        # (thread_id, seq) 가 멱등성 키: 같은 메시지를 재시도해도 한 번만 저장됨
+        UniqueConstraint("thread_id", "seq", name="uq_messages_thread_seq"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     thread_id = Column(String, nullable=False, index=True)
+    seq = Column(Integer, nullable=True)  # 대화 내 메시지 순번 (0부터). 기존 행은 NULL
     sender = Column(String(10), nullable=False)  # 'user' or 'bot'
     content = Column(Text, nullable=False)
     timestamp = Column(TIMESTAMP, nullable=False, server_default=func.now())
@@ -25,16 +30,40 @@ class GraphStateRecord(Base):
     thread_id = Column(String, primary_key=True)
     state_json = Column(JSON, nullable=False)  # ✅ 수정된 부분
 
+class CheckpointWriteRecord(Base):
+    """체크포인트별 pending write (append-only). 읽을 때 기준 상태에 접어서(fold) 적용"""
+    __tablename__ = "checkpoint_writes"
+    __table_args__ = (
+        Index("ix_checkpoint_writes_thread_checkpoint", "thread_id", "checkpoint_id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    thread_id = Column(String, nullable=False)
+    checkpoint_id = Column(String, nullable=False)
+    task_id = Column(String, nullable=False)
+    idx = Column(Integer, nullable=False)
+    channel = Column(String, nullable=False)
+    value_json = Column(JSON, nullable=True)
+
+# PostgreSQL 에서는 UUID/JSONB 그대로, SQLite(로컬/벤치마크)에서는 CHAR(32)/JSON 으로 생성됩니다.
+# session_id 는 앱 전체에서 문자열로 다루므로 as_uuid=False
+PortableJSONB = JSON().with_variant(JSONB, "postgresql")
+
+
+def _new_uuid() -> str:
+    return str(uuid.uuid4())
+
+
 class SessionStateRecord(Base):
     __tablename__ = "session_state"
-    session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    state = Column(JSONB, nullable=False)
+    session_id = Column(Uuid(as_uuid=False), primary_key=True, default=_new_uuid)
+    state = Column(PortableJSONB, nullable=False)
     updated_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow, server_default="NOW()")
 
 class SessionTranscriptRecord(Base):
     __tablename__ = "session_transcript"
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    session_id = Column(UUID(as_uuid=True), ForeignKey("session_state.session_id"), nullable=False)
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=_new_uuid)
+    session_id = Column(Uuid(as_uuid=False), ForeignKey("session_state.session_id"), nullable=False)
     occurred_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow, server_default="NOW()")
     role = Column(Text, nullable=False)
     content = Column(Text, nullable=False)
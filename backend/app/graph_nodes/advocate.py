@@ -5,6 +5,9 @@ from pydantic import BaseModel, Field # --- 구조화된 출력을 위해 추가
 
 from ..core.llm_provider import get_high_performance_llm # Provider 함수 임포트
 from ..models.graph_state import GraphState # 상태 모델 임포트
+from ..core.log import get_logger, lazy
+
+logger = get_logger(__name__)
 
 # --- 구조화된 출력을 위한 Pydantic 모델 정의 ---
 class AdvocateOutput(BaseModel):
@@ -18,7 +21,7 @@ async def advocate_node(state: GraphState) -> Dict[str, Any]:
     Advocate 에이전트 노드. 사용자의 아이디어를 건설적으로 옹호합니다.
     (LLM Provider 및 구조화된 출력 사용)
     """
-    print("--- Advocate Node 실행 ---")
+    logger.debug("--- Advocate Node 실행 ---")
 
     # --- 필요한 LLM 클라이언트 가져오기 ---
     try:
@@ -28,7 +31,7 @@ async def advocate_node(state: GraphState) -> Dict[str, Any]:
         # 구조화된 출력 사용 설정
         structured_llm = llm_advocate.with_structured_output(AdvocateOutput)
     except Exception as e:
-        print(f"Advocate: LLM 클라이언트 로드 실패 - {e}")
+        logger.error("Advocate: LLM 클라이언트 로드 실패 - %s", e)
         return {"error_message": f"LLM 클라이언트 로드 실패: {e}"}
 
     # --- 상태 정보 읽기 ---
@@ -47,7 +50,7 @@ async def advocate_node(state: GraphState) -> Dict[str, Any]:
              return {"error_message": "Advocate 입력 메시지가 비어있습니다."}
 
     except KeyError as e:
-        print(f"Advocate: 상태 객체에서 필수 키 누락 - {e}")
+        logger.error("Advocate: 상태 객체에서 필수 키 누락 - %s", e)
         return {"error_message": f"Advocate 상태 객체 키 누락: {e}"}
 
     # --- 시스템 프롬프트 구성 (제공된 예시 기반) ---
@@ -82,21 +85,19 @@ async def advocate_node(state: GraphState) -> Dict[str, Any]:
 
     # --- LLM 호출 (구조화된 출력 사용) ---
     model_name_to_log = getattr(llm_advocate, 'model', getattr(llm_advocate, 'model_name', 'N/A'))
-    print(f"Advocate: LLM 호출 준비 (Model: {model_name_to_log}, Structured Output: AdvocateOutput)")
+    logger.debug("Advocate: LLM 호출 준비 (Model: %s, Structured Output: AdvocateOutput)", model_name_to_log)
 
     try:
         # structured_llm 사용 및 ainvoke 호출
         response_object: AdvocateOutput = await structured_llm.ainvoke(prompt_messages)
-        print(f"Advocate: LLM 응답 수신 (구조화됨) - Point: {response_object.advocacy_point[:50]}...")
+        logger.debug("Advocate: LLM 응답 수신 (구조화됨) - Point: %s...", response_object.advocacy_point[:50])
 
         # 사용자에게 전달할 최종 응답 문자열 생성 (예시)
         final_response_string = f"**[Advocate의 견해]**\n\n**핵심:** {response_object.advocacy_point}\n\n**부연:** {response_object.brief_elaboration}"
 
     except Exception as e:
         error_msg = f"Advocate: LLM 호출 오류 - {e}"
-        print(error_msg)
-        import traceback
-        traceback.print_exc()
+        logger.exception("%s", error_msg)
         # 오류 발생 시 오류 메시지를 포함한 상태 반환
         return {
             "error_message": error_msg,
@@ -112,6 +113,6 @@ async def advocate_node(state: GraphState) -> Dict[str, Any]:
         # "last_advocate_output": response_object.dict(),
         "error_message": None, # 성공 시 오류 없음
     }
-    print(f"Advocate: 상태 업데이트 반환 - { {k: v for k, v in updates_to_state.items() if k != 'messages'} }")
+    logger.debug("Advocate: 상태 업데이트 반환 - %s", lazy(lambda: {k: v for k, v in updates_to_state.items() if k != 'messages'}))
 
     return updates_to_state
\ No newline at end of file
@@ -6,18 +6,22 @@ from ..models.graph_state import GraphState
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, BaseMessage
 from ..core.llm_provider import get_focus_llm # 포커스용 LLM 가져오기
 from ..core import state_manager # 초기 정보 로드용 (임시)
+from ..core.config import settings
+from ..core.log import get_logger
+
+logger = get_logger(__name__)
 
 async def determine_current_focus(last_ai_message: Optional[AIMessage], last_human_message: HumanMessage) -> Optional[str]:
     """ 마지막 AI 응답과 사용자 응답 기반으로 다음 턴 포커스 결정 (LLM 사용) """
     llm_for_focus = None
     try:
-        llm_for_focus = get_focus_llm()
+        llm_for_focus = get_focus_llm(cache_site="focus")
     except Exception as e:
-        print(f"Coordinator(Focus): LLM 로드 실패 - {e}")
+        logger.error("Coordinator(Focus): LLM 로드 실패 - %s", e)
         return None # LLM 없으면 포커스 결정 불가
 
     if not last_ai_message:
-        print("Coordinator(Focus): 이전 AI 메시지 없음, 포커스 결정 불가")
+        logger.debug("Coordinator(Focus): 이전 AI 메시지 없음, 포커스 결정 불가")
         return None
 
     try:
@@ -37,18 +41,32 @@ AI의 마지막 응답:
 
 다음 대화의 핵심 초점 (짧은 구 또는 질문 형태):"""
         # --- ---
-        print("Coordinator(Focus): 포커스 결정을 위한 LLM 호출")
+        logger.debug("Coordinator(Focus): 포커스 결정을 위한 LLM 호출")
         response = await llm_for_focus.ainvoke([SystemMessage(content=focus_prompt)])
         focus = response.content.strip()
         if focus.lower() == 'none' or len(focus) < 5: return None
         return focus[:150] # 최대 150자
     except Exception as e:
-        print(f"Coordinator(Focus): 포커스 결정 중 LLM 호출 오류 - {e}")
+        logger.error("Coordinator(Focus): 포커스 결정 중 LLM 호출 오류 - %s", e)
         return None
 
+async def focus_node(state: GraphState) -> Dict[str, Any]:
+    """ 투기적 포커스 노드: 에이전트 노드와 같은 단계에서 실행되어 다음 턴용 current_focus 를 기록 """
+    logger.debug("--- Focus Node 실행 (speculative) ---")
+    messages: List[BaseMessage] = state.get('messages', [])
+    previous_focus = state.get("current_focus") or state.get("initial_topic", "주제 없음")
+    last_message = messages[-1] if messages else None
+    if not isinstance(last_message, HumanMessage):
+        return {"focus_requested": False}
+
+    last_ai_message = messages[-2] if len(messages) > 1 and isinstance(messages[-2], AIMessage) else None
+    new_focus = await determine_current_focus(last_ai_message, last_message)
+    logger.debug("Focus: 다음 턴 current focus -> '%s'", new_focus or previous_focus)
+    return {"current_focus": new_focus or previous_focus, "focus_requested": False}
+
 async def coordinator_node(state: GraphState) -> Dict[str, Any]:
     """ Coordinator 노드 (Target Agent 설정 및 명령어 감지 로직 수정) """
-    print("--- Coordinator Node 실행 ---")
+    logger.debug("--- Coordinator Node 실행 ---")
     try:
         messages: List[BaseMessage] = state.get('messages', [])
         session_id = state.get("session_id")
@@ -57,7 +75,7 @@ async def coordinator_node(state: GraphState) -> Dict[str, Any]:
 
         # 상태 초기화 및 target_agent 설정 (이전과 동일)
         if not messages:
-            print("Coordinator: 첫 턴 또는 상태 초기화 감지")
+            logger.debug("Coordinator: 첫 턴 또는 상태 초기화 감지")
             initial_info = None
             if session_id:
                 initial_info = state_manager.get_session_initial_info(session_id)
@@ -72,7 +90,7 @@ async def coordinator_node(state: GraphState) -> Dict[str, Any]:
                 "target_agent": initial_target,
                 "session_id": session_id, "initial_topic": initial_topic_from_store
             }
-            print(f"Coordinator: 초기 상태 설정 반환 - {initial_updates}")
+            logger.debug("Coordinator: 초기 상태 설정 반환 - %s", initial_updates)
             return initial_updates
 
         last_message = messages[-1]
@@ -97,7 +115,7 @@ async def coordinator_node(state: GraphState) -> Dict[str, Any]:
         if processed_input == "/summarize":
             updates["moderator_flags"].append("summarize_request")
             command_detected = True
-            print("Coordinator: /summarize 명령어 감지됨")
+            logger.debug("Coordinator: /summarize 명령어 감지됨")
 
         # 2. /agent 명령어: 정확한 형식일 때만 감지
         #    (정규식 대신 startsWith 사용도 가능)
@@ -107,7 +125,7 @@ async def coordinator_node(state: GraphState) -> Dict[str, Any]:
              updates["target_agent"] = new_target_agent
              updates["mode"] = "OneOnOne" # 에이전트 변경 시 모드 자동 설정
              updates["nuance"] = None
-             command_detected = True; print(f"Coordinator: Target agent 변경됨 -> {new_target_agent}")
+             command_detected = True; logger.debug("Coordinator: Target agent 변경됨 -> %s", new_target_agent)
 
         # 3. /depth 명령어: 정확한 형식일 때만 감지
         depth_match = re.search(r"^/depth\s+(\d+)$", processed_input)
@@ -118,26 +136,32 @@ async def coordinator_node(state: GraphState) -> Dict[str, Any]:
                 # target_agent가 Critic일 때만 적용하거나, 모든 에이전트에 적용할지 결정 필요
                 # if updates.get("target_agent") == "critic":
                 #     updates["critique_depth"] = new_depth
-                command_detected = True; print(f"Coordinator: Depth 변경됨 -> {new_depth}")
+                command_detected = True; logger.debug("Coordinator: Depth 변경됨 -> %s", new_depth)
             except ValueError: pass
         # --- 명령어 감지 로직 수정 완료 ---
 
         # --- 포커스 결정 (명령어 없을 시) ---
-        if not command_detected and not updates.get("error_message"):
+        updates["focus_requested"] = False
+        if not command_detected and not updates.get("error_message") and settings.COORDINATOR_SPECULATIVE_FOCUS:
+            # 투기적 모드: 포커스 LLM 호출을 기다리지 않고 focus 노드를 에이전트와 병렬로 실행.
+            # 이번 턴 에이전트는 이전 턴의 current_focus 를 사용하고, 새 포커스는 다음 턴에 반영됨
+            updates["focus_requested"] = True
+            logger.debug("Coordinator: 포커스 결정을 에이전트와 병렬로 실행 (speculative)")
+        elif not command_detected and not updates.get("error_message"):
             last_ai_message = messages[-2] if len(messages)>1 and isinstance(messages[-2], AIMessage) else None
             new_focus = await determine_current_focus(last_ai_message, last_message)
             # 이전 포커스가 있으면 유지, 없으면 초기 주제 사용
             updates["current_focus"] = new_focus if new_focus else (state.get("current_focus") if state.get("current_focus") else initial_topic)
-            print(f"Coordinator: Current focus 설정됨 -> '{updates['current_focus']}'")
+            logger.debug("Coordinator: Current focus 설정됨 -> '%s'", updates['current_focus'])
         elif command_detected:
              updates["current_focus"] = None # 명령어 처리 시 포커스 초기화
 
         # 상태 업데이트 반환 (None 값 제외)
         final_updates = {k: v for k, v in updates.items() if v is not None}
-        print(f"Coordinator: 상태 업데이트 반환 - {final_updates}")
+        logger.debug("Coordinator: 상태 업데이트 반환 - %s", final_updates)
         return final_updates
 
     except Exception as e:
         error_msg = f"Coordinator 노드 오류: {e}"
-        import traceback; traceback.print_exc()
+        logger.exception("%s", error_msg)
         return {"error_message": error_msg}
\ No newline at end of file
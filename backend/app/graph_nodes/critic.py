@@ -8,6 +8,9 @@ from langchain_core.runnables import RunnableWithMessageHistory
 from langchain_core.tools import tool
 
 from ..models.graph_state import GraphState, SearchResult
+from ..core.log import get_logger
+
+logger = get_logger(__name__)
 
 # --- 구조화된 출력을 위한 Pydantic 모델 정의 ---
 class CriticOutput(BaseModel):
@@ -18,12 +21,12 @@ class CriticOutput(BaseModel):
 
 async def critic_node(state: GraphState) -> Dict[str, Any]:
     """ Critic 에이전트 노드 (LLM Provider 및 구조화된 출력 사용) """
-    print("--- Critic Node 실행 ---")
+    logger.debug("--- Critic Node 실행 ---")
     try:
         llm_critic = get_high_performance_llm() # Critic용 LLM
         structured_llm = llm_critic.with_structured_output(CriticOutput)
     except Exception as e:
-        print(f"Critic: LLM 클라이언트 로드 실패 - {e}")
+        logger.error("Critic: LLM 클라이언트 로드 실패 - %s", e)
         return {"error_message": f"LLM 클라이언트 로드 실패: {e}"}
 
     try:
@@ -64,7 +67,7 @@ async def critic_node(state: GraphState) -> Dict[str, Any]:
 
 # 입력 컨텍스트 활용:
 * 사용자의 마지막 메시지(`{{messages[-1].content}}` - *참고: 이 f-string 변수 삽입은 실제로는 작동하지 않으므로, 프롬프트 생성 전에 값을 문자열에 넣어야 합니다*)를 주로 분석하세요.
-* 현재 논의 초점(`{{current_focus}}` - *이것도 마찬가지*)을 고려하세요.
+* 현재 논의 초점(`{current_focus or '지정되지 않음'}`)을 고려하세요. (투기적 포커스 모드에서는 이전 턴에 결정된 초점입니다)
 
 # Few-Shot 예제 가이드:
 * (단일 비판점과 설명을 JSON 형식으로 제공하는 예시 추가 - request_search_query 사용 예시 포함)
@@ -80,10 +83,10 @@ async def critic_node(state: GraphState) -> Dict[str, Any]:
 
     # LLM 호출 (구조화된 출력 사용)
     model_name_to_log = getattr(llm_critic, 'model', getattr(llm_critic, 'model_name', 'N/A'))
-    print(f"Critic: LLM 호출 준비 (Model: {model_name_to_log}, Structured Output: CriticOutput)")
+    logger.debug("Critic: LLM 호출 준비 (Model: %s, Structured Output: CriticOutput)", model_name_to_log)
     try:
         response_object: CriticOutput = await structured_llm.ainvoke(prompt_messages)
-        print(f"Critic: LLM 응답 수신 (구조화됨) - Point: {response_object.critique_point[:50]}...")
+        logger.debug("Critic: LLM 응답 수신 (구조화됨) - Point: %s...", response_object.critique_point[:50])
 
         # 최종 응답 문자열 생성 (예시)
         final_response_string = f"**[Critic의 검토]**\n\n**핵심:** {response_object.critique_point}\n\n**의견:** {response_object.brief_elaboration}"
@@ -101,5 +104,5 @@ async def critic_node(state: GraphState) -> Dict[str, Any]:
         "search_results": None,
         "error_message": None,
     }
-    print(f"Critic: 상태 업데이트 반환 - Search Query: {search_query}")
+    logger.debug("Critic: 상태 업데이트 반환 - Search Query: %s", search_query)
     return updates_to_state
\ No newline at end of file
@@ -4,6 +4,9 @@ from langchain_core.messages import SystemMessage, BaseMessage, AIMessage, Human
 from ..core.llm_provider import get_fast_llm # LLM Provider 사용
 
 from ..models.graph_state import GraphState
+from ..core.log import get_logger
+
+logger = get_logger(__name__)
 
 async def check_discussion_quality(messages: List[BaseMessage]) -> Optional[str]: # 인자 타입 명시 권장
     """
@@ -23,7 +26,7 @@ async def check_discussion_quality(messages: List[BaseMessage]) -> Optional[str]
     # return None
 async def moderator_node(state: GraphState) -> Dict[str, Any]:
     """ Moderator 노드 (LLM Provider 사용) """
-    print("--- Moderator Node 실행 ---")
+    logger.debug("--- Moderator Node 실행 ---")
     messages = state.get('messages', [])
     flags = state.get('moderator_flags', [])
     # --- 마지막 발언자 확인 (중요) ---
@@ -43,12 +46,12 @@ async def moderator_node(state: GraphState) -> Dict[str, Any]:
         # --- LLM 로드 (요약 시에만) ---
         llm_for_summary = None
         if "summarize_request" in flags:
-            try: llm_for_summary = get_fast_llm()
+            try: llm_for_summary = get_fast_llm(cache_site="moderator_summary")
             except Exception as e: error_msg = f"요약 LLM 로드 실패: {e}"
 
         # 1. /summarize 처리
         if "summarize_request" in flags:
-            print("Moderator: /summarize 요청 처리 중")
+            logger.debug("Moderator: /summarize 요청 처리 중")
             if error_msg: # LLM 로드 실패 시
                  final_response_content = f"(시스템 오류: {error_msg})"
             elif not messages:
@@ -77,11 +80,11 @@ async def moderator_node(state: GraphState) -> Dict[str, Any]:
         elif last_agent_output_content: # 마지막 AI 메시지를 최종 응답으로 사용
             if quality_comment: final_response_content = f"{quality_comment}\n\n---\n\n{last_agent_output_content}"
             else: final_response_content = last_agent_output_content
-            print(f"Moderator: 최종 응답 결정됨 (Last Agent Output) - '{final_response_content[:50]}...'")
+            logger.debug("Moderator: 최종 응답 결정됨 (Last Agent Output) - '%s...'", final_response_content[:50])
         else: # 응답 생성 실패 또는 오류
             error_msg = error_msg or "Moderator: 최종 응답 내용 없음"
             final_response_content = f"(시스템 오류: {error_msg})"
-            print(f"Moderator: 오류 - {error_msg}")
+            logger.error("Moderator: 오류 - %s", error_msg)
 
         # 4. 상태 업데이트 준비
         updates = {
@@ -91,12 +94,12 @@ async def moderator_node(state: GraphState) -> Dict[str, Any]:
             "error_message": error_msg,
         }
 
-        print(f"Moderator: 상태 업데이트 반환 - FinalResponse 설정됨, Error: {error_msg}")
+        logger.debug("Moderator: 상태 업데이트 반환 - FinalResponse 설정됨, Error: %s", error_msg)
         return updates
 
     except Exception as e: # 노드 전체 오류
         error_msg = f"Moderator 노드 오류: {e}"
-        import traceback; traceback.print_exc()
+        logger.exception("%s", error_msg)
         final_response_content = f"(시스템 오류: {error_msg})"
         # messages에 오류 메시지를 추가할지 결정 필요
         return { "error_message": error_msg, "final_response": final_response_content }
\ No newline at end of file
@@ -7,6 +7,9 @@ from pydantic import BaseModel, Field # --- 구조화된 출력을 위해 추가
 # Socratic 질문은 때로 복잡한 맥락 이해가 필요할 수 있으므로 high_perf 사용 고려
 from ..core.llm_provider import get_high_performance_llm, get_fast_llm
 from ..models.graph_state import GraphState
+from ..core.log import get_logger, lazy
+
+logger = get_logger(__name__)
 
 # --- 구조화된 출력을 위한 Pydantic 모델 정의 ---
 class SocraticOutput(BaseModel):
@@ -20,7 +23,7 @@ async def socratic_node(state: GraphState) -> Dict[str, Any]:
     Socratic 에이전트 노드. 사용자가 스스로 생각하고 답을 발견하도록
     소크라테스식 질문을 통해 안내합니다. (LLM Provider 및 구조화된 출력 사용)
     """
-    print("--- Socratic Node 실행 ---")
+    logger.debug("--- Socratic Node 실행 ---")
 
     # --- 필요한 LLM 클라이언트 가져오기 ---
     try:
@@ -28,7 +31,7 @@ async def socratic_node(state: GraphState) -> Dict[str, Any]:
         llm_socratic = get_high_performance_llm()
         structured_llm = llm_socratic.with_structured_output(SocraticOutput)
     except Exception as e:
-        print(f"Socratic: LLM 클라이언트 로드 실패 - {e}")
+        logger.error("Socratic: LLM 클라이언트 로드 실패 - %s", e)
         return {"error_message": f"LLM 클라이언트 로드 실패: {e}"}
 
     # --- 상태 정보 읽기 ---
@@ -40,12 +43,12 @@ async def socratic_node(state: GraphState) -> Dict[str, Any]:
         # 마지막 사용자 메시지를 주요 분석 대상으로 삼음
         last_user_message_content = messages[-1].content if isinstance(messages[-1], HumanMessage) else None
         if not last_user_message_content:
-             print("Socratic: 마지막 메시지가 사용자 입력이 아님. 이전 기록 참조.")
+             logger.debug("Socratic: 마지막 메시지가 사용자 입력이 아님. 이전 기록 참조.")
              # TODO: 더 나은 대상 메시지 선정 로직 필요
              pass
 
     except KeyError as e:
-        print(f"Socratic: 상태 객체에서 필수 키 누락 - {e}")
+        logger.error("Socratic: 상태 객체에서 필수 키 누락 - %s", e)
         return {"error_message": f"Socratic 상태 객체 키 누락: {e}"}
 
     # --- 시스템 프롬프트 구성 (제공된 예시 기반) ---
@@ -85,20 +88,18 @@ async def socratic_node(state: GraphState) -> Dict[str, Any]:
 
     # --- LLM 호출 (구조화된 출력 사용) ---
     model_name_to_log = getattr(llm_socratic, 'model', getattr(llm_socratic, 'model_name', 'N/A'))
-    print(f"Socratic: LLM 호출 준비 (Model: {model_name_to_log}, Structured Output: SocraticOutput)")
+    logger.debug("Socratic: LLM 호출 준비 (Model: %s, Structured Output: SocraticOutput)", model_name_to_log)
 
     try:
         response_object: SocraticOutput = await structured_llm.ainvoke(prompt_messages)
-        print(f"Socratic: LLM 응답 수신 (구조화됨) - Question: {response_object.socratic_question[:50]}...")
+        logger.debug("Socratic: LLM 응답 수신 (구조화됨) - Question: %s...", response_object.socratic_question[:50])
 
         # 사용자에게 전달할 최종 응답 문자열 생성 (질문만 전달)
         final_response_string = response_object.socratic_question
 
     except Exception as e:
         error_msg = f"Socratic: LLM 호출 오류 - {e}"
-        print(error_msg)
-        import traceback
-        traceback.print_exc()
+        logger.exception("%s", error_msg)
         return {
             "error_message": error_msg,
             "messages": [AIMessage(content=f"(시스템 오류: Socratic 응답 생성 실패 - {e})")]
@@ -112,6 +113,6 @@ async def socratic_node(state: GraphState) -> Dict[str, Any]:
         # "current_focus": ..., # 필요시 업데이트
         "error_message": None,
     }
-    print(f"Socratic: 상태 업데이트 반환 - { {k: v for k, v in updates_to_state.items() if k != 'messages'} }")
+    logger.debug("Socratic: 상태 업데이트 반환 - %s", lazy(lambda: {k: v for k, v in updates_to_state.items() if k != 'messages'}))
 
     return updates_to_state
\ No newline at end of file
@@ -6,6 +6,9 @@ from pydantic import BaseModel, Field # --- 구조화된 출력을 위해 추가
 # --- LLM Provider 및 상태 모델 임포트 ---
 from ..core.llm_provider import get_high_performance_llm # Why 에이전트는 분석적이므로 고성능 모델 고려
 from ..models.graph_state import GraphState
+from ..core.log import get_logger, lazy
+
+logger = get_logger(__name__)
 
 # --- 구조화된 출력을 위한 Pydantic 모델 정의 ---
 class WhyOutput(BaseModel):
@@ -19,14 +22,14 @@ async def why_node(state: GraphState) -> Dict[str, Any]:
     Why 에이전트 노드. 사용자의 주장 이면의 근본 원인/가정/논리를 탐색하는
     통찰력 있는 질문을 생성합니다. (LLM Provider 및 구조화된 출력 사용)
     """
-    print("--- Why Node 실행 ---")
+    logger.debug("--- Why Node 실행 ---")
 
     # --- 필요한 LLM 클라이언트 가져오기 ---
     try:
         llm_why = get_high_performance_llm() # 분석적이므로 고성능 모델 사용
         structured_llm = llm_why.with_structured_output(WhyOutput)
     except Exception as e:
-        print(f"Why: LLM 클라이언트 로드 실패 - {e}")
+        logger.error("Why: LLM 클라이언트 로드 실패 - %s", e)
         return {"error_message": f"LLM 클라이언트 로드 실패: {e}"}
 
     # --- 상태 정보 읽기 ---
@@ -40,12 +43,12 @@ async def why_node(state: GraphState) -> Dict[str, Any]:
         if not last_user_message:
              # 마지막 메시지가 AI 응답인 경우 등 예외 처리 (예: 그 이전 사용자 메시지 찾기)
              # 여기서는 간단히 이전 기록을 참조하도록 함
-             print("Why: 마지막 메시지가 사용자 입력이 아님. 이전 기록 참조.")
+             logger.debug("Why: 마지막 메시지가 사용자 입력이 아님. 이전 기록 참조.")
              # TODO: 더 나은 대상 메시지 선정 로직 필요
              pass
 
     except KeyError as e:
-        print(f"Why: 상태 객체에서 필수 키 누락 - {e}")
+        logger.error("Why: 상태 객체에서 필수 키 누락 - %s", e)
         return {"error_message": f"Why 상태 객체 키 누락: {e}"}
 
     # --- 시스템 프롬프트 구성 (제공된 예시 기반) ---
@@ -72,20 +75,18 @@ async def why_node(state: GraphState) -> Dict[str, Any]:
 
     # --- LLM 호출 (구조화된 출력 사용) ---
     model_name_to_log = getattr(llm_why, 'model', getattr(llm_why, 'model_name', 'N/A'))
-    print(f"Why: LLM 호출 준비 (Model: {model_name_to_log}, Structured Output: WhyOutput)")
+    logger.debug("Why: LLM 호출 준비 (Model: %s, Structured Output: WhyOutput)", model_name_to_log)
 
     try:
         response_object: WhyOutput = await structured_llm.ainvoke(prompt_messages)
-        print(f"Why: LLM 응답 수신 (구조화됨) - Question: {response_object.probing_question[:50]}...")
+        logger.debug("Why: LLM 응답 수신 (구조화됨) - Question: %s...", response_object.probing_question[:50])
 
         # 사용자에게 전달할 최종 응답 문자열 생성 (예시: 질문만 전달)
         final_response_string = response_object.probing_question
 
     except Exception as e:
         error_msg = f"Why: LLM 호출 오류 - {e}"
-        print(error_msg)
-        import traceback
-        traceback.print_exc()
+        logger.exception("%s", error_msg)
         return {
             "error_message": error_msg,
             "messages": [AIMessage(content=f"(시스템 오류: Why 응답 생성 실패 - {e})")]
@@ -99,6 +100,6 @@ async def why_node(state: GraphState) -> Dict[str, Any]:
         # "current_focus": response_object.question_focus, # 예시
         "error_message": None,
     }
-    print(f"Why: 상태 업데이트 반환 - { {k: v for k, v in updates_to_state.items() if k != 'messages'} }")
+    logger.debug("Why: 상태 업데이트 반환 - %s", lazy(lambda: {k: v for k, v in updates_to_state.items() if k != 'messages'}))
 
     return updates_to_state
\ No newline at end of file
@@ -9,6 +9,9 @@ from pydantic import BaseModel, Field
 from ...core.llm_provider import get_high_performance_llm
 # from ...models.why_graph_state import WhyGraphState # 실제 정의된 WhyGraphState 임포트 가정
 from ...models.why_graph_state import WhyGraphState
+from ...core.log import get_logger
+
+logger = get_logger(__name__)
 
 # 구조화된 출력을 위한 Pydantic 모델 정의
 class MotivationQuestionOutput(BaseModel):
@@ -22,7 +25,7 @@ async def ask_motivation_why_node(state: WhyGraphState) -> Dict[str, Any]:
     사용자의 핵심 동기(Why)를 묻는 첫 번째 질문을 생성하고 메시지에 추가합니다.
     (수정됨: 입력 상태 확인 로직 우선 실행)
     """
-    print("--- Ask Motivation Why Node 실행 ---")
+    logger.debug("--- Ask Motivation Why Node 실행 ---")
 
     # --- 1. 상태 정보 읽기 및 필수 입력 확인 (LLM 로드 전) ---
     try:
@@ -30,14 +33,14 @@ async def ask_motivation_why_node(state: WhyGraphState) -> Dict[str, Any]:
         idea_summary = state.get('idea_summary')
         # *** 중요: idea_summary 확인을 먼저 수행 ***
         if not idea_summary:
-            print("AskMotivationWhy Error: idea_summary is missing in state.")
+            logger.error("AskMotivationWhy Error: idea_summary is missing in state.")
             # idea_summary가 없으면 LLM 호출 없이 즉시 오류 반환
             return {"error_message": "AskMotivationWhy: 상태에 아이디어 요약(idea_summary)이 없습니다."}
 
         messages = state.get('messages', []) # 메시지 기록 참조 (선택적)
 
     except KeyError as e:
-        print(f"AskMotivationWhy: 상태 객체에서 필수 키 누락 - {e}")
+        logger.error("AskMotivationWhy: 상태 객체에서 필수 키 누락 - %s", e)
         return {"error_message": f"AskMotivationWhy 상태 객체 키 누락: {e}"}
     # --- ---
 
@@ -47,7 +50,7 @@ async def ask_motivation_why_node(state: WhyGraphState) -> Dict[str, Any]:
         structured_llm = llm_questioner.with_structured_output(MotivationQuestionOutput)
     except Exception as e:
         # LLM 로드 실패는 실행 환경 문제일 수 있음 (예: API 키)
-        print(f"AskMotivationWhy: LLM 클라이언트 로드 실패 - {e}")
+        logger.error("AskMotivationWhy: LLM 클라이언트 로드 실패 - %s", e)
         # LLM 로드 실패 시 사용자에게 보여줄 메시지 생성 및 반환
         error_content = f"(시스템 오류: 질문 생성 준비 중 오류 발생 - {e})"
         # 기존 메시지에 오류 메시지 누적
@@ -87,16 +90,15 @@ async def ask_motivation_why_node(state: WhyGraphState) -> Dict[str, Any]:
         response_object: MotivationQuestionOutput = await structured_llm.ainvoke(prompt_messages)
         ai_question_content = response_object.motivation_question
         error_message_to_return = None
-        print(f"AskMotivationWhy: 질문 생성 완료 → {ai_question_content[:60]}...")
+        logger.debug("AskMotivationWhy: 질문 생성 완료 → %s...", ai_question_content[:60])
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("AskMotivationWhy: 동기 질문 생성 실패 - %s", e)
         ai_question_content = f"(시스템 오류: 동기 질문 생성 실패 - {e})"
         error_message_to_return = str(e)
 
     # 5. 인터럽트 발생 (사용자 입력 대기)
-    print("AskMotivationWhy: 질문 생성 후 interrupt 발생 → 사용자 응답 대기 중단")
+    logger.debug("AskMotivationWhy: 질문 생성 후 interrupt 발생 → 사용자 응답 대기 중단")
     raise interrupt(ai_question_content).with_data({
         "messages": messages + [AIMessage(content=ai_question_content)],
         "error_message": error_message_to_return,
@@ -9,6 +9,9 @@ from pydantic import BaseModel, Field
 # LLM Provider 및 상태 모델 임포트
 from ...core.llm_provider import get_high_performance_llm # 심층 분석 및 질문 생성
 from ...models.why_graph_state import WhyGraphState
+from ...core.log import get_logger
+
+logger = get_logger(__name__)
 # 구조화된 출력을 위한 Pydantic 모델 정의
 class MotivationClarityOutput(BaseModel):
     """동기 명확성 판단 및 후속 질문 생성 모델"""
@@ -26,14 +29,14 @@ async def clarify_motivation_node(state: WhyGraphState) -> Dict[str, Any]:
     if state.get("motivation_cleared", False):
         return {}
 
-    print("--- Clarify Motivation Node 실행 ---")
+    logger.debug("--- Clarify Motivation Node 실행 ---")
 
     # LLM 클라이언트 가져오기
     try:
         llm_analyzer = get_high_performance_llm() # 명확성 판단 및 질문 생성 위해 고성능 모델
         structured_llm = llm_analyzer.with_structured_output(MotivationClarityOutput)
     except Exception as e:
-        print(f"ClarifyMotivation: LLM 클라이언트 로드 실패 - {e}")
+        logger.error("ClarifyMotivation: LLM 클라이언트 로드 실패 - %s", e)
         return {"error_message": f"LLM 클라이언트 로드 실패: {e}"}
 
     # 상태 정보 읽기
@@ -81,11 +84,11 @@ async def clarify_motivation_node(state: WhyGraphState) -> Dict[str, Any]:
 
     # LLM 호출
     model_name_to_log = getattr(llm_analyzer, 'model', getattr(llm_analyzer, 'model_name', 'N/A'))
-    print(f"ClarifyMotivation: LLM 호출 준비 (Model: {model_name_to_log}, Structured Output: MotivationClarityOutput)")
+    logger.debug("ClarifyMotivation: LLM 호출 준비 (Model: %s, Structured Output: MotivationClarityOutput)", model_name_to_log)
 
     try:
         response_object: MotivationClarityOutput = await structured_llm.ainvoke(prompt_messages)
-        print(f"ClarifyMotivation: LLM 응답 수신 (구조화됨) - Is Clear: {response_object.is_motivation_clear}")
+        logger.debug("ClarifyMotivation: LLM 응답 수신 (구조화됨) - Is Clear: %s", response_object.is_motivation_clear)
         if not response_object.is_motivation_clear:
             # 동기 불명확 → 후속 질문만 리턴
             raise interrupt(response_object.clarification_question).with_data({
@@ -101,7 +104,7 @@ async def clarify_motivation_node(state: WhyGraphState) -> Dict[str, Any]:
     except GraphInterrupt:
         raise  # LangGraph 내부에서 처리하라고 넘김
     except Exception as e:
-        import traceback; traceback.print_exc()
+        logger.exception("ClarifyMotivation: 명확성 판단 중 예외 발생 - %s", e)
         raise interrupt(
             f"(시스템 오류: 명확성 판단 중 예외 발생 - {e})"
         ).with_data({
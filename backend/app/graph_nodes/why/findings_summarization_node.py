@@ -5,8 +5,12 @@ from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, Base
 from langgraph.types import interrupt # interrupt 임포트
 from pydantic import BaseModel, Field # Pydantic 모델 사용
 
+from ...core.context_window import build_node_history
 from ...core.llm_provider import get_high_performance_llm
 from ...models.why_graph_state import WhyGraphState # 타입 힌팅용
+from ...core.log import get_logger
+
+logger = get_logger(__name__)
 
 class FindingsSummaryOutput(BaseModel):
     findings_summary: str = Field(
@@ -22,7 +26,7 @@ async def findings_summarization_node(state: Dict[str, Any]) -> Dict[str, Any]:
     지금까지 진행된 대화 내용을 바탕으로 아이디어, 동기 및 탐색된 각 가정과 주요 인사이트를
     정리한 요약을 생성하고 사용자에게 전달하기 위해 interrupt를 발생시킵니다 (assistant_message를 상태에 포함).
     """
-    print("[FIND][DEBUG] Entering findings_summarization_node")
+    logger.debug("[FIND] Entering findings_summarization_node")
 
     messages: List[Union[BaseMessage, dict]] = state.get('messages', [])
     raw_topic: str = state.get('raw_topic', 'N/A')
@@ -31,8 +35,7 @@ async def findings_summarization_node(state: Dict[str, Any]) -> Dict[str, Any]:
     identified_assumptions: List[str] = state.get('identified_assumptions', [])
     # probed_assumptions와 그에 대한 답변은 messages 리스트에서 LLM이 추론하도록 유도
     
-    # 메시지 이력 문자열화 (LLM 프롬프트용)
-    history_lines_for_prompt = []
+    # 메시지 이력 정규화 (프롬프트 문자열은 build_node_history 에서 생성)
     current_messages_for_state = [] # BaseMessage 객체로 일관성 유지
     for i, msg_data in enumerate(messages):
         role = None; content = None; msg_obj = None
@@ -50,8 +53,6 @@ async def findings_summarization_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 role, content = "Assistant", raw_content
                 if raw_content is not None: msg_obj = AIMessage(content=raw_content, additional_kwargs=msg_data.get("additional_kwargs",{}))
         
-        if role and content is not None:
-            history_lines_for_prompt.append(f"- {role}: {content}")
         if msg_obj: 
             current_messages_for_state.append(msg_obj)
         elif isinstance(msg_data, dict) and msg_obj is None and content is not None : 
@@ -81,25 +82,26 @@ async def findings_summarization_node(state: Dict[str, Any]) -> Dict[str, Any]:
     else:
         user_prompt_str += "(No specific assumptions were listed for probing, summarize based on overall dialogue)\n"
     
-    user_prompt_str += "\nFull Dialogue History (for context and assumption insights):\n"
-    # 전체 대화 이력을 전달하여 LLM이 가정별 인사이트를 더 잘 추출하도록 함
-    user_prompt_str += "\n".join(history_lines_for_prompt)
+    user_prompt_str += "\nDialogue History (for context and assumption insights):\n"
+    # 토큰 예산 안에서 최근 대화는 원문, 그 이전은 롤링 요약으로 전달 (요약이 가정별 인사이트를 보존)
+    history = await build_node_history("findings_summarization", current_messages_for_state, state=state)
+    user_prompt_str += history.text
 
-    print(f"[FIND][DEBUG] user_prompt for findings summary (length {len(user_prompt_str)}): {user_prompt_str[:500]}...")
+    logger.debug("[FIND] user_prompt for findings summary (length %s): %s...", len(user_prompt_str), user_prompt_str[:500])
 
     # LLM 호출
     generated_summary: str
     try:
-        print("[FIND][INFO] Calling LLM for findings summarization...")
+        logger.debug("[FIND] Calling LLM for findings summarization...")
         llm_output: FindingsSummaryOutput = await structured_llm.ainvoke([
             SystemMessage(content=system_prompt_str),
             HumanMessage(content=user_prompt_str)
         ])
         generated_summary = llm_output.findings_summary
-        print("[FIND][INFO] LLM call completed.")
-        print(f"[FIND][DEBUG] Findings summary: {generated_summary}")
+        logger.debug("[FIND] LLM call completed.")
+        logger.debug("[FIND] Findings summary: %s", generated_summary)
     except Exception as e:
-        print(f"[FIND][ERROR] LLM 호출 실패: {e}")
+        logger.error("[FIND] LLM 호출 실패: %s", e)
         # import traceback; traceback.print_exc()
         generated_summary = f"(시스템 오류: 결과 정리 실패 - {e})"
 
@@ -110,7 +112,8 @@ async def findings_summarization_node(state: Dict[str, Any]) -> Dict[str, Any]:
         'messages': updated_messages_with_summary,
         'findings_summary': generated_summary, # 생성된 요약을 상태에 저장
         'assumptions_fully_probed': True, # 이 노드는 모든 가정 탐색 후 실행됨을 가정
-        'assistant_message': generated_summary  # <<< *** 중요: 사용자에게 보여줄 최종 메시지를 명시적 키로 추가 ***
+        'assistant_message': generated_summary,  # <<< *** 중요: 사용자에게 보여줄 최종 메시지를 명시적 키로 추가 ***
+        **history.state_updates(),  # older_history_summary / older_history_summary_upto
     }
-    print(f"[FIND][DEBUG] Raising interrupt with findings summary: {generated_summary[:100]}...")
+    logger.debug("[FIND] Raising interrupt with findings summary: %s...", generated_summary[:100])
     raise interrupt(generated_summary).with_data(interrupt_data_for_findings)
@@ -5,11 +5,16 @@ from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, Base
 from langgraph.types import interrupt # interrupt 임포트
 from pydantic import BaseModel, Field # Pydantic 모델 사용
 
+from ...core.config import settings
+from ...core.context_window import (
+    cached_summary_prefix, history_lines, load_shared_summary, remember_summary, rolling_summary,
+    schedule_rolling_summary,
+)
 from ...core.llm_provider import get_high_performance_llm
 from ...models.why_graph_state import WhyGraphState # 타입 힌팅용
+from ...core.log import get_logger
 
-class HistorySummaryOutput(BaseModel):
-    summary: str = Field(..., description="16턴 이전 대화를 한 문단으로 요약한 내용입니다.")
+logger = get_logger(__name__)
 
 async def free_conversation_node(state: Dict[str, Any]) -> Dict[str, Any]: # Interrupt를 발생시키므로 반환 타입은 사실상 None
     """
@@ -17,14 +22,13 @@ async def free_conversation_node(state: Dict[str, Any]) -> Dict[str, Any]: # Int
     최종 요약 및 대화 이력을 바탕으로 사용자와 자유롭게 대화하고,
     AI의 응답을 interrupt를 통해 전달합니다 (assistant_message를 상태에 포함).
     """
-    print("[FREE][DEBUG] Entering free_conversation_node")
+    logger.debug("[FREE] Entering free_conversation_node")
 
     messages: List[Union[BaseMessage, dict]] = state.get('messages', [])
     findings_summary_str = state.get('findings_summary', 'N/A (이전 탐색 요약 없음)')
     older_history_summary_str = state.get('older_history_summary', '') 
 
-    # 메시지 이력 문자열화 및 BaseMessage 객체 리스트 준비
-    recent_history_lines = []
+    # BaseMessage 객체 리스트 준비
     current_messages_for_state = [] # BaseMessage 객체로 일관성 유지
     
     # 전체 메시지 이력에서 BaseMessage 객체 추출 및 최근 15턴 분리
@@ -51,75 +55,93 @@ async def free_conversation_node(state: Dict[str, Any]) -> Dict[str, Any]: # Int
     current_messages_for_state = all_base_messages # 다음 상태에 저장될 메시지 리스트
 
     RECENT_N = 15
-    recent_base_messages = all_base_messages[-RECENT_N:]
-    older_base_messages = all_base_messages[:-RECENT_N]
+    chunk_size = max(settings.CONTEXT_SUMMARY_CHUNK_MESSAGES, 1)
+    all_lines = history_lines(all_base_messages)
+    older_count = max(len(all_lines) - RECENT_N, 0)  # 최근 RECENT_N 개 밖으로 밀려난 메시지 수
 
-    for msg in recent_base_messages:
-        role = "User" if isinstance(msg, HumanMessage) else "Assistant"
-        recent_history_lines.append(f"- {role}: {msg.content}")
+    # older_history_summary 는 messages[:older_history_summary_upto] 를 요약한 것.
+    # 저장된 요약을 캐시에 등록해 두고, 청크 경계 중 요약이 준비된 가장 긴 구간을 사용
+    stored_upto = state.get('older_history_summary_upto') or 0
+    stored_valid = bool(older_history_summary_str) and 0 < stored_upto <= len(all_lines)
+    if stored_valid:
+        remember_summary(all_lines[:stored_upto], older_history_summary_str)
+    stored_summary_str = older_history_summary_str
+    summary_upto, older_history_summary_str = cached_summary_prefix(all_lines, older_count, chunk_size)
+    if stored_valid and stored_upto > summary_upto:
+        # 다른 노드(build_history_context)가 청크 경계가 아닌 위치까지 요약해 둔 경우: 버리지 않고 그대로 사용
+        summary_upto, older_history_summary_str = stored_upto, stored_summary_str
+
+    # 새로 밀려난 메시지가 청크 하나 이상 쌓였으면 그만큼만 접어 넣음
+    target_upto = (older_count // chunk_size) * chunk_size
+    if target_upto > summary_upto:
+        shared_summary = None
+        if settings.FREE_CONVERSATION_SUMMARY_IN_BACKGROUND:
+            # 이전 턴에 예약한 요약이 (어느 워커에서든) 끝났으면 이번 턴 상태에 저장
+            shared_summary = await load_shared_summary(all_lines[:target_upto])
+        if shared_summary:
+            older_history_summary_str, summary_upto = shared_summary, target_upto
+        elif settings.FREE_CONVERSATION_SUMMARY_IN_BACKGROUND:
+            # 응답 경로에서 기다리지 않음: 결과는 캐시와 Redis 에 남아 다음 턴에 상태로 저장됨
+            logger.debug("[FREE] Scheduling background summary fold: %s -> %s", summary_upto, target_upto)
+            schedule_rolling_summary(all_lines[:target_upto], chunk_size)
+        else:
+            logger.debug("[FREE] Folding older history into summary: %s -> %s", summary_upto, target_upto)
+            try:
+                older_history_summary_str = await rolling_summary(all_lines[:target_upto], chunk_size)
+                summary_upto = target_upto
+            except Exception as e_summ:
+                logger.error("[FREE] Failed to fold older history summary: %s", e_summ)
+
+    # 요약에 아직 반영되지 않은 메시지는 모두 원문으로 전달 (요약이 늦어도 대화 내용이 빠지지 않음)
+    recent_history_lines = all_lines[summary_upto:]
+    state_updates_for_interrupt: Dict[str, Any] = {
+        'older_history_summary': older_history_summary_str or None,
+        'older_history_summary_upto': summary_upto,
+    }
 
-    # older_history_summary 생성 (필요시)
-    state_updates_for_interrupt: Dict[str,Any] = {}
-    if older_base_messages and not older_history_summary_str: # 과거 대화가 있고, 요약이 아직 없을 때만 생성
-        print("[FREE][INFO] Generating summary for older history...")
-        try:
-            llm_summarizer = get_high_performance_llm().with_structured_output(HistorySummaryOutput)
-            older_history_prompt = "\n".join(
-                f"{'User' if isinstance(m, HumanMessage) else 'Assistant'}: {m.content}" for m in older_base_messages
-            )
-            hist_out = await llm_summarizer.ainvoke([
-                SystemMessage(content="다음 대화의 핵심 내용을 간결히 한 문단으로 요약하세요."),
-                HumanMessage(content=older_history_prompt)
-            ])
-            older_history_summary_str = hist_out.summary
-            state_updates_for_interrupt['older_history_summary'] = older_history_summary_str
-            print(f"[FREE][DEBUG] Generated older history summary: {older_history_summary_str}")
-        except Exception as e_summ:
-            print(f"[FREE][ERROR] Failed to generate older history summary: {e_summ}")
-            older_history_summary_str = "(과거 대화 요약 생성 실패)"
-            state_updates_for_interrupt['older_history_summary'] = older_history_summary_str
-    
     # 시스템 프롬프트 구성
     sys_prompt_parts = [
         "당신은 사용자와 자유롭게 대화하는 AI입니다. 아래 제공된 이전 'Why 탐색' 요약과 최근 대화 내용을 참고하여 대화를 이어나가세요.",
         f"1) 'Why 탐색' 요약:\n{findings_summary_str}",
-        f"2) 최근 대화 (최대 {RECENT_N}턴):\n" + "\n".join(recent_history_lines)
+        f"2) 최근 대화:\n" + "\n".join(recent_history_lines)
     ]
     if older_history_summary_str:
-        sys_prompt_parts.append(f"3) 과거 대화 요약 (최근 {RECENT_N}턴 이전):\n{older_history_summary_str}")
+        sys_prompt_parts.append(f"3) 과거 대화 요약 (최근 대화 이전 {summary_upto}개 메시지):\n{older_history_summary_str}")
     system_prompt_for_llm = "\n\n".join(sys_prompt_parts)
 
     # LLM 호출 및 interrupt
     ai_response_text: str
     if not current_messages_for_state or not isinstance(current_messages_for_state[-1], HumanMessage):
-         print("[FREE][WARN] Last message is not from user, or no messages. Cannot generate response without user input.")
+         logger.warning("[FREE] Last message is not from user, or no messages. Cannot generate response without user input.")
          ai_response_text = "이전 대화 내용을 바탕으로 어떤 이야기를 더 나누고 싶으신가요? 아니면 다른 질문이 있으신가요?"
     else:
         user_last_message_content = current_messages_for_state[-1].content
-        print(f"[FREE][DEBUG] Last user message: {user_last_message_content}")
+        logger.debug("[FREE] Last user message: %s", user_last_message_content)
         # print(f"[FREE][DEBUG] System prompt for free conversation: {system_prompt_for_llm}") # 로그가 너무 길어질 수 있음
         llm = get_high_performance_llm()
         try:
-            print("[FREE][INFO] Calling LLM for free conversation...")
+            logger.debug("[FREE] Calling LLM for free conversation...")
             llm_response_obj = await llm.ainvoke([
                 SystemMessage(content=system_prompt_for_llm),
                 HumanMessage(content=user_last_message_content) # 사용자의 마지막 발화 전달
             ])
             ai_response_text = llm_response_obj.content if hasattr(llm_response_obj, 'content') else str(llm_response_obj)
-            print("[FREE][INFO] LLM call completed.")
-            print(f"[FREE][DEBUG] Generated response: {ai_response_text}")
+            logger.debug("[FREE] LLM call completed.")
+            logger.debug("[FREE] Generated response: %s", ai_response_text)
         except Exception as e_llm_call:
-            print(f"[FREE][ERROR] LLM 호출 실패: {e_llm_call}")
+            logger.error("[FREE] LLM 호출 실패: %s", e_llm_call)
             # import traceback; traceback.print_exc()
             ai_response_text = f"(시스템 오류: 자유 대화 응답 생성 실패 - {e_llm_call})"
 
     # 상태 업데이트 후 인터럽트 (사용자에게 응답 전달)
     updated_messages_with_free_chat = current_messages_for_state + [AIMessage(content=ai_response_text)]
     
+    # interrupt 값(dict)은 오케스트레이터가 저장할 상태에 병합하므로 요약 진행 위치도 함께 보존됨
     interrupt_data_for_free_chat = {
-        **state_updates_for_interrupt, # older_history_summary 갱신 포함 가능
+        **state_updates_for_interrupt, # older_history_summary / older_history_summary_upto
         "messages": updated_messages_with_free_chat,
-        "assistant_message": ai_response_text  # <<< *** 중요: 사용자에게 보여줄 AI 응답을 명시적 키로 추가 ***
+        "assistant_message": ai_response_text,  # <<< *** 중요: 사용자에게 보여줄 AI 응답을 명시적 키로 추가 ***
+        "user_facing_message": ai_response_text,
     }
-    print(f"[FREE][DEBUG] Raising interrupt with response: {ai_response_text[:100]}...")
-    raise interrupt(ai_response_text).with_data(interrupt_data_for_free_chat)
+    logger.debug("[FREE] Raising interrupt with response: %s...", ai_response_text[:100])
+    raise interrupt(interrupt_data_for_free_chat)
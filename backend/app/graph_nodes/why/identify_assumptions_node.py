@@ -5,8 +5,12 @@ from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, Base
 # from langgraph.types import interrupt # Interrupt 사용 안 함
 from pydantic import BaseModel, Field
 
+from ...core.context_window import build_node_history
 from ...core.llm_provider import get_high_performance_llm
 from ...models.why_graph_state import WhyGraphState
+from ...core.log import get_logger
+
+logger = get_logger(__name__)
 
 class IdentifiedAssumptionsOutput(BaseModel):
     identified_assumptions: List[str] = Field(
@@ -23,14 +27,13 @@ async def identify_assumptions_node(state: Dict[str, Any]) -> Dict[str, Any]:
     아이디어 요약과 동기 요약을 기반으로 핵심 가정을 3~5개 식별하고 중요도 순으로 정렬하여
     상태를 업데이트하고 다음 노드로 진행합니다. (사용자에게 직접 메시지 전달 안 함)
     """
-    print("[IDENT][DEBUG] Entering identify_assumptions_node")
+    logger.debug("[IDENT] Entering identify_assumptions_node")
 
     messages: List[Union[BaseMessage, dict]] = state.get('messages', [])
     
     # --- messages 리스트 처리 로직 (motivation_elicitation_node와 동일) ---
     processed_messages_for_prompt = []
-    history_lines_for_prompt = []
-    print(f"  [IDENT][DEBUG] Building history from messages list (length {len(messages)}): {messages}")
+    logger.debug("[IDENT] Building history from messages list (length %s): %s", len(messages), messages)
     for i, msg_data in enumerate(messages): 
         role = None
         content = None
@@ -55,12 +58,11 @@ async def identify_assumptions_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 msg_obj = AIMessage(content=content, additional_kwargs=msg_data.get("additional_kwargs", {})) 
         
         if role and content is not None:
-            history_lines_for_prompt.append(f"- {role}: {content}")
             if msg_obj: 
                  processed_messages_for_prompt.append(msg_obj)
-            print(f"    [IDENT][DEBUG] Processed msg {i} for prompt.")
+            logger.debug("[IDENT] Processed msg %s for prompt.", i)
         else:
-             print(f"    [IDENT][WARN] Skipped msg {i} (type: {type(msg_data)})")
+             logger.warning("[IDENT] Skipped msg %s (type: %s)", i, type(msg_data))
     # --------------------------------------------------------------------
 
     idea_summary = state.get('idea_summary')
@@ -71,11 +73,11 @@ async def identify_assumptions_node(state: Dict[str, Any]) -> Dict[str, Any]:
         if not idea_summary: missing.append('idea_summary')
         if not motivation_summary: missing.append('motivation_summary/final_motivation_summary')
         error_msg = f"IdentifyAssumptions: Missing required state fields: {', '.join(missing)}"
-        print(f"[IDENT][ERROR] {error_msg}")
+        logger.error("[IDENT] %s", error_msg)
         # 오류 발생 시에도 messages는 유지하며 반환
         return {"error_message": error_msg, "messages": processed_messages_for_prompt} 
 
-    llm = get_high_performance_llm()
+    llm = get_high_performance_llm(cache_site="identify_assumptions")
     structured_llm = llm.with_structured_output(IdentifiedAssumptionsOutput)
 
     system_prompt = f"""
@@ -92,28 +94,27 @@ async def identify_assumptions_node(state: Dict[str, Any]) -> Dict[str, Any]:
 4. **명확하고 독립적 문장:** 각 가정을 간결하고 독립된 문장으로 작성하세요.
 5. **구조화된 출력:** 지정된 JSON 형식({{"identified_assumptions": ["가정1", "가정2", ...]}})으로 출력하세요.
 """
-    # Use the full dialogue history for context
+    # 대화 이력은 토큰 예산 안에서 최근 원문 + 이전 대화 롤링 요약으로 전달
+    history = await build_node_history("identify_assumptions", processed_messages_for_prompt, state=state)
     user_prompt = (
         f"Idea Summary: {idea_summary}\n"
         f"Motivation Summary: {motivation_summary}\n\n"
-        "Dialogue History:\n" + "\n".join(history_lines_for_prompt) 
+        "Dialogue History:\n" + history.text
     )
 
-    print(f"[IDENT][DEBUG] user_prompt for identification: {user_prompt}")
+    logger.debug("[IDENT] user_prompt for identification: %s", user_prompt)
 
     try:
-        print("[IDENT][INFO] Calling LLM for assumption identification...")
+        logger.debug("[IDENT] Calling LLM for assumption identification...")
         output: IdentifiedAssumptionsOutput = await structured_llm.ainvoke([
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ])
         assumptions = output.identified_assumptions
-        print("[IDENT][INFO] LLM call completed.")
-        print(f"[IDENT][DEBUG] Identified assumptions: {assumptions}")
+        logger.debug("[IDENT] LLM call completed.")
+        logger.debug("[IDENT] Identified assumptions: %s", assumptions)
     except Exception as e:
-        print(f"[IDENT][ERROR] LLM call failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[IDENT] LLM call failed: %s", e)
         error_msg = f"(System Error: Failed to identify assumptions - {e})"
         # Return error state, keeping existing messages
         return {"error_message": error_msg, "messages": processed_messages_for_prompt}
@@ -129,7 +130,8 @@ async def identify_assumptions_node(state: Dict[str, Any]) -> Dict[str, Any]:
         # Clear any potential question keys from previous steps if needed
         'clarification_question': None, 
         'assumption_question': None,
+        **history.state_updates(),  # older_history_summary / older_history_summary_upto
     }
-    print(f"[IDENT][DEBUG] Returning state: {return_state}")
+    logger.debug("[IDENT] Returning state: %s", return_state)
     return return_state
     # ---------------------------------------------
@@ -4,10 +4,13 @@ from typing import Dict, Any, List, Optional, Union
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, BaseMessage
 from langgraph.types import interrupt # interrupt 임포트
 from pydantic import BaseModel, Field # Pydantic 모델 사용
-import json
 
 from ...core.llm_provider import get_high_performance_llm
+from ...core.context_window import build_node_history
 from ...models.why_graph_state import WhyGraphState # 타입 힌팅용
+from ...core.log import get_logger, lazy
+
+logger = get_logger(__name__)
 
 class MotivationClarityOutput(BaseModel):
     is_motivation_clear: bool = Field(..., description="동기 명확 여부")
@@ -21,7 +24,7 @@ async def motivation_elicitation_node(state: Dict[str, Any]) -> Union[Dict[str,
     - 동기가 불명확하면 (첫 질문 포함) 추가 질문을 생성하여 interrupt 발생
     - 동기가 명확하면 요약을 생성하여 다음 노드로 상태 반환
     """
-    print("[MOTIV][NODE_LIFECYCLE] Entering motivation_elicitation_node")
+    logger.debug("[MOTIV][NODE_LIFECYCLE] Entering motivation_elicitation_node")
 
     messages: List[Union[BaseMessage, dict]] = state.get('messages', [])
     raw_topic: Optional[str] = state.get('raw_topic')
@@ -56,23 +59,13 @@ async def motivation_elicitation_node(state: Dict[str, Any]) -> Union[Dict[str,
 
 응답은 반드시 JSON 형식이어야 하며, 위의 세 필드를 모두 포함해야 합니다."""
 
-    # 대화 기록 포맷팅
-    history_lines = []
-    for msg in messages:
-        if isinstance(msg, HumanMessage):
-            history_lines.append(f"- User: {msg.content}")
-        elif isinstance(msg, AIMessage):
-            history_lines.append(f"- Assistant: {msg.content}")
-        elif isinstance(msg, dict):
-            msg_type = msg.get("type")
-            content = msg.get("content")
-            if content is not None:
-                if msg_type == "human":
-                    history_lines.append(f"- User: {content}")
-                elif msg_type == "ai" or msg_type == "assistant":
-                    history_lines.append(f"- Assistant: {content}")
-
-    formatted_history = "\n".join(history_lines) if history_lines else f"Initial Idea/Topic: {raw_idea or raw_topic or 'Not provided'}"
+    # 대화 기록 포맷팅 (토큰 예산 안에서 최근 대화 원문 + 이전 대화 롤링 요약)
+    history = await build_node_history(
+        "motivation_elicitation", messages,
+        empty_text=f"Initial Idea/Topic: {raw_idea or raw_topic or 'Not provided'}",
+        state=state,
+    )
+    formatted_history = history.text
 
     # 대화 기록을 유저 프롬프트로 이동
     user_prompt = f"""Dialogue History:
@@ -80,31 +73,22 @@ async def motivation_elicitation_node(state: Dict[str, Any]) -> Union[Dict[str,
 
 이 대화를 바탕으로 사용자의 동기가 충분히 명확한지 평가하고, 필요한 경우 추가 질문을 하거나 동기를 요약해주세요."""
 
-    print(f"  [MOTIV][DEBUG] user_prompt to LLM:\n{user_prompt}")
-    print(f"  [MOTIV][INFO] Calling LLM for motivation clarity/question...")
-    
-    # LLM 호출
-    resp = llm.invoke([SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)])
-    print(f"  [MOTIV][DEBUG] LLM response (resp): {resp}")
-    print(f"  [MOTIV][INFO] LLM call completed.")
+    logger.debug("[MOTIV] user_prompt to LLM:\n%s", user_prompt)
+    logger.debug("[MOTIV] Calling LLM for motivation clarity/question...")
 
-    # 응답 파싱
+    # LLM 호출 (비동기 + structured output: 이벤트 루프를 막지 않고 JSON 수동 파싱도 불필요)
     try:
-        content = resp.content
-        # 마크다운 코드 블록 제거
-        if content.startswith("```json"):
-            content = content[7:]  # ```json 제거
-        if content.endswith("```"):
-            content = content[:-3]  # ``` 제거
-        content = content.strip()
-        
-        resp_dict = json.loads(content)
-        is_motivation_clear = resp_dict.get("is_motivation_clear", False)
-        clarification_question = resp_dict.get("clarification_question", "")
-        summary_of_motivation = resp_dict.get("summary_of_motivation", "")
-    except json.JSONDecodeError as e:
-        print(f"  [MOTIV][ERROR] Failed to parse LLM response as JSON: {resp.content}")
-        print(f"  [MOTIV][ERROR] JSON decode error: {str(e)}")
+        resp: MotivationClarityOutput = await structured_llm.ainvoke([
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_prompt)
+        ])
+        logger.debug("[MOTIV] LLM response (resp): %s", resp)
+        logger.debug("[MOTIV] LLM call completed.")
+        is_motivation_clear = resp.is_motivation_clear
+        clarification_question = resp.clarification_question or ""
+        summary_of_motivation = resp.summary_of_motivation or ""
+    except Exception as e:
+        logger.exception("[MOTIV] LLM call failed: %s", e)
         is_motivation_clear = False
         clarification_question = "죄송합니다. 응답을 처리하는 중에 문제가 발생했습니다. 다시 한번 설명해주시겠어요?"
         summary_of_motivation = None
@@ -113,21 +97,22 @@ async def motivation_elicitation_node(state: Dict[str, Any]) -> Union[Dict[str,
     messages.append(AIMessage(content=clarification_question if not is_motivation_clear else summary_of_motivation))
 
     if not is_motivation_clear:
-        print(f"  [MOTIV][DEBUG] Motivation unclear or first question -> raising interrupt with question: {clarification_question}")
+        logger.debug("[MOTIV] Motivation unclear or first question -> raising interrupt with question: %s", clarification_question)
         interrupt_data_for_question = {
             "messages": messages,  # AI의 응답이 포함된 messages
             "has_asked_initial": True,
             "clarification_question": clarification_question,
-            "user_facing_message": clarification_question
+            "user_facing_message": clarification_question,
+            **history.state_updates(),  # older_history_summary / older_history_summary_upto
         }
-        print(f"  [MOTIV][DEBUG] Data for question interrupt (interrupt_data_for_question):")
-        print(f"    - messages (last 2): {[m.content for m in messages[-2:]]}")
-        print(f"    - has_asked_initial: {interrupt_data_for_question['has_asked_initial']}")
-        print(f"    - clarification_question: {interrupt_data_for_question['clarification_question']}")
+        logger.debug("[MOTIV] Data for question interrupt: messages (last 2)=%s, has_asked_initial=%s, clarification_question=%s",
+                     lazy(lambda: [m.content for m in messages[-2:]]),
+                     interrupt_data_for_question['has_asked_initial'],
+                     interrupt_data_for_question['clarification_question'])
         raise interrupt(value=interrupt_data_for_question)
     else:
         summary_msg_str = summary_of_motivation or "(동기 요약 정보 없음)"
-        print(f"  [MOTIV][DEBUG] Motivation clear -> returning summary state: {summary_msg_str}")
+        logger.debug("[MOTIV] Motivation clear -> returning summary state: %s", summary_msg_str)
         
         updated_messages_with_summary = messages + [AIMessage(content=summary_msg_str)]
 
@@ -137,13 +122,14 @@ async def motivation_elicitation_node(state: Dict[str, Any]) -> Union[Dict[str,
             "final_motivation_summary": summary_msg_str,
             "has_asked_initial": True, 
             "error_message": None,
-            "clarification_question": None
+            "clarification_question": None,
+            **history.state_updates(),
         }
         # --- 추가된 로그 ---
-        print(f"  [MOTIV][DEBUG] Data for state_update_on_clear:")
-        print(f"    - messages (last 2): {[m.content if isinstance(m, BaseMessage) else m for m in updated_messages_with_summary[-2:]]}")
-        print(f"    - has_asked_initial: {state_update_on_clear.get('has_asked_initial')}")
-        print(f"    - motivation_cleared: {state_update_on_clear.get('motivation_cleared')}")
+        logger.debug("[MOTIV] Data for state_update_on_clear: messages (last 2)=%s, has_asked_initial=%s, motivation_cleared=%s",
+                     lazy(lambda: [m.content if isinstance(m, BaseMessage) else m for m in updated_messages_with_summary[-2:]]),
+                     state_update_on_clear.get('has_asked_initial'),
+                     state_update_on_clear.get('motivation_cleared'))
         # --- ---
-        print(f"[MOTIV][NODE_LIFECYCLE] Exiting motivation_elicitation_node with state update.")
+        logger.debug("[MOTIV][NODE_LIFECYCLE] Exiting motivation_elicitation_node with state update.")
         return state_update_on_clear
@@ -5,8 +5,12 @@ from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, Base
 from langgraph.types import interrupt # interrupt 임포트
 from pydantic import BaseModel, Field # Pydantic 모델 사용
 
+from ...core.context_window import build_node_history
 from ...core.llm_provider import get_high_performance_llm
 from ...models.why_graph_state import WhyGraphState # 타입 힌팅용
+from ...core.log import get_logger
+
+logger = get_logger(__name__)
 
 class AssumptionProbeOutput(BaseModel):
     is_fully_probed: bool = Field(..., description="가정이 충분히 탐구되었는지 여부")
@@ -20,7 +24,7 @@ async def probe_assumption_node(state: Dict[str, Any]) -> Union[Dict[str, Any],
     충분한 탐구가 이루어질 때까지 대화를 이어나가고,
     완전히 탐구되었을 때 다음 가정으로 넘어갑니다.
     """
-    print("[PROBE][NODE_LIFECYCLE] Entering probe_assumption_node")
+    logger.debug("[PROBE][NODE_LIFECYCLE] Entering probe_assumption_node")
 
     # 현재 단계의 대화 기록만 사용
     current_probe_messages: List[Union[BaseMessage, dict]] = state.get('probe_messages', [])
@@ -30,8 +34,7 @@ async def probe_assumption_node(state: Dict[str, Any]) -> Union[Dict[str, Any],
     motivation_summary = state.get('motivation_summary') or state.get('final_motivation_summary', 'N/A')
     current_assumption = state.get('assumption_being_probed_now')
 
-    # 메시지 이력 문자열화 (LLM 프롬프트용)
-    history_lines_for_prompt = []
+    # 메시지 이력 정규화 (프롬프트 문자열은 build_node_history 에서 생성)
     current_messages_for_state = []
     for i, msg_data in enumerate(current_probe_messages):
         role = None; content = None; msg_obj = None
@@ -49,8 +52,6 @@ async def probe_assumption_node(state: Dict[str, Any]) -> Union[Dict[str, Any],
                 role, content = "Assistant", raw_content
                 if raw_content is not None: msg_obj = AIMessage(content=raw_content, additional_kwargs=msg_data.get("additional_kwargs",{}))
         
-        if role and content is not None:
-            history_lines_for_prompt.append(f"- {role}: {content}")
         if msg_obj: 
             current_messages_for_state.append(msg_obj)
         elif isinstance(msg_data, dict) and msg_obj is None and content is not None : 
@@ -68,7 +69,7 @@ async def probe_assumption_node(state: Dict[str, Any]) -> Union[Dict[str, Any],
 
     # 모든 가정 탐색 완료 시
     if assumption_to_probe is None:
-        print("  [PROBE][DEBUG] All assumptions already probed. Setting flag and returning state.")
+        logger.debug("[PROBE] All assumptions already probed. Setting flag and returning state.")
         return {
             'probe_messages': current_messages_for_state,
             'probed_assumptions': current_probed_assumptions,
@@ -79,7 +80,7 @@ async def probe_assumption_node(state: Dict[str, Any]) -> Union[Dict[str, Any],
             'current_node': 'findings_summarization'  # 다음 노드로 이동
         }
 
-    print(f"  [PROBE][DEBUG] Assumption to probe: {assumption_to_probe}")
+    logger.debug("[PROBE] Assumption to probe: %s", assumption_to_probe)
 
     # LLM 준비
     llm = get_high_performance_llm()
@@ -116,22 +117,24 @@ async def probe_assumption_node(state: Dict[str, Any]) -> Union[Dict[str, Any],
 }}
 """
 
+    # probe_messages 는 state['messages'] 와 다른 이력이므로 저장된 older_history_summary 를 쓰거나 덮어쓰지 않음
+    history = await build_node_history("probe_assumption", current_messages_for_state)
     user_prompt = (
         f"Identified Assumptions (Priority Order):\n- " + "\n- ".join(identified_assumptions) + "\n\n"
-        f"Dialogue History:\n" + "\n".join(history_lines_for_prompt)
+        f"Dialogue History:\n" + history.text
     )
     
     # LLM 호출
     try:
-        print(f"  [PROBE][INFO] Calling LLM to evaluate assumption probe status: {assumption_to_probe}")
+        logger.debug("[PROBE] Calling LLM to evaluate assumption probe status: %s", assumption_to_probe)
         llm_output: AssumptionProbeOutput = await structured_llm.ainvoke([
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ])
-        print("  [PROBE][INFO] LLM call completed.")
-        print(f"  [PROBE][DEBUG] LLM output: {llm_output}")
+        logger.debug("[PROBE] LLM call completed.")
+        logger.debug("[PROBE] LLM output: %s", llm_output)
     except Exception as e:
-        print(f"  [PROBE][ERROR] LLM call failed: {e}")
+        logger.error("[PROBE] LLM call failed: %s", e)
         error_msg = f"(시스템 오류: 가정 탐구 상태 평가 실패 - {e})"
         error_interrupt_data = {
             'probe_messages': current_messages_for_state + [AIMessage(content=error_msg)],
@@ -143,12 +146,12 @@ async def probe_assumption_node(state: Dict[str, Any]) -> Union[Dict[str, Any],
             'messages': state.get('messages', []) + current_messages_for_state + [AIMessage(content=error_msg)],  # 전체 메시지 이력 업데이트
             'current_node': 'probe_assumption'  # 현재 노드 유지
         }
-        print(f"[PROBE][NODE_LIFECYCLE] Exiting probe_assumption_node with interrupt (error): {error_msg}")
+        logger.error("[PROBE][NODE_LIFECYCLE] Exiting probe_assumption_node with interrupt (error): %s", error_msg)
         raise interrupt(error_msg).with_data(error_interrupt_data)
 
     # 현재 가정이 충분히 탐구되었는지 확인
     if llm_output.is_fully_probed:
-        print(f"  [PROBE][DEBUG] Assumption fully probed. Moving to next assumption.")
+        logger.debug("[PROBE] Assumption fully probed. Moving to next assumption.")
         return {
             'probe_messages': current_messages_for_state,
             'probed_assumptions': current_probed_assumptions + [assumption_to_probe],
@@ -172,5 +175,5 @@ async def probe_assumption_node(state: Dict[str, Any]) -> Union[Dict[str, Any],
             'messages': state.get('messages', []) + updated_messages_with_ai_q,  # 전체 메시지 이력 업데이트
             'current_node': 'probe_assumption'  # 현재 노드 유지
         }
-        print(f"[PROBE][NODE_LIFECYCLE] Exiting probe_assumption_node with interrupt (question): {next_question}")
+        logger.debug("[PROBE][NODE_LIFECYCLE] Exiting probe_assumption_node with interrupt (question): %s", next_question)
         raise interrupt(next_question).with_data(interrupt_data_for_probe)
@@ -8,6 +8,9 @@ from pydantic import BaseModel, Field
 # 여기서는 일단 기존 GraphState를 사용한다고 가정하고, 필요시 WhyGraphState로 변경
 from ...core.llm_provider import get_fast_llm # 아이디어 요약은 빠른 모델 사용 가능
 from ...models.graph_state import GraphState # 또는 WhyGraphState
+from ...core.log import get_logger
+
+logger = get_logger(__name__)
 
 # 구조화된 출력을 위한 Pydantic 모델 정의
 class IdeaSummaryOutput(BaseModel):
@@ -21,14 +24,14 @@ async def understand_idea_node(state: GraphState) -> Dict[str, Any]:
     Understand Idea 노드: 사용자의 초기 아이디어 제시 메시지를 분석하여
     핵심 아이디어(What/How)를 요약하고 상태에 저장합니다.
     """
-    print("--- Understand Idea Node 실행 ---")
+    logger.debug("--- Understand Idea Node 실행 ---")
 
     # LLM 클라이언트 가져오기
     try:
         llm_summarizer = get_fast_llm() # 요약 작업이므로 빠른 모델 사용
         structured_llm = llm_summarizer.with_structured_output(IdeaSummaryOutput)
     except Exception as e:
-        print(f"UnderstandIdea: LLM 클라이언트 로드 실패 - {e}")
+        logger.error("UnderstandIdea: LLM 클라이언트 로드 실패 - %s", e)
         return {"error_message": f"LLM 클라이언트 로드 실패: {e}"}
 
     # 상태 정보 읽기
@@ -42,7 +45,7 @@ async def understand_idea_node(state: GraphState) -> Dict[str, Any]:
         if not isinstance(last_user_message, HumanMessage):
             # 만약 마지막 메시지가 사용자 메시지가 아니라면 오류 처리 또는 다른 로직 필요
             # 예를 들어, 사용자가 '/explore why' 같은 명령어로 시작했을 경우 등
-            print("UnderstandIdea: 마지막 메시지가 사용자 입력이 아닙니다. 아이디어 파악 건너뛰기 또는 오류 처리 필요.")
+            logger.warning("UnderstandIdea: 마지막 메시지가 사용자 입력이 아닙니다. 아이디어 파악 건너뛰기 또는 오류 처리 필요.")
             # 이 경우, 다음 노드로 바로 넘어가거나, 사용자에게 아이디어를 명확히 해달라고 요청하는 로직 추가 가능
             # 여기서는 일단 간단히 오류 메시지 반환
             return {"error_message": "Why 흐름 시작을 위한 사용자 아이디어가 명확하지 않습니다."}
@@ -50,7 +53,7 @@ async def understand_idea_node(state: GraphState) -> Dict[str, Any]:
         user_idea_text = last_user_message.content
 
     except KeyError as e:
-        print(f"UnderstandIdea: 상태 객체에서 필수 키 누락 - {e}")
+        logger.error("UnderstandIdea: 상태 객체에서 필수 키 누락 - %s", e)
         return {"error_message": f"UnderstandIdea 상태 객체 키 누락: {e}"}
 
     # 시스템 프롬프트 구성
@@ -74,17 +77,15 @@ async def understand_idea_node(state: GraphState) -> Dict[str, Any]:
 
     # LLM 호출
     model_name_to_log = getattr(llm_summarizer, 'model', getattr(llm_summarizer, 'model_name', 'N/A'))
-    print(f"UnderstandIdea: LLM 호출 준비 (Model: {model_name_to_log}, Structured Output: IdeaSummaryOutput)")
+    logger.debug("UnderstandIdea: LLM 호출 준비 (Model: %s, Structured Output: IdeaSummaryOutput)", model_name_to_log)
 
     try:
         response_object: IdeaSummaryOutput = await structured_llm.ainvoke(prompt_messages)
-        print(f"UnderstandIdea: LLM 응답 수신 (구조화됨) - Summary: {response_object.idea_summary[:50]}...")
+        logger.debug("UnderstandIdea: LLM 응답 수신 (구조화됨) - Summary: %s...", response_object.idea_summary[:50])
 
     except Exception as e:
         error_msg = f"UnderstandIdea: LLM 호출 오류 - {e}"
-        print(error_msg)
-        import traceback
-        traceback.print_exc()
+        logger.exception("%s", error_msg)
         return {
             "error_message": error_msg,
             # 메시지에 오류를 직접 추가하지는 않음 (Coordinator 등에서 처리)
@@ -99,6 +100,6 @@ async def understand_idea_node(state: GraphState) -> Dict[str, Any]:
         "error_message": None, # 성공 시 오류 없음
         # 이 노드는 사용자에게 직접 응답하지 않으므로 messages 필드는 건드리지 않음
     }
-    print(f"UnderstandIdea: 상태 업데이트 반환 - {updates_to_state}")
+    logger.debug("UnderstandIdea: 상태 업데이트 반환 - %s", updates_to_state)
 
     return updates_to_state
\ No newline at end of file
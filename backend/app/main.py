@@ -1,19 +1,58 @@
 # backend/app/main.py
 
-from fastapi import FastAPI
+import sys
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from .api.v1.api import api_router_v1
 from .core.config import get_settings
+from .core.log import configure_from_settings
+from .core.graph_registry import close_graph_registry
+from .core.loop_monitor import LoopBlockMonitor
+from .core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY as METRICS_REGISTRY
+from .core.redis_pool import close_redis_pool
+from .core.warmup import Warmup
 
 # 설정 불러오기
 settings = get_settings()
+# app.* 로거 레벨/포맷 (LOG_LEVEL, LOG_LEVELS, LOG_FORMAT, LOG_SAMPLE_RATES)
+configure_from_settings()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 그래프 컴파일, 체크포인터, LLM 클라이언트 등 무거운 객체는 워밍업 단계에서 프로세스당 한 번만 생성
+    # (settings.STARTUP_WARMUP: blocking | background | off, app/core/warmup.py 참고)
+    warmup = Warmup()
+    app.state.warmup = warmup
+    await warmup.start(settings.STARTUP_WARMUP)
+    loop_monitor = None
+    if settings.DEBUG_LOOP_MONITOR:
+        loop_monitor = LoopBlockMonitor(threshold_ms=settings.LOOP_BLOCK_THRESHOLD_MS)
+        loop_monitor.start()
+    try:
+        yield
+    finally:
+        await warmup.stop()
+        if loop_monitor is not None:
+            await loop_monitor.stop()
+        # 한 번도 임포트되지 않은 모듈은 정리할 것도 없으므로 종료 시 새로 임포트하지 않음
+        if "app.services.search_service" in sys.modules:
+            await sys.modules["app.services.search_service"].close_search_service()
+        if "app.core.why_orchestration" in sys.modules:
+            await sys.modules["app.core.why_orchestration"].transcript_appender.drain()  # 남은 transcript 행 저장
+            await sys.modules["app.core.why_orchestration"].state_cache.stop()  # 무효화 구독 해제
+        await close_graph_registry()
+        await close_redis_pool()
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="Think Deeper API",
     description="AI 기반 다각적 사고 증진 서비스 'Think Deeper'의 API입니다.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -23,6 +62,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Before"],  # GET /sessions/{id}/messages 재검증/페이지 커서
 )
 
 # 루트 엔드포인트
@@ -41,5 +81,24 @@ async def read_root():
         "loaded_api_keys": keys_loaded_status,
     }
 
+# 프로세스 생존 확인 (워밍업과 무관하게 바로 응답)
+@app.get("/healthz", tags=["Root"])
+async def healthz():
+    return {"status": "ok"}
+
+# 트래픽 수신 준비 확인: 워밍업이 끝나기 전에는 503 (로드밸런서/오토스케일러 readiness probe 용)
+@app.get("/readyz", tags=["Root"])
+async def readyz(request: Request):
+    warmup = getattr(request.app.state, "warmup", None)
+    if warmup is None:
+        return {"ready": True}
+    status = warmup.status()
+    return status if status["ready"] else JSONResponse(status_code=503, content=status)
+
+# Prometheus 텍스트 형식 메트릭 (턴/노드/LLM/체크포인터 저장소 지연, 백그라운드 큐 깊이; app/core/metrics.py 참고)
+@app.get("/metrics", tags=["Root"], include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(METRICS_REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
 # API v1 라우터 추가
 app.include_router(api_router_v1, prefix="/api/v1")
@@ -1,6 +1,6 @@
 # backend/app/models/chat.py
 from pydantic import BaseModel, Field
-from typing import List, Literal
+from typing import Any, Dict, List, Literal, Optional
 # from datetime import datetime # 필요시 타임스탬프용
 
 # 역할 정의: 사용자 또는 어시스턴트
@@ -11,6 +11,7 @@ class Message(BaseModel):
     """ 단일 메시지를 나타내는 기본 모델 (프론트엔드와 동기화) """
     role: Role = Field(..., description="메시지 발신자 역할 (user 또는 assistant)")
     content: str = Field(..., description="메시지 내용")
+    id: Optional[int] = Field(None, description="대화 내 메시지 순번 (GET /messages 의 before 커서로 사용)")
 # --- ---
 
 class ChatMessage(BaseModel):
@@ -30,4 +31,6 @@ class SendMessageRequest(BaseModel):
 class MessageResponse(BaseModel):
     """어시스턴트(Critic 등)의 응답 메시지 모델"""
     role: Literal["assistant"] = "assistant" # 응답 역할은 항상 assistant
-    content: str
\ No newline at end of file
+    content: str
+    # 디버그 모드(DEBUG_TRACE 또는 X-Debug-Trace 헤더)에서만 채워지는 턴 지연 분해 (app/core/tracing.py)
+    trace: Optional[Dict[str, Any]] = Field(None, description="구간별 지연 분해 또는 Chrome trace-event JSON")
\ No newline at end of file
@@ -14,6 +14,7 @@ class GraphState(TypedDict):
     nuance: Optional[str] # 예: "Debate", "Discussion"
     critique_depth: int
     current_focus: Optional[str]
+    focus_requested: Optional[bool] # 투기적 포커스 모드: focus 노드를 에이전트와 병렬 실행할지 여부
     search_query: Optional[str]
     search_results: Optional[List[SearchResult]]
     last_critic_output: Optional[Dict]
@@ -39,6 +39,7 @@ class WhyGraphState(TypedDict, total=False):
     assumptions_fully_probed: bool # 모든 가정이 탐색되었는지 여부
     findings_summary: Optional[str]
     older_history_summary: Optional[str] # 자유 대화용
+    older_history_summary_upto: int # older_history_summary 가 요약한 메시지 수 (messages[:upto])
 
     # --- 사용자 입력 대기 신호용 키 ---
     clarification_question: Optional[str] # motivation_elicitation 노드가 질문 시 설정
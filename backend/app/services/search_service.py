@@ -0,0 +1,180 @@
+# backend/app/services/search_service.py
+"""
+SearchService: search_node 와 tools.search.web_search 가 함께 쓰는 비동기 웹 검색 서비스 (Tavily REST API).
+
+- httpx.AsyncClient 연결 풀을 프로세스에서 공유하고, 요청마다 타임아웃을 적용합니다.
+- 결과 캐시: 정규화한 쿼리 기준 TTL + LRU (프로세스 메모리) → 선택적으로 Redis (워커 간 공유).
+- 같은 쿼리가 동시에 들어오면 API 호출은 한 번만 하고 결과를 나눠 받습니다(in-flight coalescing).
+- base_url 을 바꿀 수 있어 테스트에서는 로컬 가짜 HTTP 서버를 가리키면 됩니다.
+"""
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+import httpx
+from cachetools import TTLCache
+
+from ..core.config import settings
+from ..core.log import get_logger
+from ..core.tracing import span
+
+logger = get_logger(__name__)
+
+SEARCH_CACHE_PREFIX = "search_cache:"
+
+SearchResults = List[Dict[str, Any]]
+
+
+class SearchError(Exception):
+    pass
+
+
+def normalize_query(query: str) -> str:
+    """대소문자/공백 차이만 있는 쿼리는 같은 캐시 항목을 쓰도록 정규화"""
+    return " ".join(query.lower().split())
+
+
+class SearchService:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.tavily.com",
+        timeout_seconds: float = 10.0,
+        max_connections: int = 20,
+        cache_ttl_seconds: int = 3600,
+        cache_maxsize: int = 512,
+        redis_client=None,
+    ):
+        self.api_key = api_key
+        self.timeout_seconds = timeout_seconds
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.redis = redis_client  # None 이면 프로세스 메모리 캐시만 사용
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout_seconds,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        self._cache: TTLCache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl_seconds)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"requests": 0, "memory_hits": 0, "redis_hits": 0, "coalesced": 0, "api_calls": 0}
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 3,
+        search_depth: str = "basic",
+        timeout: Optional[float] = None,
+    ) -> SearchResults:
+        """[{title, url, content}, ...] 반환. 실패 시 SearchError"""
+        self.stats["requests"] += 1
+        key = f"{search_depth}:{max_results}:{normalize_query(query)}"
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.stats["memory_hits"] += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            with span("search", "search", query=query):
+                results = await self._lookup(key, query, max_results, search_depth, timeout)
+            self._cache[key] = results
+            future.set_result(results)
+            return results
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 쪽이 없어도 "never retrieved" 경고가 나지 않도록
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _lookup(self, key: str, query: str, max_results: int, search_depth: str,
+                      timeout: Optional[float]) -> SearchResults:
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(SEARCH_CACHE_PREFIX + key)
+                if raw is not None:
+                    self.stats["redis_hits"] += 1
+                    return json.loads(raw)
+            except Exception as e:  # Redis 장애는 캐시 미스로 취급
+                logger.warning("[SearchService] Redis 캐시 조회 실패: %s", e)
+
+        results = await self._call_api(query, max_results, search_depth, timeout)
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(SEARCH_CACHE_PREFIX + key, json.dumps(results, ensure_ascii=False),
+                                     ex=self.cache_ttl_seconds)
+            except Exception as e:
+                logger.warning("[SearchService] Redis 캐시 저장 실패: %s", e)
+        return results
+
+    async def _call_api(self, query: str, max_results: int, search_depth: str,
+                        timeout: Optional[float]) -> SearchResults:
+        self.stats["api_calls"] += 1
+        payload = {
+            "api_key": self.api_key,
+            "query": query,
+            "search_depth": search_depth,
+            "include_answer": False,
+            "max_results": max_results,
+        }
+        try:
+            response = await self._client.post(
+                "/search", json=payload, timeout=timeout if timeout is not None else self.timeout_seconds
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise SearchError(f"검색 API 호출 실패: {e}") from e
+
+        return [
+            {
+                "title": res.get("title", "N/A"),
+                "url": res.get("url", "N/A"),
+                "content": res.get("content", "N/A"),  # Tavily의 content는 스니펫/요약
+            }
+            for res in response.json().get("results", [])
+        ]
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+_search_service: Optional[SearchService] = None
+
+
+def get_search_service() -> Optional[SearchService]:
+    """공유 SearchService 반환. TAVILY_API_KEY 가 없으면 None"""
+    global _search_service
+    if _search_service is None and settings.TAVILY_API_KEY:
+        redis_client = None
+        if settings.SEARCH_CACHE_REDIS:
+            from ..core.redis_pool import get_redis
+            redis_client = get_redis()
+        _search_service = SearchService(
+            api_key=settings.TAVILY_API_KEY,
+            base_url=settings.SEARCH_API_BASE_URL,
+            timeout_seconds=settings.SEARCH_TIMEOUT_SECONDS,
+            max_connections=settings.SEARCH_MAX_CONNECTIONS,
+            cache_ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+            cache_maxsize=settings.SEARCH_CACHE_MAXSIZE,
+            redis_client=redis_client,
+        )
+    return _search_service
+
+
+async def close_search_service() -> None:
+    """lifespan 종료 시 연결 풀 정리"""
+    global _search_service
+    if _search_service is not None:
+        await _search_service.aclose()
+        _search_service = None
@@ -0,0 +1,111 @@
+# backend/benchmarks/bench_codec.py
+"""
+Redis 체크포인트 직렬화 비교: pickle(무압축/zlib/zstd) vs msgpack(무압축/zlib/zstd)
+
+세션 하나의 저장 상태(aput 이 만드는 wrapper)를 메시지 10/100/1000개로 만들어
+encode/decode 시간과 세션당 바이트 수를 출력합니다. 메시지 내용은 고정 시드로 어휘를 섞어 만들어
+(실제 대화처럼 메시지마다 다름) 같은 문장 반복으로 압축률이 부풀려지지 않게 합니다.
+
+실행: cd backend && python -m benchmarks.bench_codec --repeat 50
+"""
+import argparse
+import os
+import pickle
+import random
+import statistics
+import time
+import zlib
+
+# Settings 필수값 (실제 연결은 하지 않음)
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+
+from langchain_core.messages import AIMessage, HumanMessage  # noqa: E402
+
+from app.core.redis_checkpointer import RedisCheckpointer  # noqa: E402
+from app.core.serializers import MsgpackSerializer, PickleSerializer, Serializer, zstandard  # noqa: E402
+
+WORDS = (
+    "재택근무 생산성 전제 가정 측정 팀 협업 개인 처리량 동기 근거 반례 비용 시간 고객 시장 실험 데이터 "
+    "신뢰 품질 목표 지표 위험 기회 경쟁 사용자 문제 해결 가치 검증 조건 결과 원인 효과 방향 기준 사례 "
+    "왜 어떻게 무엇을 그렇다면 하지만 예를 들어 반대로 결국 오히려 특히 아마도 분명히 때문에 위해"
+).split()
+AGENTS = ("critic", "advocate", "socratic", "why")
+
+
+def _sentence(rng: random.Random, n_words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n_words)) + rng.choice(("?", ".", "!"))
+
+
+class CompressedPickle(Serializer):
+    """비교용: pickle 본문을 같은 방식으로 압축"""
+
+    def __init__(self, compression: str):
+        self.compression = compression
+        if compression == "zstd":
+            self._c, self._d = zstandard.ZstdCompressor(level=3), zstandard.ZstdDecompressor()
+
+    def dumps(self, obj) -> bytes:
+        body = pickle.dumps(obj)
+        return self._c.compress(body) if self.compression == "zstd" else zlib.compress(body, 3)
+
+    def loads(self, data: bytes):
+        return pickle.loads(self._d.decompress(data) if self.compression == "zstd" else zlib.decompress(data))
+
+
+def build_state(n_messages: int) -> dict:
+    rng = random.Random(n_messages)
+    messages = []
+    for i in range(n_messages):
+        if i % 2 == 0:
+            messages.append(HumanMessage(content=_sentence(rng, rng.randint(8, 30))))
+        else:
+            content = " ".join(_sentence(rng, rng.randint(6, 20)) for _ in range(rng.randint(2, 5)))
+            messages.append(AIMessage(content=content, additional_kwargs={"agent": rng.choice(AGENTS)}))
+    return {
+        "channel_values": {"messages": messages, "critique_depth": 3, "topic": "재택근무"},
+        "messages": messages,
+        "metadata": {"step": n_messages, "checkpoint_id": "bench", "ts": "2025-01-01T00:00:00+00:00"},
+        "channel_versions": {"messages": n_messages},
+        "versions_seen": {},
+    }
+
+
+def measure(codec, state: dict, repeat: int):
+    enc, dec = [], []
+    data = b""
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        data = codec.dumps(state)
+        t1 = time.perf_counter()
+        codec.loads(data)
+        t2 = time.perf_counter()
+        enc.append((t1 - t0) * 1e6)
+        dec.append((t2 - t1) * 1e6)
+    return statistics.median(enc), statistics.median(dec), len(data)
+
+
+def main(repeat: int) -> None:
+    codecs = {
+        "pickle": PickleSerializer(),
+        "pickle+zlib": CompressedPickle("zlib"),
+        "pickle+zstd": CompressedPickle("zstd") if zstandard is not None else None,
+        "msgpack": MsgpackSerializer(compression=None),
+        "msgpack+zlib": MsgpackSerializer(compression="zlib"),
+        "msgpack+zstd": MsgpackSerializer(compression="zstd"),
+    }
+    codecs = {name: codec for name, codec in codecs.items() if codec is not None}
+    print(f"{'messages':>8}  {'codec':<14} {'encode(us)':>11} {'decode(us)':>11} {'bytes':>9}")
+    for n in (10, 100, 1000):
+        # RedisCheckpointer.aset 과 같은 형태 (중복 messages 제거 후 직렬화)
+        state = RedisCheckpointer._dedupe_messages(build_state(n))
+        for name, codec in codecs.items():
+            enc, dec, size = measure(codec, state, repeat)
+            print(f"{n:>8}  {name:<14} {enc:>11.1f} {dec:>11.1f} {size:>9}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    main(args.repeat)
@@ -0,0 +1,72 @@
+# backend/benchmarks/bench_graph_registry.py
+"""
+턴당 그래프 준비 오버헤드 비교 (네트워크 I/O 없음)
+
+- before: 기존 run_conversation_turn_langgraph 처럼 매 턴 Redis/SQL/Combined 체크포인터를 만들고 그래프를 컴파일
+- after : graph_registry 에서 공유 그래프/체크포인터를 가져옴
+
+실행: cd backend && python -m benchmarks.bench_graph_registry --turns 200
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+# Settings 필수값 (실제 연결은 하지 않음)
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+
+from app.core.config import settings  # noqa: E402
+from app.db.session import async_session_factory  # noqa: E402
+from app.core.redis_checkpointer import RedisCheckpointer  # noqa: E402
+from app.core.sql_checkpointer import SQLCheckpointer  # noqa: E402
+from app.core.checkpointers import CombinedCheckpointer  # noqa: E402
+from app.core.orchestration import workflow  # noqa: E402
+from app.core.graph_registry import get_graph_registry, close_graph_registry  # noqa: E402
+
+
+async def per_turn_before() -> None:
+    redis_cp = RedisCheckpointer(settings.REDIS_URL, ttl=settings.SESSION_TTL_SECONDS)
+    sql_cp = SQLCheckpointer(async_session_factory)
+    cp = CombinedCheckpointer(redis_cp, sql_cp)
+    workflow.compile(checkpointer=cp)
+    # 기존 코드는 닫지 않아 풀이 GC될 때까지 남았지만, 측정 공정성을 위해 여기서는 정리
+    await redis_cp.aclose()
+
+
+async def per_turn_after() -> None:
+    registry = await get_graph_registry()
+    _ = registry.app_graph, registry.checkpointer
+
+
+async def measure(fn, turns: int) -> list:
+    samples = []
+    for _ in range(turns):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return samples
+
+
+def summarize(label: str, samples: list) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<8} mean={statistics.mean(samples):10.1f}us  p50={statistics.median(samples):10.1f}us  p95={p95:10.1f}us")
+
+
+async def main(turns: int) -> None:
+    await per_turn_after()  # 레지스트리 초기화 비용은 프로세스당 1회이므로 측정에서 제외
+    before = await measure(per_turn_before, turns)
+    after = await measure(per_turn_after, turns)
+    summarize("before", before)
+    summarize("after", after)
+    print(f"speedup  x{statistics.mean(before) / max(statistics.mean(after), 1e-9):.0f}")
+    await close_graph_registry()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.turns))
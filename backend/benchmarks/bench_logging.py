@@ -0,0 +1,69 @@
+# backend/benchmarks/bench_logging.py
+"""
+로그 레벨별 턴 비용: LOG_LEVEL=INFO vs DEBUG
+
+같은 옵션으로 부하 테스트(benchmarks.loadtest)를 레벨만 바꿔 각각 새 프로세스에서 실행하고
+흐름별 p50/p95 턴 지연, 턴당 CPU 시간, turns/sec, 로그 파일 크기를 나란히 출력합니다.
+DEBUG 에서는 체크포인터 상태/노드 프롬프트까지 포맷해서 파일에 쓰므로 그 차이가 곧 상세 로그의 비용입니다.
+LLM 지연을 0 에 가깝게 두어야 로깅 비용이 잘 드러납니다.
+
+실행: cd backend && python -m benchmarks.bench_logging --sessions 8 --turns 4
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List
+
+
+def run_loadtest(level: str, args: argparse.Namespace, workdir: str) -> Dict[str, Any]:
+    output = os.path.join(workdir, f"loadtest-{level.lower()}.json")
+    cmd = [
+        sys.executable, "-m", "benchmarks.loadtest",
+        "--sessions", str(args.sessions), "--turns", str(args.turns),
+        "--first-token-ms", str(args.first_token_ms), "--tokens-per-second", str(args.tokens_per_second),
+        "--log-level", level, "--log-format", args.log_format,
+        "--log-file", os.path.join(workdir, f"app-{level.lower()}.log"),
+        "--output", output,
+    ]
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run(cmd, cwd=backend_dir, check=True, stdout=subprocess.DEVNULL)
+    with open(output, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def format_rows(reports: Dict[str, Dict[str, Any]]) -> List[str]:
+    rows = [f"{'flow':<8}{'level':<7}{'p50 ms':>9}{'p95 ms':>9}{'cpu ms/turn':>13}{'turns/s':>9}{'log KB':>10}"]
+    flows = next(iter(reports.values()))["flows"]
+    for flow in flows:
+        for level, report in reports.items():
+            result = report["flows"][flow]
+            log_kb = (report["config"].get("log_bytes") or 0) / 1024
+            rows.append(
+                f"{flow:<8}{level:<7}{result['latency_ms']['p50']:>9.1f}{result['latency_ms']['p95']:>9.1f}"
+                f"{result['cpu_ms_per_turn']:>13.2f}{result['turns_per_second']:>9.2f}{log_kb:>10.1f}"
+            )
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_logging")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--turns", type=int, default=4)
+    parser.add_argument("--first-token-ms", type=float, default=1.0)
+    parser.add_argument("--tokens-per-second", type=float, default=100000.0)
+    parser.add_argument("--log-format", choices=["text", "json"], default="text")
+    parser.add_argument("--levels", nargs="+", default=["INFO", "DEBUG"])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="bench-logging-") as workdir:
+        reports = {level: run_loadtest(level, args, workdir) for level in args.levels}
+    print("\n".join(format_rows(reports)))
+    print("(log KB 는 두 흐름 합계)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
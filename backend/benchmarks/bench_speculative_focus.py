@@ -0,0 +1,97 @@
+# backend/benchmarks/bench_speculative_focus.py
+"""
+코디네이터 포커스 결정: 순차 실행 vs 투기적(에이전트와 병렬) 실행
+
+고정 지연을 갖는 가짜 LLM으로 실제 토론 그래프(workflow)를 돌려
+- 첫 응답까지 시간 (critic 노드 출력이 나올 때까지)
+- 턴 전체 시간
+을 비교합니다. 순차 모드는 포커스 LLM + 에이전트 LLM 을 차례로 기다리므로
+투기적 모드에서는 대략 LLM 한 번의 지연만큼 줄어야 합니다.
+
+실행: cd backend && python -m benchmarks.bench_speculative_focus --turns 10 --latency-ms 200
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import statistics
+import time
+import uuid
+
+# Settings 필수값 (실제 연결은 하지 않음)
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+
+from langchain_core.messages import AIMessage, HumanMessage  # noqa: E402
+from langgraph.checkpoint.memory import MemorySaver  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.orchestration import workflow  # noqa: E402
+from app.graph_nodes import coordinator, critic  # noqa: E402
+from app.graph_nodes.critic import CriticOutput  # noqa: E402
+
+
+class FakeLLM:
+    """ainvoke 가 고정 지연 후 응답하는 LLM 대역"""
+    def __init__(self, latency: float, response):
+        self.latency = latency
+        self.response = response
+
+    def with_structured_output(self, _schema):
+        return self
+
+    async def ainvoke(self, _messages):
+        await asyncio.sleep(self.latency)
+        return self.response
+
+
+async def run_turn(app_graph) -> tuple:
+    config = {"configurable": {"thread_id": str(uuid.uuid4())}}
+    graph_input = {
+        "messages": [
+            AIMessage(content="재택근무가 생산성을 높인다는 근거는 무엇인가요?"),
+            HumanMessage(content="출퇴근 시간이 줄어 집중 시간이 늘어납니다."),
+        ],
+        "initial_topic": "재택근무",
+        "target_agent": "critic",
+    }
+    t0 = time.perf_counter()
+    first_response = None
+    async for update in app_graph.astream(graph_input, config=config, stream_mode="updates"):
+        if first_response is None and "critic" in update:
+            first_response = time.perf_counter() - t0
+    return first_response * 1000, (time.perf_counter() - t0) * 1000
+
+
+async def measure(speculative: bool, turns: int) -> tuple:
+    settings.COORDINATOR_SPECULATIVE_FOCUS = speculative
+    app_graph = workflow.compile(checkpointer=MemorySaver())
+    firsts, totals = [], []
+    for _ in range(turns):
+        with contextlib.redirect_stdout(io.StringIO()):  # 노드 디버그 출력 숨김
+            first, total = await run_turn(app_graph)
+        firsts.append(first)
+        totals.append(total)
+    return statistics.median(firsts), statistics.median(totals)
+
+
+async def main(turns: int, latency_ms: int) -> None:
+    latency = latency_ms / 1000
+    focus_llm = FakeLLM(latency, AIMessage(content="집중 시간 증가가 생산성으로 이어지는가"))
+    critic_llm = FakeLLM(latency, CriticOutput(critique_point="측정 기준이 불분명합니다.", brief_elaboration="무엇을 생산성으로 볼까요?"))
+    coordinator.get_focus_llm = lambda: focus_llm
+    critic.get_high_performance_llm = lambda: critic_llm
+
+    print(f"LLM 지연 {latency_ms}ms, 턴 {turns}회 (중앙값)")
+    for label, speculative in (("sequential", False), ("speculative", True)):
+        first, total = await measure(speculative, turns)
+        print(f"{label:<12} first_response={first:8.1f}ms  turn_total={total:8.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--latency-ms", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.turns, args.latency_ms))
@@ -0,0 +1,81 @@
+# backend/benchmarks/import_profile.py
+"""
+앱 임포트 시간 프로파일 (python -X importtime 기반) 과 시작 시간 예산 검사.
+
+새 인터프리터에서 `import app.main` 을 실행해 모듈별 누적 임포트 시간을 집계하고,
+- 전체 시간이 --budget-ms 를 넘거나 (여러 번 실행해 가장 빠른 값 기준)
+- 지연 임포트해야 하는 무거운 패키지(--forbid)가 임포트되면
+종료 코드 1 로 실패합니다. CI 나 배포 전 검사에 사용하세요.
+
+실행: cd backend && python -m benchmarks.import_profile --budget-ms 1500 --top 15
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# app.main 임포트 시점에는 로드되지 않아야 하는 패키지 (워밍업/첫 사용 시 임포트)
+DEFAULT_FORBIDDEN = ("langgraph", "langchain_openai", "openai", "redis", "tiktoken")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def profile_imports(module: str = "app.main") -> Tuple[float, Dict[str, float]]:
+    """새 프로세스에서 module 을 임포트하고 (전체 ms, {모듈: 누적 ms}) 반환"""
+    env = dict(os.environ)
+    # Settings 필수값 (실제 연결은 하지 않음)
+    env.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+    env.setdefault("REDIS_URL", "redis://localhost:6379/0")
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=backend_dir, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module} 임포트 실패:\n{proc.stderr[-2000:]}")
+
+    cumulative: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2)) / 1000
+    return cumulative.get(module, 0.0), cumulative
+
+
+def forbidden_imports(modules: Dict[str, float], forbidden=DEFAULT_FORBIDDEN) -> List[str]:
+    return sorted(name for name in modules if name.split(".")[0] in forbidden and "." not in name)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_profile")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="허용하는 최대 임포트 시간")
+    parser.add_argument("--repeat", type=int, default=3, help="실행 횟수 (가장 빠른 값으로 판정)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 상위 모듈 수")
+    parser.add_argument("--forbid", nargs="*", default=list(DEFAULT_FORBIDDEN), help="임포트되면 실패로 볼 최상위 패키지")
+    args = parser.parse_args(argv)
+
+    runs = [profile_imports(args.module) for _ in range(max(args.repeat, 1))]
+    total_ms, modules = min(runs, key=lambda run: run[0])
+
+    print(f"{args.module} 임포트: {total_ms:.1f} ms (예산 {args.budget_ms:.0f} ms, {len(runs)}회 중 최소)")
+    print("누적 시간 상위 최상위 패키지:")
+    top_level = {name: ms for name, ms in modules.items() if "." not in name and name != args.module}
+    for name, ms in sorted(top_level.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {ms:9.1f} ms  {name}")
+
+    failed = False
+    if total_ms > args.budget_ms:
+        print(f"[실패] 임포트 시간이 예산을 초과했습니다: {total_ms:.1f} ms > {args.budget_ms:.0f} ms")
+        failed = True
+    leaked = forbidden_imports(modules, tuple(args.forbid))
+    if leaked:
+        print(f"[실패] 시작 시 임포트되면 안 되는 패키지: {', '.join(leaked)} (워밍업 또는 첫 사용 시 지연 임포트하세요)")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
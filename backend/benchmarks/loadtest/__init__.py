@@ -0,0 +1,2 @@
+# backend/benchmarks/loadtest/__init__.py
+# 엔드투엔드 부하 테스트 하네스. 실행: python -m benchmarks.loadtest --help
@@ -0,0 +1,208 @@
+# backend/benchmarks/loadtest/__main__.py
+"""
+엔드투엔드 부하 테스트: 가짜 LLM + fakeredis(또는 로컬 redis-server) + SQLite(또는 로컬 Postgres)로
+동시 세션 N 개를 토론 그래프(run_conversation_turn_langgraph)와 Why 흐름(run_why_exploration_turn)에 흘려 보냅니다.
+
+결과(JSON): 흐름별 p50/p95/p99 턴 지연, turns/sec, 턴당 CPU 시간, 턴당 Redis 명령 수 / SQL 문 수 / LLM 호출 수.
+같은 옵션으로 실행한 결과끼리 비교하세요.
+
+실행 (backend 디렉터리에서, 의존성은 benchmarks/requirements.txt):
+    python -m benchmarks.loadtest --sessions 20 --turns 3 --first-token-ms 200 --tokens-per-second 50
+    python -m benchmarks.loadtest --redis-url redis://localhost:6379/15 \\
+        --database-url postgresql+asyncpg://user:pw@localhost/think_deeper_bench --output run.json
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, List
+
+from benchmarks.loadtest import stand_ins
+from benchmarks.loadtest.fake_llm import ScriptedChatModel
+
+DEBATE_AGENTS = ("critic", "advocate", "socratic")
+USER_TURNS = (
+    "재택근무가 사무실 근무보다 생산성이 높다고 생각합니다.",
+    "출퇴근 시간이 줄어서 집중할 수 있는 시간이 늘어납니다.",
+    "팀 소통은 메신저로 충분히 대체할 수 있다고 봅니다.",
+    "측정은 주간 산출물 수로 하면 될 것 같습니다.",
+)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(latencies_ms: List[float], wall_s: float, ops: Dict[str, int], llm_calls: int, errors: int,
+              cpu_s: float = 0.0) -> Dict[str, Any]:
+    turns = len(latencies_ms)
+    per_turn = (lambda n: round(n / turns, 2)) if turns else (lambda n: 0.0)
+    return {
+        "turns": turns,
+        "errors": errors,
+        "wall_seconds": round(wall_s, 3),
+        "turns_per_second": round(turns / wall_s, 3) if wall_s else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 1),
+            "p95": round(percentile(latencies_ms, 95), 1),
+            "p99": round(percentile(latencies_ms, 99), 1),
+            "max": round(max(latencies_ms), 1) if latencies_ms else 0.0,
+        },
+        "cpu_ms_per_turn": per_turn(cpu_s * 1000),
+        "redis_ops_per_turn": per_turn(ops["redis"]),
+        "db_ops_per_turn": per_turn(ops["db"]),
+        "llm_calls_per_turn": per_turn(llm_calls),
+    }
+
+
+def _is_error(response) -> bool:
+    return response is None or str(response).startswith(("(시스템 오류", "(오류"))
+
+
+async def _debate_session(index: int, turns: int, latencies: List[float], errors: List[int]) -> None:
+    from app.core import session_store
+    from app.core.orchestration import run_conversation_turn_langgraph
+
+    session_id = str(uuid.uuid4())
+    await session_store.save_session_initial_info(session_id, "재택근무의 생산성", DEBATE_AGENTS[index % len(DEBATE_AGENTS)])
+    for turn in range(turns):
+        t0 = time.perf_counter()
+        response = await run_conversation_turn_langgraph(session_id, USER_TURNS[turn % len(USER_TURNS)])
+        latencies.append((time.perf_counter() - t0) * 1000)
+        errors[0] += _is_error(response)
+
+
+async def _why_session(index: int, turns: int, latencies: List[float], errors: List[int]) -> None:
+    from app.core.why_orchestration import run_why_exploration_turn
+
+    session_id = str(uuid.uuid4())
+    for turn in range(turns):
+        user_input = USER_TURNS[turn % len(USER_TURNS)]
+        t0 = time.perf_counter()
+        response = await run_why_exploration_turn(
+            session_id=session_id,
+            user_input=user_input,
+            initial_topic=user_input if turn == 0 else None,
+        )
+        latencies.append((time.perf_counter() - t0) * 1000)
+        errors[0] += _is_error(response)
+
+
+async def run_flow(session_fn, sessions: int, turns: int, llm: ScriptedChatModel) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = [0]
+    stand_ins.reset_ops()
+    llm.calls = 0
+    t0, cpu0 = time.perf_counter(), time.process_time()
+    await asyncio.gather(*(session_fn(i, turns, latencies, errors) for i in range(sessions)))
+    # write-behind 큐/transcript 버퍼에 남은 SQL 저장까지 이번 흐름의 비용으로 집계
+    from app.core.graph_registry import get_graph_registry
+    from app.core.why_orchestration import transcript_appender
+    registry = await get_graph_registry()
+    if registry.write_behind is not None:
+        await registry.write_behind.flush()
+    await transcript_appender.flush()
+    wall, cpu = time.perf_counter() - t0, time.process_time() - cpu0
+    return summarize(latencies, wall, stand_ins.reset_ops(), llm.calls, errors[0], cpu_s=cpu)
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.core import llm_provider
+    from app.core.graph_registry import close_graph_registry
+    from app.core.log import configure_logging
+    from app.core.why_orchestration import transcript_appender
+    from app.db.models import Base
+    from app.db.session import engine
+
+    llm = ScriptedChatModel(first_token_ms=args.first_token_ms, tokens_per_second=args.tokens_per_second, seed=args.seed)
+    llm_provider.get_llm_client = lambda *a, **kw: llm
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    stand_ins.install_db_counter(engine)
+
+    # 앱 로그는 --verbose 가 아니면 파일로 (DEBUG 에서 포맷/쓰기 비용까지 측정에 포함)
+    log_stream = sys.stderr if args.verbose else open(args.log_file, "w", encoding="utf-8")
+    configure_logging(level=args.log_level, fmt=args.log_format, stream=log_stream)
+
+    flows = {"debate": _debate_session, "why": _why_session}
+    results: Dict[str, Any] = {}
+    quiet = contextlib.redirect_stdout(io.StringIO()) if not args.verbose else contextlib.nullcontext()
+    with quiet:  # 라이브러리 출력 숨김
+        for name in args.flows:
+            results[name] = await run_flow(flows[name], args.sessions, args.turns, llm)
+        await transcript_appender.drain()
+        await close_graph_registry()
+    await engine.dispose()
+    if log_stream is not sys.stderr:
+        log_stream.close()
+    if args.metrics_output:
+        from app.core.metrics import REGISTRY
+        with open(args.metrics_output, "w", encoding="utf-8") as f:
+            f.write(REGISTRY.render())
+
+    return {
+        "config": {
+            "sessions": args.sessions,
+            "turns_per_session": args.turns,
+            "first_token_ms": args.first_token_ms,
+            "tokens_per_second": args.tokens_per_second,
+            "seed": args.seed,
+            "log_level": args.log_level,
+            "log_format": args.log_format,
+            "log_bytes": os.path.getsize(args.log_file) if not args.verbose else None,
+            "redis": "fakeredis" if args.redis_url is None else args.redis_url,
+            "database": os.environ["DATABASE_URL"].split("@")[-1],
+        },
+        "flows": results,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadtest")
+    parser.add_argument("--sessions", type=int, default=10, help="동시 세션 수")
+    parser.add_argument("--turns", type=int, default=3, help="세션당 턴 수")
+    parser.add_argument("--flows", nargs="+", choices=["debate", "why"], default=["debate", "why"])
+    parser.add_argument("--first-token-ms", type=float, default=200.0)
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--redis-url", default=None, help="지정하지 않으면 fakeredis 사용")
+    parser.add_argument("--database-url", default=None, help="지정하지 않으면 임시 SQLite 파일 사용")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로 (기본: stdout)")
+    parser.add_argument("--log-level", default="INFO", help="app.* 로그 레벨 (DEBUG 로 상세 로그 비용 측정)")
+    parser.add_argument("--log-format", choices=["text", "json"], default="text")
+    parser.add_argument("--log-file", default=None, help="앱 로그 파일 (기본: 임시 디렉터리)")
+    parser.add_argument("--verbose", action="store_true", help="앱 로그를 파일 대신 stderr 로 출력")
+    parser.add_argument("--metrics-output", default=None, help="실행 후 /metrics 와 같은 텍스트(노드/LLM/저장소 지연 히스토그램)를 저장할 파일")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    # Settings/엔진/Redis 클라이언트는 app 모듈 임포트 시점에 만들어지므로 그 전에 환경을 구성
+    tmpdir = tempfile.mkdtemp(prefix="loadtest-")
+    args.log_file = args.log_file or os.path.join(tmpdir, "app.log")
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'loadtest.db')}"
+    os.environ["REDIS_URL"] = args.redis_url or "redis://fakeredis/0"
+    if args.redis_url is None:
+        stand_ins.install_fake_redis()
+    stand_ins.install_redis_counter()
+
+    report = asyncio.run(main(args))
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    print(output, file=sys.stdout)
@@ -0,0 +1,127 @@
+# backend/benchmarks/loadtest/fake_llm.py
+"""
+ScriptedChatModel: 지연/토큰 속도를 조절할 수 있는 결정적(seed 고정) 가짜 채팅 모델.
+
+- 일반 호출: 첫 토큰까지 first_token_ms 를 기다린 뒤 tokens_per_second 속도로 토큰을 내보냅니다
+  (astream_events 에서 on_chat_model_stream 이벤트가 실제처럼 발생).
+- with_structured_output(Schema): 같은 지연 모델로 기다린 뒤 스키마 필드를 채운 인스턴스를 반환합니다.
+  bool 필드는 seed 고정 난수로 정해지므로 Why 흐름도 실행마다 같은 경로로 진행합니다.
+"""
+import asyncio
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Union, get_args, get_origin
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel, PrivateAttr
+
+DEFAULT_TEXT = (
+    "말씀하신 근거는 흥미롭지만 측정 기준이 분명하지 않습니다. "
+    "어떤 지표로 효과를 확인할 수 있을지 먼저 정해 보면 좋겠습니다."
+)
+
+# 그래프가 자연스럽게 진행되도록 일부 스키마는 Optional 필드도 채워 줍니다 (스키마 이름 기준).
+STRUCTURED_OVERRIDES: Dict[str, Callable[[random.Random], Dict[str, Any]]] = {
+    "MotivationClarityOutput": lambda rng: {
+        "is_motivation_clear": rng.random() < 0.5,
+        "clarification_question": "그 아이디어로 해결하려는 가장 구체적인 문제는 무엇인가요?",
+        "summary_of_motivation": "사용자는 반복되는 불편을 줄이고 싶어 합니다.",
+    },
+    "AssumptionProbeOutput": lambda rng: {
+        "is_fully_probed": rng.random() < 0.5,
+        "next_question": "그 가정이 틀렸다면 무엇이 달라질까요?",
+    },
+}
+
+
+def _fill_field(name: str, annotation: Any, rng: random.Random) -> Any:
+    if annotation is bool:
+        return rng.random() < 0.5
+    if annotation in (int, float):
+        return annotation(1)
+    if get_origin(annotation) in (list, List):
+        return [f"{name} {i}" for i in range(1, 4)]
+    return f"{name}: {DEFAULT_TEXT[:40]}"
+
+
+def build_structured_output(schema: type, rng: random.Random) -> BaseModel:
+    """필수 필드는 타입에 맞는 값으로, 기본값이 있는 Optional 필드는 기본값(None)으로 채움"""
+    values: Dict[str, Any] = {}
+    for name, field in schema.model_fields.items():
+        if not field.is_required():
+            continue
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            annotation = next(a for a in get_args(annotation) if a is not type(None))
+        values[name] = _fill_field(name, annotation, rng)
+    override = STRUCTURED_OVERRIDES.get(schema.__name__)
+    if override is not None:
+        values.update(override(rng))
+    return schema(**values)
+
+
+def _tokenize(text: str) -> List[str]:
+    words = text.split(" ")
+    return [w + " " for w in words[:-1]] + [words[-1]]
+
+
+class ScriptedChatModel(BaseChatModel):
+    first_token_ms: float = 200.0
+    tokens_per_second: float = 50.0
+    text: str = DEFAULT_TEXT
+    seed: int = 0
+
+    _rng: random.Random = PrivateAttr()
+    calls: int = 0
+
+    def model_post_init(self, __context: Any) -> None:
+        self._rng = random.Random(self.seed)
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-fake"
+
+    def _duration(self, n_tokens: int) -> float:
+        return self.first_token_ms / 1000 + max(n_tokens - 1, 0) / self.tokens_per_second
+
+    # --- 일반 텍스트 응답 ---
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager=None, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        time.sleep(self._duration(len(_tokenize(self.text))))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.text))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager=None, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        await asyncio.sleep(self._duration(len(_tokenize(self.text))))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.text))])
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager=None, **kwargs: Any):
+        self.calls += 1
+        await asyncio.sleep(self.first_token_ms / 1000)
+        for i, token in enumerate(_tokenize(self.text)):
+            if i:
+                await asyncio.sleep(1 / self.tokens_per_second)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager is not None:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    # --- 구조화 출력 ---
+    def with_structured_output(self, schema, **kwargs: Any):
+        async def _ainvoke(_input: Any) -> BaseModel:
+            self.calls += 1
+            output = build_structured_output(schema, self._rng)
+            await asyncio.sleep(self._duration(len(json.dumps(output.model_dump(), ensure_ascii=False).split())))
+            return output
+
+        def _invoke(_input: Any) -> BaseModel:
+            return asyncio.run(_ainvoke(_input))
+
+        return RunnableLambda(_invoke, afunc=_ainvoke, name=f"{schema.__name__}Scripted")
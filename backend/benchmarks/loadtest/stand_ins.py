@@ -0,0 +1,61 @@
+# backend/benchmarks/loadtest/stand_ins.py
+"""
+Redis/DB 대역 설치와 연산 횟수 집계.
+
+- install_fake_redis(): redis.asyncio 의 from_url 과 연결 풀 생성(app.core.redis_pool)을 fakeredis 로 바꿔, 앱 모듈들이 만드는
+  모든 클라이언트가 하나의 인메모리 서버를 공유하게 합니다. (app 모듈 임포트 전에 호출)
+- install_redis_counter(): 실제/가짜 Redis 모두에서 명령 수를 셉니다 (파이프라인은 명령 개수만큼).
+- install_db_counter(engine): SQLAlchemy 엔진에서 실행된 SQL 문 수를 셉니다.
+"""
+from typing import Dict
+
+import redis.asyncio as redis_asyncio
+from redis.asyncio.client import Pipeline
+from sqlalchemy import event
+
+OPS: Dict[str, int] = {"redis": 0, "db": 0}
+
+
+def reset_ops() -> Dict[str, int]:
+    snapshot = dict(OPS)
+    for key in OPS:
+        OPS[key] = 0
+    return snapshot
+
+
+def install_fake_redis() -> None:
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+
+    def _from_url(url, **kwargs):
+        return fakeredis.FakeAsyncRedis(server=server, decode_responses=kwargs.get("decode_responses", False))
+
+    redis_asyncio.from_url = _from_url
+    redis_asyncio.Redis.from_url = classmethod(lambda cls, url, **kwargs: _from_url(url, **kwargs))
+    # 공유 풀은 Redis(connection_pool=...) 로 만들어지므로 풀 자체를 fakeredis 연결 풀로 대체
+    pool_from_url = classmethod(lambda cls, url, **kwargs: _from_url(url).connection_pool)
+    redis_asyncio.ConnectionPool.from_url = pool_from_url
+    redis_asyncio.BlockingConnectionPool.from_url = pool_from_url
+
+
+def install_redis_counter() -> None:
+    execute_command = redis_asyncio.Redis.execute_command
+    pipeline_execute = Pipeline.execute
+
+    async def _counted_execute_command(self, *args, **options):
+        OPS["redis"] += 1
+        return await execute_command(self, *args, **options)
+
+    async def _counted_pipeline_execute(self, *args, **kwargs):
+        OPS["redis"] += len(self.command_stack)
+        return await pipeline_execute(self, *args, **kwargs)
+
+    redis_asyncio.Redis.execute_command = _counted_execute_command
+    Pipeline.execute = _counted_pipeline_execute
+
+
+def install_db_counter(engine) -> None:
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        OPS["db"] += 1
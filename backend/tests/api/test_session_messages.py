@@ -0,0 +1,89 @@
+# backend/tests/api/test_session_messages.py
+
+from contextlib import asynccontextmanager
+
+import fakeredis
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessage, HumanMessage
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.endpoints import session
+from app.core import flush_manager, message_log
+from app.db.models import GraphStateRecord, MessageRecord
+
+
+@pytest.fixture
+def client(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def _create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda c: GraphStateRecord.__table__.create(c))
+            await conn.run_sync(lambda c: MessageRecord.__table__.create(c))
+
+    @asynccontextmanager
+    async def _session():
+        async with factory() as db:
+            yield db
+
+    redis = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(session, "get_db_session", _session)
+    monkeypatch.setattr(flush_manager, "get_db_session_async", _session)
+    monkeypatch.setattr(flush_manager, "get_redis", lambda: redis)
+    monkeypatch.setattr(message_log, "get_redis", lambda: redis)
+
+    app = FastAPI()
+    app.include_router(session.router)
+    with TestClient(app) as test_client:
+        # 테이블 생성/flush 는 TestClient 의 이벤트 루프에서 (aiosqlite 연결이 루프에 묶임)
+        test_client.portal.call(_create_tables)
+        yield test_client, lambda *args: test_client.portal.call(flush_manager.flush_session_to_postgres, *args)
+
+
+def test_messages_are_paginated_with_cursor_header(client):
+    test_client, flush = client
+    messages = []
+    for i in range(3):
+        messages += [HumanMessage(content=f"q{i}"), AIMessage(content=f"a{i}")]
+    flush("s1", {}, messages)
+
+    latest = test_client.get("/sessions/s1/messages", params={"limit": 4})
+    assert latest.status_code == 200
+    assert [m["content"] for m in latest.json()] == ["q1", "a1", "q2", "a2"]
+    assert latest.json()[0] == {"id": 2, "role": "user", "content": "q1"}
+    assert latest.headers["x-next-before"] == "2"
+
+    older = test_client.get("/sessions/s1/messages", params={"limit": 4, "before": 2})
+    assert [m["content"] for m in older.json()] == ["q0", "a0"]
+    assert "x-next-before" not in older.headers
+
+
+def test_unchanged_messages_revalidate_with_304(client):
+    test_client, flush = client
+    messages = [HumanMessage(content="q0"), AIMessage(content="a0")]
+    flush("s1", {}, messages)
+
+    first = test_client.get("/sessions/s1/messages")
+    etag = first.headers["etag"]
+    cached = test_client.get("/sessions/s1/messages", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    messages += [HumanMessage(content="q1")]
+    flush("s1", {}, messages)
+    changed = test_client.get("/sessions/s1/messages", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert [m["content"] for m in changed.json()] == ["q0", "a0", "q1"]
+
+
+def test_limit_is_bounded(client):
+    test_client, _ = client
+    assert test_client.get("/sessions/s1/messages", params={"limit": 0}).status_code == 422
+    assert test_client.get("/sessions/s1/messages", params={"limit": 10_000}).status_code == 422
+    assert test_client.get("/sessions/unknown/messages").json() == []
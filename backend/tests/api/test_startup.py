@@ -0,0 +1,68 @@
+# backend/tests/api/test_startup.py
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.core.warmup import Warmup
+from benchmarks.import_profile import forbidden_imports, profile_imports
+
+
+def test_importing_app_does_not_load_graph_or_llm_sdks():
+    _, modules = profile_imports("app.main")
+
+    assert forbidden_imports(modules) == []
+    assert "app.core.why_orchestration" not in modules
+
+
+def test_readyz_is_503_until_background_warmup_finishes(monkeypatch):
+    gate = threading.Event()
+
+    async def slow_step():
+        await asyncio.to_thread(gate.wait, 5)
+
+    async def broken_step():
+        raise RuntimeError("토크나이저 없음")
+
+    monkeypatch.setattr(main.settings, "STARTUP_WARMUP", "background")
+    monkeypatch.setattr(main, "Warmup", lambda: Warmup(steps={"graph_registry": slow_step, "tokenizer": broken_step}))
+
+    with TestClient(main.app) as client:
+        assert client.get("/healthz").json() == {"status": "ok"}
+        assert client.get("/readyz").status_code == 503
+
+        gate.set()
+        deadline = time.monotonic() + 5
+        while (response := client.get("/readyz")).status_code != 200 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["errors"] == {"tokenizer": "토크나이저 없음"}  # 실패한 단계가 있어도 준비 완료
+    assert set(body["timings_ms"]) == {"graph_registry", "tokenizer", "total"}
+
+
+def test_metrics_endpoint_serves_prometheus_text(monkeypatch):
+    monkeypatch.setattr(main.settings, "STARTUP_WARMUP", "off")
+
+    with TestClient(main.app) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    assert "# TYPE thinkdeeper_turn_latency_seconds histogram" in response.text
+    assert "# TYPE thinkdeeper_write_behind_queue_depth gauge" in response.text
+
+
+@pytest.mark.asyncio
+async def test_warmup_off_is_ready_immediately():
+    warmup = Warmup(steps={})
+    await warmup.start("off")
+
+    assert warmup.status()["ready"] is True
+    with pytest.raises(ValueError):
+        await Warmup(steps={}).start("eager")
@@ -0,0 +1,203 @@
+# backend/tests/api/test_stream_endpoints.py
+
+import asyncio
+import json
+import operator
+from types import SimpleNamespace
+from typing import Annotated, List, TypedDict
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+from langgraph.types import interrupt
+
+from app.api.v1.endpoints import chat, session
+from app.core import orchestration, turn_lock, why_orchestration
+from app.core.config import settings
+from app.core.graph_registry import get_graph_registry
+from app.core.metrics import TURN_LATENCY
+from app.core.state_cache import SessionStateCache
+
+
+class State(TypedDict, total=False):
+    messages: Annotated[List[BaseMessage], operator.add]
+    current_focus: str
+
+
+def _fake_llm(text: str) -> GenericFakeChatModel:
+    return GenericFakeChatModel(messages=iter([AIMessage(content=text)]))
+
+
+def _parse_sse(body: str) -> list:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.fixture
+def client(monkeypatch):
+    flushed = []
+
+    async def _flush(session_id, memory, messages):
+        flushed.append((session_id, len(messages)))
+
+    async def _noop(*_):
+        return None
+
+    monkeypatch.setattr(orchestration, "flush_session_to_postgres", _flush)
+    monkeypatch.setattr(orchestration.state_manager, "get_session_initial_info", _noop)
+
+    app = FastAPI()
+    app.include_router(chat.router)
+    app.include_router(session.router)
+    with TestClient(app) as test_client:
+        yield test_client, app, flushed
+
+
+def test_message_stream_sends_tokens_nodes_and_final(client):
+    test_client, app, flushed = client
+    critic_llm = _fake_llm("측정 기준이 불분명합니다")
+    focus_llm = _fake_llm("내부 포커스")
+
+    async def critic(state):
+        return {"messages": [await critic_llm.ainvoke(state["messages"])]}
+
+    async def focus(state):
+        return {"current_focus": (await focus_llm.ainvoke(state["messages"])).content}
+
+    workflow = StateGraph(State)
+    workflow.add_node("critic", critic)
+    workflow.add_node("focus", focus)
+    workflow.set_entry_point("critic")
+    workflow.add_edge("critic", "focus")
+    workflow.add_edge("focus", END)
+    checkpointer = MemorySaver()
+    registry = SimpleNamespace(checkpointer=checkpointer, app_graph=workflow.compile(checkpointer=checkpointer))
+    app.dependency_overrides[get_graph_registry] = lambda: registry
+    turns_before = TURN_LATENCY.count(endpoint="/message/stream")
+
+    response = test_client.post("/sessions/s1/message/stream", json={"content": "재택근무가 낫다"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    tokens = [data["delta"] for name, data in events if name == "token"]
+    assert "".join(tokens) == "측정 기준이 불분명합니다"
+    assert len(tokens) > 1
+    assert {data["node"] for name, data in events if name == "token"} == {"critic"}  # focus 토큰은 숨김
+    assert ("node", {"node": "critic", "status": "start"}) in events
+    assert ("node", {"node": "focus", "status": "end"}) in events
+    assert events[-1] == ("final", {"content": "측정 기준이 불분명합니다"})
+    assert flushed == [("s1", 2)]
+    assert TURN_LATENCY.count(endpoint="/message/stream") == turns_before + 1  # 스트림이 끝난 뒤 기록
+
+
+def test_message_with_debug_trace_header_returns_latency_breakdown(client, monkeypatch):
+    test_client, app, _ = client
+    monkeypatch.setattr(settings, "DEBUG_TRACE_HEADER_ENABLED", True)  # 기본값은 False (환경별로 켬)
+
+    async def critic(state):
+        return {"messages": [await _fake_llm("근거가 부족합니다").ainvoke(state["messages"])]}
+
+    workflow = StateGraph(State)
+    workflow.add_node("critic", critic)
+    workflow.set_entry_point("critic")
+    workflow.add_edge("critic", END)
+    checkpointer = MemorySaver()
+    registry = SimpleNamespace(checkpointer=checkpointer, app_graph=workflow.compile(checkpointer=checkpointer))
+    app.dependency_overrides[get_graph_registry] = lambda: registry
+
+    plain = test_client.post("/sessions/s3/message", json={"content": "주 4일제"})
+    traced = test_client.post("/sessions/s3/message", json={"content": "왜요?"}, headers={"X-Debug-Trace": "1"})
+    chrome = test_client.post("/sessions/s3/message", json={"content": "그래서요?"}, headers={"X-Debug-Trace": "chrome"})
+
+    assert "trace" not in plain.json()
+    trace = traced.json()["trace"]
+    assert trace["name"] == "/message"
+    assert {"state_load", "graph", "flush"} <= set(trace["by_category_ms"])
+    assert [s["name"] for s in trace["spans"]][:2] == ["load_state", "astream_events"]
+    assert {e["ph"] for e in chrome.json()["trace"]["traceEvents"]} == {"X"}
+
+
+def test_why_stream_returns_interrupt_question_as_final(client, monkeypatch):
+    test_client, _, _ = client
+    saved = {}
+
+    class FakeUserStore:
+        async def load_versioned(self, session_id):
+            return saved.get(session_id) or {}, None
+
+        async def upsert(self, session_id, state):
+            saved[session_id] = state
+            return 1
+
+        async def append_transcript_many(self, session_id, rows):
+            saved.setdefault("transcript", []).extend(rows)
+
+    llm = _fake_llm("동기를 정리해 볼게요")
+
+    async def motivation_elicitation(state):
+        await llm.ainvoke(state["messages"])
+        interrupt({"user_facing_message": "왜 그 아이디어가 중요한가요?"})
+        return {}
+
+    workflow = StateGraph(State)
+    workflow.add_node("motivation_elicitation", motivation_elicitation)
+    workflow.set_entry_point("motivation_elicitation")
+    workflow.add_edge("motivation_elicitation", END)
+    why_graph = workflow.compile(checkpointer=MemorySaver())
+
+    async def _get_why_graph():
+        return why_graph
+
+    monkeypatch.setattr(why_orchestration, "get_why_graph", _get_why_graph)
+    monkeypatch.setattr(why_orchestration, "user_store", FakeUserStore())
+    monkeypatch.setattr(why_orchestration, "state_cache", SessionStateCache())
+
+    response = test_client.post("/sessions/w1/why/stream", json={"input": "독서 모임 앱"})
+
+    events = _parse_sse(response.text)
+    assert "".join(data["delta"] for name, data in events if name == "token") == "동기를 정리해 볼게요"
+    assert events[-1] == ("final", {"content": "왜 그 아이디어가 중요한가요?"})
+    assert saved["w1"]["messages"][0]["content"] == "독서 모임 앱"
+    assert saved["transcript"] == [("user", "독서 모임 앱"), ("assistant", "왜 그 아이디어가 중요한가요?")]
+
+
+@pytest.mark.asyncio
+async def test_second_turn_for_busy_session_gets_409_in_reject_mode(client, monkeypatch):
+    _, app, flushed = client
+    monkeypatch.setattr(turn_lock, "_turn_lock", turn_lock.SessionTurnLock(mode="reject"))
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_critic(state):
+        started.set()
+        await release.wait()
+        return {"messages": [AIMessage(content="첫 요청 응답")]}
+
+    workflow = StateGraph(State)
+    workflow.add_node("critic", slow_critic)
+    workflow.set_entry_point("critic")
+    workflow.add_edge("critic", END)
+    checkpointer = MemorySaver()
+    registry = SimpleNamespace(checkpointer=checkpointer, app_graph=workflow.compile(checkpointer=checkpointer))
+    app.dependency_overrides[get_graph_registry] = lambda: registry
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+        first = asyncio.create_task(http.post("/sessions/s1/message/stream", json={"content": "안녕"}))
+        await started.wait()
+        duplicate = await http.post("/sessions/s1/message", json={"content": "안녕"})
+        duplicate_stream = await http.post("/sessions/s1/message/stream", json={"content": "안녕"})
+        release.set()
+        first_response = await first
+
+    assert duplicate.status_code == 409
+    assert duplicate_stream.status_code == 409
+    assert _parse_sse(first_response.text)[-1] == ("final", {"content": "첫 요청 응답"})
+    assert flushed == [("s1", 2)]
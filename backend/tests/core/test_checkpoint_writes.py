@@ -0,0 +1,116 @@
+# backend/tests/core/test_checkpoint_writes.py
+
+import copy
+import pytest
+
+from app.core.checkpointers import CombinedCheckpointer
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeRedisCheckpointer:
+    """상태/pending writes를 메모리에 두는 Redis 체크포인터 대역"""
+    def __init__(self):
+        self.states = {}
+        self.writes = {}
+        self.aset_calls = 0
+        self.aset_configs = []
+
+    async def aget(self, config):
+        state = self.states.get(config["configurable"]["thread_id"])
+        return copy.deepcopy(state)
+
+    async def aset(self, config, state, stale_writes_checkpoint_id=None):
+        self.aset_calls += 1
+        self.aset_configs.append(config)
+        thread_id = config["configurable"]["thread_id"]
+        self.states[thread_id] = copy.deepcopy(state)
+        if stale_writes_checkpoint_id is not None:
+            self.writes.pop((thread_id, stale_writes_checkpoint_id), None)
+
+    async def aappend_writes(self, config, checkpoint_id, task_id, writes):
+        key = (config["configurable"]["thread_id"], checkpoint_id or "latest")
+        self.writes.setdefault(key, []).extend((task_id, ch, v) for ch, v in writes)
+
+    async def aget_writes(self, config, checkpoint_id):
+        return list(self.writes.get((config["configurable"]["thread_id"], checkpoint_id or "latest"), []))
+
+
+class FakeSQLCheckpointer:
+    def __init__(self):
+        self.states = {}
+        self.writes = []
+        self.aset_calls = 0
+
+    async def aget(self, config):
+        return copy.deepcopy(self.states.get(config["configurable"]["thread_id"]))
+
+    async def aset(self, config, state):
+        self.aset_calls += 1
+        self.states[config["configurable"]["thread_id"]] = copy.deepcopy(state)
+
+    async def aput_writes(self, config, checkpoint_id, task_id, writes):
+        for ch, v in writes:
+            self.writes.append((config["configurable"]["thread_id"], checkpoint_id or "latest", task_id, ch, v))
+
+    async def aget_writes(self, config, checkpoint_id):
+        thread_id = config["configurable"]["thread_id"]
+        return [(task, ch, v) for t, c, task, ch, v in self.writes if t == thread_id and c == (checkpoint_id or "latest")]
+
+
+def _checkpoint(checkpoint_id, messages):
+    return {"id": checkpoint_id, "ts": "2025-01-01T00:00:00+00:00",
+            "channel_values": {"messages": messages}, "channel_versions": {}, "versions_seen": {}}
+
+
+async def test_aput_writes_appends_delta_without_rewriting_state():
+    redis_cp, sql_cp = FakeRedisCheckpointer(), FakeSQLCheckpointer()
+    cp = CombinedCheckpointer(redis_cp, sql_cp)
+    cfg = {"configurable": {"thread_id": "t1"}}
+    saved = await cp.aput(cfg, _checkpoint("c1", ["hi"]), {"step": 1})
+    assert (redis_cp.aset_calls, sql_cp.aset_calls) == (1, 1)
+
+    await cp.aput_writes(saved, [("messages", ["hi", "hello"]), ("critique_depth", 2)], "task-a")
+
+    # 전체 상태는 다시 저장되지 않고 레코드만 추가되어야 함
+    assert (redis_cp.aset_calls, sql_cp.aset_calls) == (1, 1)
+    assert len(sql_cp.writes) == 2
+
+    wrapper = await cp.aget(cfg)
+    assert wrapper["channel_values"]["messages"] == ["hi", "hello"]
+    assert wrapper["channel_values"]["critique_depth"] == 2
+    assert wrapper["messages"] == ["hi", "hello"]
+
+
+async def test_new_checkpoint_drops_folded_writes_and_sql_fallback_folds():
+    redis_cp, sql_cp = FakeRedisCheckpointer(), FakeSQLCheckpointer()
+    cp = CombinedCheckpointer(redis_cp, sql_cp)
+    cfg = {"configurable": {"thread_id": "t1"}}
+    saved = await cp.aput(cfg, _checkpoint("c1", []), {"step": 1})
+    await cp.aput_writes(saved, [("messages", ["a"])], "task-a")
+
+    # 다음 체크포인트 저장 시 부모(c1)의 Redis writes는 정리됨
+    await cp.aput(saved, _checkpoint("c2", ["a"]), {"step": 2})
+    assert ("t1", "c1") not in redis_cp.writes
+
+    # Redis 미스 → SQL 기준 상태 + SQL writes를 접어서 반환
+    await cp.aput_writes({"configurable": {"thread_id": "t1", "checkpoint_id": "c2"}}, [("messages", ["a", "b"])], "task-b")
+    redis_cp.states.clear()
+    wrapper = await cp.aget(cfg)
+    assert wrapper["messages"] == ["a", "b"]
+
+
+async def test_aput_caches_latest_state_and_skips_interrupt_writes():
+    redis_cp, sql_cp = FakeRedisCheckpointer(), FakeSQLCheckpointer()
+    cp = CombinedCheckpointer(redis_cp, sql_cp)
+    saved = await cp.aput({"configurable": {"thread_id": "why:t1", "checkpoint_id": "c1"}},
+                          _checkpoint("c2", ["q"]), {"step": 2})
+
+    # 부모 체크포인트 id가 아니라 aget이 읽는 최신 키로 캐시되어야 함
+    assert "checkpoint_id" not in redis_cp.aset_configs[-1]["configurable"]
+
+    await cp.aput_writes(saved, [("__interrupt__", [object()]), ("messages", ["q", "a"])], "task-a")
+    assert [w[3] for w in sql_cp.writes] == ["messages"]
+    wrapper = await cp.aget({"configurable": {"thread_id": "why:t1"}})
+    assert "__interrupt__" not in wrapper["channel_values"]
+    assert wrapper["messages"] == ["q", "a"]
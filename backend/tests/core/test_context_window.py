@@ -0,0 +1,106 @@
+# backend/tests/core/test_context_window.py
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.core import context_window, llm_provider
+
+pytestmark = pytest.mark.asyncio
+
+
+class CountingLLM:
+    def __init__(self):
+        self.prompts = []
+
+    async def ainvoke(self, messages):
+        self.prompts.append(messages[-1].content)
+        return AIMessage(content=f"요약 {len(self.prompts)}")
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    fake = CountingLLM()
+    monkeypatch.setattr(context_window, "_encoding", lambda: None)  # 오프라인에서도 같은 결과가 나오도록 근사치 사용
+    monkeypatch.setattr(context_window, "_summary_cache", context_window.LRUCache(maxsize=64))
+    monkeypatch.setattr(context_window.settings, "CONTEXT_SUMMARY_CHUNK_MESSAGES", 4)
+    monkeypatch.setattr(llm_provider, "get_fast_llm", lambda: fake)
+    return fake
+
+
+def _conversation(turns):
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"사용자 답변 {i} " + "가" * 40))
+        messages.append({"type": "ai", "content": f"질문 {i} " + "나" * 40})
+    return messages
+
+
+async def test_short_history_is_kept_verbatim(llm):
+    messages = _conversation(2)
+
+    ctx = await context_window.build_history_context(messages, budget_tokens=1000)
+
+    assert ctx.text == "\n".join(context_window.history_lines(messages))
+    assert (ctx.verbatim_messages, ctx.summarized_messages) == (4, 0)
+    assert llm.prompts == []
+
+
+async def test_long_history_fits_budget_with_rolling_summary(llm):
+    messages = _conversation(20)
+
+    ctx = await context_window.build_history_context(messages, budget_tokens=400)
+
+    assert ctx.total_tokens <= 400 < ctx.full_history_tokens
+    assert ctx.summarized_messages % 4 == 0  # 요약 구간은 청크 경계
+    assert ctx.verbatim_messages + ctx.summarized_messages == 40
+    assert ctx.text.endswith(context_window.message_line(messages[-1]))
+    assert f"요약 {len(llm.prompts)}" in ctx.text
+
+
+async def test_cold_miss_summarizes_older_history_in_one_call(llm):
+    ctx = await context_window.build_history_context(_conversation(20), budget_tokens=400)
+
+    assert len(llm.prompts) == 1
+    assert llm.prompts[0].count("\n- ") == ctx.summarized_messages  # 요약 구간 전체를 한 번에
+    assert ctx.state_updates() == {
+        "older_history_summary": "요약 1", "older_history_summary_upto": ctx.summarized_messages,
+    }
+
+
+async def test_next_turns_reuse_cached_summary_and_fold_only_new_chunk(llm):
+    messages = _conversation(20)
+    await context_window.build_history_context(messages, budget_tokens=400)
+    calls = len(llm.prompts)
+
+    # 한 턴(2개 메시지) 추가: 요약 경계가 그대로면 LLM 호출 없음, 넘어가도 새 청크 하나만
+    messages += _conversation(1)
+    await context_window.build_history_context(messages, budget_tokens=400)
+    messages += _conversation(1)
+    await context_window.build_history_context(messages, budget_tokens=400)
+    assert len(llm.prompts) - calls <= 1
+    assert all(p.count("\n- ") <= 4 for p in llm.prompts[calls:])  # 이어 갈 때는 청크 크기만큼만 접어 넣음
+
+
+async def test_stored_summary_from_state_is_reused_on_cold_cache(llm, monkeypatch):
+    messages = _conversation(20)
+    first = await context_window.build_node_history("findings_summarization", messages)
+    state = {"messages": messages, **first.state_updates()}
+
+    # 다른 워커/재시작: 프로세스 캐시는 비었지만 상태에 저장된 요약으로 이어 감
+    monkeypatch.setattr(context_window, "_summary_cache", context_window.LRUCache(maxsize=64))
+    calls = len(llm.prompts)
+    again = await context_window.build_node_history("findings_summarization", messages, state=state)
+
+    assert len(llm.prompts) == calls
+    assert again.summary == first.summary
+
+
+async def test_summary_failure_falls_back_to_omission_marker(llm, monkeypatch):
+    async def _fail(*_):
+        raise RuntimeError("rate limited")
+
+    monkeypatch.setattr(context_window, "_fold_into_summary", _fail)
+
+    ctx = await context_window.build_history_context(_conversation(20), budget_tokens=400)
+
+    assert "생략" in ctx.text and ctx.total_tokens <= 400
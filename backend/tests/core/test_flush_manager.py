@@ -0,0 +1,169 @@
+# backend/tests/core/test_flush_manager.py
+
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+from langchain_core.messages import AIMessage, HumanMessage
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import flush_manager
+from app.core.config import settings
+from app.db.models import GraphStateRecord, MessageRecord
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __len__(self):
+        return len(self.commands)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.lists = {}
+        self.ttls = {}
+        self.round_trips = 0
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = str(value).encode()
+
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None or self.lists.pop(key, None) is not None)
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def expire(self, key, seconds):
+        if key in self.data or key in self.lists:
+            self.ttls[key] = seconds
+
+    async def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(value.encode() for value in values)
+        return len(self.lists[key])
+
+    async def ltrim(self, key, start, end):
+        items = self.lists.get(key, [])
+        self.lists[key] = items[start:] if end == -1 else items[start:end + 1]
+
+    async def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest_asyncio.fixture
+async def db(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: GraphStateRecord.__table__.create(c))
+        await conn.run_sync(lambda c: MessageRecord.__table__.create(c))
+    factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def _session():
+        async with factory() as session:
+            yield session
+
+    fake_redis = FakeRedis()
+    monkeypatch.setattr(flush_manager, "get_db_session_async", _session)
+    monkeypatch.setattr(flush_manager, "get_redis", lambda: fake_redis)
+    yield factory, fake_redis
+    await engine.dispose()
+
+
+async def _rows(factory, thread_id):
+    async with factory() as session:
+        result = await session.execute(
+            select(MessageRecord.seq, MessageRecord.sender, MessageRecord.content)
+            .where(MessageRecord.thread_id == thread_id).order_by(MessageRecord.seq)
+        )
+        return result.all()
+
+
+async def test_flush_inserts_only_new_messages(db):
+    factory, _ = db
+    messages = [HumanMessage(content="q1"), AIMessage(content="a1")]
+    await flush_manager.flush_session_to_postgres("t1", {}, messages)
+
+    messages += [HumanMessage(content="q2"), AIMessage(content="a2")]
+    await flush_manager.flush_session_to_postgres("t1", {}, messages)
+
+    assert await _rows(factory, "t1") == [
+        (0, "user", "q1"), (1, "bot", "a1"), (2, "user", "q2"), (3, "bot", "a2"),
+    ]
+
+
+async def test_retry_after_lost_high_water_mark_does_not_double_insert(db):
+    factory, fake_redis = db
+    messages = [{"sender": "user", "content": "q1"}, {"sender": "bot", "content": "a1"}]
+    await flush_manager.flush_session_to_postgres("t1", {}, messages)
+
+    # retry_failed_flush 처럼 같은 목록을 다시 flush (HWM 유실 + 오래된 HWM 모두)
+    fake_redis.data.clear()
+    await flush_manager.flush_session_to_postgres("t1", {}, messages)
+    fake_redis.data[flush_manager.FLUSH_HWM_KEY_PREFIX + "t1"] = b"0"
+    await flush_manager.flush_session_to_postgres("t1", {}, messages)
+
+    assert len(await _rows(factory, "t1")) == 2
+
+
+async def test_batch_flush_upserts_graph_states_for_many_sessions(db):
+    factory, _ = db
+    await flush_manager.flush_session_to_postgres("t1", {"v": 1}, [HumanMessage(content="q1")])
+    await flush_manager.flush_sessions_to_postgres({
+        "t1": ({"v": 2}, [HumanMessage(content="q1"), AIMessage(content="a1")]),
+        "t2": ({"v": 1}, [HumanMessage(content="x1")]),
+    })
+
+    async with factory() as session:
+        result = await session.execute(select(GraphStateRecord.thread_id, GraphStateRecord.state_json))
+        assert dict(result.all()) == {"t1": {"v": 2}, "t2": {"v": 1}}
+    assert await _rows(factory, "t1") == [(0, "user", "q1"), (1, "bot", "a1")]
+    assert await _rows(factory, "t2") == [(0, "user", "x1")]
+
+
+async def test_successful_flush_clears_failed_marker_and_refreshes_ttl_in_one_round_trip(db):
+    _, fake_redis = db
+    await flush_manager.mark_flush_failed("t1")
+    await flush_manager.mark_flush_failed("t2")
+    fake_redis.data["session_info:t1"] = b"{}"
+    assert await flush_manager.filter_flush_failed(["t1", "t2", "t3"]) == ["t1", "t2"]
+
+    fake_redis.round_trips = 0
+    await flush_manager.flush_session_to_postgres("t1", {}, [HumanMessage(content="q1")])
+
+    assert fake_redis.round_trips == 1
+    assert not await flush_manager.has_flush_failed("t1")
+    assert await flush_manager.has_flush_failed("t2")
+    assert fake_redis.data[flush_manager.FLUSH_HWM_KEY_PREFIX + "t1"] == b"1"
+    assert len(fake_redis.lists["message_log:t1"]) == 2  # 시작 표식 + q1
+    assert fake_redis.ttls["session_info:t1"] == settings.SESSION_TTL_SECONDS
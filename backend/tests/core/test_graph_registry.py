@@ -0,0 +1,19 @@
+# backend/tests/core/test_graph_registry.py
+
+import pytest
+from app.core import graph_registry
+from app.core.graph_registry import get_graph_registry, close_graph_registry
+
+@pytest.mark.asyncio
+async def test_registry_is_built_once_and_reused():
+    await close_graph_registry()
+    first = await get_graph_registry()
+    second = await get_graph_registry()
+
+    # 같은 컴파일 그래프/체크포인터 인스턴스를 재사용해야 함
+    assert first is second
+    assert first.app_graph is second.app_graph
+    assert first.app_graph.checkpointer is first.checkpointer
+
+    await close_graph_registry()
+    assert graph_registry._registry is None
@@ -0,0 +1,142 @@
+# backend/tests/core/test_llm_admission.py
+
+import asyncio
+import operator
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langgraph.graph import END, StateGraph
+
+from app.core.llm_admission import AdmittedChatModel, ModelLimiter, TokenBucket
+from app.core.metrics import REGISTRY
+
+pytestmark = pytest.mark.asyncio
+
+
+class SlowModel:
+    """호출 순서(세션 태그)를 기록하고 delay 만큼 걸리는 가짜 모델"""
+    model_name = "slow-fake"
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.order = []
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.order.append(messages[-1].content)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return AIMessage(content="ok", usage_metadata={"input_tokens": 5, "output_tokens": 5, "total_tokens": 10})
+
+
+async def test_concurrency_limit_and_round_robin_between_sessions():
+    model = SlowModel()
+    limiter = ModelLimiter("slow-fake", max_concurrency=1, requests_per_minute=0, tokens_per_minute=0)
+    llm = AdmittedChatModel(model, limiter)
+
+    async def call(session, tag):
+        await limiter.acquire(session, 1)
+        try:
+            return await model.ainvoke([HumanMessage(content=tag)])
+        finally:
+            limiter.release()
+
+    # 세션 a 가 요청 4개를 먼저 쌓고 b, c 가 뒤늦게 1개씩
+    tasks = [asyncio.create_task(call("a", f"a{i}")) for i in range(4)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(call("b", "b0")), asyncio.create_task(call("c", "c0"))]
+    await asyncio.gather(*tasks)
+
+    assert model.max_active == 1
+    # a 의 나머지 요청은 b, c 와 한 번씩 번갈아 승인 (a 가 b, c 를 굶기지 않음)
+    assert model.order == ["a0", "a1", "b0", "c0", "a2", "a3"]
+    assert limiter.stats["admitted"] == 6
+    assert limiter.stats["waiting"] == 0
+    assert limiter.in_flight == 0
+    assert await llm.ainvoke([HumanMessage(content="x")]) is not None
+
+
+async def test_request_rate_limit_delays_admission():
+    bucket_limiter = ModelLimiter("m-rate", max_concurrency=10, requests_per_minute=600, tokens_per_minute=0)  # 초당 10회
+    bucket_limiter.requests.level = 1  # 버킷에 요청 1회분만 남은 상태
+
+    loop = asyncio.get_running_loop()
+    t0 = loop.time()
+    await bucket_limiter.acquire("s", 1)
+    await bucket_limiter.acquire("s", 1)  # 다음 1회분이 찰 때까지(~0.1초) 대기
+    elapsed = loop.time() - t0
+    bucket_limiter.release()
+    bucket_limiter.release()
+
+    assert elapsed >= 0.08
+    assert bucket_limiter.stats["queue_wait_ms_max"] >= 80
+    text = REGISTRY.render()
+    assert 'thinkdeeper_llm_admission_queue_wait_seconds_bucket{model="m-rate",le="0.05"} 1.0' in text  # 첫 요청은 즉시
+    assert 'thinkdeeper_llm_admission_queue_wait_seconds_count{model="m-rate"} 2.0' in text
+
+
+async def test_token_bucket_allows_oversized_request_when_full():
+    now = [0.0]
+    bucket = TokenBucket(600, clock=lambda: now[0])
+
+    assert bucket.delay(5000) == 0.0  # capacity(600) 보다 큰 요청도 가득 차 있으면 통과
+    bucket.consume(5000)
+    assert bucket.delay(1) > 0  # 초과분(4400)은 빚으로 남아 다음 승인을 늦춤
+    now[0] += 60
+    assert bucket.delay(1) > 0
+    now[0] += 480
+    assert bucket.delay(600) == 0.0
+
+
+async def test_cancelled_waiter_leaves_queue():
+    limiter = ModelLimiter("m", max_concurrency=1, requests_per_minute=0, tokens_per_minute=0)
+    await limiter.acquire("a", 1)
+    waiting = asyncio.create_task(limiter.acquire("b", 1))
+    await asyncio.sleep(0)
+    assert limiter.stats["waiting"] == 1
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    limiter.release()
+
+    assert limiter.stats["waiting"] == 0
+    assert limiter.in_flight == 0
+    await limiter.acquire("c", 1)  # 다음 요청은 바로 승인
+    limiter.release()
+
+
+class State(TypedDict, total=False):
+    messages: Annotated[List[BaseMessage], operator.add]
+
+
+async def test_calls_inside_graph_queue_under_thread_id():
+    model = SlowModel(delay=0)
+    limiter = ModelLimiter("slow-fake", max_concurrency=4, requests_per_minute=0, tokens_per_minute=0)
+    llm = AdmittedChatModel(model, limiter)
+    sessions = []
+    original_acquire = limiter.acquire
+
+    async def recording_acquire(session, tokens):
+        sessions.append(session)
+        await original_acquire(session, tokens)
+
+    limiter.acquire = recording_acquire
+
+    async def node(state):
+        return {"messages": [await llm.ainvoke(state["messages"])]}
+
+    workflow = StateGraph(State)
+    workflow.add_node("agent", node)
+    workflow.set_entry_point("agent")
+    workflow.add_edge("agent", END)
+    graph = workflow.compile()
+
+    await graph.ainvoke({"messages": [HumanMessage(content="hi")]}, {"configurable": {"thread_id": "session-1"}})
+
+    assert sessions == ["session-1"]
+    assert limiter.in_flight == 0
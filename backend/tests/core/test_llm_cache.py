@@ -0,0 +1,144 @@
+# backend/tests/core/test_llm_cache.py
+
+from typing import List
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+from app.core import llm_cache
+from app.core.llm_cache import CachedChatModel, LLMResponseCache, cache_key, maybe_cached
+from app.core.metrics import REGISTRY
+
+pytestmark = pytest.mark.asyncio
+
+
+class CountingModel(FakeListChatModel):
+    calls: int = 0
+    temperature: float = 0.2
+
+    async def ainvoke(self, *args, **kwargs):
+        self.calls += 1
+        return await super().ainvoke(*args, **kwargs)
+
+
+class Assumptions(BaseModel):
+    assumptions: List[str]
+
+
+class FakeStructured:
+    def __init__(self, outputs):
+        self.outputs = list(outputs)
+        self.calls = 0
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        self.calls += 1
+        return self.outputs.pop(0)
+
+
+class StructuredModel:
+    model_name = "structured-fake"
+    temperature = 0.2
+
+    def __init__(self, runnable):
+        self.runnable = runnable
+
+    def with_structured_output(self, schema, **kwargs):
+        return self.runnable
+
+
+class FakeRedis:
+    def __init__(self, fail: bool = False):
+        self.data = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value
+
+
+PROMPT = [SystemMessage(content="포커스를 한 구로 요약"), HumanMessage(content="재택근무가 낫다")]
+
+
+async def test_same_prompt_hits_memory_and_skips_llm():
+    model = CountingModel(responses=["생산성 측정", "다른 답"])
+    cache = LLMResponseCache()
+    cached = CachedChatModel(model, "focus", cache)
+
+    first = await cached.ainvoke(PROMPT)
+    second = await cached.ainvoke(PROMPT)
+
+    assert first.content == second.content == "생산성 측정"
+    assert isinstance(second, AIMessage)
+    assert model.calls == 1
+    assert cache.stats["focus"] == {"memory_hits": 1, "redis_hits": 0, "misses": 1, "errors": 0}
+
+
+async def test_key_changes_with_messages_temperature_and_schema():
+    model = CountingModel(responses=["x"])
+    base = cache_key(model, PROMPT)
+
+    assert cache_key(model, PROMPT) == base
+    assert cache_key(model, PROMPT[:1]) != base
+    assert cache_key(model, PROMPT, schema=Assumptions) != base
+    assert cache_key(CountingModel(responses=["x"], temperature=0.7), PROMPT) != base
+
+
+async def test_structured_output_round_trips_through_redis_tier():
+    redis = FakeRedis()
+    runnable = FakeStructured([Assumptions(assumptions=["사용자가 원한다"])])
+    writer = CachedChatModel(StructuredModel(runnable), "identify_assumptions", LLMResponseCache(redis_client=redis))
+    first = await writer.with_structured_output(Assumptions).ainvoke(PROMPT)
+
+    # 다른 워커(빈 메모리 계층)에서 같은 호출 → Redis 적중
+    other_worker = LLMResponseCache(redis_client=redis)
+    reader = CachedChatModel(StructuredModel(FakeStructured([])), "identify_assumptions", other_worker)
+    second = await reader.with_structured_output(Assumptions).ainvoke(PROMPT)
+
+    assert second == first
+    assert isinstance(second, Assumptions)
+    assert runnable.calls == 1
+    assert other_worker.stats["identify_assumptions"]["redis_hits"] == 1
+
+
+async def test_redis_errors_are_misses():
+    model = CountingModel(responses=["a", "b"])
+    cache = LLMResponseCache(redis_client=FakeRedis(fail=True))
+    cached = CachedChatModel(model, "focus", cache)
+
+    assert (await cached.ainvoke(PROMPT)).content == "a"
+    assert (await cached.ainvoke(PROMPT)).content == "a"  # 메모리 계층은 계속 동작
+    assert cache.stats["focus"]["errors"] == 2  # 조회 1 + 저장 1
+    assert model.calls == 1
+
+
+async def test_maybe_cached_only_wraps_enabled_sites(monkeypatch):
+    model = CountingModel(responses=["x"])
+    monkeypatch.setattr(llm_cache.settings, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(llm_cache.settings, "LLM_CACHE_SITES", "focus, moderator_summary")
+
+    assert isinstance(maybe_cached(model, "focus"), CachedChatModel)
+    assert maybe_cached(model, "identify_assumptions") is model
+    assert maybe_cached(model, None) is model
+
+    monkeypatch.setattr(llm_cache.settings, "LLM_CACHE_ENABLED", False)
+    assert maybe_cached(model, "focus") is model
+
+
+async def test_shared_cache_hits_and_misses_are_exported(monkeypatch):
+    monkeypatch.setattr(llm_cache, "_llm_cache", LLMResponseCache())
+    cached = CachedChatModel(CountingModel(responses=["a"]), "focus", llm_cache.get_llm_cache())
+
+    await cached.ainvoke(PROMPT)
+    await cached.ainvoke(PROMPT)
+
+    text = REGISTRY.render()
+    assert 'thinkdeeper_llm_cache_lookups_total{site="focus",result="memory_hit"} 1.0' in text
+    assert 'thinkdeeper_llm_cache_lookups_total{site="focus",result="miss"} 1.0' in text
@@ -0,0 +1,72 @@
+# backend/tests/core/test_log.py
+
+import io
+import json
+
+import pytest
+
+from app.core.log import configure_logging, get_logger, lazy
+
+
+@pytest.fixture
+def stream():
+    buffer = io.StringIO()
+    yield buffer
+    configure_logging()  # 기본 설정으로 복원
+
+
+def test_disabled_debug_does_not_format_arguments(stream):
+    configure_logging(level="INFO", stream=stream)
+    calls = []
+    logger = get_logger("app.core.checkpointers")
+
+    logger.debug("state: %s", lazy(lambda: calls.append("formatted") or {"big": "state"}))
+    logger.info("flush 성공 %s개", 3)
+
+    assert calls == []
+    assert "flush 성공 3개" in stream.getvalue()
+
+
+def test_module_levels_override_default_and_reset_on_reconfigure(stream):
+    configure_logging(level="WARNING", module_levels={"app.graph_nodes.why": "DEBUG"}, stream=stream)
+    get_logger("app.graph_nodes.why.free_conversation_node").debug("프롬프트")
+    get_logger("app.graph_nodes.critic").info("숨김")
+
+    assert "프롬프트" in stream.getvalue()
+    assert "숨김" not in stream.getvalue()
+
+    configure_logging(level="WARNING", stream=stream)
+    assert not get_logger("app.graph_nodes.why.free_conversation_node").isEnabledFor(10)
+
+
+def test_json_format_includes_extra_fields_and_exception(stream):
+    configure_logging(level="INFO", fmt="json", stream=stream)
+    logger = get_logger("app.core.orchestration")
+    try:
+        raise RuntimeError("그래프 오류")
+    except RuntimeError:
+        logger.exception("턴 실패 %s", "s1", extra={"session_id": "s1"})
+
+    record = json.loads(stream.getvalue())
+    assert record["level"] == "ERROR"
+    assert record["logger"] == "app.core.orchestration"
+    assert record["msg"] == "턴 실패 s1"
+    assert record["session_id"] == "s1"
+    assert "RuntimeError: 그래프 오류" in record["exc_info"]
+
+
+def test_sampling_keeps_one_in_n_info_records_but_all_warnings(stream):
+    configure_logging(level="DEBUG", sample_rates={"app.core.streaming": 0.25}, stream=stream)
+    logger = get_logger("app.core.streaming")
+    for i in range(8):
+        logger.debug("event %d", i)
+    logger.warning("경고")
+    get_logger("app.core.flush_manager").info("샘플링 대상 아님")
+
+    lines = stream.getvalue().splitlines()
+    assert [line.rsplit(": ", 1)[1] for line in lines] == ["event 0", "event 4", "경고", "샘플링 대상 아님"]
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        configure_logging(fmt="xml")
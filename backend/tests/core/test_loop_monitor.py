@@ -0,0 +1,31 @@
+# backend/tests/core/test_loop_monitor.py
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.loop_monitor import LoopBlockMonitor
+
+pytestmark = pytest.mark.asyncio
+
+
+def _blocking_call():
+    time.sleep(0.2)  # 동기 I/O 흉내 (예: llm.invoke)
+
+
+async def test_detects_blocking_callback_with_stack():
+    async with LoopBlockMonitor(threshold_ms=50, on_block=lambda block: None) as monitor:
+        await asyncio.sleep(0.02)
+        _blocking_call()
+
+    assert len(monitor.blocks) == 1
+    block = monitor.blocks[0]
+    assert "_blocking_call" in block.stack
+    assert block.duration_ms >= 150
+
+
+async def test_awaiting_does_not_count_as_blocking():
+    async with LoopBlockMonitor(threshold_ms=50, on_block=lambda block: None) as monitor:
+        await asyncio.sleep(0.2)
+    assert monitor.blocks == []
@@ -0,0 +1,95 @@
+# backend/tests/core/test_message_log.py
+
+from contextlib import asynccontextmanager
+
+import fakeredis
+import pytest
+import pytest_asyncio
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import flush_manager, message_log
+from app.core.config import settings
+from app.db.models import GraphStateRecord, MessageRecord
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def log(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: GraphStateRecord.__table__.create(c))
+        await conn.run_sync(lambda c: MessageRecord.__table__.create(c))
+    factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    queries = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: queries.append(args[2]))
+
+    @asynccontextmanager
+    async def _session():
+        async with factory() as session:
+            yield session
+
+    redis = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(flush_manager, "get_db_session_async", _session)
+    monkeypatch.setattr(flush_manager, "get_redis", lambda: redis)
+    monkeypatch.setattr(message_log, "get_redis", lambda: redis)
+    async with factory() as db:
+        yield db, redis, queries
+    await engine.dispose()
+
+
+def _conversation(turns):
+    messages = []
+    for i in range(turns):
+        messages += [HumanMessage(content=f"q{i}"), AIMessage(content=f"a{i}")]
+    return messages
+
+
+async def test_recent_pages_are_served_from_redis_without_sql(log):
+    db, _, queries = log
+    messages = _conversation(2)
+    await flush_manager.flush_session_to_postgres("t1", {}, messages)
+    messages += [ToolMessage(content="도구 결과", tool_call_id="c1"), HumanMessage(content="q2")]
+    await flush_manager.flush_session_to_postgres("t1", {}, messages)
+    queries.clear()
+
+    latest = await message_log.read_page(db, "t1", limit=3)
+    older = await message_log.read_page(db, "t1", limit=3, before=latest[0]["id"])
+
+    assert latest == [
+        {"id": 2, "role": "user", "content": "q1"},
+        {"id": 3, "role": "assistant", "content": "a1"},
+        {"id": 5, "role": "user", "content": "q2"},  # 저장 대상이 아닌 ToolMessage(4) 는 건너뜀
+    ]
+    assert older == [{"id": 0, "role": "user", "content": "q0"}, {"id": 1, "role": "assistant", "content": "a0"}]
+    assert queries == []
+
+
+async def test_pages_beyond_the_redis_window_fall_back_to_sql(log, monkeypatch):
+    db, redis, queries = log
+    monkeypatch.setattr(settings, "MESSAGE_LOG_REDIS_MAXLEN", 4)
+    await flush_manager.flush_session_to_postgres("t1", {}, _conversation(4))
+    queries.clear()
+
+    assert [m["id"] for m in await message_log.read_page(db, "t1", limit=4)] == [4, 5, 6, 7]
+    assert queries == []
+    assert [m["id"] for m in await message_log.read_page(db, "t1", limit=3, before=4)] == [1, 2, 3]
+    assert len(queries) == 1
+
+    # Redis 로그가 사라져도(만료/재시작) DB 에서 같은 결과
+    await redis.flushall()
+    assert [m["content"] for m in await message_log.read_page(db, "t1", limit=2)] == ["q3", "a3"]
+
+
+async def test_retried_flush_does_not_duplicate_log_entries(log):
+    db, redis, _ = log
+    messages = _conversation(1)
+    await flush_manager.flush_session_to_postgres("t1", {}, messages)
+    await redis.set(flush_manager.FLUSH_HWM_KEY_PREFIX + "t1", 1)  # 오래된 HWM 으로 재시도
+    await flush_manager.flush_session_to_postgres("t1", {}, messages)
+
+    assert [m["id"] for m in await message_log.read_page(db, "t1", limit=10)] == [0, 1]
+    assert await flush_manager.get_flushed_count(db, "t1") == 2
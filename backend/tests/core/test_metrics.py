@@ -0,0 +1,129 @@
+# backend/tests/core/test_metrics.py
+
+import operator
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+from langgraph.types import interrupt
+from pydantic import BaseModel
+
+from app.core.llm_provider import InstrumentedChatModel
+from app.core.metrics import (
+    LLM_ERRORS, LLM_LATENCY, LLM_TOKENS, NODE_LATENCY, Counter, Gauge, Histogram, MetricsRegistry, instrument_node,
+)
+
+
+def test_render_counter_and_cumulative_histogram_buckets():
+    registry = MetricsRegistry()
+    calls = Counter("calls_total", "호출 수", ["route"], registry=registry)
+    latency = Histogram("latency_seconds", "지연", ["route"], registry=registry, buckets=(0.1, 1.0))
+    calls.inc(route='/a"b')
+    calls.inc(2, route='/a"b')
+    for value in (0.05, 0.5, 3.0):
+        latency.observe(value, route="/x")
+
+    text = registry.render()
+
+    assert "# TYPE calls_total counter" in text
+    assert 'calls_total{route="/a\\"b"} 3.0' in text
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/x",le="0.1"} 1.0' in text
+    assert 'latency_seconds_bucket{route="/x",le="1.0"} 2.0' in text
+    assert 'latency_seconds_bucket{route="/x",le="+Inf"} 3.0' in text
+    assert 'latency_seconds_sum{route="/x"} 3.55' in text
+    assert 'latency_seconds_count{route="/x"} 3.0' in text
+
+
+def test_labels_must_match_and_names_are_unique():
+    registry = MetricsRegistry()
+    calls = Counter("calls_total", "호출 수", ["route"], registry=registry)
+
+    with pytest.raises(ValueError):
+        calls.inc(path="/a")
+    with pytest.raises(ValueError):
+        Gauge("calls_total", "중복", registry=registry)
+
+
+def test_collected_gauges_are_read_at_render_time():
+    registry = MetricsRegistry()
+    depth = {"value": None}
+    Gauge("queue_depth", "큐 깊이", registry=registry, collect=lambda: depth["value"])
+    waiting = Gauge("waiting", "대기", ["model"], registry=registry, collect=lambda: {("m1",): 2, ("m0",): 0})
+
+    assert "\nqueue_depth " not in registry.render()  # 아직 큐가 없으면 샘플 없음
+    depth["value"] = 7
+
+    text = registry.render()
+    assert "queue_depth 7.0" in text
+    assert text.index('waiting{model="m0"} 0.0') < text.index('waiting{model="m1"} 2.0')
+    assert waiting.value(model="m1") == 2
+
+
+class State(TypedDict, total=False):
+    messages: Annotated[List[BaseMessage], operator.add]
+
+
+@pytest.mark.asyncio
+async def test_instrumented_nodes_record_latency_including_interrupts():
+    async def answer(state):
+        return {"messages": [AIMessage(content="답")]}
+
+    async def ask(state):
+        interrupt("왜 그렇게 생각하나요?")
+
+    workflow = StateGraph(State)
+    workflow.add_node("answer", instrument_node("test", "answer", answer))
+    workflow.add_node("ask", instrument_node("test", "ask", ask))
+    workflow.set_entry_point("answer")
+    workflow.add_edge("answer", "ask")
+    workflow.add_edge("ask", END)
+    graph = workflow.compile(checkpointer=MemorySaver())
+    before = {node: NODE_LATENCY.count(graph="test", node=node) for node in ("answer", "ask")}
+
+    await graph.ainvoke({"messages": [HumanMessage(content="시작")]}, {"configurable": {"thread_id": "t1"}})
+
+    assert NODE_LATENCY.count(graph="test", node="answer") == before["answer"] + 1
+    assert NODE_LATENCY.count(graph="test", node="ask") == before["ask"] + 1
+
+
+class Answer(BaseModel):
+    text: str
+
+
+class FakeModel:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        if self.fail:
+            raise TimeoutError("응답 없음")
+        return AIMessage(content="ok", usage_metadata={"input_tokens": 7, "output_tokens": 3, "total_tokens": 10})
+
+    def with_structured_output(self, schema, **kwargs):
+        model = self
+
+        class Structured:
+            async def ainvoke(self, messages, config=None, **kwargs):
+                await model.ainvoke(messages)
+                return schema(text="ok")
+
+        return Structured()
+
+
+@pytest.mark.asyncio
+async def test_instrumented_chat_model_records_latency_tokens_and_errors():
+    llm = InstrumentedChatModel(FakeModel(), "fake-metrics")
+    await llm.ainvoke([HumanMessage(content="x")])
+    assert await llm.with_structured_output(Answer).ainvoke([HumanMessage(content="x")]) == Answer(text="ok")
+
+    assert LLM_LATENCY.count(model="fake-metrics") == 2
+    assert LLM_TOKENS.value(model="fake-metrics", kind="input") == 7  # 구조화 출력은 usage 없음
+    assert LLM_TOKENS.value(model="fake-metrics", kind="output") == 3
+
+    with pytest.raises(TimeoutError):
+        await InstrumentedChatModel(FakeModel(fail=True), "fake-metrics").ainvoke([HumanMessage(content="x")])
+    assert LLM_ERRORS.value(model="fake-metrics", error="TimeoutError") == 1
+    assert LLM_LATENCY.count(model="fake-metrics") == 3
@@ -0,0 +1,70 @@
+# backend/tests/core/test_recovery_manager.py
+
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import recovery_manager
+from app.db.models import GraphStateRecord, MessageRecord
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeRedisCheckpointer:
+    def __init__(self):
+        self.saved = {}
+
+    async def aset(self, config, state):
+        self.saved[config["configurable"]["thread_id"]] = state
+
+
+class FakeRegistry:
+    def __init__(self):
+        self.redis_cp = FakeRedisCheckpointer()
+
+
+@pytest_asyncio.fixture
+async def db(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: GraphStateRecord.__table__.create(c))
+        await conn.run_sync(lambda c: MessageRecord.__table__.create(c))
+    factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def _session():
+        async with factory() as session:
+            yield session
+
+    registry = FakeRegistry()
+
+    async def _registry():
+        return registry
+
+    monkeypatch.setattr(recovery_manager, "get_db_session_async", _session)
+    monkeypatch.setattr(recovery_manager, "get_graph_registry", _registry)
+    yield factory, registry
+    await engine.dispose()
+
+
+async def test_restores_messages_in_conversation_order(db):
+    factory, registry = db
+    async with factory() as session:
+        session.add(GraphStateRecord(thread_id="t1", state_json={"memory": {"k": "v"}}))
+        # 재시도/배치 flush 로 삽입 순서가 대화 순서와 다를 수 있음. seq 가 없는 기존 행이 가장 앞
+        session.add_all([
+            MessageRecord(thread_id="t1", seq=2, sender="user", content="q2"),
+            MessageRecord(thread_id="t1", seq=0, sender="user", content="q1"),
+            MessageRecord(thread_id="t1", seq=None, sender="user", content="legacy"),
+            MessageRecord(thread_id="t1", seq=1, sender="bot", content="a1"),
+        ])
+        await session.commit()
+
+    assert await recovery_manager.restore_session_to_redis("t1")
+
+    restored = registry.redis_cp.saved["t1"]
+    assert [m["content"] for m in restored["messages"]] == ["legacy", "q1", "a1", "q2"]
+    assert restored["memory"] == {"k": "v"}
@@ -0,0 +1,55 @@
+# backend/tests/core/test_redis_pool.py
+
+import fakeredis
+import pytest
+
+from app.core import redis_pool
+from app.core.config import settings
+from app.core.redis_checkpointer import RedisCheckpointer
+
+
+@pytest.fixture
+def fresh_pool(monkeypatch):
+    monkeypatch.setattr(redis_pool, "_client", None)
+    yield
+    redis_pool._client = None
+
+
+def test_get_redis_builds_one_bounded_pool_with_health_checks(fresh_pool, monkeypatch):
+    monkeypatch.setattr(settings, "REDIS_MAX_CONNECTIONS", 7)
+    monkeypatch.setattr(settings, "REDIS_HEALTH_CHECK_INTERVAL_SECONDS", 15)
+
+    client = redis_pool.get_redis()
+
+    assert redis_pool.get_redis() is client  # 프로세스당 하나
+    pool = client.connection_pool
+    assert pool.max_connections == 7
+    assert pool.connection_kwargs["health_check_interval"] == 15
+    assert redis_pool.pool_stats() == {"max_connections": 7, "in_use": 0, "idle": 0}
+
+
+@pytest.mark.asyncio
+async def test_transaction_sends_queued_commands_in_one_exec():
+    client = fakeredis.FakeAsyncRedis()
+
+    async with redis_pool.transaction(client) as pipe:
+        pipe.set("state", b"v", ex=60)
+        pipe.expire("state", 120)
+        pipe.delete("marker")
+    assert await client.get("state") == b"v"
+    assert 60 < await client.ttl("state") <= 120
+
+    with pytest.raises(RuntimeError):
+        async with redis_pool.transaction(client) as pipe:
+            pipe.set("state", b"lost")
+            raise RuntimeError("중단")
+    assert await client.get("state") == b"v"  # 예외가 나면 아무것도 보내지 않음
+
+
+@pytest.mark.asyncio
+async def test_checkpointer_does_not_close_shared_client():
+    client = fakeredis.FakeAsyncRedis()
+    cp = RedisCheckpointer(client=client)
+    await cp.aclose()
+
+    assert await client.ping()
@@ -0,0 +1,114 @@
+# backend/tests/core/test_search_service.py
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import pytest_asyncio
+
+from app.services.search_service import SearchError, SearchService
+
+pytestmark = pytest.mark.asyncio
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass  # 타임아웃 테스트에서 클라이언트가 먼저 끊는 경우 (BrokenPipe)
+
+
+class FakeTavilyServer:
+    """POST /search 에 Tavily 형식으로 응답하는 로컬 HTTP 서버"""
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.queries = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                server.queries.append(body["query"])
+                time.sleep(server.delay)
+                payload = json.dumps({"results": [
+                    {"title": f"결과: {body['query']}", "url": "https://example.com", "content": "스니펫"}
+                ]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = _QuietHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+@pytest.fixture
+def fake_server():
+    server = FakeTavilyServer()
+    yield server
+    server.close()
+
+
+@pytest_asyncio.fixture
+async def service(fake_server):
+    svc = SearchService(api_key="test", base_url=fake_server.base_url)
+    yield svc
+    await svc.aclose()
+
+
+async def test_normalized_query_is_served_from_cache(service, fake_server):
+    first = await service.search("재택근무 생산성")
+    second = await service.search("  재택근무   생산성 ")
+    assert first == second
+    assert fake_server.queries == ["재택근무 생산성"]
+    assert service.stats["memory_hits"] == 1
+
+
+async def test_identical_inflight_queries_are_coalesced(service, fake_server):
+    results = await asyncio.gather(*(service.search("AI 규제") for _ in range(5)))
+    assert all(r == results[0] for r in results)
+    assert fake_server.queries == ["AI 규제"]
+    assert service.stats["coalesced"] == 4
+
+
+async def test_redis_tier_is_shared_between_workers(fake_server):
+    redis = FakeRedis()
+    worker_a = SearchService(api_key="test", base_url=fake_server.base_url, redis_client=redis)
+    worker_b = SearchService(api_key="test", base_url=fake_server.base_url, redis_client=redis)
+    try:
+        await worker_a.search("기본소득")
+        await worker_b.search("기본소득")
+    finally:
+        await worker_a.aclose()
+        await worker_b.aclose()
+    assert fake_server.queries == ["기본소득"]
+    assert worker_b.stats["redis_hits"] == 1
+
+
+async def test_per_query_timeout_raises_search_error(service, fake_server):
+    fake_server.delay = 0.5
+    with pytest.raises(SearchError):
+        await service.search("느린 쿼리", timeout=0.05)
@@ -0,0 +1,88 @@
+# backend/tests/core/test_serializers.py
+
+import pickle
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from pydantic import BaseModel
+
+from app.core import serializers
+from app.core.serializers import FORMAT_VERSION, MsgpackSerializer, SerializationError
+
+
+class Verdict(BaseModel):
+    label: str
+    score: float
+
+
+def _state(n_messages):
+    messages = []
+    for i in range(n_messages):
+        messages.append(HumanMessage(content=f"질문 {i}"))
+        messages.append(AIMessage(content=f"답변 {i}", additional_kwargs={"agent": "critic"}))
+    return {
+        "channel_values": {"messages": messages, "critique_depth": 2},
+        "messages": messages,
+        "metadata": {"step": 3, "checkpoint_id": "c1"},
+        "channel_versions": {"messages": 4},
+        "versions_seen": {},
+    }
+
+
+@pytest.mark.parametrize("compression", [None, "zlib", "zstd"])
+def test_roundtrip_preserves_messages_and_values(compression):
+    ser = MsgpackSerializer(compression=compression, compress_min_bytes=64)
+    state = _state(20)
+    data = ser.dumps(state)
+
+    assert data[0] == FORMAT_VERSION
+    restored = ser.loads(data)
+    assert restored == state
+    assert isinstance(restored["messages"][1], AIMessage)
+    assert restored["messages"][1].additional_kwargs == {"agent": "critic"}
+
+
+def test_small_payload_is_not_compressed_and_tuples_survive():
+    ser = MsgpackSerializer(compression="zlib", compress_min_bytes=1024)
+    data = ser.dumps(("task", 0, "messages", [HumanMessage(content="hi")]))
+    assert data[1:2] == b"n"
+    assert ser.loads(data) == ("task", 0, "messages", [HumanMessage(content="hi")])
+
+
+def test_reads_legacy_pickle_only_when_allowed():
+    legacy = pickle.dumps({"messages": [], "metadata": {"step": 1}})
+    assert MsgpackSerializer(allow_legacy_pickle=True).loads(legacy)["metadata"] == {"step": 1}
+    with pytest.raises(SerializationError):
+        MsgpackSerializer().loads(legacy)
+
+
+def test_restored_messages_behave_like_validated_ones():
+    ser = MsgpackSerializer(compression=None)
+    tool_call = {"name": "search", "args": {"q": "x"}, "id": "call-1", "type": "tool_call"}
+    original = [
+        AIMessage(content="", tool_calls=[tool_call], response_metadata={"model": "m"}),
+        ToolMessage(content="결과", tool_call_id="call-1"),
+    ]
+
+    restored = ser.loads(ser.dumps(original))
+
+    assert restored == original
+    assert [m.model_dump() for m in restored] == [m.model_dump() for m in original]
+    restored[0].invalid_tool_calls.append("x")  # 가변 기본값을 다른 메시지와 공유하지 않음
+    assert ser.loads(ser.dumps(original))[0].invalid_tool_calls == []
+
+
+def test_only_registered_models_are_encoded_and_decoded(monkeypatch):
+    monkeypatch.setattr(serializers, "_MODELS_BY_TAG", {})
+    monkeypatch.setattr(serializers, "_TAGS_BY_MODEL", {})
+    ser = MsgpackSerializer(compression=None)
+    with pytest.raises(TypeError):
+        ser.dumps({"verdict": Verdict(label="ok", score=0.5)})
+
+    serializers.register_model("verdict", Verdict)
+    data = ser.dumps({"verdict": Verdict(label="ok", score=0.5)})
+    assert ser.loads(data) == {"verdict": Verdict(label="ok", score=0.5)}
+
+    # 다른 배포에서 태그가 없어졌거나, 임의로 만든 바이트: import 하지 않고 거부
+    serializers._MODELS_BY_TAG.clear()
+    with pytest.raises(SerializationError):
+        ser.loads(data)
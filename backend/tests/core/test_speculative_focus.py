@@ -0,0 +1,59 @@
+# backend/tests/core/test_speculative_focus.py
+
+import asyncio
+import time
+import uuid
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+
+from app.core.config import settings
+from app.core.orchestration import workflow
+from app.graph_nodes.critic import CriticOutput
+
+pytestmark = pytest.mark.asyncio
+
+LATENCY = 0.2
+
+
+class FakeLLM:
+    def __init__(self, response):
+        self.response = response
+        self.prompts = []
+
+    def with_structured_output(self, _schema):
+        return self
+
+    async def ainvoke(self, messages):
+        self.prompts.append(messages)
+        await asyncio.sleep(LATENCY)
+        return self.response
+
+
+async def test_focus_runs_in_parallel_and_is_used_next_turn(mocker):
+    focus_llm = FakeLLM(AIMessage(content="집중 시간과 생산성의 관계"))
+    critic_llm = FakeLLM(CriticOutput(critique_point="기준이 모호합니다.", brief_elaboration="무엇으로 측정하나요?"))
+    mocker.patch("app.graph_nodes.coordinator.get_focus_llm", return_value=focus_llm)
+    mocker.patch("app.graph_nodes.critic.get_high_performance_llm", return_value=critic_llm)
+    mocker.patch.object(settings, "COORDINATOR_SPECULATIVE_FOCUS", True)
+
+    app_graph = workflow.compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": str(uuid.uuid4())}}
+    graph_input = {
+        "messages": [AIMessage(content="근거가 있나요?"), HumanMessage(content="출퇴근이 줄어듭니다.")],
+        "initial_topic": "재택근무",
+        "current_focus": "이전 포커스",
+        "target_agent": "critic",
+    }
+
+    t0 = time.perf_counter()
+    final = await app_graph.ainvoke(graph_input, config=config)
+    elapsed = time.perf_counter() - t0
+
+    # 포커스 LLM 과 critic LLM 이 겹쳐 실행되어야 함 (순차면 2 * LATENCY 이상)
+    assert elapsed < LATENCY * 1.8
+    # 이번 턴 critic 은 이전 포커스를, 다음 턴부터는 새 포커스를 사용
+    assert "이전 포커스" in critic_llm.prompts[0][0].content
+    assert final["current_focus"] == "집중 시간과 생산성의 관계"
+    assert final["focus_requested"] is False
@@ -0,0 +1,83 @@
+# backend/tests/core/test_sql_upserts.py
+
+import pytest
+import pytest_asyncio
+from langchain_core.messages import HumanMessage
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.sql_checkpointer import SQLCheckpointer
+from app.core.user_state import UserStateStore
+from app.db.models import Base
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    yield sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False), statements
+    await engine.dispose()
+
+
+async def test_sql_checkpointer_aset_is_single_upsert(db):
+    factory, statements = db
+    cp = SQLCheckpointer(factory)
+    cfg = {"configurable": {"thread_id": "t1"}}
+
+    await cp.aset(cfg, {"messages": [HumanMessage(content="a")]})
+    statements.clear()
+    await cp.aset(cfg, {"messages": [HumanMessage(content="b")]})
+
+    assert statements == ["INSERT"]  # SELECT 없이 한 번의 INSERT ... ON CONFLICT
+    state = await cp.aget(cfg)
+    assert state["messages"][0]["kwargs"]["content"] == "b"
+
+
+async def test_sql_checkpointer_aset_many_keeps_last_state_per_thread(db):
+    factory, statements = db
+    cp = SQLCheckpointer(factory)
+    cfg = lambda t: {"configurable": {"thread_id": t}}
+
+    await cp.aset_many([(cfg("t1"), {"n": 1}), (cfg("t2"), {"n": 1}), (cfg("t1"), {"n": 2})])
+
+    assert statements.count("INSERT") == 1
+    assert (await cp.aget(cfg("t1")))["n"] == 2
+    assert (await cp.aget(cfg("t2")))["n"] == 1
+
+
+async def test_user_state_upsert_and_upsert_many(db):
+    factory, statements = db
+    store = UserStateStore(factory)
+    s1, s2 = "7f6c1f0e-1b9a-4b59-9a52-2b1f4f1f0a01", "7f6c1f0e-1b9a-4b59-9a52-2b1f4f1f0a02"
+
+    await store.upsert(s1, {"step": 1})
+    statements.clear()
+    await store.upsert_many({s1: {"step": 2}, s2: {"step": 1}})
+
+    assert statements == ["INSERT"]
+    assert await store.load(s1) == {"step": 2}
+    assert await store.load(s2) == {"step": 1}
+
+
+async def test_user_state_version_is_returned_by_upsert_and_load(db):
+    factory, _ = db
+    store = UserStateStore(factory)
+    s1 = "7f6c1f0e-1b9a-4b59-9a52-2b1f4f1f0a01"
+
+    assert await store.load_versioned(s1) == ({}, None)
+    first = await store.upsert(s1, {"step": 1})
+    second = await store.upsert(s1, {"step": 2})
+
+    assert second > first
+    assert await store.load_versioned(s1) == ({"step": 2}, second)
+    assert await store.load_version(s1) == second
@@ -0,0 +1,119 @@
+# backend/tests/core/test_state_cache.py
+
+import asyncio
+
+import fakeredis
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.core import why_orchestration
+from app.core.state_cache import SessionStateCache
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_lru_bound_and_stale_loads_are_not_cached():
+    cache = SessionStateCache(maxsize=2)
+    cache.put("a", {"n": 1}, 1)
+    cache.put("b", {"n": 1}, 1)
+    assert cache.get("a") == {"n": 1}  # a 가 최근 사용 → b 가 밀려남
+    cache.put("c", {"n": 1}, 1)
+    assert cache.get("b") is None and len(cache) == 2
+
+    # DB 읽기 도중 같은 세션이 저장되면 읽은(오래된) 상태는 넣지 않음
+    token = cache.load_token()
+    await cache.commit("a", {"n": 2}, 2)
+    cache.put("a", {"n": 1}, 1, token=token)
+    assert cache.get("a") == {"n": 2}
+
+    cache.discard("a")
+    assert cache.get("a") is None
+    assert cache.stats["evictions"] == 1
+
+
+class FakeUserStore:
+    def __init__(self):
+        self.saved = {}
+        self.loads = 0
+        self.version = 0
+
+    async def load_versioned(self, session_id):
+        self.loads += 1
+        return self.saved.get(session_id, ({}, None))
+
+    async def load_version(self, session_id):
+        return self.saved.get(session_id, ({}, None))[1]
+
+    async def upsert(self, session_id, state):
+        self.version += 1
+        self.saved[session_id] = (state, self.version)
+        return self.version
+
+    async def append_transcript_many(self, session_id, rows):
+        pass
+
+
+async def test_why_turns_reuse_hydrated_state_without_db_reads(monkeypatch):
+    store = FakeUserStore()
+    store.saved["w1"] = ({"messages": [{"type": "human", "content": "q1"}, {"type": "ai", "content": "a1"}], "raw_topic": "q1"}, 1)
+    monkeypatch.setattr(why_orchestration, "user_store", store)
+    monkeypatch.setattr(why_orchestration, "state_cache", SessionStateCache())
+
+    graph_input, _ = await why_orchestration._prepare_why_turn("w1", "q2", None)
+    assert [type(m) for m in graph_input["messages"]] == [HumanMessage, AIMessage, HumanMessage]
+    final_state = {**graph_input, "messages": graph_input["messages"] + [AIMessage(content="a2")]}
+    await why_orchestration._save_why_turn("w1", graph_input, final_state, "a2")
+
+    graph_input, _ = await why_orchestration._prepare_why_turn("w1", "q3", None)
+
+    assert store.loads == 1  # 두 번째 턴은 캐시 (write-through 된 상태)
+    assert [m.content for m in graph_input["messages"]] == ["q1", "a1", "q2", "a2", "q3"]
+    cached = why_orchestration.state_cache.get("w1")
+    assert [m.content for m in cached["messages"]] == ["q1", "a1", "q2", "a2"]  # 입력 추가가 캐시를 바꾸지 않음
+    assert cached["messages"][0] is graph_input["messages"][0]  # 메시지 객체는 다시 만들지 않음
+
+
+async def test_cached_state_saved_by_another_worker_is_reloaded(monkeypatch):
+    store = FakeUserStore()
+    store.saved["w1"] = ({"messages": [{"type": "human", "content": "q1"}]}, 1)
+    monkeypatch.setattr(why_orchestration, "user_store", store)
+    monkeypatch.setattr(why_orchestration, "state_cache", SessionStateCache())
+    await why_orchestration._load_why_state("w1")
+
+    # 다른 워커가 저장 (pub/sub 없음 → 이 워커의 캐시는 모름)
+    store.saved["w1"] = ({"messages": [{"type": "human", "content": "q1"}, {"type": "ai", "content": "a1"}]}, 2)
+    state = await why_orchestration._load_why_state("w1")
+
+    assert [m.content for m in state["messages"]] == ["q1", "a1"]
+    assert store.loads == 2
+    assert why_orchestration.state_cache.stats["stale"] == 1
+    await why_orchestration._load_why_state("w1")
+    assert store.loads == 2  # 다시 최신 버전이 캐시됨
+
+
+async def _wait_for(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+async def test_commit_on_one_worker_invalidates_other_workers():
+    redis = fakeredis.FakeAsyncRedis()
+    worker_a = SessionStateCache(pubsub=True, redis_client=redis)
+    worker_b = SessionStateCache(pubsub=True, redis_client=redis)
+    assert worker_b.get("w1") is None  # 구독 전에는 캐시를 쓰지 않음 (리스너 시작)
+    worker_a.start()
+    await _wait_for(lambda: worker_a._subscribed and worker_b._subscribed)
+    try:
+        worker_b.put("w1", {"n": 1}, 1)
+        worker_b.put("w2", {"n": 1}, 1)
+
+        await worker_a.commit("w1", {"n": 2}, 2)
+
+        await _wait_for(lambda: worker_b.get("w1") is None)
+        assert worker_a.get("w1") == {"n": 2}  # 자기가 보낸 무효화는 무시
+        assert worker_b.get("w2") == {"n": 1}
+    finally:
+        await worker_a.stop()
+        await worker_b.stop()
@@ -0,0 +1,74 @@
+# backend/tests/core/test_tracing.py
+
+import asyncio
+
+import pytest
+
+from app.core import tracing
+from app.core.llm_admission import AdmittedChatModel, ModelLimiter
+from app.core.llm_provider import InstrumentedChatModel
+from app.core.tracing import current_trace, span, trace_format, trace_turn
+
+pytestmark = pytest.mark.asyncio
+
+
+class SlowModel:
+    async def ainvoke(self, messages, config=None, **kwargs):
+        await asyncio.sleep(0.02)
+        return "ok"
+
+
+async def test_spans_without_trace_are_not_recorded():
+    with span("load_state", "state_load"):
+        pass
+
+    assert current_trace() is None
+
+
+async def test_llm_queue_wait_and_call_are_separate_spans_across_tasks():
+    limiter = ModelLimiter("fake-trace", max_concurrency=1, requests_per_minute=0, tokens_per_minute=0)
+    llm = AdmittedChatModel(InstrumentedChatModel(SlowModel(), "fake-trace"), limiter)
+
+    with trace_turn("/message", "summary") as trace:
+        with span("astream_events", "graph"):
+            # 노드처럼 별도 태스크에서 실행돼도 같은 trace 에 기록됨
+            await asyncio.gather(llm.ainvoke("a"), llm.ainvoke("b"))
+
+    summary = trace.export()
+    spans = summary["spans"]
+    assert [s["category"] for s in spans].count("llm") == 2
+    assert [s["category"] for s in spans].count("llm_queue") == 2
+    # 동시 실행 한도 1: 두 번째 호출은 첫 호출이 끝날 때까지 승인 대기
+    assert max(s["duration_ms"] for s in spans if s["category"] == "llm_queue") >= 15
+    assert summary["by_category_ms"]["graph"] <= summary["total_ms"]
+    assert current_trace() is None
+
+
+async def test_chrome_export_uses_microseconds_and_task_threads():
+    async def node(name):
+        with span(name, "node"):
+            await asyncio.sleep(0.01)
+
+    with trace_turn("/why", "chrome") as trace:
+        await asyncio.gather(node("a"), node("b"))
+
+    events = trace.export()["traceEvents"]
+    assert events[0]["name"] == "/why" and events[0]["ph"] == "X"
+    nodes = [e for e in events if e["cat"] == "node"]
+    assert {e["name"] for e in nodes} == {"a", "b"}
+    assert all(e["dur"] >= 10_000 for e in nodes)
+    assert len({e["tid"] for e in nodes}) == 2  # 병렬 구간은 서로 다른 줄에 표시
+
+
+async def test_trace_format_from_header_and_settings(monkeypatch):
+    monkeypatch.setattr(tracing.settings, "DEBUG_TRACE", False)
+    monkeypatch.setattr(tracing.settings, "DEBUG_TRACE_HEADER_ENABLED", True)
+    assert trace_format(None) is None
+    assert trace_format("1") == "summary"
+    assert trace_format("Chrome") == "chrome"
+    assert trace_format("0") is None
+
+    monkeypatch.setattr(tracing.settings, "DEBUG_TRACE_HEADER_ENABLED", False)
+    assert trace_format("chrome") is None
+    monkeypatch.setattr(tracing.settings, "DEBUG_TRACE", True)
+    assert trace_format(None) == "summary"
@@ -0,0 +1,101 @@
+# backend/tests/core/test_transcript_appender.py
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.transcript_appender import TranscriptAppender
+from app.core.user_state import UserStateStore
+from app.db.models import Base, SessionTranscriptRecord
+
+pytestmark = pytest.mark.asyncio
+
+S1 = "0b6f7d1c-5a4e-4e0c-9d7a-6f0a1c2b3d01"
+S2 = "0b6f7d1c-5a4e-4e0c-9d7a-6f0a1c2b3d02"
+
+
+@pytest_asyncio.fixture
+async def store():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    inserts = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO session_transcript"):
+            inserts.append(statement)
+
+    factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    yield UserStateStore(factory), factory, inserts
+    await engine.dispose()
+
+
+async def _transcript(factory, session_id):
+    async with factory() as session:
+        result = await session.execute(
+            select(SessionTranscriptRecord.role, SessionTranscriptRecord.content)
+            .where(SessionTranscriptRecord.session_id == session_id)
+        )
+        return result.all()
+
+
+async def test_append_transcript_many_without_appender_is_one_executemany(store):
+    user_store, factory, inserts = store
+
+    await user_store.append_transcript_many(S1, [("user", "q1"), ("assistant", "a1"), ("user", "q2")])
+
+    assert len(inserts) == 1
+    assert sorted(await _transcript(factory, S1)) == [("assistant", "a1"), ("user", "q1"), ("user", "q2")]
+
+
+async def test_appender_buffers_rows_from_all_sessions_until_flush(store):
+    user_store, factory, inserts = store
+    appender = TranscriptAppender(user_store.insert_transcript_rows, flush_interval_ms=60_000, batch_size=100)
+    user_store.transcript_appender = appender
+
+    await user_store.append_transcript(S1, "user", "q1")
+    await user_store.append_transcript_many(S2, [("user", "x1"), ("assistant", "y1")])
+    assert inserts == [] and appender.depth() == 3
+
+    await appender.flush()
+    assert len(inserts) == 1  # 두 세션의 행이 한 번에 저장
+    assert await _transcript(factory, S1) == [("user", "q1")]
+    assert len(await _transcript(factory, S2)) == 2
+    await appender.drain()
+
+
+async def test_appender_flushes_in_background_when_batch_is_full(store):
+    user_store, factory, _ = store
+    appender = TranscriptAppender(user_store.insert_transcript_rows, flush_interval_ms=60_000, batch_size=2)
+    user_store.transcript_appender = appender
+
+    await user_store.append_transcript_many(S1, [("user", "q1"), ("assistant", "a1")])
+    for _ in range(50):
+        if appender.depth() == 0 and appender.stats["batches"]:
+            break
+        await asyncio.sleep(0.01)
+
+    assert len(await _transcript(factory, S1)) == 2
+    await appender.drain()
+
+
+async def test_failed_batch_is_retried_per_session_and_bad_rows_dropped():
+    written = []
+
+    async def write_rows(rows):
+        if any(row["session_id"] == "bad" for row in rows):
+            raise RuntimeError("fk violation")
+        written.extend(rows)
+
+    appender = TranscriptAppender(write_rows, flush_interval_ms=60_000)
+    await appender.append([{"session_id": "good", "role": "user", "content": "q"},
+                           {"session_id": "bad", "role": "user", "content": "x"}])
+    await appender.drain()
+
+    assert [row["session_id"] for row in written] == ["good"]
+    assert appender.stats["dropped"] == 1
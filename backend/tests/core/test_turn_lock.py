@@ -0,0 +1,140 @@
+# backend/tests/core/test_turn_lock.py
+
+import asyncio
+import json
+
+import pytest
+
+from app.core.turn_lock import LOCK_PREFIX, SessionTurnLock, TurnInProgressError
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeRedis:
+    """SET NX PX / GET / 잠금 스크립트(EVAL)만 흉내 내는 공유 저장소 (만료는 무시)"""
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def eval(self, script, numkeys, key, token, *args):
+        value = self.data.get(key)
+        if value is None or json.loads(value)["token"] != token:
+            return 0
+        if "'del'" in script:
+            del self.data[key]
+        return 1
+
+
+async def _run_turn(lock, key, user_input, log, gate=None):
+    async with lock.turn(key, user_input) as turn:
+        if turn.shared_result is not None:
+            log.append(("shared", user_input))
+            return turn.shared_result
+        log.append(("start", user_input))
+        if gate is not None:
+            await gate.wait()
+        await asyncio.sleep(0.01)
+        log.append(("end", user_input))
+        turn.set_result(f"응답: {user_input}")
+        return f"응답: {user_input}"
+
+
+async def test_queue_mode_runs_same_session_turns_one_at_a_time():
+    lock = SessionTurnLock(mode="queue")
+    log = []
+
+    results = await asyncio.gather(
+        _run_turn(lock, "s1", "첫 번째", log),
+        _run_turn(lock, "s1", "첫 번째", log),
+        _run_turn(lock, "s2", "다른 세션", log),
+    )
+
+    assert results == ["응답: 첫 번째", "응답: 첫 번째", "응답: 다른 세션"]
+    s1 = [entry for entry in log if entry[1] == "첫 번째"]
+    assert s1 == [("start", "첫 번째"), ("end", "첫 번째"), ("start", "첫 번째"), ("end", "첫 번째")]
+    assert log.index(("start", "다른 세션")) < log.index(("end", "첫 번째"))  # 다른 세션은 기다리지 않음
+    assert lock.stats["queued"] == 1
+    assert not lock._locks  # 사용이 끝난 잠금 객체는 정리됨
+
+
+async def test_reject_mode_raises_while_turn_in_progress():
+    lock = SessionTurnLock(mode="reject")
+    gate = asyncio.Event()
+    log = []
+    first = asyncio.create_task(_run_turn(lock, "s1", "안녕", log, gate))
+    await asyncio.sleep(0)
+
+    with pytest.raises(TurnInProgressError):
+        await _run_turn(lock, "s1", "안녕", log)
+
+    gate.set()
+    assert await first == "응답: 안녕"
+    assert lock.stats["rejected"] == 1
+
+
+async def test_coalesce_shares_answer_for_duplicate_input_and_queues_new_input():
+    lock = SessionTurnLock(mode="coalesce")
+    gate = asyncio.Event()
+    log = []
+    first = asyncio.create_task(_run_turn(lock, "s1", "같은 입력", log, gate))
+    await asyncio.sleep(0)
+    duplicate = asyncio.create_task(_run_turn(lock, "s1", "같은 입력", log))
+    different = asyncio.create_task(_run_turn(lock, "s1", "새 입력", log))
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await asyncio.gather(first, duplicate, different) == ["응답: 같은 입력", "응답: 같은 입력", "응답: 새 입력"]
+    assert log.count(("start", "같은 입력")) == 1
+    assert ("shared", "같은 입력") in log
+    assert log.count(("start", "새 입력")) == 1
+
+    # 끝난 턴과 같은 입력을 다시 보내면 새 턴으로 실행
+    await _run_turn(lock, "s1", "같은 입력", log)
+    assert log.count(("start", "같은 입력")) == 2
+
+
+async def test_redis_lease_serializes_and_coalesces_across_workers():
+    redis = FakeRedis()
+    worker_a = SessionTurnLock(mode="coalesce", redis_client=redis, poll_ms=5)
+    worker_b = SessionTurnLock(mode="coalesce", redis_client=redis, poll_ms=5)
+    gate = asyncio.Event()
+    log = []
+
+    first = asyncio.create_task(_run_turn(worker_a, "s1", "중복 제출", log, gate))
+    await asyncio.sleep(0.01)
+    assert LOCK_PREFIX + "s1" in redis.data
+    duplicate = asyncio.create_task(_run_turn(worker_b, "s1", "중복 제출", log))
+    await asyncio.sleep(0.02)
+    gate.set()
+
+    assert await asyncio.gather(first, duplicate) == ["응답: 중복 제출", "응답: 중복 제출"]
+    assert log.count(("start", "중복 제출")) == 1
+    assert worker_b.stats["coalesced"] == 1
+    assert LOCK_PREFIX + "s1" not in redis.data  # lease 해제
+
+    # 기다린 적 없는 같은 입력은 남아 있는 응답을 재사용하지 않음
+    await _run_turn(worker_b, "s1", "중복 제출", log)
+    assert log.count(("start", "중복 제출")) == 2
+
+
+async def test_redis_reject_mode_raises_when_other_worker_holds_lease():
+    redis = FakeRedis()
+    holder = SessionTurnLock(mode="reject", redis_client=redis)
+    other = SessionTurnLock(mode="reject", redis_client=redis)
+    gate = asyncio.Event()
+    first = asyncio.create_task(_run_turn(holder, "s1", "a", [], gate))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(TurnInProgressError):
+        await _run_turn(other, "s1", "a", [])
+
+    gate.set()
+    await first
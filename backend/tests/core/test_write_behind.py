@@ -0,0 +1,80 @@
+# backend/tests/core/test_write_behind.py
+
+import asyncio
+import pytest
+
+from app.core.write_behind import SQLWriteBehindQueue
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeSQLCheckpointer:
+    """aset_many 호출을 기록하는 SQL 체크포인터 대역"""
+    def __init__(self, fail_times: int = 0):
+        self.batches = []
+        self.fail_times = fail_times
+
+    async def aset_many(self, items):
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("db down")
+        self.batches.append({cfg["configurable"]["thread_id"]: state for cfg, state in items})
+
+
+def _cfg(thread_id):
+    return {"configurable": {"thread_id": thread_id}}
+
+
+async def test_coalesces_repeated_saves_for_same_thread():
+    sql = FakeSQLCheckpointer()
+    q = SQLWriteBehindQueue(sql, flush_interval_ms=10, max_lag_ms=10_000)
+    for step in range(5):
+        await q.enqueue(_cfg("t1"), {"step": step})
+    await q.enqueue(_cfg("t2"), {"step": 0})
+
+    # flush 전에는 대기 중인 최신 상태를 읽을 수 있어야 함
+    assert q.get_pending("t1") == {"step": 4}
+
+    await q.flush()
+    assert sql.batches == [{"t1": {"step": 4}, "t2": {"step": 0}}]
+    assert q.stats["coalesced"] == 4
+    assert q.depth() == 0
+
+
+async def test_background_flush_respects_max_lag_and_drain():
+    sql = FakeSQLCheckpointer()
+    q = SQLWriteBehindQueue(sql, flush_interval_ms=5, max_lag_ms=20)
+    q.start()
+    await q.enqueue(_cfg("t1"), {"v": 1})
+    await asyncio.sleep(0.1)
+    assert sql.batches == [{"t1": {"v": 1}}]
+
+    await q.enqueue(_cfg("t2"), {"v": 2})
+    await q.drain()
+    assert sql.batches[-1] == {"t2": {"v": 2}}
+
+
+async def test_backpressure_blocks_until_flushed():
+    sql = FakeSQLCheckpointer()
+    q = SQLWriteBehindQueue(sql, flush_interval_ms=10_000, max_lag_ms=10_000, max_pending=2, batch_size=10)
+    await q.enqueue(_cfg("a"), {})
+    await q.enqueue(_cfg("b"), {})
+
+    blocked = asyncio.create_task(q.enqueue(_cfg("c"), {}))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    await q.flush()
+    await asyncio.wait_for(blocked, timeout=1)
+    assert q.get_pending("c") == {}
+
+
+async def test_failed_batch_is_requeued():
+    sql = FakeSQLCheckpointer(fail_times=1)
+    q = SQLWriteBehindQueue(sql)
+    await q.enqueue(_cfg("t1"), {"v": 1})
+    await q.flush()
+    assert q.depth() == 1 and q.stats["failed"] == 1
+
+    await q.flush()
+    assert sql.batches == [{"t1": {"v": 1}}]
@@ -0,0 +1,129 @@
+# backend/tests/graph_nodes/why/test_free_conversation_node.py
+
+import asyncio
+import fakeredis
+import pytest
+from unittest.mock import MagicMock
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.app.core import context_window
+from backend.app.core.config import settings
+from backend.app.graph_nodes.why.free_conversation_node import free_conversation_node
+
+pytestmark = pytest.mark.asyncio
+
+
+class Interrupted(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class FoldLLM:
+    """롤링 요약 호출을 세고, gate 가 열릴 때까지 대기할 수 있는 가짜 요약 LLM"""
+    def __init__(self):
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def ainvoke(self, messages):
+        await self.gate.wait()
+        self.calls += 1
+        return AIMessage(content=f"요약 {self.calls}")
+
+
+@pytest.fixture
+def fold_llm(mocker, monkeypatch):
+    fake = FoldLLM()
+    mocker.patch("app.core.llm_provider.get_fast_llm", return_value=fake)
+    reply = MagicMock()
+    reply.ainvoke.side_effect = lambda _messages: asyncio.sleep(0, result=AIMessage(content="자유 대화 응답"))
+    mocker.patch("backend.app.graph_nodes.why.free_conversation_node.get_high_performance_llm", return_value=reply)
+
+    def _interrupt(value):
+        raise Interrupted(value)
+
+    mocker.patch("backend.app.graph_nodes.why.free_conversation_node.interrupt", side_effect=_interrupt)
+    monkeypatch.setattr(context_window, "_summary_cache", context_window.LRUCache(maxsize=64))
+    monkeypatch.setattr(settings, "CONTEXT_SUMMARY_CHUNK_MESSAGES", 8)
+    redis = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(context_window, "get_redis", lambda: redis)
+    fake.reply = reply
+    return fake
+
+
+def _messages(n):
+    return [HumanMessage(content=f"u{i}") if i % 2 == 0 else AIMessage(content=f"a{i}") for i in range(n)]
+
+
+async def _turn(state):
+    with pytest.raises(Interrupted) as exc:
+        await free_conversation_node(state)
+    return exc.value.value
+
+
+def _system_prompt(fold_llm):
+    return fold_llm.reply.ainvoke.call_args[0][0][0].content
+
+
+async def test_folds_aged_out_messages_in_chunks_and_records_index(fold_llm, monkeypatch):
+    monkeypatch.setattr(settings, "FREE_CONVERSATION_SUMMARY_IN_BACKGROUND", False)
+
+    value = await _turn({"messages": _messages(31), "findings_summary": "탐색 요약"})
+
+    # 31개 중 최근 15개 밖 16개(청크 경계) → 이어 갈 요약이 없으므로 한 번에 요약
+    assert fold_llm.calls == 1
+    assert value["older_history_summary_upto"] == 16
+    assert value["older_history_summary"] == "요약 1"
+    assert value["user_facing_message"] == "자유 대화 응답"
+    assert "- User: u16" in _system_prompt(fold_llm) and "- User: u14" not in _system_prompt(fold_llm)
+
+    # 다른 워커(빈 캐시)에서 이어지는 턴: 저장된 요약을 재사용, 새로 밀려난 2개는 청크 미만이라 원문 유지
+    monkeypatch.setattr(context_window, "_summary_cache", context_window.LRUCache(maxsize=64))
+    state = dict(value, messages=value["messages"] + [HumanMessage(content="다음 질문")])
+    value = await _turn(state)
+    assert fold_llm.calls == 1
+    assert value["older_history_summary_upto"] == 16
+    assert "요약 1" in _system_prompt(fold_llm)
+
+
+async def test_background_fold_does_not_block_reply(fold_llm, monkeypatch):
+    monkeypatch.setattr(settings, "FREE_CONVERSATION_SUMMARY_IN_BACKGROUND", True)
+    fold_llm.gate.clear()
+
+    value = await _turn({"messages": _messages(31)})
+
+    # 요약이 끝나지 않았어도 응답은 바로 반환, 밀려난 메시지는 원문으로 전달됨
+    assert value["older_history_summary_upto"] == 0
+    assert "- User: u0" in _system_prompt(fold_llm)
+
+    fold_llm.gate.set()
+    await context_window.wait_for_background_summaries()
+    value = await _turn(dict(value, messages=value["messages"] + [HumanMessage(content="다음 질문")]))
+    assert value["older_history_summary_upto"] == 16
+    assert "- User: u0" not in _system_prompt(fold_llm)
+
+
+async def test_background_summary_is_saved_to_state_on_another_worker(fold_llm, monkeypatch):
+    monkeypatch.setattr(settings, "FREE_CONVERSATION_SUMMARY_IN_BACKGROUND", True)
+
+    value = await _turn({"messages": _messages(31)})
+    await context_window.wait_for_background_summaries()
+    assert value["older_history_summary_upto"] == 0
+
+    # 다음 턴은 다른 워커(빈 프로세스 캐시): Redis 에 남은 백그라운드 결과를 상태에 저장, 다시 요약하지 않음
+    monkeypatch.setattr(context_window, "_summary_cache", context_window.LRUCache(maxsize=64))
+    value = await _turn(dict(value, messages=value["messages"] + [HumanMessage(content="다음 질문")]))
+    assert fold_llm.calls == 1
+    assert (value["older_history_summary_upto"], value["older_history_summary"]) == (16, "요약 1")
+
+
+async def test_stored_summary_off_chunk_boundary_is_kept(fold_llm, monkeypatch):
+    monkeypatch.setattr(settings, "FREE_CONVERSATION_SUMMARY_IN_BACKGROUND", True)
+    # findings_summarization 등 build_history_context 가 남긴 요약 (청크 경계가 아닌 위치)
+    state = {"messages": _messages(31), "older_history_summary": "노드 요약", "older_history_summary_upto": 19}
+
+    value = await _turn(state)
+
+    assert fold_llm.calls == 0
+    assert (value["older_history_summary_upto"], value["older_history_summary"]) == (19, "노드 요약")
+    assert "- User: u18" not in _system_prompt(fold_llm) and "- Assistant: a19" in _system_prompt(fold_llm)
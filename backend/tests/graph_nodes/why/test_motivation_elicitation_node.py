@@ -0,0 +1,60 @@
+# backend/tests/graph_nodes/why/test_motivation_elicitation_node.py
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.app.graph_nodes.why.motivation_elicitation_node import (
+    motivation_elicitation_node,
+    MotivationClarityOutput,
+)
+from backend.app.core.loop_monitor import LoopBlockMonitor
+
+pytestmark = pytest.mark.asyncio
+
+
+def _mock_llm(mocker, response):
+    """structured_llm.ainvoke 가 네트워크 대기처럼 await 하도록 모킹"""
+    async def slow_ainvoke(_messages):
+        await asyncio.sleep(0.15)
+        return response
+
+    structured_llm = MagicMock()
+    structured_llm.ainvoke.side_effect = slow_ainvoke
+    llm = MagicMock()
+    llm.with_structured_output.return_value = structured_llm
+    # 동기 invoke 가 다시 쓰이면 바로 드러나도록
+    llm.invoke.side_effect = AssertionError("sync llm.invoke must not be used")
+    mocker.patch(
+        'backend.app.graph_nodes.why.motivation_elicitation_node.get_high_performance_llm',
+        return_value=llm,
+    )
+    return structured_llm
+
+
+async def test_clear_motivation_returns_summary_without_blocking_loop(mocker):
+    structured_llm = _mock_llm(mocker, MotivationClarityOutput(
+        is_motivation_clear=True, summary_of_motivation="회의록 작성 시간을 줄이고 싶다",
+    ))
+    state = {"messages": [HumanMessage(content="회의록 쓰는 시간이 너무 아까워요")], "raw_topic": "AI 회의록"}
+
+    async with LoopBlockMonitor(threshold_ms=50, on_block=lambda block: None) as monitor:
+        result = await motivation_elicitation_node(state)
+
+    assert monitor.blocks == []
+    structured_llm.ainvoke.assert_called_once()
+    assert result["motivation_cleared"] is True
+    assert result["final_motivation_summary"] == "회의록 작성 시간을 줄이고 싶다"
+    assert isinstance(result["messages"][-1], AIMessage)
+
+
+async def test_llm_error_asks_again(mocker):
+    structured_llm = _mock_llm(mocker, None)
+    structured_llm.ainvoke.side_effect = RuntimeError("openai down")
+    state = {"messages": [], "raw_idea": "AI 회의록"}
+
+    # interrupt()는 그래프 실행 컨텍스트 밖에서는 오류를 내므로, 질문 경로로 갔는지만 확인
+    with pytest.raises(Exception):
+        await motivation_elicitation_node(state)
+    assert "다시 한번 설명해주시겠어요" in state["messages"][-1].content
@@ -6,8 +6,8 @@ import { useEffect, useRef, useState } from "react";
 import { Textarea } from "@/components/ui/textarea";
 import { Button } from "@/components/ui/button";
 import {
-  sendMessage,
-  sendWhyMessage,
+  streamMessage,
+  streamWhyMessage,
   fetchSessionMessages,
   Message,
   ApiError,
@@ -24,6 +24,8 @@ export function TurnExchange({ sessionId, agentType }: TurnExchangeProps) {
   const [input, setInput] = useState("");
   const [messages, setMessages] = useState<Message[]>([]);
   const [loading, setLoading] = useState(false);
+  // 스트리밍 중인 assistant 응답 (token 이벤트가 도착할 때마다 이어 붙임)
+  const [streamingText, setStreamingText] = useState("");
   const [criticOutput, setCriticOutput] = useState<null | {
     critiquePoint: string;
     briefElaboration: string;
@@ -54,14 +56,28 @@ export function TurnExchange({ sessionId, agentType }: TurnExchangeProps) {
     setLoading(true);
     setInput("");
     setCriticOutput(null);
+    setStreamingText("");
+
+    // 다른 노드에서 토큰이 오기 시작하면 이전 노드의 중간 출력은 버리고 새로 시작
+    let tokenNode = "";
+    const handlers = {
+      onToken: (delta: string, node: string) => {
+        if (node !== tokenNode) {
+          tokenNode = node;
+          setStreamingText(delta);
+        } else {
+          setStreamingText((prev) => prev + delta);
+        }
+      },
+    };
 
     try {
       let assistantMsg: Message;
 
       if (agentType === "why") {
-        assistantMsg = await sendWhyMessage(sessionId, input);
+        assistantMsg = await streamWhyMessage(sessionId, input, handlers);
       } else {
-        assistantMsg = await sendMessage(sessionId, input);
+        assistantMsg = await streamMessage(sessionId, input, handlers);
 
         // 🎯 Critic용 분석 결과 처리
         if ("last_critic_output" in assistantMsg) {
@@ -108,13 +124,14 @@ export function TurnExchange({ sessionId, agentType }: TurnExchangeProps) {
         ]);
       }
     } finally {
+      setStreamingText("");
       setLoading(false);
     }
   };
 
   useEffect(() => {
     bottomRef.current?.scrollIntoView({ behavior: "smooth" });
-  }, [messages, loading, criticOutput]);
+  }, [messages, loading, criticOutput, streamingText]);
 
   return (
     <div className="relative flex flex-col h-full">
@@ -131,7 +148,9 @@ export function TurnExchange({ sessionId, agentType }: TurnExchangeProps) {
           />
         )}
 
-        {loading && <ChatBubble role="assistant" content="답변 작성 중..." />}
+        {loading && (
+          <ChatBubble role="assistant" content={streamingText || "답변 작성 중..."} />
+        )}
         <div ref={bottomRef} />
       </div>
 
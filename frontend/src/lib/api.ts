@@ -135,3 +135,132 @@ export async function sendWhyMessage(
 
   return { role: "assistant", content: assistantContent };
 }
+
+// --- SSE 스트리밍 ---
+
+export type StreamEvent =
+  | { event: "node"; data: { node: string; status: "start" | "end" } }
+  | { event: "token"; data: { node: string; delta: string } }
+  | { event: "final"; data: { content: string } }
+  | { event: "error"; data: { content: string } };
+
+export interface StreamHandlers {
+  onToken?: (delta: string, node: string) => void;
+  onNode?: (node: string, status: "start" | "end") => void;
+}
+
+/**
+ * POST 후 text/event-stream 응답을 읽어 이벤트마다 핸들러 호출.
+ * (EventSource는 POST 본문을 보낼 수 없어 fetch 스트림을 직접 파싱)
+ * final 이벤트의 전체 응답을 Message로 반환
+ */
+async function streamRequest(
+  path: string,
+  body: any,
+  handlers: StreamHandlers,
+  timeoutMs = 120000
+): Promise<Message> {
+  const controller = new AbortController();
+  const timer = setTimeout(() => controller.abort("Request timed out"), timeoutMs);
+
+  try {
+    let res: Response;
+    try {
+      res = await fetch(`${API_BASE}${path}`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json", Accept: "text/event-stream" },
+        body: JSON.stringify(body),
+        signal: controller.signal,
+      });
+    } catch (e) {
+      if (e instanceof DOMException && e.name === "AbortError") {
+        throw new ApiError(408, controller.signal.reason ?? "Request timed out");
+      }
+      throw e;
+    }
+
+    if (!res.ok) {
+      // request() 와 같이 백엔드의 detail 을 사용 (예: 409 턴 진행 중)
+      let errorData: any = null;
+      try {
+        errorData = await res.json();
+      } catch { /* JSON 파싱 실패 시 무시 */ }
+      const detail = errorData?.detail ?? res.statusText;
+      const errorMessage = `HTTP ${res.status}: ${detail}`;
+      console.error("API Error:", errorMessage, errorData);
+      throw new ApiError(res.status, errorMessage);
+    }
+    if (!res.body) {
+      throw new ApiError(res.status, `HTTP ${res.status}: 응답 본문이 없습니다.`);
+    }
+
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    let finalContent: string | null = null;
+
+    const handle = (block: string) => {
+      let event = "message";
+      let data = "";
+      for (const line of block.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      if (!data) return;
+      const ev = { event, data: JSON.parse(data) } as StreamEvent;
+      switch (ev.event) {
+        case "token":
+          handlers.onToken?.(ev.data.delta, ev.data.node);
+          break;
+        case "node":
+          handlers.onNode?.(ev.data.node, ev.data.status);
+          break;
+        case "final":
+          finalContent = ev.data.content;
+          break;
+        case "error":
+          throw new ApiError(500, ev.data.content);
+      }
+    };
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      let sep: number;
+      while ((sep = buffer.indexOf("\n\n")) !== -1) {
+        handle(buffer.slice(0, sep));
+        buffer = buffer.slice(sep + 2);
+      }
+    }
+
+    if (finalContent === null) {
+      throw new ApiError(500, "스트림이 final 이벤트 없이 종료되었습니다.");
+    }
+    return { role: "assistant", content: finalContent };
+  } finally {
+    clearTimeout(timer);
+  }
+}
+
+/**
+ * 사용자 메시지 전송 후 assistant 응답을 토큰 단위로 스트리밍
+ */
+export async function streamMessage(
+  sessionId: string,
+  content: string,
+  handlers: StreamHandlers = {}
+): Promise<Message> {
+  return streamRequest(`/sessions/${sessionId}/message/stream`, { content }, handlers);
+}
+
+/**
+ * Why 모드 메시지 전송 후 응답 스트리밍
+ */
+export async function streamWhyMessage(
+  sessionId: string,
+  content: string,
+  handlers: StreamHandlers = {}
+): Promise<Message> {
+  return streamRequest(`/sessions/${sessionId}/why/stream`, { input: content }, handlers);
+}